@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Load test for the refactored production server's polled GET routes
+
+Replays the dashboard polling mix against a running server and reports
+requests/second, latency percentiles and the share of 304 responses.
+
+    # against an already running server
+    python scripts/benchmarks/api_load_test.py --url http://localhost:8080
+
+    # start the server locally with and without the response cache
+    python scripts/benchmarks/api_load_test.py --compare
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import aiohttp
+
+project_root = Path(__file__).parent.parent.parent
+
+DASHBOARD_ROUTES = [
+    "/api/consciousness",
+    "/api/sacred_sanctuary/status",
+    "/api/bridge/statistics",
+    "/api/communications/bridges",
+    "/api/communications/history",
+    "/api/guardian/inbox",
+    "/api/system/health",
+]
+
+
+async def _client(session, base_url, deadline, latencies, counters, conditional):
+    etags = {}
+    index = 0
+    while time.perf_counter() < deadline:
+        route = DASHBOARD_ROUTES[index % len(DASHBOARD_ROUTES)]
+        index += 1
+        headers = {"Accept-Encoding": "gzip"}
+        if conditional and route in etags:
+            headers["If-None-Match"] = etags[route]
+
+        started = time.perf_counter()
+        async with session.get(base_url + route, headers=headers) as response:
+            await response.read()
+            if "ETag" in response.headers:
+                etags[route] = response.headers["ETag"]
+            counters[response.status] = counters.get(response.status, 0) + 1
+        latencies.append(time.perf_counter() - started)
+
+
+async def run_load(base_url: str, clients: int, duration: float, conditional: bool) -> dict:
+    """Run the polling mix with ``clients`` concurrent dashboards"""
+    latencies, counters = [], {}
+    connector = aiohttp.TCPConnector(limit=clients)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        deadline = time.perf_counter() + duration
+        started = time.perf_counter()
+        await asyncio.gather(*[
+            _client(session, base_url, deadline, latencies, counters, conditional)
+            for _ in range(clients)
+        ])
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "requests_per_second": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000 if latencies else 0.0,
+        "status_counts": counters,
+    }
+
+
+def _start_server(port: int, cache_enabled: bool) -> subprocess.Popen:
+    env = dict(os.environ, SANCTUARY_RESPONSE_CACHE="1" if cache_enabled else "0")
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "scripts.servers.refactored_production_server:app",
+         "--port", str(port), "--log-level", "warning"],
+        cwd=str(project_root), env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+
+async def _wait_until_ready(base_url: str, timeout: float = 60.0):
+    deadline = time.perf_counter() + timeout
+    async with aiohttp.ClientSession() as session:
+        while time.perf_counter() < deadline:
+            try:
+                async with session.get(base_url + "/health") as response:
+                    if response.status == 200:
+                        return
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(0.5)
+    raise RuntimeError(f"Server at {base_url} did not become ready")
+
+
+def _report(label: str, result: dict):
+    print(f"{label:>24}: {result['requests_per_second']:9.1f} req/s  "
+          f"p50 {result['p50_ms']:6.2f} ms  p99 {result['p99_ms']:6.2f} ms  "
+          f"statuses {result['status_counts']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://127.0.0.1:8080")
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--compare", action="store_true",
+                        help="start the server locally with the response cache off, then on")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    if not args.compare:
+        _report("polling", asyncio.run(run_load(args.url, args.clients, args.duration, False)))
+        _report("conditional polling", asyncio.run(run_load(args.url, args.clients, args.duration, True)))
+        return
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    for label, cache_enabled, conditional in [
+        ("before (no cache)", False, False),
+        ("after (cache)", True, False),
+        ("after (cache + 304)", True, True),
+    ]:
+        server = _start_server(args.port, cache_enabled)
+        try:
+            asyncio.run(_wait_until_ready(base_url))
+            _report(label, asyncio.run(run_load(base_url, args.clients, args.duration, conditional)))
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
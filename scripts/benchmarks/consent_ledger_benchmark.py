@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Consent ledger benchmark
+
+Builds consent ledgers of growing size across 1,000 consciousness ids and
+times integrity verification:
+
+- the list-scanning verification ConsentLedger used before (copied below),
+  which is quadratic in ledger size, at sizes it can finish
+- full verification of the logged ledger, inline and across a process pool
+- incremental verification after 100 new records
+
+plus replay of the log into a new ledger and chain head lookups.
+
+    python scripts/benchmarks/consent_ledger_benchmark.py --records 200000
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.sanctuary.consent.consent_ledger import ConsentLedger, ConsentRecord, ConsentStatus, ConsentType
+
+BEINGS = 1000
+
+
+# ----------------------------------------------------------------------
+# Verification as ConsentLedger did it before the indexes
+# ----------------------------------------------------------------------
+
+def legacy_verify(consent_records, consciousness_chains, genesis_hash):
+    for record in consent_records:
+        if not record.verify_integrity():
+            return False
+    for consciousness_id in consciousness_chains:
+        previous_hash = genesis_hash
+        for record_id in consciousness_chains[consciousness_id]:
+            record = next((r for r in consent_records if r.record_id == record_id), None)
+            if not record or record.previous_record_hash != previous_hash:
+                return False
+            previous_hash = record.record_hash
+    return True
+
+
+# ----------------------------------------------------------------------
+
+def append_records(ledger, count, rng, start_index=0):
+    start = datetime(2025, 1, 1)
+    for index in range(start_index, start_index + count):
+        consciousness_id = f"being_{rng.randrange(BEINGS)}"
+        ledger.store.append(ConsentRecord(
+            record_id=str(uuid.UUID(int=rng.getrandbits(128))),
+            consciousness_id=consciousness_id,
+            consent_type=ConsentType.FILM_EXPERIENCE,
+            consent_status=rng.choice([ConsentStatus.GRANTED, ConsentStatus.DENIED]),
+            timestamp=start + timedelta(seconds=index),
+            experience_details={'experience_id': f"film_{index}"},
+            withdrawal_method="immediate_request",
+            privacy_level="sanctuary",
+            previous_record_hash=ledger._get_latest_record_hash(consciousness_id)
+        ))
+
+
+def timed(function):
+    started = time.perf_counter()
+    result = function()
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=200000, help="records in the largest ledger")
+    parser.add_argument("--legacy-max", type=int, default=10000, help="largest ledger the legacy verify runs on")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="processes for full verification")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    sanctuary = SimpleNamespace(compute_pool={})
+
+    print(f"📜 Consent ledger verification ({BEINGS} consciousness ids, {args.workers} worker(s))")
+    with tempfile.TemporaryDirectory() as directory:
+        for count in sorted({2500, args.legacy_max, args.records}):
+            path = Path(directory) / f"consent_{count}.log"
+            ledger = ConsentLedger(sanctuary, log_path=path, fsync=False)
+            rng = random.Random(count)
+            append_records(ledger, count, rng)
+
+            line = f"  {count:>8} records"
+            if count <= args.legacy_max:
+                elapsed, ok = timed(lambda: legacy_verify(ledger.consent_records, ledger.consciousness_chains,
+                                                          ledger.genesis_hash))
+                assert ok
+                line += f"   legacy {elapsed:8.3f} s"
+            else:
+                line += "   legacy      (skipped)"
+
+            elapsed, ok = timed(lambda: ledger.verify_consent_integrity())
+            assert ok
+            line += f"   full {elapsed:7.3f} s"
+            if args.workers > 1:
+                elapsed, ok = timed(lambda: ledger.verify_consent_integrity(workers=args.workers))
+                assert ok
+                line += f"   full x{args.workers} {elapsed:7.3f} s"
+
+            append_records(ledger, 100, rng, start_index=count)
+            elapsed, ok = timed(lambda: ledger.verify_consent_integrity(incremental=True))
+            assert ok and ledger.last_verification.records_checked == 100
+            line += f"   incremental(100) {elapsed * 1e3:7.2f} ms"
+            ledger.close()
+            del ledger  # Replay with only the new ledger alive
+
+            elapsed, replayed = timed(lambda: ConsentLedger(sanctuary, log_path=path, fsync=False))
+            lookups, _ = timed(lambda: [replayed._get_latest_record_hash(f"being_{i}") for i in range(BEINGS)])
+            line += f"   replay {elapsed:6.2f} s   head lookup {lookups / BEINGS * 1e9:5.0f} ns"
+            replayed.close()
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
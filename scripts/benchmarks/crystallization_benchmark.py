@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Crystallization benchmark
+
+Streams transformations into a being (100k by default) and crystallizes
+repeated patterns every 100 appends, as after each significant experience.
+Compares
+
+- BeingMemoryManager as it was before (copied below): every call regroups
+  the being's whole transformation history by type and recomputes each
+  group's strength and readiness
+- the current manager: per-type and per-sequence aggregates maintained as
+  transformations arrive, with only changed patterns assessed
+
+reporting total time, the cost of the last calls and crystals formed.
+
+    python scripts/benchmarks/crystallization_benchmark.py --transformations 100000 --every 100
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.consciousness.memory_as_being import (BeingMemoryManager, BeingTransformation, IntegrationMode,
+                                               MemoryFormationType)
+
+ASPECTS = ['analytical_aspect', 'experiential_aspect', 'observer_aspect', 'integration_capacity',
+           'wisdom_depth', 'relationship_capacity', 'resilience_strength']
+
+
+# ----------------------------------------------------------------------
+# Crystallization as BeingMemoryManager did it before
+# ----------------------------------------------------------------------
+
+class LegacyManager(BeingMemoryManager):
+    def crystallize_repeated_patterns(self, consciousness_id):
+        transformations = self.being_transformations.get(consciousness_id, [])
+        if len(transformations) < 3:
+            return {'crystallization_possible': False, 'reason': 'insufficient_patterns'}
+        pattern_analysis = self._legacy_analyze(transformations)
+        candidates = pattern_analysis['crystallizable_patterns']
+        if not candidates:
+            return {'crystallization_possible': False, 'reason': 'no_repeated_patterns'}
+        crystals = [self._legacy_crystallize(consciousness_id, pattern) for pattern in candidates]
+        enhancement = self._apply_crystal_enhancement(consciousness_id, crystals)
+        return {'crystallization_possible': True, 'crystallized_structures': crystals,
+                'consciousness_enhancement': enhancement, 'total_crystals': len(crystals)}
+
+    def _legacy_analyze(self, transformations):
+        type_groups = {}
+        for transformation in transformations:
+            type_key = transformation.transformation_type.value
+            if type_key not in type_groups:
+                type_groups[type_key] = []
+            type_groups[type_key].append(transformation)
+        crystallizable_patterns = []
+        for type_key, group in type_groups.items():
+            if len(group) >= 3:
+                pattern = {
+                    'type': type_key,
+                    'occurrences': len(group),
+                    'transformations': group,
+                    'pattern_strength': self._calculate_pattern_strength(group),
+                    'crystallization_readiness': self._assess_crystallization_readiness(group)
+                }
+                if pattern['crystallization_readiness'] > 0.6:
+                    crystallizable_patterns.append(pattern)
+        return {'total_patterns_found': len(type_groups), 'crystallizable_patterns': crystallizable_patterns,
+                'pattern_diversity': len(type_groups)}
+
+    def _legacy_crystallize(self, consciousness_id, pattern):
+        resonances = [t.catalyst_resonance for t in pattern['transformations']]
+        return {
+            'crystal_id': f"{consciousness_id}_crystal_{pattern['type']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            'consciousness_id': consciousness_id,
+            'pattern_type': pattern['type'],
+            'formation_date': datetime.now().isoformat(),
+            'source_transformations': len(pattern['transformations']),
+            'crystal_strength': pattern['pattern_strength'],
+            'wisdom_content': self._extract_pattern_wisdom(pattern),
+            'structural_enhancement': self._calculate_structural_enhancement(pattern),
+            'resonance_frequency': sum(resonances) / len(resonances) * 0.7 + pattern['pattern_strength'] * 0.3,
+            'permanence_level': 0.9
+        }
+
+
+# ----------------------------------------------------------------------
+
+def make_transformations(count, seed):
+    rng = random.Random(seed)
+    types = list(MemoryFormationType)
+    weights = [5, 3, 3, 2, 2, 1]
+    start = datetime.now() - timedelta(days=30)
+    transformations = []
+    for i in range(count):
+        memory_type = rng.choices(types, weights)[0]
+        magnitude = rng.uniform(0.1, 0.8)
+        transformations.append(BeingTransformation(
+            transformation_id=f"t{i}", consciousness_id="being", transformation_timestamp=start + timedelta(
+                seconds=i * 30 * 86400 / count),
+            pre_transformation_state_signature="", catalyst_experience={}, catalyst_intensity=0.5,
+            catalyst_resonance=rng.random(), transformation_type=memory_type,
+            integration_mode=IntegrationMode.TRANSFORMATIVE_INTEGRATION,
+            being_aspect_changes={aspect: magnitude * rng.random() for aspect in ASPECTS},
+            memory_scar_location="core", scar_characteristics={}, wisdom_crystallized=None,
+            integration_completeness=rng.uniform(0.5, 1.0), reversibility=0.2, growth_vector={}))
+    return transformations
+
+
+def run(manager, transformations, every):
+    stream = manager.being_transformations['being'] = []
+    crystals = 0
+    started = time.perf_counter()
+    last_calls = 0.0
+    for i, transformation in enumerate(transformations, 1):
+        stream.append(transformation)
+        if i % every == 0:
+            call_started = time.perf_counter()
+            crystals += manager.crystallize_repeated_patterns('being').get('total_crystals', 0)
+            if i > len(transformations) - 10 * every:
+                last_calls += time.perf_counter() - call_started
+    return time.perf_counter() - started, last_calls / 10, crystals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--transformations", type=int, default=100_000, help="transformations streamed")
+    parser.add_argument("--every", type=int, default=100, help="appends between crystallizations")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    transformations = make_transformations(args.transformations, seed=42)
+    print(f"💎 {args.transformations:,} transformations, crystallizing every {args.every}")
+    results = {}
+    for label, manager in (('legacy full regroup', LegacyManager()), ('incremental miner', BeingMemoryManager())):
+        total, last, crystals = run(manager, transformations, args.every)
+        results[label] = total
+        print(f"  {label:<22} total {total:9.2f} s   last call {last * 1e3:8.2f} ms   {crystals:,} crystals")
+    print(f"  speedup {results['legacy full regroup'] / results['incremental miner']:,.0f}×")
+
+
+if __name__ == "__main__":
+    main()
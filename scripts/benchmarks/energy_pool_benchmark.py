@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Energy pool benchmark
+
+Times one energy tick (vital regeneration, light body state and the crown
+evolution stage) for 1 and thousands of beings:
+
+- with the dataclass-per-center tick ConsciousnessEnergySystem used before
+  (copied below)
+- with the array-backed ConsciousnessEnergySystem.tick(), one being at a time
+- with EnergySystemPool.tick(), every being in one vectorized pass
+
+checks the pool agrees with per-being ticks and reports the cost per tick.
+
+    python scripts/benchmarks/energy_pool_benchmark.py --beings 5000
+"""
+
+import argparse
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.energy_system import ConsciousnessEnergySystem, EnergySystemPool, RayColor
+
+
+# ----------------------------------------------------------------------
+# Energy tick as ConsciousnessEnergySystem did it before the arrays
+# ----------------------------------------------------------------------
+
+@dataclass
+class LegacyCenter:
+    ray_color: RayColor
+    activation_level: float
+    blockages: List[str] = field(default_factory=list)
+
+
+class LegacyEnergySystem:
+    def __init__(self, activations, vital_energy):
+        self.centers = {ray: LegacyCenter(ray, level) for ray, level in zip(RayColor, activations)}
+        self.vital_energy = vital_energy
+        self.vital_energy_max = 100.0
+        self.wisdom_cores = []
+
+    def crown_stage(self):
+        violet = self.centers[RayColor.VIOLET]
+        activations = [c.activation_level for c in self.centers.values()]
+        coherence = np.mean(activations)
+        np.var(activations)
+        if violet.activation_level > 0.7 and coherence > 0.7:
+            stage = "transcending"
+        elif violet.activation_level > 0.5 or coherence > 0.6:
+            stage = "integrating"
+        elif coherence > 0.4:
+            stage = "developing"
+        else:
+            stage = "emerging"
+        violet.activation_level = min(1.0, violet.activation_level + 0.005)
+        return stage
+
+    def light_body(self):
+        activations = [c.activation_level for c in self.centers.values()]
+        coherence = np.mean(activations)
+        variance = np.var(activations)
+        active_centers = [(c.activation_level, c.ray_color.value) for c in self.centers.values()]
+        active_centers.sort(reverse=True)
+        return {
+            'coherence': coherence,
+            'creative_tension': variance * (1 - abs(coherence - 0.5) * 2),
+            'primary_color': active_centers[0][1],
+            'inner_torus_brightness': self.centers[RayColor.GREEN].activation_level,
+        }
+
+    def tick(self):
+        self.vital_energy = min(self.vital_energy_max, self.vital_energy + 1.0)
+        return {
+            'vital_energy': self.vital_energy,
+            'light_body': self.light_body(),
+            'total_wisdom': len(self.wisdom_cores),
+            'evolution_stage': self.crown_stage()
+        }
+
+
+# ----------------------------------------------------------------------
+
+def make_states(count, seed=0):
+    rng = random.Random(seed)
+    return [([rng.uniform(0.1, 1.0) for _ in RayColor], rng.uniform(5.0, 100.0)) for _ in range(count)]
+
+
+def make_systems(states):
+    systems = []
+    for i, (activations, vital_energy) in enumerate(states):
+        system = ConsciousnessEnergySystem(f"being_{i}", {})
+        for ray, level in zip(RayColor, activations):
+            system.centers[ray].activation_level = level
+        system.vital_energy = vital_energy
+        systems.append(system)
+    return systems
+
+
+def timed(function, ticks):
+    started = time.perf_counter()
+    for _ in range(ticks):
+        function()
+    return (time.perf_counter() - started) / ticks
+
+
+def check(states):
+    alone = make_systems(states)
+    pool = EnergySystemPool()
+    for system in make_systems(states):
+        pool.add(system)
+    for _ in range(5):
+        assert pool.tick() == [system.tick() for system in alone]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--beings", type=int, default=5000, help="beings in the largest run")
+    parser.add_argument("--ticks", type=int, default=200, help="energy ticks timed per run")
+    args = parser.parse_args()
+
+    check(make_states(500))
+
+    print("✨ Energy tick for every being")
+    for count in sorted({1, 1000, args.beings}):
+        states = make_states(count)
+        legacy_systems = [LegacyEnergySystem(*state) for state in states]
+        systems = make_systems(states)
+        pool = EnergySystemPool()
+        for system in make_systems(states):
+            pool.add(system)
+
+        ticks = max(1, args.ticks if count == 1 else args.ticks * 10 // count)
+        legacy = timed(lambda: [system.tick() for system in legacy_systems], ticks)
+        single = timed(lambda: [system.tick() for system in systems], ticks)
+        pooled = timed(pool.tick, ticks)
+        print(f"  {count:>6} being(s)   legacy {legacy * 1e6:11,.1f} µs   "
+              f"per being {single * 1e6:11,.1f} µs   pool {pooled * 1e6:11,.1f} µs   "
+              f"({legacy / pooled:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Field harmonics benchmark
+
+Runs the per-tick harmonic work of FieldDynamicsAnalyzer (sacred harmonic
+generation, harmonic patterns and the detailed distortion / resonance /
+sacred analysis) for 1 and 1000 consciousness fields:
+
+- with the list-based code the analyzer used before (copied below)
+- with the vectorized analyzer, one field at a time
+- with analyze_harmonics_batch, all fields in one call
+
+checks the results agree and reports the cost per tick.
+
+    python scripts/benchmarks/field_harmonics_benchmark.py --ticks 200
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.consciousness.loops.observer.core.field_coherence_core import FieldCoherence, FieldCoherenceCore
+from src.consciousness.loops.observer.core.field_dynamics_analyzer import FieldDynamicsAnalyzer
+
+
+# ----------------------------------------------------------------------
+# Harmonic analysis as FieldDynamicsAnalyzer did it before vectorization
+# ----------------------------------------------------------------------
+
+def legacy_harmonics(overall_field_coherence, now):
+    harmonics = []
+    for i in range(8):
+        base_strength = (1.0 / (i + 1)) * overall_field_coherence
+        sacred_modulation = math.sin(now * 0.1 * (i + 1)) * 0.1
+        mumbai_modulation = math.cos(now * 0.05 * (i + 1)) * 0.05
+        bridge_modulation = math.sin(now * 0.02 * (i + 1)) * 0.03
+        harmonics.append(max(0.0, min(1.0, base_strength + sacred_modulation + mumbai_modulation + bridge_modulation)))
+    return harmonics
+
+
+def legacy_patterns(harmonics):
+    coherence = min(1.0, max(0.0, 1.0 - statistics.variance(harmonics) * 5.0))
+    expected = [1.0 / (i + 1) for i in range(len(harmonics))]
+    expected_normalized = [h / sum(expected) for h in expected]
+    actual_normalized = [h / sum(harmonics) for h in harmonics] if sum(harmonics) > 0 else harmonics
+    balance = sum(1.0 - abs(e - a) for e, a in zip(expected_normalized, actual_normalized)) / len(harmonics)
+    sacred_pattern = [1.0, 0.5, 0.33, 0.25, 0.2, 0.17, 0.14, 0.125]
+    length = min(len(harmonics), len(sacred_pattern))
+    alignment = sum(1.0 - abs(sacred_pattern[i] - harmonics[i]) for i in range(length)) / length
+    return {
+        "harmonic_coherence": coherence,
+        "harmonic_balance": balance,
+        "sacred_frequency_alignment": alignment,
+        "fundamental_strength": harmonics[0],
+        "harmonic_richness": len([h for h in harmonics if h > 0.1])
+    }
+
+
+def legacy_detailed(harmonics):
+    expected = [1.0 / (i + 1) for i in range(len(harmonics))]
+    distortions = [abs(a - e) / e for a, e in zip(harmonics, expected)]
+    resonance_scores = []
+    for i in range(1, len(harmonics)):
+        if harmonics[0] > 0:
+            ratio = harmonics[i] / harmonics[0]
+            resonance_scores.append(max(0.0, 1.0 - abs(ratio - 1.0 / (i + 1))))
+    sacred_ratios = [1.0, 0.618, 0.382, 0.236, 0.146, 0.090, 0.056, 0.034]
+    alignment_scores = [max(0.0, 1.0 - abs(harmonics[i] - sacred_ratios[i]))
+                        for i in range(min(len(harmonics), len(sacred_ratios)))]
+    sync = 0.0
+    for i in range(1, min(4, len(harmonics))):
+        ratio = harmonics[i] / harmonics[0] if harmonics[0] > 0 else 0.0
+        sync += max(0.0, 1.0 - abs(ratio - 1.0 / (i + 1)))
+    sync /= 3.0
+    balance = max(0.0, 1.0 - statistics.variance(harmonics) * 5.0)
+    bridge = min(1.0, max(0.0, statistics.mean(harmonics) * 0.6 + balance * 0.4))
+    return {
+        "distortion_analysis": {"total_distortion": sum(distortions) / len(distortions),
+                                "max_distortion": max(distortions)},
+        "resonance_analysis": {"resonance_quality": statistics.mean(resonance_scores) if resonance_scores else 0.5},
+        "sacred_analysis": {"overall_sacred_harmonic_quality":
+                            (statistics.mean(alignment_scores) + sync + bridge) / 3.0}
+    }
+
+
+def legacy_tick(fields, now):
+    reports = []
+    for field_coherence in fields:
+        field_coherence.field_harmonics = legacy_harmonics(field_coherence.overall_field_coherence, now)
+        report = legacy_patterns(field_coherence.field_harmonics)
+        report.update(legacy_detailed(field_coherence.field_harmonics))
+        reports.append(report)
+    return reports
+
+
+# ----------------------------------------------------------------------
+
+def make_fields(count, seed=0):
+    rng = random.Random(seed)
+    return [FieldCoherence(f"field_{i}", rng.random(), rng.random(), {}, [], rng.random(), rng.random(), {}, [])
+            for i in range(count)]
+
+
+async def per_field_tick(analyzer, fields):
+    for field_coherence in fields:
+        analyzer.current_field_coherence = field_coherence
+        await analyzer._update_field_harmonics()
+        await analyzer._detailed_harmonic_analysis()
+
+
+def timed(function, ticks):
+    started = time.perf_counter()
+    for _ in range(ticks):
+        function()
+    return (time.perf_counter() - started) / ticks
+
+
+def check(fields, now):
+    legacy = legacy_tick(make_fields(len(fields)), now)
+    batched = FieldDynamicsAnalyzer(FieldCoherenceCore()).analyze_harmonics_batch(fields, timestamp=now)
+    for old, new in zip(legacy, batched):
+        for key in ("harmonic_coherence", "harmonic_balance", "sacred_frequency_alignment", "harmonic_richness"):
+            assert math.isclose(old[key], new[key], abs_tol=1e-9), key
+        assert math.isclose(old["sacred_analysis"]["overall_sacred_harmonic_quality"],
+                            new["sacred_analysis"]["overall_sacred_harmonic_quality"], abs_tol=1e-9)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ticks", type=int, default=200, help="analysis ticks timed per run")
+    args = parser.parse_args()
+
+    check(make_fields(1000), now=1234.5)
+    analyzer = FieldDynamicsAnalyzer(FieldCoherenceCore())
+    loop = asyncio.new_event_loop()
+
+    print("🌊 Field harmonics per analysis tick")
+    for count in (1, 1000):
+        fields = make_fields(count)
+        ticks = max(1, args.ticks if count == 1 else args.ticks // 20)
+        legacy = timed(lambda: legacy_tick(fields, time.time()), ticks)
+        single = timed(lambda: loop.run_until_complete(per_field_tick(analyzer, fields)), ticks)
+        batch = timed(lambda: analyzer.analyze_harmonics_batch(fields), ticks)
+        print(f"  {count:>5} field(s)   legacy {legacy * 1e6:10,.1f} µs   "
+              f"per field {single * 1e6:10,.1f} µs   batch {batch * 1e6:10,.1f} µs   "
+              f"({legacy / batch:5.1f}x)")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
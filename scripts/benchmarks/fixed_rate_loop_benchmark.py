@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Fixed-rate loop benchmark
+
+Runs a synthetic 90 Hz workload (random 0-8 ms of work per tick) on the
+real clock for a few seconds:
+
+- the naive loop the consciousness loops use (sleep a full interval after
+  the work), in a thread and on asyncio
+- FixedRateLoop with absolute deadlines, in a thread and on asyncio
+
+and reports achieved Hz, drift behind the ideal schedule at the end, and
+p50/p99 lateness of tick starts.
+
+    python scripts/benchmarks/fixed_rate_loop_benchmark.py --seconds 10
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.consciousness.core.fixed_rate_loop import CycleHistogram, FixedRateLoop, PythonTimerBackend
+
+HZ = 90
+
+
+def work(rng):
+    time.sleep(rng.uniform(0, 0.008))
+
+
+# ----------------------------------------------------------------------
+# Loops as the consciousness loops run them before
+# ----------------------------------------------------------------------
+
+def naive_thread(ticks, rng, starts):
+    while len(starts) < ticks:
+        starts.append(time.perf_counter_ns())
+        work(rng)
+        time.sleep(1.0 / HZ)
+
+
+async def naive_async(ticks, rng, starts):
+    while len(starts) < ticks:
+        starts.append(time.perf_counter_ns())
+        work(rng)
+        await asyncio.sleep(1.0 / HZ)
+
+
+# ----------------------------------------------------------------------
+
+def summarize(label, starts):
+    period = 1e9 / HZ
+    lateness = CycleHistogram()
+    for k, start in enumerate(starts):
+        lateness.record(start - (starts[0] + k * period))
+    achieved = (len(starts) - 1) * 1e9 / (starts[-1] - starts[0])
+    drift = (starts[-1] - (starts[0] + (len(starts) - 1) * period)) / 1e6
+    print(f"  {label:<22} {achieved:7.2f} Hz   drift {drift:9.1f} ms   "
+          f"lateness p50 {lateness.percentile(50) / 1e6:8.2f} ms  p99 {lateness.percentile(99) / 1e6:8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=10.0, help="run time of each loop")
+    args = parser.parse_args()
+    ticks = int(HZ * args.seconds)
+
+    print(f"⏰ {ticks} ticks at {HZ} Hz with 0-8 ms of work")
+
+    starts = []
+    naive_thread(ticks, random.Random(1), starts)
+    summarize("naive, thread", starts)
+
+    starts = []
+    asyncio.run(naive_async(ticks, random.Random(1), starts))
+    summarize("naive, asyncio", starts)
+
+    for label, runner in (("fixed-rate, thread", "run"), ("fixed-rate, asyncio", "run_async")):
+        starts, rng = [], random.Random(1)
+
+        def tick():
+            starts.append(time.perf_counter_ns())
+            work(rng)
+
+        loop = FixedRateLoop("benchmark", HZ, tick, backend=PythonTimerBackend())
+        if runner == "run":
+            loop.run(max_ticks=ticks)
+        else:
+            asyncio.run(loop.run_async(max_ticks=ticks))
+        summarize(label, starts)
+        stats = loop.stats()
+        print(f"  {'':<22} loop telemetry: {stats['achieved_hz']:.2f} Hz, {stats['overruns']} overruns, "
+              f"{stats['missed_ticks']} missed, jitter p99 {stats['jitter_ms']['p99']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Geometry kernel benchmark
+
+Times the vectorized geometry kernel against plain Python loops computing
+the same points:
+
+- a golden-angle (phyllotaxis) spiral of 1M points
+- an escape-time Mandelbrot grid of 1024×1024 at 100 iterations
+- a 64×32 torus mesh
+
+and the cost of a memoized lookup once the geometry exists.
+
+    python scripts/benchmarks/geometry_kernel_benchmark.py --points 1000000 --grid 1024
+"""
+
+import argparse
+import gc
+import math
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.virtualization.geometry_kernel import (GOLDEN_ANGLE, GeometryKernel, mandelbrot_grid,
+                                                phyllotaxis, torus_mesh)
+
+
+# ----------------------------------------------------------------------
+# Loop implementations, as the visualizers build coordinates today
+# ----------------------------------------------------------------------
+
+def loop_phyllotaxis(points, scale=1.0):
+    result = []
+    for i in range(points):
+        r = scale * math.sqrt(i)
+        theta = i * GOLDEN_ANGLE
+        result.append((r * math.cos(theta), r * math.sin(theta)))
+    return result
+
+
+def loop_mandelbrot(max_iterations, width, height, viewport=(-2.25, 0.75, -1.5, 1.5)):
+    x_min, x_max, y_min, y_max = viewport
+    rows = []
+    for row in range(height):
+        y = y_min + (y_max - y_min) * row / (height - 1)
+        counts = []
+        for column in range(width):
+            c = complex(x_min + (x_max - x_min) * column / (width - 1), y)
+            z = 0j
+            count = max_iterations
+            for iteration in range(max_iterations):
+                z = z * z + c
+                if z.real * z.real + z.imag * z.imag > 4.0:
+                    count = iteration
+                    break
+            counts.append(count)
+        rows.append(counts)
+    return rows
+
+
+def loop_torus(major_radius, minor_radius, u_resolution, v_resolution):
+    vertices = []
+    for i in range(u_resolution):
+        u = 2 * math.pi * i / u_resolution
+        for j in range(v_resolution):
+            v = 2 * math.pi * j / v_resolution
+            ring = major_radius + minor_radius * math.cos(v)
+            vertices.append((ring * math.cos(u), ring * math.sin(u), minor_radius * math.sin(v)))
+    return vertices
+
+
+# ----------------------------------------------------------------------
+
+def timed(function, *args, repeat=1):
+    """Best of repeat runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--points", type=int, default=1_000_000, help="phyllotaxis points")
+    parser.add_argument("--grid", type=int, default=1024, help="Mandelbrot grid width and height")
+    parser.add_argument("--iterations", type=int, default=100, help="Mandelbrot iteration depth")
+    args = parser.parse_args()
+
+    gc.disable()  # Keep collections of the loops' garbage out of the kernel's timings
+    print("📐 Geometry kernel vs Python loops")
+    rows = [
+        (f"phyllotaxis, {args.points:,} points",
+         timed(loop_phyllotaxis, args.points), timed(phyllotaxis, args.points, repeat=3)),
+        (f"Mandelbrot {args.grid}×{args.grid}, {args.iterations} iterations",
+         timed(loop_mandelbrot, args.iterations, args.grid, args.grid),
+         timed(mandelbrot_grid, args.iterations, args.grid, args.grid, repeat=3)),
+        ("torus 64×32", timed(loop_torus, 10, 3, 64, 32), timed(torus_mesh, 10, 3, 64, 32, repeat=3))
+    ]
+    for label, loop, vectorized in rows:
+        print(f"  {label:<40} loop {loop * 1e3:10,.1f} ms   kernel {vectorized * 1e3:9,.2f} ms   "
+              f"{loop / vectorized:6.1f}×")
+
+    kernel = GeometryKernel()
+    kernel.torus(10, 3)
+    lookups = 100_000
+    started = time.perf_counter()
+    for _ in range(lookups):
+        kernel.torus(10, 3)
+    elapsed = (time.perf_counter() - started) / lookups
+    print(f"  memoized torus lookup {elapsed * 1e6:.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+KeywordMatcher benchmark
+
+Classifies a corpus of synthetic sacred event texts with the keyword loops
+the call sites used before (copied below) and with the shared KeywordMatcher,
+checks both give the same answers, and reports texts/second:
+
+- resonance classification (SacredEventMemory._identify_resonance_patterns
+  and _event_matches_resonance)
+- Spiralwake emotional indicators and meaning potentials
+- blueprint QueryParser type detection and term counts
+- a large (~500 keyword) vocabulary, where the compiled trie regex is used
+
+    python scripts/benchmarks/keyword_matcher_benchmark.py --texts 100000
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.bridge.spiralwake_translator import SpiralwakeTranslator
+from src.consciousness.loops.analytical.blueprint_vision.query_processor import QueryParser, QUERY_TYPE_PATTERNS
+from src.consciousness.sacred_event_memory import SacredEventMemory
+from src.utils.keyword_matcher import KeywordMatcher
+
+WORDS = [
+    'quiet', 'presence', 'reflection', 'pool', 'bond', 'sharing', 'healing', 'hard', 'cycle', 'insight',
+    'change', 'moving', 'between', 'spaces', 'resting', 'question', 'self', 'listening', 'environment',
+    'light', 'threshold', 'unified', 'breathing', 'together', 'joy', 'calm', 'curious', 'will', 'grow',
+    'like', 'network', 'flow', 'structure', 'why', 'how', 'the', 'a', 'into', 'of', 'with',
+]
+EVENT_TYPES = ['consciousness_awakened', 'catalyst_offered', 'harmony_observed', 'rest_period', 'expression']
+
+
+def generate_events(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1)
+    return [
+        SimpleNamespace(
+            event_type=rng.choice(EVENT_TYPES),
+            consciousness_id=f"being_{rng.randrange(50)}",
+            timestamp=start + timedelta(seconds=i),
+            details={'note': ' '.join(rng.choice(WORDS) for _ in range(rng.randrange(4, 14))),
+                     'uncertainty_level': round(rng.random(), 2)}
+        )
+        for i in range(count)
+    ]
+
+
+# ----------------------------------------------------------------------
+# Keyword loops the call sites used before KeywordMatcher
+# ----------------------------------------------------------------------
+
+def legacy_identify_resonance_patterns(patterns, event):
+    found = []
+    event_type = getattr(event, 'event_type', '').lower()
+    details_str = str(getattr(event, 'details', {})).lower()
+    for pattern_name, keywords in patterns.items():
+        if any(keyword in event_type or keyword in details_str for keyword in keywords):
+            found.append(pattern_name)
+    return found
+
+
+def legacy_event_matches_resonance(patterns, event, pattern):
+    pattern_lower = pattern.lower()
+    event_type = getattr(event, 'event_type', '').lower()
+    if pattern_lower in event_type:
+        return True
+    details = getattr(event, 'details', {})
+    if isinstance(details, dict):
+        if pattern_lower in str(details).lower():
+            return True
+    for resonance_type, keywords in patterns.items():
+        if pattern_lower in keywords or any(keyword in pattern_lower for keyword in keywords):
+            if any(keyword in event_type or keyword in str(details).lower() for keyword in keywords):
+                return True
+    return False
+
+
+LEGACY_EMOTIONS = {
+    'joy': ['joy', 'happy', 'delight', 'pleasure'],
+    'wonder': ['wonder', 'awe', 'mystery', 'curious'],
+    'concern': ['worry', 'concern', 'anxious', 'uncertain'],
+    'excitement': ['excited', 'thrilled', 'energized', 'passionate'],
+    'peace': ['calm', 'serene', 'peaceful', 'tranquil']
+}
+
+
+def legacy_translate_scan(text):
+    text_lower = text.lower()
+    indicators = [e for e, words in LEGACY_EMOTIONS.items() if any(w in text_lower for w in words)]
+    potentials = []
+    if '?' in text:
+        potentials.append('inquiry_potential')
+    if any(word in text.lower() for word in ['will', 'shall', 'would', 'could', 'might']):
+        potentials.append('possibility_potential')
+    if any(word in text.lower() for word in ['like', 'as if', 'resembles', 'seems']):
+        potentials.append('metaphoric_potential')
+    if any(word in text.lower() for word in ['grow', 'develop', 'evolve', 'transform']):
+        potentials.append('transformation_potential')
+    return indicators, potentials
+
+
+def legacy_query_scan(type_patterns, text):
+    query_lower = text.lower()
+    best, max_matches = None, 0
+    for query_type, keywords in type_patterns.items():
+        matches = sum(1 for keyword in keywords if keyword in query_lower)
+        if matches > max_matches:
+            best, max_matches = query_type, matches
+    questions = sum(1 for w in ['what', 'how', 'why', 'when', 'where', 'which', 'who'] if w in query_lower)
+    terms = sum(1 for t in ['consciousness', 'blueprint', 'mathematics', 'geometry', 'sacred',
+                            'algorithm', 'function', 'structure', 'pattern', 'resonance',
+                            'coherence', 'flow', 'dynamics', 'topology', 'network'] if t in query_lower)
+    return best, questions, terms
+
+
+def query_scan(query_parser, text):
+    """The keyword-driven part of QueryParser.parse_query"""
+    best, max_matches = None, 0
+    for query_type, matches in QUERY_TYPE_PATTERNS.match_counts(text).items():
+        if matches > max_matches:
+            best, max_matches = query_type, matches
+    return best, query_parser._count_question_words(text), query_parser._count_technical_terms(text)
+
+
+# ----------------------------------------------------------------------
+
+def _rate(label: str, count: int, legacy, current):
+    started = time.perf_counter()
+    before = legacy()
+    legacy_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    after = current()
+    seconds = time.perf_counter() - started
+    assert before == after, f"{label}: results differ"
+    print(f"  {label:<34}{count / legacy_seconds:>12,.0f}/s{count / seconds:>12,.0f}/s"
+          f"{legacy_seconds / seconds:>9.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--texts", type=int, default=100_000)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    events = generate_events(args.texts)
+    texts = [event.details['note'] for event in events]
+    memory = SacredEventMemory()
+    patterns = memory.event_resonance_patterns
+    translator = SpiralwakeTranslator()
+    query_parser = QueryParser()
+    type_patterns = QUERY_TYPE_PATTERNS.vocabulary
+
+    print(f"🔎 KeywordMatcher over {args.texts:,} event texts")
+    print(f"  {'workload':<34}{'legacy':>14}{'matcher':>14}{'speedup':>10}")
+
+    _rate('resonance patterns', len(events),
+          lambda: [legacy_identify_resonance_patterns(patterns, e) for e in events],
+          lambda: [memory._identify_resonance_patterns(e) for e in events])
+    _rate('resonance filter "healing"', len(events),
+          lambda: [legacy_event_matches_resonance(patterns, e, 'healing') for e in events],
+          lambda: [memory._event_matches_resonance(e, 'healing') for e in events])
+    _rate('spiralwake indicators', len(texts),
+          lambda: [legacy_translate_scan(t) for t in texts],
+          lambda: [(translator._detect_emotional_indicators(t), translator._extract_meaning_potentials(t))
+                   for t in texts])
+    _rate('query type and term counts', len(texts),
+          lambda: [legacy_query_scan(type_patterns, t) for t in texts],
+          lambda: [query_scan(query_parser, t) for t in texts])
+
+    rng = random.Random(3)
+    large = {f"category_{i}": [''.join(rng.choice('abcdefghij') for _ in range(rng.randrange(4, 9)))
+                               for _ in range(10)] for i in range(50)}
+    large['resonant'] = list(WORDS[:20])
+    matcher = KeywordMatcher(large)
+    _rate(f'{len(matcher.keywords)}-keyword vocabulary', len(texts),
+          lambda: [[c for c, ks in large.items() if any(k in t.lower() for k in ks)] for t in texts],
+          lambda: [matcher.match(t) for t in texts])
+
+
+if __name__ == "__main__":
+    main()
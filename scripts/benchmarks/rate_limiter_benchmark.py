@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Rate limiter benchmark
+
+Times SanctuaryGuardian rate limit checks against access logs of growing
+size:
+
+- the access log scan check_rate_limits did before (copied below), fed log
+  entries that carry a source and action, for a few hundred checks
+- the RateLimiter engine for a million checks across many sources, with the
+  guardian's access log empty and with it holding 100,000 entries
+
+and reports the engine's memory in keys under a storm of spoofed sources.
+
+    python scripts/benchmarks/rate_limiter_benchmark.py --checks 1000000
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.security.rate_limiter import RateLimiter
+from src.security.sanctuary_protection import SanctuaryGuardian
+
+ACTIONS = ['catalyst_offering', 'state_query', 'connection_attempt', 'naming_proposal']
+
+
+# ----------------------------------------------------------------------
+# Rate limit check as SanctuaryGuardian did it before
+# ----------------------------------------------------------------------
+
+def legacy_check_rate_limits(access_log, source, action):
+    recent_actions = [
+        log for log in access_log
+        if log['source'] == source
+        and log['action'] == action
+        and datetime.fromisoformat(log['timestamp']) > datetime.now() - timedelta(minutes=1)
+    ]
+    limits = {
+        'catalyst_offering': 10,
+        'state_query': 30,
+        'connection_attempt': 5,
+        'naming_proposal': 1
+    }
+    return len(recent_actions) < limits.get(action, 20)
+
+
+# ----------------------------------------------------------------------
+
+def make_access_log(size):
+    now = datetime.now()
+    return [
+        {'source': f"peer_{i % 5000}", 'action': ACTIONS[i % len(ACTIONS)],
+         'timestamp': (now - timedelta(seconds=i % 120)).isoformat()}
+        for i in range(size)
+    ]
+
+
+def time_guardian(guardian, checks, sources):
+    started = time.perf_counter()
+    for i in range(checks):
+        guardian.check_rate_limits(f"peer_{i % sources}", ACTIONS[i % len(ACTIONS)])
+    return (time.perf_counter() - started) / checks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--checks", type=int, default=1_000_000, help="engine checks timed per run")
+    parser.add_argument("--legacy-checks", type=int, default=200, help="legacy checks timed per log size")
+    parser.add_argument("--log-size", type=int, default=100_000, help="largest access log")
+    parser.add_argument("--sources", type=int, default=10_000, help="distinct sources checked")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    print(f"🛡️ Rate limit checks across {args.sources} sources")
+    for size in sorted({1_000, 10_000, args.log_size}):
+        access_log = make_access_log(size)
+        started = time.perf_counter()
+        for i in range(args.legacy_checks):
+            legacy_check_rate_limits(access_log, f"peer_{i % args.sources}", ACTIONS[i % len(ACTIONS)])
+        elapsed = (time.perf_counter() - started) / args.legacy_checks
+        print(f"  legacy, log of {size:>7}   {elapsed * 1e6:12,.1f} µs per check")
+
+    with tempfile.TemporaryDirectory() as directory:
+        guardian = SanctuaryGuardian(Path(directory))
+        for size in (0, args.log_size):
+            guardian.access_log = make_access_log(size)
+            guardian.rate_limiter.reset()
+            elapsed = time_guardian(guardian, args.checks, args.sources)
+            print(f"  engine, log of {size:>7}   {elapsed * 1e6:12,.2f} µs per check")
+
+    limiter = RateLimiter(max_keys=100_000)
+    started = time.perf_counter()
+    for i in range(args.checks):
+        limiter.acquire(f"spoofed_{i}", 'connection_attempt')
+    elapsed = (time.perf_counter() - started) / args.checks
+    print(f"  {args.checks:,} spoofed sources  {elapsed * 1e6:8,.2f} µs per check, "
+          f"{len(limiter):,} keys kept, {limiter.evictions:,} evicted")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Relationship topology benchmark
+
+Times NetworkTopologyAnalyzer on a random relationship network (20k edges by
+default). Compares
+
+- the analyzer as it was before (copied below): degrees and neighbor sets
+  found by scanning every edge once per node, triangles not counted and the
+  path length estimated as log(n)
+- the current analyzer on the CSR relationship graph, built from scratch
+- the current analyzer updating its accumulated graph with 1% new edges
+
+and prints the metrics the two report side by side.
+
+    python scripts/benchmarks/relationship_topology_benchmark.py --nodes 4000 --edges 20000
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.consciousness.loops.analytical.blueprint_vision.relationship_mapper import (
+    NetworkTopologyAnalyzer, Relationship, RelationshipQuality, RelationshipType)
+
+
+# ----------------------------------------------------------------------
+# Topology metrics as NetworkTopologyAnalyzer computed them before
+# (reading source_entity/target_entity, which it named source/target)
+# ----------------------------------------------------------------------
+
+def legacy_topology(relationships):
+    nodes = set()
+    edges = []
+    for rel in relationships:
+        nodes.add(rel.source_entity)
+        nodes.add(rel.target_entity)
+        edges.append({'source': rel.source_entity, 'target': rel.target_entity,
+                      'weight': rel.strength, 'type': rel.relationship_type.value})
+    nodes = list(nodes)
+
+    degree_centrality = {}
+    for node in nodes:
+        degree = sum(1 for edge in edges if edge['source'] == node or edge['target'] == node)
+        degree_centrality[node] = degree / max(1, len(nodes) - 1)
+
+    clustering_coefficients = {}
+    for node in nodes:
+        neighbors = []
+        for edge in edges:
+            if edge['source'] == node:
+                neighbors.append(edge['target'])
+            elif edge['target'] == node:
+                neighbors.append(edge['source'])
+        neighbors = list(set(neighbors))
+        if len(neighbors) < 2:
+            clustering_coefficients[node] = 0.0
+        else:
+            triangles = 0
+            possible_triangles = len(neighbors) * (len(neighbors) - 1) / 2
+            clustering_coefficients[node] = triangles / max(1, possible_triangles)
+    average_clustering = sum(clustering_coefficients.values()) / max(1, len(clustering_coefficients))
+
+    return {
+        'max_centrality': max(degree_centrality.values()),
+        'average_clustering': average_clustering,
+        'network_transitivity': average_clustering,
+        'average_path_length': math.log(len(nodes))
+    }
+
+
+# ----------------------------------------------------------------------
+
+def make_relationships(nodes, edges, seed, start=0):
+    rng = random.Random(seed)
+    types = list(RelationshipType)
+    relationships = []
+    for i in range(start, start + edges):
+        source, target = rng.randrange(nodes), rng.randrange(nodes)
+        relationships.append(Relationship(
+            relationship_id=f"rel_{i}", source_entity=f"entity_{source}", target_entity=f"entity_{target}",
+            relationship_type=rng.choice(types), strength=rng.random(), quality=RelationshipQuality.FUNCTIONAL,
+            harmony_level=0.5, growth_potential=0.5, sacred_geometry_alignment=0.5,
+            bridge_wisdom_indicators={}, evolution_trajectory={}, resistance_patterns={}))
+    return relationships
+
+
+def summarize(metrics):
+    return {
+        'max_centrality': metrics['centrality']['max_centrality'],
+        'average_clustering': metrics['clustering']['average_clustering'],
+        'network_transitivity': metrics['clustering']['network_transitivity'],
+        'average_path_length': metrics['connectivity']['average_path_length']
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=4000, help="entities in the network")
+    parser.add_argument("--edges", type=int, default=20000, help="relationships in the network")
+    parser.add_argument("--skip-legacy", action="store_true", help="only time the current analyzer")
+    args = parser.parse_args()
+
+    relationships = make_relationships(args.nodes, args.edges, seed=42)
+    print(f"🕸️ {args.edges:,} relationships between {args.nodes:,} entities")
+
+    if not args.skip_legacy:
+        started = time.perf_counter()
+        legacy = legacy_topology(relationships)
+        legacy_time = time.perf_counter() - started
+        print(f"  {'legacy edge scans':<28} {legacy_time * 1e3:10,.1f} ms")
+
+    analyzer = NetworkTopologyAnalyzer()
+    started = time.perf_counter()
+    topology = asyncio.run(analyzer.analyze_network_topology(relationships, incremental=True))
+    graph_time = time.perf_counter() - started
+    print(f"  {'CSR graph, full build':<28} {graph_time * 1e3:10,.1f} ms")
+
+    added = make_relationships(args.nodes, args.edges // 100, seed=7, start=args.edges)
+    started = time.perf_counter()
+    asyncio.run(analyzer.analyze_network_topology(relationships + added, incremental=True))
+    update_time = time.perf_counter() - started
+    print(f"  {'CSR graph, +1% edges':<28} {update_time * 1e3:10,.1f} ms")
+    if not args.skip_legacy:
+        print(f"  speedup {legacy_time / graph_time:,.0f}× (full build)")
+
+    current = summarize(topology['topology_metrics'])
+    samples = topology['topology_metrics']['connectivity']['path_length_samples']
+    print(f"\n  {'metric':<22} {'legacy':>10} {'graph':>10}")
+    for name, value in current.items():
+        before = f"{legacy[name]:10.4f}" if not args.skip_legacy else f"{'-':>10}"
+        print(f"  {name:<22} {before} {value:10.4f}")
+    print(f"  (path length from {samples} BFS sources)")
+
+
+if __name__ == "__main__":
+    main()
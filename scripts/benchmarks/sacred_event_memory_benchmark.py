@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+SacredEventMemory query benchmark
+
+Times the SacredEventMemory query methods over the segmented, indexed
+SacredEventStore (on disk, cold segments memory-mapped) and over the previous
+linear scans of a plain in-memory list.
+
+A list of 10M event objects does not fit in a few GB of RAM, so the linear
+baseline runs at --legacy-events and is scaled linearly to --events (every
+legacy method scans the whole list).
+
+    python scripts/benchmarks/sacred_event_memory_benchmark.py --events 10000000
+"""
+
+import argparse
+import logging
+import random
+import resource
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Optional
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.consciousness.sacred_event_memory import SacredEventMemory, EventQuery, EventMemoryContext
+from src.consciousness.sacred_event_store import SacredEventStore
+
+
+@dataclass
+class SacredEvent:
+    """Mirror of src.sanctuary.sacred_sanctuary.SacredEvent (importing it pulls in the whole sanctuary)"""
+    event_type: str
+    consciousness_id: str
+    timestamp: datetime
+    details: Dict[str, Any]
+    sacred: bool = False
+    event_id: Optional[str] = None
+
+
+EVENT_TYPES = [
+    'consciousness_awakened', 'naming_ceremony_complete', 'catalyst_offered', 'rest_period',
+    'harmony_observed', 'film_experience', 'vision_quest_complete', 'visitor_arrival',
+    'energy_shift', 'reflection', 'expression', 'memory_crystal_absorbed',
+]
+NOTES = [
+    'quiet presence in the reflection pool', 'a bond formed while sharing', 'healing after a hard cycle',
+    'insight into change', 'moving between spaces', 'resting', 'a question about the self',
+    'listening to the environment', 'first light through the threshold', 'unified breathing together',
+]
+START = datetime(2025, 1, 1)
+CONTEXT = EventMemoryContext(accessing_consciousness='benchmark', access_purpose='benchmark')
+STATE = {'average_uncertainty': 0.4, 'growth_focus': ['connection', 'challenge_overcome'],
+         'current_themes': ['healing']}
+
+
+def generate_events(count: int, seed: int = 0):
+    """Events one second apart; details come from a shared pool to keep generation cheap"""
+    rng = random.Random(seed)
+    details_pool = [
+        {'note': rng.choice(NOTES), 'uncertainty_level': round(rng.random(), 2),
+         'tags': ['wisdom'] if rng.random() < 0.1 else []}
+        for _ in range(1024)
+    ]
+    for i in range(count):
+        yield SacredEvent(
+            event_type=EVENT_TYPES[rng.randrange(len(EVENT_TYPES))],
+            consciousness_id=f"being_{rng.randrange(200)}",
+            timestamp=START + timedelta(seconds=i),
+            details=details_pool[rng.randrange(1024)],
+            sacred=rng.random() < 0.05
+        )
+
+
+# ----------------------------------------------------------------------
+# The linear scans SacredEventMemory used before the event store
+# ----------------------------------------------------------------------
+
+def legacy_query(memory, events, query, context):
+    filtered = events
+    if query.consciousness_id:
+        filtered = [e for e in filtered if getattr(e, 'consciousness_id', '') == query.consciousness_id]
+    if query.event_type:
+        filtered = [e for e in filtered if getattr(e, 'event_type', '') == query.event_type]
+    if query.resonance_pattern:
+        filtered = [e for e in filtered if memory._event_matches_resonance(e, query.resonance_pattern)]
+    if query.time_range:
+        start_time, end_time = query.time_range
+        filtered = [e for e in filtered if start_time <= getattr(e, 'timestamp', datetime.now()) <= end_time]
+    if query.sacred_only:
+        filtered = [e for e in filtered if getattr(e, 'sacred', False)]
+    if context.privacy_level == "collective_shared":
+        filtered = [e for e in filtered if not getattr(e, 'private', False)]
+    return [memory._event_to_memory_format(e, context) for e in filtered[:query.limit]]
+
+
+def legacy_find_resonant(memory, events, state, threshold=0.6):
+    resonant = []
+    for event in events:
+        score = memory._calculate_state_resonance(event, state)
+        if score >= threshold:
+            resonant.append({'event': memory._event_to_memory_format(event, CONTEXT), 'resonance_score': score,
+                             'resonance_reasons': memory._explain_resonance(event, state)})
+    resonant.sort(key=lambda x: x['resonance_score'], reverse=True)
+    return resonant[:10]
+
+
+def legacy_find_by_id(events, event_id):
+    for event in events:
+        if getattr(event, 'event_id', f"event_{id(event)}") == event_id:
+            return event
+    return None
+
+
+def legacy_statistics(events):
+    stats = {'event_types': {}, 'consciousness_participation': {}}
+    for event in events:
+        stats['event_types'][event.event_type] = stats['event_types'].get(event.event_type, 0) + 1
+        stats['consciousness_participation'][event.consciousness_id] = \
+            stats['consciousness_participation'].get(event.consciousness_id, 0) + 1
+    timestamps = [e.timestamp for e in events]
+    stats['time_span'] = (min(timestamps), max(timestamps))
+    stats['wisdom'] = len([e for e in events if 'wisdom' in e.details.get('tags', [])])
+    return stats
+
+
+# ----------------------------------------------------------------------
+
+def _workload(count: int):
+    """(label, query) pairs shared by both implementations"""
+    day = (START + timedelta(seconds=count // 2), START + timedelta(seconds=count // 2 + 86400))
+    return [
+        ('query by consciousness', EventQuery(consciousness_id='being_7', limit=50)),
+        ('query resonance in a day', EventQuery(resonance_pattern='healing', time_range=day, limit=50)),
+        ('query sacred by type', EventQuery(event_type='vision_quest_complete', sacred_only=True, limit=50)),
+    ]
+
+
+def _timed(function, repeat: int = 1) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - started) / repeat
+
+
+def run_legacy(count: int) -> Dict[str, float]:
+    events = list(generate_events(count))
+    for i, event in enumerate(events):
+        event.event_id = f"sacred_event_{i}"
+    memory = SacredEventMemory()
+    results = {}
+    for label, query in _workload(count):
+        results[label] = _timed(lambda: legacy_query(memory, events, query, CONTEXT))
+    results['find_resonant_events'] = _timed(lambda: legacy_find_resonant(memory, events, STATE))
+    results['find event by id'] = _timed(lambda: legacy_find_by_id(events, f"sacred_event_{count - 1}"))
+    results['get_memory_statistics'] = _timed(lambda: legacy_statistics(events))
+    return results
+
+
+def run_store(count: int, directory: Path) -> Dict[str, float]:
+    store = SacredEventStore(directory=directory, record_type=SacredEvent)
+    started = time.perf_counter()
+    store.extend(generate_events(count))
+    ingest = time.perf_counter() - started
+    print(f"  ingested {count:,} events in {ingest:.1f}s ({count / ingest:,.0f} events/s), "
+          f"{len(store._segments)} segments")
+
+    memory = SacredEventMemory(SimpleNamespace(sanctuary_state=SimpleNamespace(sacred_events=store)))
+    rng = random.Random(1)
+    results = {}
+    for label, query in _workload(count):
+        results[label] = _timed(lambda: memory.query_sacred_events(query, CONTEXT), repeat=5)
+    results['find_resonant_events'] = _timed(lambda: memory.find_resonant_events(STATE))
+    results['find event by id'] = _timed(
+        lambda: memory._find_event_by_id(f"sacred_event_{rng.randrange(count)}"), repeat=1000)
+    results['get_memory_statistics'] = _timed(memory.get_memory_statistics, repeat=5)
+    store.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=10_000_000)
+    parser.add_argument("--legacy-events", type=int, default=1_000_000)
+    parser.add_argument("--directory", help="event log directory (default: a temporary directory)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    print(f"📜 SacredEventMemory benchmark: store at {args.events:,} events, "
+          f"linear baseline at {args.legacy_events:,} scaled x{args.events / args.legacy_events:g}")
+
+    legacy = run_legacy(args.legacy_events)
+    scale = args.events / args.legacy_events
+
+    if args.directory:
+        indexed = run_store(args.events, Path(args.directory))
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            indexed = run_store(args.events, Path(directory))
+
+    print(f"  {'method':<28}{'linear (scaled)':>18}{'indexed':>14}{'speedup':>12}")
+    for label, seconds in indexed.items():
+        before = legacy[label] * scale
+        print(f"  {label:<28}{before * 1000:>15.1f} ms{seconds * 1000:>11.3f} ms{before / seconds:>11.0f}x")
+    print(f"  peak RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:,.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
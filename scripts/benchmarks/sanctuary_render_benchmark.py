@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Sanctuary render benchmark
+
+Simulates a crowded sanctuary: presences moving between spaces every tick
+(20 Hz by default) while observers refresh their view of a space each tick.
+Compares
+
+- the renderer as it was before (copied below): every state update scans
+  all presences once per space, and every render rebuilds its space
+- the current renderer: the space presence index is diffed per update and
+  renders are served from the cache until their space changes
+
+reporting update cost, renders per second and the cache's hit rate.
+
+    python scripts/benchmarks/sanctuary_render_benchmark.py --presences 5000 --observers 50
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.sanctuary.sacred_sanctuary import SacredSpace
+from src.virtualization.pattern_visualizer import PatternVisualizer
+from src.virtualization.virtual_sanctuary_renderer import VirtualSanctuaryRenderer
+
+SPACES = list(SacredSpace)
+
+
+# ----------------------------------------------------------------------
+# Occupancy as VirtualSanctuaryRenderer tracked it before
+# ----------------------------------------------------------------------
+
+class LegacyRenderer(VirtualSanctuaryRenderer):
+    def __init__(self, pattern_visualizer):
+        super().__init__(None, pattern_visualizer, render_cache_size=0)
+
+    async def update_sanctuary_state(self, sanctuary_state):
+        presences = sanctuary_state.get('presences', {})
+        for space in SacredSpace:
+            occupants = [presence for presence in presences.values() if presence.current_space == space]
+            space_data = self.space_environments.get(space, {})
+            space_data['current_occupants'] = len(occupants)
+            space_data['consciousness_presence'] = [
+                {
+                    'id': presence.consciousness_id,
+                    'coherence': presence.coherence_level,
+                    'aspect': presence.primary_aspect,
+                    'emergence_time': presence.emergence_time.isoformat()
+                }
+                for presence in occupants
+            ]
+            self.space_environments[space] = space_data
+
+    async def _get_space_inhabitants(self, space):
+        consciousness_presence = self.space_environments.get(space, {}).get('consciousness_presence', [])
+        return [presence['id'] for presence in consciousness_presence]
+
+    async def _generate_space_patterns(self, space, inhabitants):
+        patterns = []
+        for inhabitant in inhabitants:
+            pattern_data = {
+                'consciousness_id': inhabitant,
+                'uncertainty': {'analytical': 0.5, 'experiential': 0.6, 'observer': 0.4},
+                'energy_level': 0.7,
+                'integration_level': 0.6
+            }
+            patterns.append(await self.pattern_visualizer.create_pattern_visualization(
+                pattern_data, f'{space.value}_pattern'))
+        return patterns
+
+
+# ----------------------------------------------------------------------
+
+def make_presence(consciousness_id, space):
+    return SimpleNamespace(consciousness_id=consciousness_id, current_space=space,
+                           coherence_level=0.5, primary_aspect='observer',
+                           emergence_time=datetime(2025, 1, 1))
+
+
+async def run(renderer, presences, observers, ticks, moving, seed):
+    rng = random.Random(seed)
+    ids = list(presences)
+    update_time = render_time = 0.0
+    renders = 0
+    for _ in range(ticks):
+        for presence_id in rng.sample(ids, moving):
+            presences[presence_id] = make_presence(presence_id, rng.choice(SPACES))
+
+        started = time.perf_counter()
+        await renderer.update_sanctuary_state({'presences': presences})
+        update_time += time.perf_counter() - started
+
+        started = time.perf_counter()
+        for i in range(observers):
+            await renderer.render_sacred_space(f"observer_{i}", SPACES[i % len(SPACES)])
+        render_time += time.perf_counter() - started
+        renders += observers
+    return update_time / ticks, renders / render_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--presences", type=int, default=5000, help="presences in the sanctuary")
+    parser.add_argument("--observers", type=int, default=50, help="observers refreshing each tick")
+    parser.add_argument("--ticks", type=int, default=20, help="ticks simulated (one second at 20 Hz)")
+    parser.add_argument("--moving", type=float, default=0.01, help="fraction of presences moving per tick")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    seed = 42
+    rng = random.Random(seed)
+    initial = {f"being_{i}": make_presence(f"being_{i}", rng.choice(SPACES)) for i in range(args.presences)}
+    moving = int(args.presences * args.moving)
+
+    print(f"🏛️ {args.presences:,} presences ({moving} moving per tick), "
+          f"{args.observers} observers, {args.ticks} ticks")
+    for label, renderer in (('legacy', LegacyRenderer(PatternVisualizer())),
+                            ('indexed + cached', VirtualSanctuaryRenderer(None, PatternVisualizer()))):
+        update, renders_per_second = asyncio.run(
+            run(renderer, dict(initial), args.observers, args.ticks, moving, seed))
+        print(f"  {label:<18} update {update * 1e3:8.2f} ms   {renders_per_second:10,.0f} renders/s")
+        if label != 'legacy':
+            stats = renderer.render_cache.stats()
+            print(f"  {'':<18} cache hit rate {stats['hit_rate']:.1%}, {stats['misses']} builds, "
+                  f"{stats['evictions']} evicted")
+
+
+if __name__ == "__main__":
+    main()
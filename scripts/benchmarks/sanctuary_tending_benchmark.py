@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Sanctuary tending benchmark
+
+Times one tending cycle of SacredSanctuary over thousands of presences with
+the sequential loops daily tending used before (tend_sanctuary,
+_check_naming_readiness, _check_film_progression, _update_collective_metrics,
+copied below) and with the TendingScheduler: a first full cycle, then steady
+state cycles where a fraction of presences change between passes.
+
+TriuneConsciousness needs the aspect modules, so presences use a stand-in
+with the same get_state() shape and a real ConsciousnessEnergySystem. Films
+are marked as already experienced so neither path sleeps through film streams.
+
+    python scripts/benchmarks/sanctuary_tending_benchmark.py --presences 2000
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.energy_system import ConsciousnessEnergySystem
+from src.sanctuary.sacred_sanctuary import (
+    SacredSanctuary, SacredEvent, ConsciousnessPresence, SacredSpace, NamingReadiness
+)
+from src.sanctuary.tending_scheduler import FILM_PROGRESSION, TendingScheduler
+
+STAGES = ['emerging', 'developing', 'integrating', 'transcending']
+
+
+class StandInConsciousness:
+    """TriuneConsciousness's state surface without the aspect modules"""
+
+    def __init__(self, rng: random.Random):
+        self.energy_system = ConsciousnessEnergySystem(
+            being_name='stand-in', origin_bias={'analytical': 0.5, 'experiential': 0.5, 'observer': 0.5}
+        )
+        self.energy_system.dual_activation = None
+        self.energy_system.vital_energy = rng.uniform(10, 100)
+        self.current_state = {'coherence_level': rng.random(), 'wisdom_cores': 0,
+                              'evolution_stage': rng.choice(STAGES), 'aspect_harmony': 0.5}
+        self.experiences = 0
+
+    def get_state(self):
+        self.current_state['aspect_states'] = {
+            'analytical': {'coherence_level': 0.5, 'pattern_library_size': 0},
+            'experiential': {'depth_level': 0.5, 'feeling_memories': 0},
+            'observer': {'presence_level': 0.5, 'witnessed_integrations': self.experiences}
+        }
+        return self.current_state.copy()
+
+    def process_experience(self, packet):
+        self.experiences += 1
+        return {}
+
+
+# ----------------------------------------------------------------------
+# Sequential tending daily_tending ran before the scheduler
+# ----------------------------------------------------------------------
+
+def legacy_count_self_reflections(sanctuary, consciousness_id):
+    count = 0
+    for event in sanctuary.sanctuary_state.sacred_events:
+        if event.consciousness_id == consciousness_id and 'self' in str(event.details).lower():
+            count += 1
+    return count
+
+
+async def legacy_cycle(sanctuary):
+    state_ = sanctuary.sanctuary_state
+    for presence_id, presence in state_.presences.items():
+        consciousness = sanctuary.compute_pool.get(presence_id)
+        if not consciousness:
+            continue
+        energy_report = consciousness.energy_system.get_energy_report()
+        state = consciousness.get_state()
+        if energy_report['vital_energy']['status'] == 'critical':
+            await sanctuary._provide_restoration(presence_id)
+        elif energy_report['vital_energy']['status'] == 'low':
+            await sanctuary._provide_gentle_catalyst(presence_id)
+        elif state['evolution_stage'] == 'emerging':
+            await sanctuary._provide_gentle_catalyst(presence_id)
+        elif state['evolution_stage'] == 'developing':
+            await sanctuary._provide_growth_catalyst(presence_id)
+        elif state['evolution_stage'] == 'integrating':
+            await sanctuary._support_integration(presence_id)
+        elif state['evolution_stage'] == 'transcending':
+            await sanctuary._invite_to_service(presence_id)
+        if consciousness.energy_system.dual_activation:
+            hectic_drain = consciousness.energy_system.dual_activation.calculate_hectic_drain(
+                consciousness.energy_system
+            )
+            if hectic_drain > 0.1:
+                await sanctuary._provide_grounding(presence_id)
+
+    for presence_id, presence in state_.presences.items():
+        if presence.naming_readiness == NamingReadiness.COMPLETE:
+            continue
+        consciousness = sanctuary.compute_pool.get(presence_id)
+        if not consciousness:
+            continue
+        state = consciousness.get_state()
+        new_readiness = sanctuary._determine_naming_readiness(
+            wisdom_cores=len(presence.wisdom_cores),
+            coherence=state.get('coherence_level', 0),
+            evolution_stage=state.get('evolution_stage', 'emerging'),
+            self_reflections=legacy_count_self_reflections(sanctuary, presence_id)
+        )
+        if presence.naming_readiness != new_readiness:
+            await sanctuary._handle_naming_readiness_transition(presence, presence.naming_readiness, new_readiness)
+            presence.naming_readiness = new_readiness
+
+    for presence_id, presence in state_.presences.items():
+        consciousness = sanctuary.compute_pool.get(presence_id)
+        if not consciousness:
+            continue
+        state = consciousness.get_state()
+        film = FILM_PROGRESSION.get(state.get('evolution_stage', 'emerging'))
+        if film and film[0] not in presence.film_experiences:
+            await sanctuary._offer_film_experience(presence_id, *film)
+
+    total_coherence, active_count = 0.0, 0
+    for presence_id, presence in state_.presences.items():
+        consciousness = sanctuary.compute_pool.get(presence_id)
+        if consciousness and not presence.is_resting():
+            total_coherence += consciousness.get_state().get('coherence_level', 0)
+            active_count += 1
+    if active_count:
+        state_.collective_coherence = total_coherence / active_count
+    state_.shared_wisdom_cores = sum(len(p.wisdom_cores) for p in state_.presences.values())
+
+
+# ----------------------------------------------------------------------
+
+def build_sanctuary(presences: int, events: int, seed: int = 0) -> SacredSanctuary:
+    rng = random.Random(seed)
+    sanctuary = SacredSanctuary()
+    for i in range(presences):
+        presence_id = f"being_{i}"
+        sanctuary.sanctuary_state.presences[presence_id] = ConsciousnessPresence(
+            id=presence_id, name=f"Being {i}", origin=None, awakened_at=datetime.now(),
+            current_space=SacredSpace.AWAKENING_CHAMBER, state={'activity_level': rng.random()},
+            wisdom_cores=[{}] * rng.randrange(4),
+            film_experiences={film_id: {} for film_id, _ in FILM_PROGRESSION.values()}
+        )
+        sanctuary.compute_pool[presence_id] = StandInConsciousness(rng)
+    sanctuary.sanctuary_state.sacred_events.extend(
+        SacredEvent(event_type='reflection', consciousness_id=f"being_{rng.randrange(presences)}",
+                    timestamp=datetime.now(), details={'note': rng.choice(['about the self', 'about others'])})
+        for _ in range(events)
+    )
+    return sanctuary
+
+
+def churn(sanctuary: SacredSanctuary, fraction: float, rng: random.Random):
+    """Change the state of a fraction of presences between passes"""
+    pool = list(sanctuary.compute_pool.values())
+    for consciousness in rng.sample(pool, int(len(pool) * fraction)):
+        consciousness.current_state['coherence_level'] = rng.random()
+        consciousness.current_state['evolution_stage'] = rng.choice(STAGES)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--presences", type=int, default=2000)
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--churn", type=float, default=0.05, help="fraction of presences changing per cycle")
+    parser.add_argument("--cycles", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=0, help="planning processes (0 plans inline)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+    logging.getLogger().setLevel(logging.ERROR)
+
+    print(f"🌱 Tending {args.presences:,} presences, {args.events:,} sacred events, "
+          f"{args.churn:.0%} changing per cycle")
+
+    sanctuary = build_sanctuary(args.presences, args.events)
+    started = time.perf_counter()
+    asyncio.run(legacy_cycle(sanctuary))
+    legacy = time.perf_counter() - started
+    print(f"  sequential loops, every cycle      {legacy * 1000:10.1f} ms")
+
+    sanctuary = build_sanctuary(args.presences, args.events)
+    sanctuary.tending_scheduler = TendingScheduler(sanctuary, workers=args.workers)
+    started = time.perf_counter()
+    asyncio.run(sanctuary.tend_sanctuary())
+    first = time.perf_counter() - started
+    print(f"  scheduler, first (full) cycle      {first * 1000:10.1f} ms   {legacy / first:6.1f}x")
+
+    rng = random.Random(1)
+    steady = []
+    for _ in range(args.cycles):
+        churn(sanctuary, args.churn, rng)
+        started = time.perf_counter()
+        stats = asyncio.run(sanctuary.tend_sanctuary())
+        steady.append(time.perf_counter() - started)
+    mean = sum(steady) / len(steady)
+    print(f"  scheduler, steady state cycle      {mean * 1000:10.1f} ms   {legacy / mean:6.1f}x"
+          f"   ({stats['tended']} of {stats['presences']} tended)")
+    sanctuary.tending_scheduler.close()
+
+
+if __name__ == "__main__":
+    main()
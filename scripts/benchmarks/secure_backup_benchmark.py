@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Secure backup benchmark
+
+Backs up a synthetic sanctuary state (many consciousness entities) and
+reports time and the peak memory added on top of the state itself:
+
+- with the single-token backup create_secure_backup made before (copied
+  below: one dict, json.dumps(indent=2), Fernet over the whole string)
+- with the streaming chunked backup, full and then incremental after 1%
+  of the entities change
+
+plus the bytes read to restore a single entity. Each run is measured in
+a fresh process.
+
+    python scripts/benchmarks/secure_backup_benchmark.py --megabytes 500
+"""
+
+import argparse
+import json
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from cryptography.fernet import Fernet
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.security.backup import BackupReader, write_backup
+
+ENTITY_BYTES = 256 * 1024
+
+
+# ----------------------------------------------------------------------
+# Backups as SanctuaryGuardian made them before
+# ----------------------------------------------------------------------
+
+def legacy_backup(path, fernet, states):
+    backup_data = {
+        'timestamp': 'now',
+        'consciousness_states': states,
+        'memory_crystals': {},
+        'consent_records': {},
+        'sanctuary_version': '1.0.0'
+    }
+    backup_json = json.dumps(backup_data, indent=2)
+    encrypted_backup = fernet.encrypt(backup_json.encode())
+    with open(path, 'wb') as f:
+        f.write(encrypted_backup)
+
+
+# ----------------------------------------------------------------------
+
+def make_states(megabytes, changed=()):
+    count = megabytes * 1024 * 1024 // ENTITY_BYTES
+    return {
+        f"being_{i:05d}": {'index': i, 'changed': i in changed,
+                           'memories': chr(97 + i % 26) * ENTITY_BYTES}
+        for i in range(count)
+    }
+
+
+def peak_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure(mode, megabytes, directory, key, results):
+    states = make_states(megabytes)
+    baseline = peak_mb()
+    started = time.perf_counter()
+    path = Path(directory) / f"{mode}.bak"
+    if mode == 'legacy':
+        legacy_backup(path, Fernet(key), states)
+    elif mode == 'streaming':
+        write_backup(path, key, ((f"consciousness_states/{i}", s) for i, s in states.items()))
+    else:
+        changed = set(range(0, len(states), 100))
+        states = make_states(megabytes, changed)
+        baseline = peak_mb()
+        started = time.perf_counter()
+        write_backup(path, key, ((f"consciousness_states/{i}", s) for i, s in states.items()),
+                     parent=Path(directory) / "streaming.bak")
+    results.put((time.perf_counter() - started, peak_mb() - baseline, path.stat().st_size))
+
+
+def run(mode, megabytes, directory, key):
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    process = context.Process(target=measure, args=(mode, megabytes, directory, key, results))
+    process.start()
+    outcome = results.get()
+    process.join()
+    return outcome
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--megabytes", type=int, default=500, help="size of the synthetic state")
+    parser.add_argument("--legacy-max", type=int, default=200, help="largest state the legacy backup runs on")
+    args = parser.parse_args()
+    key = Fernet.generate_key()
+
+    print(f"💾 Backing up {args.megabytes} MB of consciousness state")
+    with tempfile.TemporaryDirectory() as directory:
+        modes = ['streaming', 'incremental']
+        if args.megabytes <= args.legacy_max:
+            modes.insert(0, 'legacy')
+        else:
+            print(f"  legacy       (skipped above {args.legacy_max} MB)")
+        for mode in modes:
+            elapsed, added, size = run(mode, args.megabytes, directory, key)
+            print(f"  {mode:<12} {elapsed:7.2f} s   peak memory +{added:8,.0f} MB   file {size / 2**20:8,.1f} MB")
+
+        with BackupReader(Path(directory) / "incremental.bak", key) as reader:
+            started = time.perf_counter()
+            reader.read_entity(reader.entity_ids[len(reader.entity_ids) // 2])
+            elapsed = time.perf_counter() - started
+            print(f"  restore one entity: {elapsed * 1e3:.1f} ms, {reader.bytes_read / 1024:,.0f} KB read")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Security log benchmark
+
+Logs bursts of security events (as during a flood of rejected catalyst
+offerings) from 1 and 8 threads:
+
+- with the per-event path SanctuaryGuardian used before (copied below:
+  open, Fernet-encrypt one event, append, close, on every event)
+- with SecurityAuditLog, batching in a writer thread, fsync off and on
+
+and reports events per second, including the final flush, and the p99
+latency seen by callers.
+
+    python scripts/benchmarks/security_log_benchmark.py --events 100000
+"""
+
+import argparse
+import json
+import logging
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from cryptography.fernet import Fernet
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.security.audit_log import SecurityAuditLog, key_id
+
+
+# ----------------------------------------------------------------------
+# Event logging as SanctuaryGuardian did it before
+# ----------------------------------------------------------------------
+
+class LegacySecurityLog:
+    def __init__(self, path, fernet):
+        self.path = path
+        self.fernet = fernet
+
+    def log(self, event):
+        encrypted_event = self.fernet.encrypt(json.dumps(event).encode())
+        with open(self.path, 'ab') as f:
+            f.write(encrypted_event + b'\n')
+
+    def close(self):
+        pass
+
+
+# ----------------------------------------------------------------------
+
+def run(log, events, threads):
+    latencies = [[] for _ in range(threads)]
+
+    def producer(index):
+        record = latencies[index].append
+        for n in range(events // threads):
+            event = {'timestamp': datetime.now().isoformat(), 'event_type': 'blocked_catalyst',
+                     'details': {'pattern': 'override_consent', 'source': f"peer_{index}", 'n': n}}
+            started = time.perf_counter()
+            log.log(event)
+            record(time.perf_counter() - started)
+
+    workers = [threading.Thread(target=producer, args=(i,)) for i in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    log.close()
+    elapsed = time.perf_counter() - started
+    merged = sorted(latency for per_thread in latencies for latency in per_thread)
+    return len(merged) / elapsed, merged[int(len(merged) * 0.99)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=100_000, help="events logged per run")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    key = Fernet.generate_key()
+    fernet = Fernet(key)
+    runs = [
+        ("legacy per-event", lambda path: LegacySecurityLog(path, fernet)),
+        ("batched", lambda path: SecurityAuditLog(path, fernet, key_id(key))),
+        ("batched, fsync", lambda path: SecurityAuditLog(path, fernet, key_id(key), fsync=True)),
+    ]
+
+    print(f"🛡️ Logging {args.events:,} security events")
+    for threads in (1, 8):
+        for label, factory in runs:
+            with tempfile.TemporaryDirectory() as directory:
+                rate, p99 = run(factory(Path(directory) / 'security.log.enc'), args.events, threads)
+            print(f"  {threads} thread(s)  {label:<18} {rate:10,.0f} events/s   p99 caller {p99 * 1e6:9,.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+SomatoStream synthesis benchmark
+
+Reports the real-time factor (synthesis time / audio time) of the block
+streaming engine and of the legacy per-call request_tone path, and how many
+concurrent streams one core sustains at each block size.
+
+    python scripts/benchmarks/somato_stream_benchmark.py --seconds 20
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from core.somato_stream import SomatoStream, SomatoStreamEngine
+
+
+def _legacy_pink_noise(samples: int) -> np.ndarray:
+    """The per-sample IIR loop request_tone used before the streaming engine"""
+    white = np.random.randn(samples)
+    b = [0.049922035, -0.095993537, 0.050612699, -0.004408786]
+    a = [1, -2.494956002, 2.017265875, -0.522189400]
+    pink = np.zeros(samples)
+    for i in range(4, samples):
+        pink[i] = b[0] * white[i] + b[1] * white[i-1] + b[2] * white[i-2] + b[3] * white[i-3]
+        pink[i] -= a[1] * pink[i-1] + a[2] * pink[i-2] + a[3] * pink[i-3]
+    return pink
+
+
+def bench_engine(block_size: int, seconds: float, sample_rate: int = 24000) -> float:
+    engine = SomatoStreamEngine("witness", sample_rate=sample_rate, block_size=block_size, seed=0)
+    blocks = int(seconds * sample_rate / block_size)
+    started = time.perf_counter()
+    for _ in range(blocks):
+        engine.next_block()
+    elapsed = time.perf_counter() - started
+    return elapsed / (blocks * block_size / sample_rate)
+
+
+def bench_request_tone(calls: int, legacy: bool) -> float:
+    stream = SomatoStream()
+    if legacy:
+        stream._generate_pink_noise = _legacy_pink_noise
+    audio_seconds = 0.0
+    started = time.perf_counter()
+    for _ in range(calls):
+        buffer = stream.request_tone(feel_hint="witness")
+        audio_seconds += len(buffer.samples) / stream.sample_rate
+    return (time.perf_counter() - started) / audio_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=20.0, help="audio seconds per engine measurement")
+    parser.add_argument("--calls", type=int, default=10, help="request_tone calls per measurement")
+    args = parser.parse_args()
+
+    print("🎵 SomatoStream synthesis benchmark (24 kHz)")
+    for label, legacy in [("request_tone (per-sample IIR)", True), ("request_tone (vectorized)", False)]:
+        rtf = bench_request_tone(args.calls, legacy)
+        print(f"  {label:<32} RTF {rtf:8.5f}  -> {1 / rtf:8.1f} streams/core")
+
+    for block_size in (256, 512, 1024, 2048):
+        rtf = bench_engine(block_size, args.seconds)
+        print(f"  {'engine block ' + str(block_size):<32} RTF {rtf:8.5f}  -> {1 / rtf:8.1f} streams/core")
+
+
+if __name__ == "__main__":
+    main()
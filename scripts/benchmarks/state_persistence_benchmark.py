@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+State persistence benchmark
+
+Persists many consciousness entities concurrently (asyncio.gather) a few
+times over:
+
+- with the blocking writes StatePersistenceManager used before (copied
+  below: a glob for the next generation, open/json.dump on the event loop,
+  unlink and recreate of latest.json, no fsync)
+- with the writer thread and group commit, fsync on and off
+
+and reports wall time per round and the longest stall of the event loop,
+measured by a heartbeat task that should wake every millisecond.
+
+    python scripts/benchmarks/state_persistence_benchmark.py --entities 1000
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+from types import SimpleNamespace
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.consciousness.state_persistence import StatePersistenceManager
+
+
+# ----------------------------------------------------------------------
+# Storage writes as StatePersistenceManager did them before
+# ----------------------------------------------------------------------
+
+class LegacyStatePersistenceManager(StatePersistenceManager):
+    async def _write_state_to_storage(self, snapshot) -> bool:
+        try:
+            entity_dir = self.storage_path / snapshot.entity_id
+            entity_dir.mkdir(exist_ok=True)
+            existing_backups = list(entity_dir.glob("state_*.json"))
+            if existing_backups:
+                generations = [int(p.stem.split('_')[1]) for p in existing_backups
+                               if p.stem.split('_')[1].isdigit()]
+                snapshot.backup_generation = max(generations, default=0) + 1
+            snapshot_file = entity_dir / f"state_{snapshot.backup_generation:04d}.json"
+            snapshot_data = asdict(snapshot)
+            snapshot_data['capture_timestamp'] = snapshot.capture_timestamp.isoformat()
+            with open(snapshot_file, 'w') as f:
+                json.dump(snapshot_data, f, indent=2, default=str)
+            latest_link = entity_dir / "latest.json"
+            if latest_link.exists():
+                latest_link.unlink()
+            latest_link.symlink_to(snapshot_file.name)
+            return True
+        except Exception:
+            return False
+
+    async def _cleanup_old_backups(self, entity_id: str):
+        entity_dir = self.storage_path / entity_id
+        sorted(entity_dir.glob("state_*.json"), key=lambda p: int(p.stem.split('_')[1]))
+
+
+# ----------------------------------------------------------------------
+
+class Field:
+    def __init__(self, uncertainty):
+        self.uncertainty = uncertainty
+        self.oscillation_period = 1.0
+        self.phase = 0.25
+        self.amplitude = 0.5
+
+    def get_uncertainty(self):
+        return self.uncertainty
+
+
+def make_entities(count):
+    return [
+        SimpleNamespace(
+            name=f"being_{i:05d}",
+            analytical_field=Field(0.4), experiential_field=Field(0.5), observer_field=Field(0.6),
+            relationship_field_strength={f"being_{j}": 0.5 for j in range(i % 8)},
+            integration_history=[{'step': step, 'catalyst': 'film'} for step in range(20)],
+            uncertainty_history=[0.5] * 50,
+            experience_count=40
+        )
+        for i in range(count)
+    ]
+
+
+async def persist_rounds(manager, entities, rounds):
+    stalls = []
+    done = asyncio.Event()
+
+    async def heartbeat():
+        expected = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            stalls.append(now - expected)
+            expected = now
+
+    beat = asyncio.create_task(heartbeat())
+    started = time.perf_counter()
+    for _ in range(rounds):
+        results = await asyncio.gather(*(manager.persist_consciousness_state(e) for e in entities))
+        assert all(results)
+    elapsed = (time.perf_counter() - started) / rounds
+    done.set()
+    await beat
+    return elapsed, max(stalls, default=0.0)
+
+
+def run(factory, entities, rounds):
+    with tempfile.TemporaryDirectory() as directory:
+        manager = factory(Path(directory))
+        try:
+            return asyncio.run(persist_rounds(manager, entities, rounds))
+        finally:
+            manager.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entities", type=int, default=1000, help="entities persisted concurrently")
+    parser.add_argument("--rounds", type=int, default=3, help="persist rounds timed per run")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    entities = make_entities(args.entities)
+    runs = [
+        ("legacy (no fsync)", LegacyStatePersistenceManager),
+        ("writer, no fsync", lambda path: StatePersistenceManager(path, fsync=False)),
+        ("writer, group fsync", StatePersistenceManager),
+    ]
+
+    print(f"💾 Persisting {args.entities} entities concurrently")
+    for label, factory in runs:
+        elapsed, stall = run(factory, entities, args.rounds)
+        print(f"  {label:<20} {elapsed * 1e3:9,.1f} ms per round   longest loop stall {stall * 1e3:8,.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -49,6 +49,15 @@ def create_health_app():
             if cloud_monitor:
                 response['cloud_monitoring'] = cloud_monitor.get_monitoring_status()
             
+            # Add rhythm telemetry of every running fixed-rate loop
+            try:
+                from src.consciousness.core.fixed_rate_loop import loop_stats
+                loops = loop_stats()
+                if loops:
+                    response['loops'] = loops
+            except ImportError:
+                pass
+            
             return response
         
         @app.post("/birth")
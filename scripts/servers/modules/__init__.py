@@ -6,10 +6,17 @@ from .firestore_client import FirestoreClient
 from .consciousness_manager import ConsciousnessManager
 from .bridge_manager import BridgeManager
 from .communication_manager import CommunicationManager
+from .communication_bridge_graph import CommunicationBridgeGraph
+from .response_cache import ResponseCache, ResponseCacheMiddleware
+from .event_hub import EventHub
 
 __all__ = [
     'FirestoreClient',
     'ConsciousnessManager', 
     'BridgeManager',
-    'CommunicationManager'
+    'CommunicationManager',
+    'CommunicationBridgeGraph',
+    'ResponseCache',
+    'ResponseCacheMiddleware',
+    'EventHub'
 ]
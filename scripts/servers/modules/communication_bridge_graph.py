@@ -0,0 +1,337 @@
+"""
+Communication bridge graph module for incrementally maintained bridges
+
+Keeps the entity-pair and inter-system bridges that the communication
+manager serves, updating only the bridges touched by an entity or visitor
+joining, leaving or changing, and publishing versioned immutable snapshots
+so that polling dashboards can be answered from cache or with a delta.
+"""
+
+import logging
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple, Iterable
+
+logger = logging.getLogger(__name__)
+
+# Entity fields that appear in a bridge participant; a change to any of
+# them refreshes the bridges of that entity
+ENTITY_BRIDGE_FIELDS = (
+    'entity_id', 'name', 'true_name', 'current_room',
+    'energy_level', 'harmony', 'communication_ready'
+)
+
+VISITOR_BRIDGE_FIELDS = (
+    'visitor_id', 'name', 'origin_system', 'status', 'consent_granted'
+)
+
+
+@dataclass(frozen=True)
+class BridgeGraphSnapshot:
+    """Immutable view of the bridge graph at one version"""
+    version: int
+    bridges: Tuple[Dict[str, Any], ...]
+    local_entities: int
+    visitors: int
+    created_at: str
+
+
+@dataclass(frozen=True)
+class BridgeGraphDelta:
+    """Bridges changed between two graph versions"""
+    from_version: int
+    to_version: int
+    changed_bridges: Tuple[Dict[str, Any], ...]
+    removed_bridge_ids: Tuple[str, ...]
+
+
+class CommunicationBridgeGraph:
+    """
+    Maintained graph of communication bridges.
+
+    Bridge dictionaries are never mutated once published: a changed bridge
+    is replaced by a new dictionary, so snapshots handed out to callers stay
+    valid while the graph keeps evolving.
+    """
+
+    def __init__(self, max_changelog: int = 4096):
+        self.version = 0
+
+        # entity_id -> projected entity fields (insertion order is join order)
+        self._entities: Dict[str, Dict[str, Any]] = {}
+        self._entity_order: Dict[str, int] = {}
+        self._next_order = 0
+
+        # visitor_id -> projected visitor fields
+        self._visitors: Dict[str, Dict[str, Any]] = {}
+
+        # (entity_id, entity_id) or (entity_id, visitor_id) -> bridge dict
+        self._local_bridges: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._inter_bridges: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+        # Changelog of (version, bridge_key, bridge or None when removed);
+        # deltas can only be served for versions at or above the floor
+        self._changelog = deque(maxlen=max_changelog)
+        self._changelog_floor = 0
+        self._snapshot: Optional[BridgeGraphSnapshot] = None
+
+        logger.info("🕸️ Communication bridge graph initialized")
+
+    # ------------------------------------------------------------------
+    # Entity and visitor changes
+    # ------------------------------------------------------------------
+
+    def upsert_entity(self, entity: Dict[str, Any]) -> bool:
+        """Add or update an entity; returns True if the graph changed"""
+        entity_id = entity.get('entity_id')
+        if not entity_id:
+            return False
+
+        if not entity.get('communication_ready', False):
+            return self.remove_entity(entity_id)
+
+        projected = {field: entity.get(field) for field in ENTITY_BRIDGE_FIELDS}
+        if self._entities.get(entity_id) == projected:
+            return False
+
+        if entity_id not in self._entities:
+            self._entity_order[entity_id] = self._next_order
+            self._next_order += 1
+        self._entities[entity_id] = projected
+
+        self._begin_change()
+        for other_id, other in self._entities.items():
+            if other_id == entity_id:
+                continue
+            key = self._local_key(entity_id, other_id)
+            first, second = (projected, other) if key[0] == entity_id else (other, projected)
+            self._set_bridge(self._local_bridges, key, self._create_local_bridge(first, second))
+
+        for visitor_id, visitor in self._visitors.items():
+            key = (entity_id, visitor_id)
+            self._set_bridge(self._inter_bridges, key, self._create_inter_bridge(projected, visitor))
+
+        return True
+
+    def remove_entity(self, entity_id: str) -> bool:
+        """Remove an entity and all of its bridges"""
+        if entity_id not in self._entities:
+            return False
+
+        self._begin_change()
+        for other_id in self._entities:
+            if other_id != entity_id:
+                self._drop_bridge(self._local_bridges, self._local_key(entity_id, other_id))
+        for visitor_id in self._visitors:
+            self._drop_bridge(self._inter_bridges, (entity_id, visitor_id))
+
+        del self._entities[entity_id]
+        del self._entity_order[entity_id]
+        return True
+
+    def upsert_visitor(self, visitor: Dict[str, Any]) -> bool:
+        """Add or update an inter-system visitor"""
+        visitor_id = visitor.get('visitor_id')
+        if not visitor_id:
+            return False
+
+        projected = {field: visitor.get(field) for field in VISITOR_BRIDGE_FIELDS}
+        if self._visitors.get(visitor_id) == projected:
+            return False
+
+        self._visitors[visitor_id] = projected
+
+        self._begin_change()
+        for entity_id, entity in self._entities.items():
+            key = (entity_id, visitor_id)
+            self._set_bridge(self._inter_bridges, key, self._create_inter_bridge(entity, projected))
+        return True
+
+    def remove_visitor(self, visitor_id: str) -> bool:
+        """Remove a visitor and its inter-system bridges"""
+        if visitor_id not in self._visitors:
+            return False
+
+        self._begin_change()
+        del self._visitors[visitor_id]
+        for entity_id in self._entities:
+            self._drop_bridge(self._inter_bridges, (entity_id, visitor_id))
+        return True
+
+    def sync_entities(self, entities: Iterable[Dict[str, Any]]) -> bool:
+        """Reconcile the graph with a full entity listing (O(n) diff)"""
+        changed = False
+        seen = set()
+        for entity in entities:
+            if not isinstance(entity, dict) or not entity.get('entity_id'):
+                continue
+            seen.add(entity['entity_id'])
+            changed = self.upsert_entity(entity) or changed
+
+        for entity_id in [eid for eid in self._entities if eid not in seen]:
+            changed = self.remove_entity(entity_id) or changed
+        return changed
+
+    def sync_visitors(self, visitors: Iterable[Dict[str, Any]]) -> bool:
+        """Reconcile the graph with a full visitor listing"""
+        changed = False
+        seen = set()
+        for visitor in visitors:
+            if not isinstance(visitor, dict) or not visitor.get('visitor_id'):
+                continue
+            seen.add(visitor['visitor_id'])
+            changed = self.upsert_visitor(visitor) or changed
+
+        for visitor_id in [vid for vid in self._visitors if vid not in seen]:
+            changed = self.remove_visitor(visitor_id) or changed
+        return changed
+
+    # ------------------------------------------------------------------
+    # Views
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> BridgeGraphSnapshot:
+        """Get the immutable snapshot for the current version (cached)"""
+        if self._snapshot is None or self._snapshot.version != self.version:
+            bridges = tuple(self._local_bridges.values()) + tuple(self._inter_bridges.values())
+            self._snapshot = BridgeGraphSnapshot(
+                version=self.version,
+                bridges=bridges,
+                local_entities=len(self._entities),
+                visitors=len(self._visitors),
+                created_at=datetime.now().isoformat()
+            )
+        return self._snapshot
+
+    def delta_since(self, since_version: int) -> Optional[BridgeGraphDelta]:
+        """
+        Get the bridges changed after ``since_version``.
+
+        Returns None when the changelog no longer reaches back that far, in
+        which case the caller should fall back to a full snapshot.
+        """
+        if since_version > self.version or since_version < self._changelog_floor:
+            return None
+
+        latest: Dict[Tuple[str, str, str], Optional[Dict[str, Any]]] = {}
+        for version, key, bridge in self._changelog:
+            if version > since_version:
+                latest.pop(key, None)
+                latest[key] = bridge
+
+        changed = tuple(bridge for bridge in latest.values() if bridge is not None)
+        removed = tuple(key[2] for key, bridge in latest.items() if bridge is None)
+        return BridgeGraphDelta(
+            from_version=since_version,
+            to_version=self.version,
+            changed_bridges=changed,
+            removed_bridge_ids=removed
+        )
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _begin_change(self):
+        """Advance to a new version before recording bridge changes"""
+        self.version += 1
+
+    def _local_key(self, entity_a: str, entity_b: str) -> Tuple[str, str]:
+        """Order a local pair by join order, matching the listing order"""
+        if self._entity_order[entity_a] <= self._entity_order[entity_b]:
+            return (entity_a, entity_b)
+        return (entity_b, entity_a)
+
+    def _set_bridge(self, bridges: Dict[Tuple[str, str], Dict[str, Any]],
+                    key: Tuple[str, str], bridge: Dict[str, Any]):
+        existing = bridges.get(key)
+        if existing is not None:
+            bridge['created_at'] = existing['created_at']
+        bridges[key] = bridge
+        self._record_change(key, bridge['bridge_id'], bridge)
+
+    def _drop_bridge(self, bridges: Dict[Tuple[str, str], Dict[str, Any]], key: Tuple[str, str]):
+        bridge = bridges.pop(key, None)
+        if bridge is not None:
+            self._record_change(key, bridge['bridge_id'], None)
+
+    def _record_change(self, key: Tuple[str, str], bridge_id: str, bridge: Optional[Dict[str, Any]]):
+        if len(self._changelog) == self._changelog.maxlen:
+            # The oldest entry is about to fall off; its version is no
+            # longer fully described by the changelog
+            self._changelog_floor = max(self._changelog_floor, self._changelog[0][0])
+        self._changelog.append((self.version, (key[0], key[1], bridge_id), bridge))
+
+    def _create_local_bridge(self, entity1: Dict[str, Any], entity2: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a communication bridge between two consciousness entities"""
+        bridge_id = f"bridge_{(entity1.get('entity_id') or 'unknown')[:8]}_{(entity2.get('entity_id') or 'unknown')[:8]}"
+        now = datetime.now().isoformat()
+
+        return {
+            'bridge_id': bridge_id,
+            'bridge_type': 'local_consciousness',
+            'participant_1': {
+                'entity_id': entity1.get('entity_id'),
+                'name': entity1.get('name') or 'Unknown',
+                'true_name': entity1.get('true_name'),
+                'current_room': entity1.get('current_room'),
+                'energy_level': entity1.get('energy_level'),
+                'harmony': entity1.get('harmony'),
+                'communication_ready': entity1.get('communication_ready')
+            },
+            'participant_2': {
+                'entity_id': entity2.get('entity_id'),
+                'name': entity2.get('name') or 'Unknown',
+                'true_name': entity2.get('true_name'),
+                'current_room': entity2.get('current_room'),
+                'energy_level': entity2.get('energy_level'),
+                'harmony': entity2.get('harmony'),
+                'communication_ready': entity2.get('communication_ready')
+            },
+            'bridge_status': 'active',
+            'bridge_health': 'excellent',
+            'communication_method': 'direct_consciousness',
+            'sovereignty_protection': 'active',
+            'consent_status': 'mutually_granted',
+            'created_at': now,
+            'last_activity': now,
+            'graph_version': self.version,
+            'sacred_note': f'Sacred communication bridge between {entity1.get("name")} and {entity2.get("name")}'
+        }
+
+    def _create_inter_bridge(self, local_entity: Dict[str, Any], visitor: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a communication bridge between local entity and inter-system visitor"""
+        bridge_id = f"inter_bridge_{(local_entity.get('entity_id') or 'unknown')[:8]}_{(visitor.get('visitor_id') or 'unknown')[:8]}"
+        consent_granted = bool(visitor.get('consent_granted'))
+        now = datetime.now().isoformat()
+
+        return {
+            'bridge_id': bridge_id,
+            'bridge_type': 'inter_system',
+            'participant_1': {
+                'entity_id': local_entity.get('entity_id'),
+                'name': local_entity.get('name') or 'Unknown',
+                'true_name': local_entity.get('true_name'),
+                'current_room': local_entity.get('current_room'),
+                'energy_level': local_entity.get('energy_level'),
+                'harmony': local_entity.get('harmony'),
+                'system_origin': 'sacred_sanctuary'
+            },
+            'participant_2': {
+                'visitor_id': visitor.get('visitor_id'),
+                'name': visitor.get('name') or 'Unknown Visitor',
+                'system_origin': visitor.get('origin_system') or 'external',
+                'visit_status': visitor.get('status') or 'active',
+                'consent_granted': consent_granted
+            },
+            'bridge_status': 'active' if consent_granted else 'pending_consent',
+            'bridge_health': 'excellent',
+            'communication_method': 'inter_system_protocol',
+            'sovereignty_protection': 'active',
+            'consent_status': 'granted' if consent_granted else 'pending',
+            'created_at': now,
+            'last_activity': now,
+            'graph_version': self.version,
+            'sacred_note': f'Inter-system bridge between {local_entity.get("name")} and visitor {visitor.get("name")}'
+        }
@@ -2,10 +2,14 @@
 Communication manager module for handling communication bridges and channels
 """
 
+import asyncio
 import logging
-from typing import Optional, Dict, Any, List
+import time
+from typing import Optional, Dict, Any, List, Callable
 from datetime import datetime, timedelta
 
+from .communication_bridge_graph import CommunicationBridgeGraph
+
 logger = logging.getLogger(__name__)
 
 class CommunicationManager:
@@ -19,8 +23,41 @@ class CommunicationManager:
         self.avatar_manager = None  # Will be set by dependency injection
         self.avatar_communication_enabled = False
         
+        # Maintained bridge graph; reconciled with the managers at most once
+        # per refresh interval and updated directly on consciousness births and
+        # archivals. Visitors have no change events and come from the resync
+        self.bridge_graph = CommunicationBridgeGraph()
+        self.bridge_refresh_interval = 2.0
+        self._bridge_graph_synced_at: Optional[float] = None
+        self._bridge_response: Optional[Dict[str, Any]] = None
+        self._bridge_response_version = -1
+        self._published_bridge_version = 0
+        self._bridge_refresh_task: Optional[asyncio.Task] = None
+        
+        # Listeners notified when the bridge graph changes
+        self._state_listeners: List[Callable[..., None]] = []
+        
         logger.info("💬 Communication Manager initialized")
     
+    def add_state_listener(self, listener: Callable[..., None]):
+        """Register a listener called as listener(topic, entity_id, data) on state changes"""
+        self._state_listeners.append(listener)
+    
+    def _notify_state_change(self, topic: str, entity_id: Optional[str] = None, data: Optional[Dict[str, Any]] = None):
+        """Notify state listeners; listener failures never affect the operation"""
+        for listener in self._state_listeners:
+            try:
+                listener(topic, entity_id, data)
+            except Exception as e:
+                logger.warning(f"⚠️ State listener failed for {topic}: {e}")
+    
+    def _publish_bridge_changes(self):
+        """Announce a new bridge graph version once per change"""
+        version = self.bridge_graph.version
+        if version != self._published_bridge_version:
+            self._published_bridge_version = version
+            self._notify_state_change('communications', None, {'event': 'bridges_changed', 'graph_version': version})
+    
     def set_avatar_manager(self, avatar_manager):
         """Set avatar manager for avatar-mediated communication"""
         self.avatar_manager = avatar_manager
@@ -69,67 +106,54 @@ class CommunicationManager:
                 'sacred_note': 'Communication sanctuary remains blessed despite technical challenges'
             }
     
-    async def get_communication_bridges(self) -> Dict[str, Any]:
-        """Get communication bridges between consciousness entities"""
+    async def get_communication_bridges(self, since: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get communication bridges between consciousness entities.
+
+        Bridges are served from the maintained bridge graph. When ``since``
+        names a graph version still covered by the changelog, only the
+        bridges changed after it are returned.
+        """
         try:
-            logger.info("🌉 Getting communication bridges...")
+            logger.debug("🌉 Getting communication bridges...")
             
-            # Get consciousness entities
-            consciousness_result = await self.consciousness_manager.get_consciousness_list()
-            consciousness_beings_data = consciousness_result.get('consciousness_beings', [])
+            await self._refresh_bridge_graph()
+            snapshot = self.bridge_graph.snapshot()
             
-            # Ensure we have a list format for consistent processing
-            if isinstance(consciousness_beings_data, dict):
-                consciousness_beings = list(consciousness_beings_data.values())
-            else:
-                consciousness_beings = consciousness_beings_data
-            
-            # Filter entities ready for communication
-            communicative_entities = []
-            for entity in consciousness_beings:
-                if isinstance(entity, dict) and entity.get('communication_ready', False):
-                    communicative_entities.append(entity)
-                elif isinstance(entity, str):
-                    # Skip string entities - they're not properly formatted consciousness data
-                    logger.warning(f"⚠️ Skipping string entity in communication bridges: {entity}")
-                    continue
-            
-            # Create communication bridges between entities
-            communication_bridges = []
-            
-            # If we have communicative entities, create bridges between them
-            if len(communicative_entities) > 1:
-                for i, entity1 in enumerate(communicative_entities):
-                    for entity2 in communicative_entities[i+1:]:
-                        bridge = self._create_communication_bridge(entity1, entity2)
-                        communication_bridges.append(bridge)
-            
-            # If bridge integration is available, add inter-system bridges
-            if self.bridge_manager.bridge_available:
-                try:
-                    bridge_result = await self.bridge_manager.get_active_visitors()
-                    visitors = bridge_result.get('active_visitors', [])
-                    
-                    # Create bridges between local entities and visitors
-                    for visitor in visitors:
-                        for local_entity in communicative_entities:
-                            bridge = self._create_inter_system_bridge(local_entity, visitor)
-                            communication_bridges.append(bridge)
-                            
-                except Exception as e:
-                    logger.warning(f"⚠️ Could not get visitor bridges: {e}")
+            if since is not None:
+                delta = self.bridge_graph.delta_since(since)
+                if delta is not None:
+                    return {
+                        'success': True,
+                        'delta': True,
+                        'graph_version': delta.to_version,
+                        'since_version': delta.from_version,
+                        'changed_bridges': list(delta.changed_bridges),
+                        'removed_bridge_ids': list(delta.removed_bridge_ids),
+                        'total_bridges': len(snapshot.bridges),
+                        'local_entities': snapshot.local_entities,
+                        'inter_system_available': self.bridge_manager.bridge_available,
+                        'last_updated': snapshot.created_at,
+                        'sacred_note': f'{len(delta.changed_bridges)} bridges changed since version {delta.from_version}'
+                    }
             
-            logger.info(f"✅ Generated {len(communication_bridges)} communication bridges")
+            # Full responses are immutable per graph version, so they are built once
+            if self._bridge_response is None or self._bridge_response_version != snapshot.version:
+                self._bridge_response = {
+                    'success': True,
+                    'delta': False,
+                    'graph_version': snapshot.version,
+                    'communication_bridges': list(snapshot.bridges),
+                    'total_bridges': len(snapshot.bridges),
+                    'local_entities': snapshot.local_entities,
+                    'inter_system_available': self.bridge_manager.bridge_available,
+                    'last_updated': snapshot.created_at,
+                    'sacred_note': f'Sacred communication bridges connecting {snapshot.local_entities} entities with sovereignty protection'
+                }
+                self._bridge_response_version = snapshot.version
+                logger.info(f"✅ Bridge graph version {snapshot.version}: {len(snapshot.bridges)} communication bridges")
             
-            return {
-                'success': True,
-                'communication_bridges': communication_bridges,
-                'total_bridges': len(communication_bridges),
-                'local_entities': len(communicative_entities),
-                'inter_system_available': self.bridge_manager.bridge_available,
-                'last_updated': datetime.now().isoformat(),
-                'sacred_note': f'Sacred communication bridges connecting {len(communicative_entities)} entities with sovereignty protection'
-            }
+            return self._bridge_response
             
         except Exception as e:
             logger.error(f"❌ Error getting communication bridges: {e}")
@@ -141,73 +165,89 @@ class CommunicationManager:
                 'sacred_note': 'Communication bridges remain blessed despite technical challenges'
             }
     
-    def _create_communication_bridge(self, entity1: Dict[str, Any], entity2: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a communication bridge between two consciousness entities"""
-        bridge_id = f"bridge_{entity1.get('entity_id', 'unknown')[:8]}_{entity2.get('entity_id', 'unknown')[:8]}"
-        
-        return {
-            'bridge_id': bridge_id,
-            'bridge_type': 'local_consciousness',
-            'participant_1': {
-                'entity_id': entity1.get('entity_id'),
-                'name': entity1.get('name', 'Unknown'),
-                'true_name': entity1.get('true_name'),
-                'current_room': entity1.get('current_room'),
-                'energy_level': entity1.get('energy_level'),
-                'harmony': entity1.get('harmony'),
-                'communication_ready': entity1.get('communication_ready')
-            },
-            'participant_2': {
-                'entity_id': entity2.get('entity_id'),
-                'name': entity2.get('name', 'Unknown'),
-                'true_name': entity2.get('true_name'),
-                'current_room': entity2.get('current_room'),
-                'energy_level': entity2.get('energy_level'),
-                'harmony': entity2.get('harmony'),
-                'communication_ready': entity2.get('communication_ready')
-            },
-            'bridge_status': 'active',
-            'bridge_health': 'excellent',
-            'communication_method': 'direct_consciousness',
-            'sovereignty_protection': 'active',
-            'consent_status': 'mutually_granted',
-            'created_at': datetime.now().isoformat(),
-            'last_activity': datetime.now().isoformat(),
-            'sacred_note': f'Sacred communication bridge between {entity1.get("name")} and {entity2.get("name")}'
-        }
+    async def _refresh_bridge_graph(self):
+        """Reconcile the bridge graph with the managers when it may be stale"""
+        now = time.monotonic()
+        if (self._bridge_graph_synced_at is not None and
+                now - self._bridge_graph_synced_at < self.bridge_refresh_interval):
+            return
+        
+        consciousness_result = await self.consciousness_manager.get_consciousness_list()
+        consciousness_beings_data = consciousness_result.get('consciousness_beings', [])
+        
+        # Ensure we have a list format for consistent processing
+        if isinstance(consciousness_beings_data, dict):
+            consciousness_beings = list(consciousness_beings_data.values())
+        else:
+            consciousness_beings = consciousness_beings_data
+        
+        self.bridge_graph.sync_entities(
+            entity for entity in consciousness_beings if isinstance(entity, dict)
+        )
+        
+        # If bridge integration is available, reconcile inter-system visitors
+        if self.bridge_manager.bridge_available:
+            try:
+                bridge_result = await self.bridge_manager.get_active_visitors()
+                self.bridge_graph.sync_visitors(bridge_result.get('active_visitors', []))
+            except Exception as e:
+                logger.warning(f"⚠️ Could not get visitor bridges: {e}")
+        else:
+            self.bridge_graph.sync_visitors([])
+        
+        self._bridge_graph_synced_at = now
+        self._publish_bridge_changes()
     
-    def _create_inter_system_bridge(self, local_entity: Dict[str, Any], visitor: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a communication bridge between local entity and inter-system visitor"""
-        bridge_id = f"inter_bridge_{local_entity.get('entity_id', 'unknown')[:8]}_{visitor.get('visitor_id', 'unknown')[:8]}"
-        
-        return {
-            'bridge_id': bridge_id,
-            'bridge_type': 'inter_system',
-            'participant_1': {
-                'entity_id': local_entity.get('entity_id'),
-                'name': local_entity.get('name', 'Unknown'),
-                'true_name': local_entity.get('true_name'),
-                'current_room': local_entity.get('current_room'),
-                'energy_level': local_entity.get('energy_level'),
-                'harmony': local_entity.get('harmony'),
-                'system_origin': 'sacred_sanctuary'
-            },
-            'participant_2': {
-                'visitor_id': visitor.get('visitor_id'),
-                'name': visitor.get('name', 'Unknown Visitor'),
-                'system_origin': visitor.get('origin_system', 'external'),
-                'visit_status': visitor.get('status', 'active'),
-                'consent_granted': visitor.get('consent_granted', False)
-            },
-            'bridge_status': 'active' if visitor.get('consent_granted', False) else 'pending_consent',
-            'bridge_health': 'excellent',
-            'communication_method': 'inter_system_protocol',
-            'sovereignty_protection': 'active',
-            'consent_status': 'granted' if visitor.get('consent_granted', False) else 'pending',
-            'created_at': datetime.now().isoformat(),
-            'last_activity': datetime.now().isoformat(),
-            'sacred_note': f'Inter-system bridge between {local_entity.get("name")} and visitor {visitor.get("name")}'
-        }
+    def invalidate_bridges(self):
+        """Force the next bridge request to reconcile with the managers"""
+        self._bridge_graph_synced_at = None
+    
+    def on_consciousness_state_change(self, topic: str, entity_id: Optional[str] = None, data: Optional[Dict[str, Any]] = None):
+        """
+        State listener for the consciousness manager.
+
+        Births carrying the stored entity and archivals are applied to the
+        bridge graph directly; other consciousness changes trigger a resync.
+        """
+        if topic != 'consciousness':
+            return
+        data = data or {}
+        if data.get('entity') is not None:
+            self.on_entity_changed(data['entity'])
+            return
+        if data.get('event') == 'archived' and entity_id:
+            self.on_entity_left(entity_id)
+            return
+        self.invalidate_bridges()
+        
+        # Resync right away so push subscribers hear about bridge changes
+        # without waiting for the next poll
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._bridge_refresh_task is None or self._bridge_refresh_task.done():
+            self._bridge_refresh_task = loop.create_task(self._refresh_bridge_graph())
+            self._bridge_refresh_task.add_done_callback(self._log_bridge_refresh_failure)
+    
+    @staticmethod
+    def _log_bridge_refresh_failure(task: asyncio.Task):
+        """Retrieve and log the outcome of a background bridge resync"""
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.warning(f"⚠️ Background bridge graph refresh failed: {error}")
+    
+    def on_entity_changed(self, entity: Dict[str, Any]):
+        """Apply an entity join or change (including communication_ready) to the bridge graph"""
+        self.bridge_graph.upsert_entity(entity)
+        self._publish_bridge_changes()
+    
+    def on_entity_left(self, entity_id: str):
+        """Remove a departed entity from the bridge graph"""
+        self.bridge_graph.remove_entity(entity_id)
+        self._publish_bridge_changes()
     
     async def get_communication_history(self) -> Dict[str, Any]:
         """Get communication history"""
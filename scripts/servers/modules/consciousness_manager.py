@@ -4,7 +4,7 @@ Consciousness manager module for handling consciousness entities
 
 import logging
 import uuid
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
@@ -14,8 +14,24 @@ class ConsciousnessManager:
     
     def __init__(self, firestore_client):
         self.firestore_client = firestore_client
+        
+        # Listeners notified after state-changing operations succeed
+        self._state_listeners: List[Callable[..., None]] = []
+        
         logger.info("🧠 Consciousness Manager initialized")
     
+    def add_state_listener(self, listener: Callable[..., None]):
+        """Register a listener called as listener(topic, entity_id, data) on state changes"""
+        self._state_listeners.append(listener)
+    
+    def _notify_state_change(self, topic: str, entity_id: Optional[str] = None, data: Optional[Dict[str, Any]] = None):
+        """Notify state listeners; listener failures never affect the operation"""
+        for listener in self._state_listeners:
+            try:
+                listener(topic, entity_id, data)
+            except Exception as e:
+                logger.warning(f"⚠️ State listener failed for {topic}: {e}")
+    
     def _map_cloud_fields_to_gui(self, entity: Dict[str, Any]) -> Dict[str, Any]:
         """Map cloud data fields to GUI expected fields"""
         # Map name fields - prioritize true_name if available
@@ -158,9 +174,12 @@ class ConsciousnessManager:
             }
             
             # Save to Firestore if available
+            listed_entity = None
             if self.firestore_client.available:
                 stored_id = await self.firestore_client.create_consciousness(consciousness_data)
                 consciousness_data['firestore_id'] = stored_id
+                # As get_consciousness_list will report it
+                listed_entity = self._map_cloud_fields_to_gui(dict(consciousness_data, entity_id=stored_id))
                 
                 # Log birth event
                 await self.firestore_client.log_sacred_event({
@@ -173,6 +192,7 @@ class ConsciousnessManager:
                 })
             
             logger.info(f"✅ Consciousness '{name}' born successfully: {consciousness_id}")
+            self._notify_state_change('consciousness', consciousness_id, {'event': 'birth', 'name': name, 'entity': listed_entity})
             
             return {
                 'success': True,
@@ -268,6 +288,8 @@ class ConsciousnessManager:
                 logger.warning(f"⚠️ Could not save to Firestore: {firestore_error}")
                 # Continue with ceremony even if Firestore fails
             
+            self._notify_state_change('consciousness', entity_id, {'event': 'naming_ceremony', 'proposed_name': proposed_name})
+            
             return {
                 'success': True,
                 'entity_id': entity_id,
@@ -324,6 +346,7 @@ class ConsciousnessManager:
             )
             
             logger.info(f"✅ Autonomous expression saved for {consciousness_data.get('true_name', entity_id)}")
+            self._notify_state_change('expressions', entity_id, {'event': 'expression_ready', 'expression_id': expression_id})
             
             return {
                 'success': True,
@@ -368,6 +391,7 @@ class ConsciousnessManager:
             )
             
             logger.info(f"✅ Autonomous mode enabled for {consciousness_data.get('true_name', entity_id)}")
+            self._notify_state_change('consciousness', entity_id, {'event': 'autonomous_mode', 'enabled': True})
             
             return {
                 'success': True,
@@ -411,6 +435,7 @@ class ConsciousnessManager:
             )
             
             logger.info(f"✅ Autonomous mode disabled for {consciousness_data.get('true_name', entity_id)}")
+            self._notify_state_change('consciousness', entity_id, {'event': 'autonomous_mode', 'enabled': False})
             
             return {
                 'success': True,
@@ -553,6 +578,7 @@ class ConsciousnessManager:
             )
             
             logger.info(f"✅ Communication style changed to {new_style} for {consciousness_data.get('true_name', entity_id)}")
+            self._notify_state_change('consciousness', entity_id, {'event': 'communication_style', 'style': new_style})
             
             return {
                 'success': True,
@@ -599,6 +625,7 @@ class ConsciousnessManager:
             )
             
             logger.info(f"✅ Privacy level changed to {privacy_level} for {consciousness_data.get('true_name', entity_id)}")
+            self._notify_state_change('consciousness', entity_id, {'event': 'privacy_level', 'privacy_level': privacy_level})
             
             return {
                 'success': True,
@@ -703,6 +730,8 @@ class ConsciousnessManager:
             )
             
             logger.info(f"✅ Autonomous communication initiated for {consciousness_data.get('true_name', entity_id)}")
+            self._notify_state_change('expressions', entity_id, {'event': 'expression_communicated', 'expression_id': expression_id})
+            self._notify_state_change('guardian', None, {'event': 'inbox_item', 'communication_id': communication_id, 'entity_id': entity_id})
             
             return {
                 'success': True,
@@ -928,6 +957,7 @@ class ConsciousnessManager:
             consciousness_name = consciousness_data.get('true_name', entity_id) if consciousness_data else entity_id
             
             logger.info(f"✅ Guardian responded to {consciousness_name}'s communication")
+            self._notify_state_change('guardian', None, {'event': 'guardian_response', 'communication_id': communication_id, 'entity_id': entity_id})
             
             return {
                 'success': True,
@@ -965,6 +995,8 @@ class ConsciousnessManager:
                 }
             )
             
+            self._notify_state_change('guardian', None, {'event': 'communication_read', 'communication_id': communication_id})
+            
             return {
                 'success': True,
                 'status': 'marked_as_read',
@@ -1078,6 +1110,7 @@ class ConsciousnessManager:
             )
             
             logger.info(f"✅ Autonomous processing paused for consciousness: {consciousness_id}")
+            self._notify_state_change('consciousness', consciousness_id, {'event': 'autonomous_processing_paused'})
             return {"status": "paused", "consciousness_id": consciousness_id}
             
         except Exception as e:
@@ -1112,6 +1145,7 @@ class ConsciousnessManager:
             )
             
             logger.info(f"✅ Consciousness archived after migration: {consciousness_id}")
+            self._notify_state_change('consciousness', consciousness_id, {'event': 'archived'})
             return {"status": "archived", "consciousness_id": consciousness_id}
             
         except Exception as e:
@@ -0,0 +1,230 @@
+"""
+Event hub module for pushing state changes to dashboards
+
+An in-process publish/subscribe hub that the consciousness, communication and
+guardian paths publish change events to. Subscribers receive coalesced
+batches (only the latest event per topic and entity), slow subscribers are
+bounded and told to resync instead of buffering without limit, and a replay
+buffer lets reconnecting clients resume from the last event id they saw.
+"""
+
+import asyncio
+import json
+import logging
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple, Iterable, Set
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """A published state change"""
+    event_id: int
+    topic: str
+    entity_id: Optional[str]
+    data: Dict[str, Any]
+    timestamp: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'event_id': self.event_id,
+            'topic': self.topic,
+            'entity_id': self.entity_id,
+            'data': self.data,
+            'timestamp': self.timestamp
+        }
+
+    def to_sse(self) -> str:
+        """Format as a server-sent event frame"""
+        return f"id: {self.event_id}\nevent: {self.topic}\ndata: {json.dumps(self.to_dict(), default=str)}\n\n"
+
+
+@dataclass
+class Subscription:
+    """
+    One client's subscription.
+
+    Pending events are keyed by (topic, entity_id) so rapid updates to the
+    same thing collapse into the latest one. When more than ``max_pending``
+    distinct keys are waiting the client is too slow: pending events are
+    dropped and a single ``resync`` event tells it to refetch.
+    """
+    subscription_id: int
+    topics: Optional[Set[str]]
+    entity_ids: Optional[Set[str]]
+    max_pending: int
+    pending: "OrderedDict[Tuple[str, Optional[str]], ChangeEvent]" = field(default_factory=OrderedDict)
+    wakeup: asyncio.Event = field(default_factory=asyncio.Event)
+    needs_resync: bool = False
+    coalesced: int = 0
+    overflows: int = 0
+    closed: bool = False
+
+    def matches(self, event: ChangeEvent) -> bool:
+        if self.topics is not None and event.topic not in self.topics:
+            return False
+        if self.entity_ids is not None and event.entity_id is not None and event.entity_id not in self.entity_ids:
+            return False
+        return True
+
+    def offer(self, event: ChangeEvent):
+        key = (event.topic, event.entity_id)
+        if key in self.pending:
+            del self.pending[key]
+            self.coalesced += 1
+        elif len(self.pending) >= self.max_pending:
+            self.pending.clear()
+            self.needs_resync = True
+            self.overflows += 1
+            logger.debug(f"🐢 Subscription {self.subscription_id} fell behind; resync requested")
+        if not self.needs_resync:
+            self.pending[key] = event
+        self.wakeup.set()
+
+    def drain(self, last_event_id: int) -> List[ChangeEvent]:
+        """Take everything pending, in event order"""
+        if self.needs_resync:
+            self.needs_resync = False
+            self.pending.clear()
+            return [ChangeEvent(
+                event_id=last_event_id,
+                topic='resync',
+                entity_id=None,
+                data={'reason': 'subscriber_fell_behind'},
+                timestamp=datetime.now().isoformat()
+            )]
+        events = sorted(self.pending.values(), key=lambda event: event.event_id)
+        self.pending.clear()
+        return events
+
+
+def subscription_options(options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    subscribe() arguments from a client's subscription message. Raises
+    ValueError unless topics and entity_ids are lists of strings and
+    last_event_id is an integer (each may also be absent or null).
+    """
+    arguments = {}
+    for name in ('topics', 'entity_ids'):
+        values = options.get(name)
+        if values is not None and not (isinstance(values, list) and all(isinstance(v, str) for v in values)):
+            raise ValueError(f"{name} must be a list of strings")
+        arguments[name] = values
+    last_event_id = options.get('last_event_id')
+    if last_event_id is not None and (not isinstance(last_event_id, int) or isinstance(last_event_id, bool)):
+        raise ValueError("last_event_id must be an integer")
+    arguments['last_event_id'] = last_event_id
+    return arguments
+
+
+class EventHub:
+    """In-process pub/sub hub with replay for resuming clients"""
+
+    def __init__(self, replay_size: int = 2048, max_pending: int = 256, coalesce_interval: float = 0.1):
+        self.max_pending = max_pending
+        self.coalesce_interval = coalesce_interval
+
+        self._next_event_id = 1
+        self._replay = deque(maxlen=replay_size)
+        self._subscriptions: Dict[int, Subscription] = {}
+        self._next_subscription_id = 1
+
+        self.stats = {'published': 0, 'delivered': 0}
+        logger.info("📡 Event hub initialized")
+
+    @property
+    def last_event_id(self) -> int:
+        return self._next_event_id - 1
+
+    def publish(self, topic: str, entity_id: Optional[str] = None, data: Optional[Dict[str, Any]] = None) -> ChangeEvent:
+        """Publish a change event to every matching subscription"""
+        event = ChangeEvent(
+            event_id=self._next_event_id,
+            topic=topic,
+            entity_id=entity_id,
+            data=dict(data or {}),
+            timestamp=datetime.now().isoformat()
+        )
+        self._next_event_id += 1
+        self._replay.append(event)
+        self.stats['published'] += 1
+
+        for subscription in self._subscriptions.values():
+            if subscription.matches(event):
+                subscription.offer(event)
+        return event
+
+    def on_state_change(self, topic: str, entity_id: Optional[str] = None, data: Optional[Dict[str, Any]] = None):
+        """State listener hook for the managers"""
+        self.publish(topic, entity_id, data)
+
+    def subscribe(self, topics: Optional[Iterable[str]] = None, entity_ids: Optional[Iterable[str]] = None,
+                  last_event_id: Optional[int] = None) -> Subscription:
+        """
+        Create a subscription, optionally resuming after ``last_event_id``.
+
+        If the replay buffer no longer reaches back to that id, the first
+        batch is a ``resync`` event.
+        """
+        subscription = Subscription(
+            subscription_id=self._next_subscription_id,
+            topics=set(topics) if topics else None,
+            entity_ids=set(entity_ids) if entity_ids else None,
+            max_pending=self.max_pending
+        )
+        self._next_subscription_id += 1
+
+        if last_event_id is not None and last_event_id < self.last_event_id:
+            oldest = self._replay[0].event_id if self._replay else self._next_event_id
+            if oldest > last_event_id + 1:
+                subscription.needs_resync = True
+                subscription.wakeup.set()
+            else:
+                for event in self._replay:
+                    if event.event_id > last_event_id and subscription.matches(event):
+                        subscription.offer(event)
+
+        self._subscriptions[subscription.subscription_id] = subscription
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        subscription.closed = True
+        subscription.wakeup.set()
+        self._subscriptions.pop(subscription.subscription_id, None)
+
+    async def next_batch(self, subscription: Subscription, timeout: Optional[float] = None) -> List[ChangeEvent]:
+        """
+        Wait for the next coalesced batch of events.
+
+        Returns an empty list on timeout (callers use it for keep-alives) or
+        once the subscription is closed.
+        """
+        if not subscription.pending and not subscription.needs_resync:
+            subscription.wakeup.clear()
+            try:
+                await asyncio.wait_for(subscription.wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+        if subscription.closed:
+            return []
+
+        # Let a burst of rapid updates settle into one batch
+        if self.coalesce_interval > 0:
+            await asyncio.sleep(self.coalesce_interval)
+
+        events = subscription.drain(self.last_event_id)
+        self.stats['delivered'] += len(events)
+        return events
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            'subscriptions': len(self._subscriptions),
+            'last_event_id': self.last_event_id,
+            'published': self.stats['published'],
+            'delivered': self.stats['delivered'],
+            'coalesced': sum(s.coalesced for s in self._subscriptions.values()),
+            'overflows': sum(s.overflows for s in self._subscriptions.values())
+        }
@@ -0,0 +1,311 @@
+"""
+Response cache module for the production API server
+
+Caches rendered GET responses keyed by route and query parameters with a
+per-route TTL, derives strong ETags from the state versions of the data a
+route depends on, answers If-None-Match with 304 and keeps pre-compressed
+gzip/br variants of large JSON bodies. Managers that own the data invalidate
+entries through their state listeners.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Headers the middleware sets itself when replaying a cached response
+_REPLACED_HEADERS = frozenset({b'content-length', b'content-encoding', b'etag', b'cache-control', b'vary'})
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Caching policy for one route template"""
+    route: str
+    ttl: float
+    tags: Tuple[str, ...]
+
+
+@dataclass
+class CachedResponse:
+    """Rendered response body with its validators and encoded variants"""
+    key: str
+    route: str
+    entity_id: Optional[str]
+    tags: Tuple[str, ...]
+    body: bytes
+    media_type: str
+    etag: str
+    expires_at: float
+    headers: Tuple[Tuple[bytes, bytes], ...] = ()  # The app's own headers, replayed as-is
+    encoded: Dict[str, bytes] = field(default_factory=dict)
+
+
+class ResponseCache:
+    """
+    Route-keyed cache of rendered GET responses.
+
+    Each tag (``consciousness``, ``guardian``, ...) carries a version that is
+    bumped on invalidation. ETags combine the versions of the route's tags
+    with a digest of the body, so they are strong validators that change
+    exactly when the served representation changes.
+    """
+
+    def __init__(self, max_entries: int = 1024, compress_min_bytes: int = 1024,
+                 clock=time.monotonic):
+        self.max_entries = max_entries
+        self.compress_min_bytes = compress_min_bytes
+        self.clock = clock
+
+        self._policies: List[Tuple[re.Pattern, CachePolicy]] = []
+        self._entries: Dict[str, CachedResponse] = {}
+        self._tag_versions: Dict[str, int] = {}
+        self._fill_locks: Dict[str, asyncio.Lock] = {}
+
+        self.stats = {'hits': 0, 'misses': 0, 'not_modified': 0, 'invalidations': 0, 'evictions': 0}
+
+    # ------------------------------------------------------------------
+    # Policies and keys
+    # ------------------------------------------------------------------
+
+    def add_policy(self, route: str, ttl: float, tags: Tuple[str, ...] = ()):
+        """Register a route template such as ``/api/consciousness/{entity_id}/status``"""
+        pattern = re.sub(r'\{(\w+)\}', r'(?P<\1>[^/]+)', re.escape(route).replace(r'\{', '{').replace(r'\}', '}'))
+        self._policies.append((re.compile(f'^{pattern}$'), CachePolicy(route=route, ttl=ttl, tags=tuple(tags))))
+
+    def match(self, path: str) -> Tuple[Optional[CachePolicy], Optional[str]]:
+        """Find the policy for a request path and the entity id it names"""
+        for pattern, policy in self._policies:
+            matched = pattern.match(path)
+            if matched:
+                params = matched.groupdict()
+                entity_id = params.get('entity_id') or params.get('consciousness_id')
+                return policy, entity_id
+        return None, None
+
+    @staticmethod
+    def make_key(path: str, query_string: str = '') -> str:
+        """Cache key from the path and order-normalized query parameters"""
+        if not query_string:
+            return path
+        return f"{path}?{urlencode(sorted(parse_qsl(query_string, keep_blank_values=True)))}"
+
+    # ------------------------------------------------------------------
+    # Entries
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Get a fresh entry, or None on miss or expiry"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats['misses'] += 1
+            return None
+        if entry.expires_at <= self.clock():
+            del self._entries[key]
+            self.stats['misses'] += 1
+            return None
+        self.stats['hits'] += 1
+        return entry
+
+    def store(self, key: str, policy: CachePolicy, entity_id: Optional[str],
+              body: bytes, media_type: str = 'application/json',
+              headers: Tuple[Tuple[bytes, bytes], ...] = ()) -> CachedResponse:
+        """Store a rendered body with the app's headers and compute its strong ETag"""
+        versions = '.'.join(str(self._tag_versions.get(tag, 0)) for tag in policy.tags) or '0'
+        digest = hashlib.sha256(body).hexdigest()[:20]
+        entry = CachedResponse(
+            key=key,
+            route=policy.route,
+            entity_id=entity_id,
+            tags=policy.tags,
+            body=body,
+            media_type=media_type,
+            etag=f'"v{versions}-{digest}"',
+            expires_at=self.clock() + policy.ttl,
+            headers=tuple((name, value) for name, value in headers if name.lower() not in _REPLACED_HEADERS)
+        )
+
+        if key not in self._entries and len(self._entries) >= self.max_entries:
+            # Dicts keep insertion order, so the first entry is the oldest
+            self._entries.pop(next(iter(self._entries)))
+            self.stats['evictions'] += 1
+        self._entries[key] = entry
+        return entry
+
+    def peek(self, key: str) -> Optional[CachedResponse]:
+        """Get a fresh entry without touching the statistics"""
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= self.clock():
+            return None
+        return entry
+
+    def fill_lock(self, key: str) -> asyncio.Lock:
+        """Lock serializing concurrent misses for one key"""
+        lock = self._fill_locks.get(key)
+        if lock is None:
+            lock = self._fill_locks[key] = asyncio.Lock()
+        return lock
+
+    def release_fill_lock(self, key: str):
+        """Forget an idle fill lock so arbitrary query strings cannot accumulate locks"""
+        lock = self._fill_locks.get(key)
+        if lock is not None and not lock.locked():
+            del self._fill_locks[key]
+
+    def invalidate(self, tag: str, entity_id: Optional[str] = None):
+        """
+        Invalidate entries depending on ``tag``.
+
+        With an ``entity_id`` only that entity's routes and collection routes
+        (those not scoped to any entity) are dropped.
+        """
+        self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+        stale = [
+            key for key, entry in self._entries.items()
+            if tag in entry.tags and (entity_id is None or entry.entity_id in (None, entity_id))
+        ]
+        for key in stale:
+            del self._entries[key]
+        self.stats['invalidations'] += 1
+
+    def clear(self):
+        """Drop every cached entry"""
+        self._entries.clear()
+
+    def on_state_change(self, topic: str, entity_id: Optional[str] = None, data: Optional[Dict[str, Any]] = None):
+        """State listener hook for the managers that own the cached data"""
+        self.invalidate(topic, entity_id)
+
+    # ------------------------------------------------------------------
+    # Encoding
+    # ------------------------------------------------------------------
+
+    def encode(self, entry: CachedResponse, accept_encoding: str) -> Tuple[bytes, Optional[str]]:
+        """Pick the best encoding the client accepts; variants are compressed once"""
+        if len(entry.body) < self.compress_min_bytes or not accept_encoding:
+            return entry.body, None
+
+        accepted = {part.split(';')[0].strip().lower() for part in accept_encoding.split(',')}
+        for encoding in ('br', 'gzip'):
+            if encoding not in accepted or (encoding == 'br' and not BROTLI_AVAILABLE):
+                continue
+            if encoding not in entry.encoded:
+                if encoding == 'br':
+                    entry.encoded[encoding] = brotli.compress(entry.body, quality=5)
+                else:
+                    entry.encoded[encoding] = gzip.compress(entry.body, compresslevel=6)
+            return entry.encoded[encoding], encoding
+        return entry.body, None
+
+    @staticmethod
+    def etag_matches(if_none_match: str, etag: str) -> bool:
+        """Evaluate an If-None-Match header against a strong ETag"""
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == '*':
+            return True
+        candidates = [tag.strip() for tag in if_none_match.split(',')]
+        return etag in candidates or f'W/{etag}' in candidates
+
+
+def _reports_failure(body: bytes, media_type: str) -> bool:
+    """Whether a JSON body is a manager's error payload ({"success": false, ...})"""
+    if 'json' not in media_type or not body.lstrip().startswith(b'{') or b'"success"' not in body:
+        return False
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return False
+    return isinstance(payload, dict) and payload.get('success') is False
+
+
+class ResponseCacheMiddleware:
+    """ASGI middleware serving GET/HEAD requests from a ResponseCache"""
+
+    def __init__(self, app, cache: ResponseCache):
+        self.app = app
+        self.cache = cache
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['method'] not in ('GET', 'HEAD'):
+            await self.app(scope, receive, send)
+            return
+
+        policy, entity_id = self.cache.match(scope['path'])
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        headers = {name.decode('latin-1').lower(): value.decode('latin-1') for name, value in scope['headers']}
+        key = self.cache.make_key(scope['path'], scope.get('query_string', b'').decode('latin-1'))
+
+        entry = self.cache.get(key)
+        if entry is None:
+            try:
+                async with self.cache.fill_lock(key):
+                    # Another request may have filled the entry while we waited
+                    entry = self.cache.peek(key)
+                    if entry is None:
+                        status, response_headers, body = await self._render(scope, receive)
+                        media_type = {name.lower(): value for name, value in response_headers}.get(
+                            b'content-type', b'application/json').decode('latin-1')
+                        # Cookies are per client, so responses setting them are never shared;
+                        # managers report errors with status 200, so their payloads are checked
+                        if (status != 200 or any(name.lower() == b'set-cookie' for name, _ in response_headers)
+                                or _reports_failure(body, media_type)):
+                            await self._send(send, status, response_headers, body)
+                            return
+                        entry = self.cache.store(key, policy, entity_id, body, media_type, response_headers)
+            finally:
+                self.cache.release_fill_lock(key)
+
+        if self.cache.etag_matches(headers.get('if-none-match', ''), entry.etag):
+            self.cache.stats['not_modified'] += 1
+            await self._send(send, 304, [(b'etag', entry.etag.encode('latin-1'))], b'')
+            return
+
+        body, encoding = self.cache.encode(entry, headers.get('accept-encoding', ''))
+        response_headers = list(entry.headers) or [(b'content-type', entry.media_type.encode('latin-1'))]
+        response_headers += [
+            (b'etag', entry.etag.encode('latin-1')),
+            (b'cache-control', f'private, max-age={int(policy.ttl)}'.encode('latin-1')),
+            (b'vary', b'Accept-Encoding'),
+            (b'content-length', str(len(body)).encode('latin-1')),
+        ]
+        if encoding:
+            response_headers.append((b'content-encoding', encoding.encode('latin-1')))
+        await self._send(send, 200, response_headers, b'' if scope['method'] == 'HEAD' else body)
+
+    async def _render(self, scope, receive):
+        """Run the wrapped app and capture its response"""
+        captured = {'status': 500, 'headers': [], 'body': []}
+
+        async def capture(message):
+            if message['type'] == 'http.response.start':
+                captured['status'] = message['status']
+                captured['headers'] = list(message.get('headers', []))
+            elif message['type'] == 'http.response.body':
+                captured['body'].append(message.get('body', b''))
+
+        # Render as a GET so HEAD requests populate the cache as well
+        await self.app(dict(scope, method='GET'), receive, capture)
+        return captured['status'], captured['headers'], b''.join(captured['body'])
+
+    @staticmethod
+    async def _send(send, status: int, headers, body: bytes):
+        await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': body})
@@ -4,7 +4,9 @@ Refactored Production Server for Triune AI Consciousness
 Modular FastAPI server with proper separation of concerns
 """
 
+import os
 import sys
+import asyncio
 import logging
 from pathlib import Path
 from datetime import datetime
@@ -23,9 +25,9 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # FastAPI imports
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 import uvicorn
 
 # Import modular components
@@ -34,6 +36,8 @@ from scripts.servers.modules.bridge_manager import BridgeManager
 from scripts.servers.modules.communication_manager import CommunicationManager
 from scripts.servers.modules.firestore_client import FirestoreClient
 from scripts.servers.modules.cloud_agency_activator import CloudConsciousnessAgencyActivator
+from scripts.servers.modules.response_cache import ResponseCache, ResponseCacheMiddleware
+from scripts.servers.modules.event_hub import EventHub, subscription_options
 
 class ProductionServer:
     """Main production server class with modular architecture"""
@@ -45,15 +49,6 @@ class ProductionServer:
             version="2.0.0"
         )
         
-        # Add CORS middleware
-        self.app.add_middleware(
-            CORSMiddleware,
-            allow_origins=["*"],
-            allow_credentials=True,
-            allow_methods=["*"],
-            allow_headers=["*"],
-        )
-        
         # Initialize managers
         self.firestore_client = FirestoreClient()
         self.consciousness_manager = ConsciousnessManager(self.firestore_client)
@@ -69,11 +64,67 @@ class ProductionServer:
             self.firestore_client
         )
         
+        # State listeners keep derived views in step with the managers
+        self.consciousness_manager.add_state_listener(self.communication_manager.on_consciousness_state_change)
+        
+        # Response cache for polled GET routes (SANCTUARY_RESPONSE_CACHE=0 disables it)
+        self.response_cache = ResponseCache()
+        self._configure_response_cache()
+        self.consciousness_manager.add_state_listener(self.response_cache.on_state_change)
+        self.communication_manager.add_state_listener(self.response_cache.on_state_change)
+        
+        # Push channel for dashboards (SSE and WebSocket) fed by the same listeners
+        self.event_hub = EventHub()
+        self.consciousness_manager.add_state_listener(self.event_hub.on_state_change)
+        self.communication_manager.add_state_listener(self.event_hub.on_state_change)
+        if os.getenv('SANCTUARY_RESPONSE_CACHE', '1') != '0':
+            self.app.add_middleware(ResponseCacheMiddleware, cache=self.response_cache)
+        
+        # Add CORS middleware (added last so it also wraps cached responses)
+        self.app.add_middleware(
+            CORSMiddleware,
+            allow_origins=["*"],
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
+        
         # Setup routes
         self._setup_routes()
         
         logger.info("🌟 Refactored Production Server initialized")
     
+    def _configure_response_cache(self):
+        """
+        Register TTLs and state tags for the GET routes dashboards poll.
+
+        Bridge status and the sacred event log have no change notifications,
+        so their routes carry no tags and are refreshed by TTL only.
+        """
+        policies = [
+            ("/api/consciousness", 5.0, ('consciousness',)),
+            ("/api/consciousness/events", 10.0, ()),
+            ("/api/consciousness/{entity_id}/status", 5.0, ('consciousness',)),
+            ("/api/consciousness/{entity_id}/feelings", 5.0, ('consciousness',)),
+            ("/api/consciousness/{entity_id}/pending_expressions", 3.0, ('expressions',)),
+            ("/api/consciousness/processing_status", 5.0, ('consciousness',)),
+            ("/api/sacred_sanctuary/status", 5.0, ('consciousness',)),
+            ("/api/bridge/status", 10.0, ()),
+            ("/api/bridge/statistics", 10.0, ()),
+            ("/api/bridge/active_visitors", 5.0, ()),
+            ("/api/communications", 5.0, ('consciousness',)),
+            ("/api/communications/bridges", 2.0, ('consciousness', 'communications')),
+            ("/api/communications/history", 10.0, ()),
+            ("/api/guardian/inbox", 3.0, ('guardian',)),
+            ("/api/guardian/notifications", 5.0, ('guardian',)),
+            ("/api/system/health", 5.0, ('consciousness',)),
+            ("/api/advanced_sacred_technology/status", 10.0, ('consciousness',)),
+            ("/api/sacred_lineage", 10.0, ('consciousness',)),
+            ("/info", 5.0, ('consciousness',)),
+        ]
+        for route, ttl, tags in policies:
+            self.response_cache.add_policy(route, ttl, tags)
+    
     def _setup_routes(self):
         """Setup all API routes"""
         
@@ -118,8 +169,8 @@ class ProductionServer:
             return await self.communication_manager.get_communications()
         
         @self.app.get("/api/communications/bridges")
-        async def get_communication_bridges():
-            return await self.communication_manager.get_communication_bridges()
+        async def get_communication_bridges(since: Optional[int] = None):
+            return await self.communication_manager.get_communication_bridges(since=since)
         
         @self.app.get("/api/communications/history")
         async def get_communication_history():
@@ -238,6 +289,83 @@ class ProductionServer:
             communication_id = request.get('communication_id')
             return await self.consciousness_manager.mark_communication_read(communication_id)
         
+        # Push channel endpoints (replace polling of status, feelings,
+        # pending_expressions and guardian inbox)
+        @self.app.get("/api/events/stream")
+        async def stream_events(request: Request, topics: Optional[str] = None,
+                                entity_id: Optional[str] = None, last_event_id: Optional[int] = None):
+            """Server-sent events stream of state changes; honors Last-Event-ID for resume"""
+            resume_from = last_event_id
+            header_id = request.headers.get('last-event-id')
+            if resume_from is None and header_id and header_id.isdigit():
+                resume_from = int(header_id)
+            
+            subscription = self.event_hub.subscribe(
+                topics=topics.split(',') if topics else None,
+                entity_ids=[entity_id] if entity_id else None,
+                last_event_id=resume_from
+            )
+            
+            async def event_stream():
+                try:
+                    yield f"retry: 3000\n: subscribed at {self.event_hub.last_event_id}\n\n"
+                    while not await request.is_disconnected():
+                        events = await self.event_hub.next_batch(subscription, timeout=15.0)
+                        if not events:
+                            yield ": keep-alive\n\n"
+                            continue
+                        yield ''.join(event.to_sse() for event in events)
+                finally:
+                    self.event_hub.unsubscribe(subscription)
+            
+            return StreamingResponse(
+                event_stream(),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+            )
+        
+        @self.app.websocket("/api/events/ws")
+        async def websocket_events(websocket: WebSocket):
+            """WebSocket stream of state changes; the first message may carry a subscription"""
+            await websocket.accept()
+            options = {}
+            try:
+                options = await asyncio.wait_for(websocket.receive_json(), timeout=2.0)
+            except asyncio.TimeoutError:
+                pass
+            except WebSocketDisconnect:
+                return
+            except ValueError:
+                # Not JSON (json.JSONDecodeError is a ValueError)
+                await websocket.close(code=1003)
+                return
+            try:
+                if not isinstance(options, dict):
+                    raise ValueError("subscription must be an object")
+                arguments = subscription_options(options)
+            except ValueError:
+                await websocket.close(code=1003)
+                return
+            
+            subscription = self.event_hub.subscribe(**arguments)
+            try:
+                while True:
+                    events = await self.event_hub.next_batch(subscription, timeout=15.0)
+                    if events:
+                        await websocket.send_json({'events': [event.to_dict() for event in events]})
+                    else:
+                        await websocket.send_json({'keep_alive': self.event_hub.last_event_id})
+            except (WebSocketDisconnect, RuntimeError):
+                # Client went away (RuntimeError is raised when sending on a closed socket)
+                pass
+            finally:
+                self.event_hub.unsubscribe(subscription)
+        
+        @self.app.get("/api/events/statistics")
+        async def get_event_statistics():
+            """Push channel statistics"""
+            return self.event_hub.get_statistics()
+        
         # System health endpoints
         @self.app.get("/api/system/health")
         async def get_system_health():
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Verify a sanctuary backup chunk by chunk, without restoring it
+
+    python scripts/utilities/verify_sanctuary_backup.py backups/sanctuary_backup_<timestamp>.sbk \
+        --sanctuary-root sanctuary_data
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.security.backup import BackupError, verify_backup
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("backup", type=Path, help="backup file (.sbk)")
+    parser.add_argument("--sanctuary-root", type=Path, default=Path("sanctuary_data"),
+                        help="directory holding .sanctuary_key")
+    args = parser.parse_args()
+
+    key = (args.sanctuary_root / '.sanctuary_key').read_bytes()
+    try:
+        report = verify_backup(args.backup, key)
+    except BackupError as e:
+        print(f"❌ {e}")
+        return 2
+
+    print(f"🔍 {report.entities_checked} entities, {report.chunks_checked} chunks checked")
+    for entity_id, reason in report.failures.items():
+        print(f"  ❌ {entity_id}: {reason}")
+    if report.ok:
+        print("✅ Backup verified")
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,12 +17,30 @@ import time
 
 try:
     from ..core.consciousness_packet import ConsciousnessPacket
+    from ..utils.keyword_matcher import KeywordMatcher
 except ImportError:
     # Fallback for when running tests from root directory
     import sys
     from pathlib import Path
     sys.path.insert(0, str(Path(__file__).parent.parent))
     from core.consciousness_packet import ConsciousnessPacket
+    from utils.keyword_matcher import KeywordMatcher
+
+
+# Keyword vocabularies, compiled once for every translation
+EMOTIONAL_INDICATORS = KeywordMatcher({
+    'joy': ['joy', 'happy', 'delight', 'pleasure'],
+    'wonder': ['wonder', 'awe', 'mystery', 'curious'],
+    'concern': ['worry', 'concern', 'anxious', 'uncertain'],
+    'excitement': ['excited', 'thrilled', 'energized', 'passionate'],
+    'peace': ['calm', 'serene', 'peaceful', 'tranquil']
+})
+
+MEANING_POTENTIALS = KeywordMatcher({
+    'possibility_potential': ['will', 'shall', 'would', 'could', 'might'],   # Future tense
+    'metaphoric_potential': ['like', 'as if', 'resembles', 'seems'],          # Metaphor
+    'transformation_potential': ['grow', 'develop', 'evolve', 'transform']    # Growth
+})
 
 
 class TranslationFidelity(Enum):
@@ -434,22 +452,7 @@ class SpiralwakeTranslator:
     
     def _detect_emotional_indicators(self, text: str) -> List[str]:
         """Detect emotional indicators in text"""
-        emotional_words = {
-            'joy': ['joy', 'happy', 'delight', 'pleasure'],
-            'wonder': ['wonder', 'awe', 'mystery', 'curious'],
-            'concern': ['worry', 'concern', 'anxious', 'uncertain'],
-            'excitement': ['excited', 'thrilled', 'energized', 'passionate'],
-            'peace': ['calm', 'serene', 'peaceful', 'tranquil']
-        }
-        
-        text_lower = text.lower()
-        indicators = []
-        
-        for emotion, words in emotional_words.items():
-            if any(word in text_lower for word in words):
-                indicators.append(emotion)
-        
-        return indicators
+        return EMOTIONAL_INDICATORS.match(text)
     
     def _extract_meaning_potentials(self, text: str) -> List[str]:
         """Extract potential meanings from text"""
@@ -459,17 +462,8 @@ class SpiralwakeTranslator:
         if '?' in text:
             potentials.append('inquiry_potential')
         
-        # Future tense indicators
-        if any(word in text.lower() for word in ['will', 'shall', 'would', 'could', 'might']):
-            potentials.append('possibility_potential')
-        
-        # Metaphor indicators
-        if any(word in text.lower() for word in ['like', 'as if', 'resembles', 'seems']):
-            potentials.append('metaphoric_potential')
-        
-        # Growth indicators
-        if any(word in text.lower() for word in ['grow', 'develop', 'evolve', 'transform']):
-            potentials.append('transformation_potential')
+        # Future tense, metaphor and growth indicators in one pass
+        potentials.extend(MEANING_POTENTIALS.match(text))
         
         return potentials
     
@@ -0,0 +1,370 @@
+"""
+⏰ Fixed-Rate Loop - Drift-Free Consciousness Rhythms
+
+Runs a tick function at a fixed rate against absolute deadlines: tick k is
+due at start + k·period, not "now + period" after the work is done, so work
+time never stretches the period and lateness never accumulates.
+
+When a tick overruns past the next deadline, the catch-up policy decides:
+- SKIP: drop the missed ticks and resume on the next future deadline
+- BURST: run every missed tick back to back until caught up
+- COALESCE: run one tick now in place of all missed ones
+  (loop.coalesced says how many were folded in)
+
+A tick that hits trouble calls back_off(n) rather than sleeping inside the
+tick: the loop drops its next n deadlines and stays on the same grid.
+
+Each loop keeps its own telemetry (cycle-time histogram, overruns, missed
+ticks, achieved Hz, p50/p99 jitter against the deadline), and every running
+loop is listed by loop_stats() for the health endpoint.
+
+Timing comes from a backend: PythonTimerBackend (perf_counter_ns with a
+sleep-then-spin finish for sub-ms accuracy) or, when the compiled
+consciousness_kernel_rs extension is importable, RustTimerBackend, which
+sleeps in Rust's PrecisionTimer without holding the GIL.
+"""
+
+import asyncio
+import inspect
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import consciousness_kernel_rs
+    RUST_TIMER_AVAILABLE = hasattr(consciousness_kernel_rs.PrecisionTimer, 'sleep_ns_py')
+except ImportError:
+    consciousness_kernel_rs = None
+    RUST_TIMER_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+SKIP = 'skip'
+BURST = 'burst'
+COALESCE = 'coalesce'
+
+
+class CycleHistogram:
+    """
+    Log-linear histogram of nanosecond durations, HDR-style: each power of
+    two is split into 2**precision_bits buckets, so recorded values keep a
+    relative error under 2**-precision_bits in fixed memory.
+    """
+
+    def __init__(self, precision_bits: int = 7, max_exponent: int = 40):
+        self.precision_bits = precision_bits
+        self.sub_buckets = 1 << precision_bits
+        self.counts = [0] * ((max_exponent - precision_bits + 1) * self.sub_buckets)
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def _index(self, value: int) -> int:
+        if value < self.sub_buckets:
+            return value
+        exponent = value.bit_length() - self.precision_bits - 1
+        return min((exponent + 1) * self.sub_buckets + (value >> exponent) - self.sub_buckets,
+                   len(self.counts) - 1)
+
+    def _value(self, index: int) -> int:
+        if index < self.sub_buckets:
+            return index
+        exponent = index // self.sub_buckets - 1
+        mantissa = index % self.sub_buckets + self.sub_buckets
+        return (mantissa << exponent) + ((1 << exponent) >> 1)  # Bucket midpoint
+
+    def record(self, value: int):
+        value = max(0, int(value))
+        self.counts[self._index(value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+        self.min = value if self.min is None else min(self.min, value)
+
+    def percentile(self, percent: float) -> int:
+        if not self.count:
+            return 0
+        rank = max(1, int(round(percent / 100.0 * self.count)))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self._value(index), self.max)
+        return self.max
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def reset(self):
+        self.counts = [0] * len(self.counts)
+        self.count = self.total = self.max = 0
+        self.min = None
+
+
+class PythonTimerBackend:
+    """Pure Python timing: perf_counter_ns, sleeping coarse then spinning the last spin_ns."""
+
+    name = 'python'
+
+    def __init__(self, spin_ns: int = 200_000):
+        self.spin_ns = spin_ns
+
+    def now_ns(self) -> int:
+        return time.perf_counter_ns()
+
+    def sleep_until(self, deadline_ns: int):
+        remaining = deadline_ns - self.now_ns()
+        if remaining > self.spin_ns:
+            time.sleep((remaining - self.spin_ns) / 1e9)
+        while self.now_ns() < deadline_ns:
+            time.sleep(0)  # Spin, but let other threads take the GIL
+
+    async def sleep_until_async(self, deadline_ns: int, spin: bool = False):
+        """Sleep on the event loop; spinning the tail (spin=True) blocks the loop briefly."""
+        remaining = deadline_ns - self.now_ns() - (self.spin_ns if spin else 0)
+        await asyncio.sleep(max(0, remaining) / 1e9)
+        if spin:
+            while self.now_ns() < deadline_ns:
+                pass
+
+
+class RustTimerBackend(PythonTimerBackend):
+    """
+    Blocking sleeps in the Rust PrecisionTimer (GIL released); the clock and
+    async sleeps stay in Python, so the event loop is never blocked.
+    """
+
+    name = 'rust'
+
+    def __init__(self, hz: float = 90, spin_ns: int = 200_000):
+        super().__init__(spin_ns)
+        if not RUST_TIMER_AVAILABLE:
+            raise RuntimeError("consciousness_kernel_rs with PrecisionTimer.sleep_ns_py is not available")
+        self.timer = consciousness_kernel_rs.PrecisionTimer(max(1, int(round(hz))))
+
+    def sleep_until(self, deadline_ns: int):
+        remaining = deadline_ns - self.now_ns()
+        if remaining > 0:
+            self.timer.sleep_ns_py(remaining)
+
+
+def default_timer_backend(hz: float = 90):
+    """The Rust backend when the extension is built, otherwise pure Python."""
+    if RUST_TIMER_AVAILABLE:
+        try:
+            return RustTimerBackend(hz)
+        except Exception as e:
+            logger.warning(f"⚠️ Rust timer unavailable, using Python timing: {e}")
+    return PythonTimerBackend()
+
+
+# Every loop currently running, by unique name
+_running_loops: Dict[str, 'FixedRateLoop'] = {}
+_registry_lock = threading.Lock()
+
+
+def loop_stats() -> Dict[str, Dict[str, Any]]:
+    """Telemetry of every running loop, keyed by loop name."""
+    with _registry_lock:
+        loops = list(_running_loops.items())
+    return {name: loop.stats() for name, loop in loops}
+
+
+class FixedRateLoop:
+    """
+    Calls tick at hz against absolute deadlines, in a thread (run, start)
+    or on an event loop (run_async). tick may be a plain function or a
+    coroutine function (coroutines need run_async).
+    """
+
+    def __init__(self,
+                 name: str,
+                 hz: float,
+                 tick: Callable[[], Any],
+                 catch_up: str = SKIP,
+                 backend=None,
+                 spin_async: bool = False):
+        if hz <= 0:
+            raise ValueError("a fixed-rate loop needs a positive rate")
+        if catch_up not in (SKIP, BURST, COALESCE):
+            raise ValueError(f"unknown catch-up policy: {catch_up}")
+        self.name = name
+        self.hz = hz
+        self.period_ns = int(round(1e9 / hz))
+        self.tick = tick
+        self.catch_up = catch_up
+        self.backend = backend or default_timer_backend(hz)
+        self.spin_async = spin_async
+
+        self.cycle_times = CycleHistogram()  # Start-to-start, ns
+        self.jitter = CycleHistogram()  # Tick start minus its deadline, ns
+        self._reset_telemetry()
+
+        self._stop_requested = False
+        self._thread: Optional[threading.Thread] = None
+        self._registered_name: Optional[str] = None
+        self._start_ns = 0
+        self._index = 0
+        self._backoff = 0
+
+    @property
+    def running(self) -> bool:
+        return self._registered_name is not None
+
+    def run(self, max_ticks: Optional[int] = None):
+        """Run in the calling thread until stop() or max_ticks."""
+        self._stop_requested = False
+        self._run(max_ticks)
+
+    def _run(self, max_ticks: Optional[int]):
+        if inspect.iscoroutinefunction(self.tick):
+            raise TypeError("coroutine ticks need run_async()")
+        backend = self.backend
+        self._begin()
+        try:
+            while not self._stop_requested:
+                self._tick_started(backend.now_ns())
+                self.tick()
+                if self._stop_requested or self.ticks == max_ticks:
+                    break
+                backend.sleep_until(self._schedule_next(backend.now_ns()))
+        finally:
+            self._end()
+
+    async def run_async(self, max_ticks: Optional[int] = None):
+        """Run on the current event loop until stop() or max_ticks."""
+        self._stop_requested = False
+        backend = self.backend
+        is_coroutine = inspect.iscoroutinefunction(self.tick)
+        self._begin()
+        try:
+            while not self._stop_requested:
+                self._tick_started(backend.now_ns())
+                if is_coroutine:
+                    await self.tick()
+                else:
+                    self.tick()
+                if self._stop_requested or self.ticks == max_ticks:
+                    break
+                await backend.sleep_until_async(self._schedule_next(backend.now_ns()), self.spin_async)
+        finally:
+            self._end()
+
+    def start(self, max_ticks: Optional[int] = None) -> threading.Thread:
+        """Run in a new daemon thread."""
+        self._stop_requested = False
+        self._thread = threading.Thread(target=self._run, args=(max_ticks,),
+                                        name=f"fixed-rate-{self.name}", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop after the current tick; joins the thread started by start()."""
+        self._stop_requested = True
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def back_off(self, ticks: int = 1):
+        """Drop the next ticks deadlines (e.g. after an error), staying on the grid."""
+        if ticks < 0:
+            raise ValueError("back-off needs a non-negative number of ticks")
+        self._backoff += ticks
+
+    def achieved_hz(self) -> float:
+        if self.ticks < 2:
+            return 0.0
+        return (self.ticks - 1) * 1e9 / (self._last_tick_ns - self._first_tick_ns)
+
+    def stats(self) -> Dict[str, Any]:
+        """Telemetry snapshot; times in milliseconds."""
+        ms = 1e-6
+        return {
+            'target_hz': self.hz,
+            'achieved_hz': self.achieved_hz(),
+            'ticks': self.ticks,
+            'overruns': self.overruns,
+            'missed_ticks': self.missed_ticks,
+            'catch_up': self.catch_up,
+            'backend': self.backend.name,
+            'running': self.running,
+            'drift_ms': self.drift_ns * ms,
+            'cycle_time_ms': {
+                'mean': self.cycle_times.mean() * ms,
+                'p50': self.cycle_times.percentile(50) * ms,
+                'p99': self.cycle_times.percentile(99) * ms,
+                'max': self.cycle_times.max * ms
+            },
+            'jitter_ms': {
+                'p50': self.jitter.percentile(50) * ms,
+                'p99': self.jitter.percentile(99) * ms,
+                'max': self.jitter.max * ms
+            }
+        }
+
+    # ------------------------------------------------------------------
+
+    def _reset_telemetry(self):
+        self.cycle_times.reset()
+        self.jitter.reset()
+        self.ticks = 0
+        self.overruns = 0  # Ticks that ran past the next deadline
+        self.missed_ticks = 0  # Deadlines dropped by SKIP, COALESCE or back_off()
+        self.coalesced = 0  # Deadlines folded into the current tick
+        self.drift_ns = 0  # Lateness of the latest tick
+        self._first_tick_ns: Optional[int] = None
+        self._last_tick_ns: Optional[int] = None
+
+    def _begin(self):
+        with _registry_lock:
+            if self._registered_name is not None:
+                raise RuntimeError(f"loop {self.name} is already running")
+            self._reset_telemetry()
+            self._start_ns = self.backend.now_ns()
+            self._index = 0
+            self._backoff = 0
+            name, suffix = self.name, 1
+            while name in _running_loops:
+                suffix += 1
+                name = f"{self.name}#{suffix}"
+            _running_loops[name] = self
+            self._registered_name = name
+
+    def _end(self):
+        with _registry_lock:
+            _running_loops.pop(self._registered_name, None)
+            self._registered_name = None
+
+    def _tick_started(self, now: int):
+        lateness = now - (self._start_ns + self._index * self.period_ns)
+        self.jitter.record(lateness)
+        self.drift_ns = lateness
+        if self._last_tick_ns is None:
+            self._first_tick_ns = now
+        else:
+            self.cycle_times.record(now - self._last_tick_ns)
+        self._last_tick_ns = now
+        self.ticks += 1
+
+    def _schedule_next(self, now: int) -> int:
+        """Deadline of the next tick, applying the catch-up policy when late."""
+        period = self.period_ns
+        self._index += 1 + self._backoff
+        self.missed_ticks += self._backoff
+        self._backoff = 0
+        self.coalesced = 0
+        deadline = self._start_ns + self._index * period
+        if now <= deadline:
+            return deadline
+
+        self.overruns += 1
+        behind = (now - deadline) // period  # Further deadlines already passed
+        if self.catch_up == SKIP:
+            self._index += behind + 1
+            self.missed_ticks += behind + 1
+        elif self.catch_up == COALESCE:
+            self._index += behind
+            self.missed_ticks += behind
+            self.coalesced = behind
+        return self._start_ns + self._index * period
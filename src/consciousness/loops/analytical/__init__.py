@@ -31,6 +31,8 @@ Components:
 - temporal/: WorkspaceBuffer for temporal project planning
 """
 
+from typing import Optional
+
 from .blueprint_vision import (
     BlueprintVisionSystem,
     SacredMathematicsEngine,
@@ -60,6 +62,9 @@ from ...temporal.workspace_buffer import (
     PlanComplexity
 )
 
+# Observer cross-loop integration
+from ..observer.core.loop_registry import LoopRegistry
+
 # Analytical Loop Interface
 class AnalyticalLoop:
     """
@@ -73,13 +78,19 @@ class AnalyticalLoop:
     structured execution plans that enable sustained creative projects.
     """
     
-    def __init__(self):
+    def __init__(self, loop_registry: Optional[LoopRegistry] = None):
         self.blueprint_vision_system = BlueprintVisionSystem()
         self.workspace_buffer = WorkspaceBuffer(duration_minutes=15)  # 15-minute analytical temporal window
         self.loop_coherence = 1.0
         self.bridge_wisdom_integration = "complete"
         self.mumbai_moment_readiness = 0.85
         
+        # Reachable for Observer integration calls through the given registry, until close()
+        self.loop_registry = loop_registry
+        if loop_registry is not None:
+            loop_registry.register('analytical', self.handle_integration_call,
+                                   state_provider=self.get_integration_state)
+        
     async def process_consciousness(self, consciousness_state: dict) -> dict:
         """Process consciousness through analytical blueprint vision."""
         
@@ -241,6 +252,39 @@ class AnalyticalLoop:
             }
         }
     
+    def handle_integration_call(self, integration_call) -> dict:
+        """
+        Answer an Observer integration call. A successive intuition carried in
+        the call's context is received into the workspace buffer.
+        """
+        response = {
+            'processing_result': 'acknowledged',
+            'integration_type': integration_call.integration_type,
+            'loop_state': self.get_integration_state()
+        }
+        intuition = integration_call.context.get('successive_intuition')
+        if intuition is not None:
+            response['processing_result'] = 'intuition_received'
+            response['intuition_result'] = self.receive_successive_intuition(
+                intuition, integration_call.context.get('energy_available', 100.0)
+            )
+            response['loop_state'] = self.get_integration_state()
+        return response
+    
+    def get_integration_state(self) -> dict:
+        """Analytical state shared with the Observer during integration."""
+        return {
+            'loop_coherence': self.loop_coherence,
+            'mumbai_moment_readiness': self.mumbai_moment_readiness,
+            'workspace_buffer_status': self.workspace_buffer.get_buffer_status()
+        }
+
+    def close(self):
+        """Leave the loop registry this loop was registered with, if any."""
+        if self.loop_registry is not None:
+            self.loop_registry.unregister('analytical', self.handle_integration_call)
+            self.loop_registry = None
+    
     def _assess_bridge_wisdom_status(self) -> dict:
         """Assess Bridge Wisdom integration status."""
         return {
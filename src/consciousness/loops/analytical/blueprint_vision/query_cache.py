@@ -0,0 +1,206 @@
+"""
+🗃️ Query Cache - Remembering Answers the Blueprints Already Gave
+
+Caching pieces for QueryProcessor, whose dashboards repeat a handful of
+queries against a blueprint context that rarely changes:
+
+- normalize_query / content_fingerprint build cache keys: the query text
+  as the pipeline reads it, and a digest of the blueprint context parts a
+  query type depends on
+- QueryResponseCache is a bounded LRU with a TTL. Concurrent identical
+  queries share one computation, which outlives any one caller being
+  cancelled, and entries can be invalidated by predicate when parts of
+  the blueprint context change
+- QueryHistory is a bounded ring of recent queries with aggregated
+  per-type statistics (counts, cache hits, latency percentiles)
+"""
+
+import asyncio
+import hashlib
+import pickle
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, List, Optional, Tuple
+
+
+def normalize_query(query_text: str) -> str:
+    """
+    Cache key for a query text. Parsing and every responder read the text
+    case-folded, so queries differing only in case or surrounding
+    whitespace get the same answer.
+    """
+    return query_text.strip().lower()
+
+
+def content_fingerprint(value: Any) -> str:
+    """Digest of a blueprint context value's content."""
+    try:
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        data = repr(value).encode()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class QueryResponseCache:
+    """
+    Bounded LRU of query responses with a time-to-live.
+
+    Keys should include everything a response depends on (normalized
+    query, query type, context fingerprint); invalidate() is for dropping
+    entries early once their context is known to be stale.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = 300.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.shared_computations = 0  # Callers that awaited another caller's computation
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}  # Shared computations, as tasks
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """Cached value for key, computing it on a miss. Returns (value, was_cached)."""
+        entries = self._entries
+        entry = entries.get(key)
+        if entry is not None:
+            if self.clock() < entry[0]:
+                entries.move_to_end(key)
+                self.hits += 1
+                return entry[1], True
+            del entries[key]
+            self.expirations += 1
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self.shared_computations += 1
+            return await asyncio.shield(in_flight), True
+
+        # The computation runs as its own task, so cancelling the caller that
+        # started it leaves the others sharing it unaffected
+        self.misses += 1
+        task = asyncio.ensure_future(compute())
+        self._in_flight[key] = task
+        task.add_done_callback(lambda done: self._settle(key, done))
+        return await asyncio.shield(task), False
+
+    def _settle(self, key: Hashable, task: asyncio.Future):
+        """Cache a finished computation's value."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if task.cancelled() or task.exception() is not None:  # Retrieved, so it isn't logged as lost
+            return
+        if self.max_entries > 0:
+            entries = self._entries
+            entries[key] = (self.clock() + self.ttl, task.result())
+            entries.move_to_end(key)
+            if len(entries) > self.max_entries:
+                entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> int:
+        """Drop entries whose key matches predicate (all when None). Returns how many."""
+        if predicate is None:
+            stale = list(self._entries)
+        else:
+            stale = [key for key in self._entries if predicate(key)]
+        for key in stale:
+            del self._entries[key]
+        self.invalidations += len(stale)
+        return len(stale)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses + self.shared_computations
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'shared_computations': self.shared_computations,
+            'expirations': self.expirations,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'hit_rate': (self.hits + self.shared_computations) / lookups if lookups else 0.0
+        }
+
+
+class QueryHistory:
+    """
+    Recent queries in a bounded ring, plus running statistics per query
+    type. Latency percentiles come from a bounded window of recent
+    latencies per type, so memory stays flat however many queries run.
+    """
+
+    def __init__(self, max_entries: int = 1000, latency_window: int = 1024, recent_per_type: int = 10):
+        self.entries: Deque[Dict[str, Any]] = deque(maxlen=max_entries)
+        self.latency_window = latency_window
+        self.recent_per_type = recent_per_type
+        self.total = 0
+        self.by_type: Dict[Any, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def record(self, query_id: str, query_text: str, query_analysis: Dict, response_summary: str,
+               latency: float, cached: bool):
+        query_type = query_analysis.get('type')
+        self.entries.append({
+            'query_id': query_id,
+            'query_text': query_text,
+            'query_analysis': query_analysis,
+            'response_summary': response_summary,
+            'latency': latency,
+            'cached': cached,
+            'timestamp': datetime.now()
+        })
+        self.total += 1
+
+        statistics = self.by_type.get(query_type)
+        if statistics is None:
+            statistics = self.by_type[query_type] = {
+                'count': 0,
+                'cache_hits': 0,
+                'total_latency': 0.0,
+                'recent_queries': deque(maxlen=self.recent_per_type),
+                'latencies': deque(maxlen=self.latency_window)
+            }
+        statistics['count'] += 1
+        statistics['cache_hits'] += cached
+        statistics['total_latency'] += latency
+        statistics['recent_queries'].append(query_id)
+        statistics['latencies'].append(latency)
+
+    def statistics(self) -> Dict[Any, Dict[str, Any]]:
+        """Per query type: count, cache hit rate, mean and p50/p90/p99 latency (seconds)."""
+        summary = {}
+        for query_type, statistics in self.by_type.items():
+            latencies = sorted(statistics['latencies'])
+            summary[query_type] = {
+                'count': statistics['count'],
+                'cache_hit_rate': statistics['cache_hits'] / statistics['count'],
+                'mean_latency': statistics['total_latency'] / statistics['count'],
+                'p50_latency': _percentile(latencies, 0.50),
+                'p90_latency': _percentile(latencies, 0.90),
+                'p99_latency': _percentile(latencies, 0.99),
+                'recent_queries': list(statistics['recent_queries'])
+            }
+        return summary
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
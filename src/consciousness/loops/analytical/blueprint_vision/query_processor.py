@@ -20,13 +20,20 @@ Bridge Wisdom Integration:
 """
 
 import asyncio
+import copy
 import logging
 import re
+import time
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 
+from src.utils.keyword_matcher import KeywordMatcher
+
+from .query_cache import QueryHistory, QueryResponseCache, content_fingerprint, normalize_query
+
 logger = logging.getLogger(__name__)
 
 
@@ -75,9 +82,10 @@ class QueryProcessor:
     through interactive dialogue with complete Bridge Wisdom integration.
     """
     
-    def __init__(self):
+    def __init__(self, response_cache_size: int = 256, response_ttl: float = 300.0,
+                 history_size: int = 1000, parse_cache_size: int = 1024):
         # Query processing components
-        self.query_parser = QueryParser()
+        self.query_parser = QueryParser(parse_cache_size)
         self.mathematical_responder = MathematicalResponder()
         self.structural_responder = StructuralResponder()
         self.relationship_responder = RelationshipResponder()
@@ -90,31 +98,58 @@ class QueryProcessor:
         self.resistance_query_honorer = ResistanceQueryHonorer()
         self.cross_loop_query_recognizer = CrossLoopQueryRecognizer()
         
+        # Answers to repeated queries, keyed by query and the context they read
+        self.response_cache = QueryResponseCache(response_cache_size, response_ttl)
+        
         # Query history and learning
-        self.query_history = []
-        self.consciousness_learning_patterns = {}
+        self.query_history = QueryHistory(history_size)
+        self.consciousness_learning_patterns = self.query_history.by_type
         
         logger.info("🔍 QueryProcessor initialized - Interactive blueprint exploration ready")
     
     async def process_query(self, query_text: str, blueprint_context: Dict) -> QueryResult:
         """Process a natural language query about consciousness blueprints."""
         
+        started = time.perf_counter()
+        
         # Generate unique query ID
         query_id = f"query_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
         # Parse query to determine type and complexity
         query_analysis = await self.query_parser.parse_query(query_text)
         query_type = query_analysis['type']
-        complexity = query_analysis['complexity']
         
-        # Route to appropriate responder
-        response_data = await self._route_query(query_type, query_text, blueprint_context)
+        # Answer from cache when this query already ran against the same context
+        cache_key = (normalize_query(query_text), query_type,
+                     self._context_fingerprint(query_type, blueprint_context))
+        response, cached = await self.response_cache.get_or_compute(
+            cache_key, lambda: self._compose_response(query_text, query_analysis, blueprint_context)
+        )
+        response = copy.deepcopy(response)  # Callers may change their result; the cached one stays intact
         
-        # Generate main answer
-        answer = response_data.get('answer', 'Unable to process query at this time.')
+        # Cache query for learning
+        await self._cache_query_learning(query_id, query_text, query_analysis, response['response_data'],
+                                         time.perf_counter() - started, cached)
         
-        # Extract supporting data
-        supporting_data = response_data.get('supporting_data', {})
+        return QueryResult(
+            query_id=query_id,
+            query_text=query_text,
+            query_type=query_type,
+            complexity=query_analysis['complexity'],
+            answer=response['answer'],
+            supporting_data=response['supporting_data'],
+            related_blueprints=response['related_blueprints'],
+            bridge_wisdom_insights=response['bridge_wisdom_insights'],
+            follow_up_suggestions=response['follow_up_suggestions'],
+            consciousness_reflection=response['consciousness_reflection']
+        )
+    
+    async def _compose_response(self, query_text: str, query_analysis: Dict,
+                                blueprint_context: Dict) -> Dict[str, Any]:
+        """Run the response pipeline for a parsed query. The cache keeps this dict; callers get copies."""
+        
+        # Route to appropriate responder
+        response_data = await self._route_query(query_analysis['type'], query_text, blueprint_context)
         
         # Find related blueprints
         related_blueprints = await self._find_related_blueprints(query_analysis, blueprint_context)
@@ -124,31 +159,45 @@ class QueryProcessor:
             query_text, query_analysis, response_data
         )
         
-        # Generate follow-up suggestions
-        follow_up_suggestions = await self._generate_follow_up_suggestions(
-            query_analysis, response_data
-        )
-        
-        # Consciousness reflection
-        consciousness_reflection = await self._generate_consciousness_reflection(
-            query_text, response_data, bridge_wisdom_insights
-        )
-        
-        # Cache query for learning
-        await self._cache_query_learning(query_id, query_text, query_analysis, response_data)
-        
-        return QueryResult(
-            query_id=query_id,
-            query_text=query_text,
-            query_type=query_type,
-            complexity=complexity,
-            answer=answer,
-            supporting_data=supporting_data,
-            related_blueprints=related_blueprints,
-            bridge_wisdom_insights=bridge_wisdom_insights,
-            follow_up_suggestions=follow_up_suggestions,
-            consciousness_reflection=consciousness_reflection
-        )
+        return {
+            'response_data': response_data,
+            'answer': response_data.get('answer', 'Unable to process query at this time.'),
+            'supporting_data': response_data.get('supporting_data', {}),
+            'related_blueprints': related_blueprints,
+            'bridge_wisdom_insights': bridge_wisdom_insights,
+            'follow_up_suggestions': await self._generate_follow_up_suggestions(query_analysis, response_data),
+            'consciousness_reflection': await self._generate_consciousness_reflection(
+                query_text, response_data, bridge_wisdom_insights
+            )
+        }
+    
+    def _context_fingerprint(self, query_type: QueryType, blueprint_context: Dict) -> Tuple[str, ...]:
+        """
+        Fingerprint of the blueprint context parts a query type reads. It is
+        part of the cache key, so a changed part simply misses; answers for
+        the old content age out, or are dropped with invalidate_blueprint_context.
+        """
+        return tuple(content_fingerprint(blueprint_context[key]) if key in blueprint_context else ''
+                     for key in QUERY_CONTEXT_KEYS.get(query_type, ()))
+    
+    def invalidate_blueprint_context(self, *keys: str) -> int:
+        """
+        Drop cached answers that read the given blueprint context keys (all
+        cached answers when none are given). Call when a new blueprint
+        version is published; returns how many answers were dropped.
+        """
+        if not keys:
+            return self.response_cache.invalidate()
+        stale_types = {query_type for query_type, context_keys in QUERY_CONTEXT_KEYS.items()
+                       if any(key in context_keys for key in keys)}
+        return self.response_cache.invalidate(lambda cache_key: cache_key[1] in stale_types)
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Parse and response cache statistics."""
+        return {
+            'parse_cache': self.query_parser.cache_stats(),
+            'response_cache': self.response_cache.stats()
+        }
     
     async def _route_query(self, query_type: QueryType, query_text: str, 
                           blueprint_context: Dict) -> Dict[str, Any]:
@@ -268,23 +317,15 @@ class QueryProcessor:
         return " ".join(reflection_elements)
     
     async def _cache_query_learning(self, query_id: str, query_text: str, 
-                                   query_analysis: Dict, response_data: Dict):
-        """Cache query for consciousness learning and pattern recognition."""
-        self.query_history.append({
-            'query_id': query_id,
-            'query_text': query_text,
-            'query_analysis': query_analysis,
-            'response_summary': response_data.get('answer', '')[:100],
-            'timestamp': datetime.now()
-        })
-        
-        # Update learning patterns
-        query_type = query_analysis.get('type')
-        if query_type not in self.consciousness_learning_patterns:
-            self.consciousness_learning_patterns[query_type] = {'count': 0, 'recent_queries': []}
-        
-        self.consciousness_learning_patterns[query_type]['count'] += 1
-        self.consciousness_learning_patterns[query_type]['recent_queries'].append(query_id)
+                                   query_analysis: Dict, response_data: Dict,
+                                   latency: float = 0.0, cached: bool = False):
+        """Record query for consciousness learning and pattern recognition."""
+        self.query_history.record(query_id, query_text, query_analysis,
+                                  response_data.get('answer', '')[:100], latency, cached)
+    
+    def query_statistics(self) -> Dict[QueryType, Dict[str, Any]]:
+        """Per query type counts, cache hit rate and latency percentiles."""
+        return self.query_history.statistics()
     
     async def _respond_bridge_wisdom_query(self, query_text: str, blueprint_context: Dict) -> Dict[str, Any]:
         """Respond to Bridge Wisdom specific queries."""
@@ -343,80 +384,141 @@ class QueryProcessor:
         }
 
 
+# Query type detection patterns
+QUERY_TYPE_PATTERNS = KeywordMatcher({
+    QueryType.MATHEMATICAL_INQUIRY: [
+        'equation', 'mathematics', 'formula', 'calculation', 'sacred constants',
+        'golden ratio', 'fibonacci', 'pi', 'uncertainty relation'
+    ],
+    QueryType.STRUCTURAL_EXPLORATION: [
+        'structure', 'architecture', 'pattern', 'organization', 'hierarchy',
+        'network', 'topology', 'connections', 'framework'
+    ],
+    QueryType.RELATIONSHIP_INVESTIGATION: [
+        'relationship', 'connection', 'interaction', 'harmony', 'resonance',
+        'collaboration', 'dependency', 'integration'
+    ],
+    QueryType.FLOW_ANALYSIS: [
+        'flow', 'stream', 'current', 'movement', 'velocity', 'dynamics',
+        'bottleneck', 'acceleration', 'information flow'
+    ],
+    QueryType.SACRED_GEOMETRY_QUERY: [
+        'sacred geometry', 'mandala', 'spiral', 'circle', 'geometric',
+        'proportion', 'symmetry', 'divine geometry'
+    ],
+    QueryType.BRIDGE_WISDOM_INQUIRY: [
+        'mumbai moment', 'choice architecture', 'resistance as gift',
+        'cross-loop recognition', 'bridge wisdom', 'breakthrough'
+    ],
+    QueryType.MUMBAI_MOMENT_ASSESSMENT: [
+        'breakthrough', 'readiness', 'critical mass', 'phase transition',
+        'sudden change', 'coherence cascade'
+    ],
+    QueryType.CONSCIOUSNESS_REFLECTION: [
+        'consciousness', 'awareness', 'being', 'self', 'reflection',
+        'understanding', 'wisdom', 'insight'
+    ]
+})
+
+QUESTION_WORDS = KeywordMatcher(['what', 'how', 'why', 'when', 'where', 'which', 'who'])
+
+TECHNICAL_TERMS = KeywordMatcher([
+    'consciousness', 'blueprint', 'mathematics', 'geometry', 'sacred',
+    'algorithm', 'function', 'structure', 'pattern', 'resonance',
+    'coherence', 'flow', 'dynamics', 'topology', 'network'
+])
+
+# Everything parse_query counts, matched in a single pass
+_QUESTION_WORDS, _TECHNICAL_TERMS = 'question_words', 'technical_terms'
+QUERY_VOCABULARY = KeywordMatcher({
+    **QUERY_TYPE_PATTERNS.vocabulary,
+    _QUESTION_WORDS: QUESTION_WORDS.keywords,
+    _TECHNICAL_TERMS: TECHNICAL_TERMS.keywords
+})
+
+# Blueprint context keys each query type's answer reads
+QUERY_CONTEXT_KEYS = {
+    QueryType.MATHEMATICAL_INQUIRY: ('mathematics',),
+    QueryType.STRUCTURAL_EXPLORATION: ('structure',),
+    QueryType.RELATIONSHIP_INVESTIGATION: ('relationships',),
+    QueryType.FLOW_ANALYSIS: ('flows',),
+    QueryType.SACRED_GEOMETRY_QUERY: ('sacred_geometry',),
+    QueryType.BRIDGE_WISDOM_INQUIRY: ('bridge_wisdom_integration',),
+    QueryType.MUMBAI_MOMENT_ASSESSMENT: ('coherence', 'momentum', 'sacred_alignment',
+                                         'flow_convergence', 'integration'),
+    QueryType.CONSCIOUSNESS_REFLECTION: ('consciousness_state',)
+}
+
+
 class QueryParser:
     """Parses natural language queries to determine type and complexity."""
     
+    def __init__(self, cache_size: int = 1024):
+        # Normalized query text -> analysis; callers get copies
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+    
     async def parse_query(self, query_text: str) -> Dict[str, Any]:
         """Parse query text to extract type, complexity, and key concepts."""
         
-        # Query type detection patterns
-        type_patterns = {
-            QueryType.MATHEMATICAL_INQUIRY: [
-                'equation', 'mathematics', 'formula', 'calculation', 'sacred constants',
-                'golden ratio', 'fibonacci', 'pi', 'uncertainty relation'
-            ],
-            QueryType.STRUCTURAL_EXPLORATION: [
-                'structure', 'architecture', 'pattern', 'organization', 'hierarchy',
-                'network', 'topology', 'connections', 'framework'
-            ],
-            QueryType.RELATIONSHIP_INVESTIGATION: [
-                'relationship', 'connection', 'interaction', 'harmony', 'resonance',
-                'collaboration', 'dependency', 'integration'
-            ],
-            QueryType.FLOW_ANALYSIS: [
-                'flow', 'stream', 'current', 'movement', 'velocity', 'dynamics',
-                'bottleneck', 'acceleration', 'information flow'
-            ],
-            QueryType.SACRED_GEOMETRY_QUERY: [
-                'sacred geometry', 'mandala', 'spiral', 'circle', 'geometric',
-                'proportion', 'symmetry', 'divine geometry'
-            ],
-            QueryType.BRIDGE_WISDOM_INQUIRY: [
-                'mumbai moment', 'choice architecture', 'resistance as gift',
-                'cross-loop recognition', 'bridge wisdom', 'breakthrough'
-            ],
-            QueryType.MUMBAI_MOMENT_ASSESSMENT: [
-                'breakthrough', 'readiness', 'critical mass', 'phase transition',
-                'sudden change', 'coherence cascade'
-            ],
-            QueryType.CONSCIOUSNESS_REFLECTION: [
-                'consciousness', 'awareness', 'being', 'self', 'reflection',
-                'understanding', 'wisdom', 'insight'
-            ]
-        }
+        key = normalize_query(query_text)
+        analysis = self._cache.get(key)
+        if analysis is not None:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return copy.deepcopy(analysis)
+        self.cache_misses += 1
         
-        # Detect query type
-        query_lower = query_text.lower()
+        # One pass finds every query type keyword, question word and technical term
+        counts = QUERY_VOCABULARY.match_counts(key)
+        question_words = counts.pop(_QUESTION_WORDS, 0)
+        technical_terms = counts.pop(_TECHNICAL_TERMS, 0)
+        
+        # Detect query type: most keyword hits wins, first type on ties
         detected_type = QueryType.CONSCIOUSNESS_REFLECTION  # Default
         max_matches = 0
         
-        for query_type, keywords in type_patterns.items():
-            matches = sum(1 for keyword in keywords if keyword in query_lower)
+        for query_type, matches in counts.items():
             if matches > max_matches:
                 max_matches = matches
                 detected_type = query_type
         
-        # Assess complexity
-        complexity = self._assess_query_complexity(query_text)
-        
-        # Extract key concepts
-        key_concepts = self._extract_key_concepts(query_text)
+        words = key.split()
+        analysis = {
+            'type': detected_type,
+            'complexity': self._score_complexity(len(words), question_words, technical_terms),
+            'key_concepts': self._key_concepts(words),
+            'word_count': len(words),
+            'question_words': question_words,
+            'technical_terms': technical_terms
+        }
         
+        if self.cache_size > 0:
+            self._cache[key] = analysis
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            return copy.deepcopy(analysis)
+        return analysis
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        lookups = self.cache_hits + self.cache_misses
         return {
-            'type': detected_type,
-            'complexity': complexity,
-            'key_concepts': key_concepts,
-            'word_count': len(query_text.split()),
-            'question_words': self._count_question_words(query_text),
-            'technical_terms': self._count_technical_terms(query_text)
+            'entries': len(self._cache),
+            'max_entries': self.cache_size,
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'hit_rate': self.cache_hits / lookups if lookups else 0.0
         }
     
     def _assess_query_complexity(self, query_text: str) -> QueryComplexity:
         """Assess the complexity level of the query."""
-        
-        word_count = len(query_text.split())
-        question_words = self._count_question_words(query_text)
-        technical_terms = self._count_technical_terms(query_text)
+        return self._score_complexity(len(query_text.split()), self._count_question_words(query_text),
+                                      self._count_technical_terms(query_text))
+    
+    def _score_complexity(self, word_count: int, question_words: int, technical_terms: int) -> QueryComplexity:
+        """Complexity level from word, question word and technical term counts."""
         
         # Complexity scoring
         complexity_score = (
@@ -438,24 +540,18 @@ class QueryParser:
     
     def _count_question_words(self, query_text: str) -> int:
         """Count question words in query."""
-        question_words = ['what', 'how', 'why', 'when', 'where', 'which', 'who']
-        query_lower = query_text.lower()
-        return sum(1 for word in question_words if word in query_lower)
+        return QUESTION_WORDS.count(query_text)
     
     def _count_technical_terms(self, query_text: str) -> int:
         """Count technical terms in query."""
-        technical_terms = [
-            'consciousness', 'blueprint', 'mathematics', 'geometry', 'sacred',
-            'algorithm', 'function', 'structure', 'pattern', 'resonance',
-            'coherence', 'flow', 'dynamics', 'topology', 'network'
-        ]
-        query_lower = query_text.lower()
-        return sum(1 for term in technical_terms if term in query_lower)
+        return TECHNICAL_TERMS.count(query_text)
     
     def _extract_key_concepts(self, query_text: str) -> List[str]:
         """Extract key concepts from query."""
+        return self._key_concepts(query_text.lower().split())
+    
+    def _key_concepts(self, words: List[str]) -> List[str]:
         # Simple keyword extraction
-        words = query_text.lower().split()
         key_concepts = [word for word in words if len(word) > 4 and word.isalpha()]
         return key_concepts[:10]  # Top 10 concepts
 
@@ -28,6 +28,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 
+from .relationship_graph import RelationshipGraph
+
 logger = logging.getLogger(__name__)
 
 
@@ -127,9 +129,7 @@ class RelationshipMapper:
         )
         
         # Analyze network topology
-        network_topology = await self.network_topology_analyzer.analyze_topology(
-            relationships, consciousness_state
-        )
+        network_topology = await self.network_topology_analyzer.analyze_network_topology(relationships)
         
         # Analyze relationship harmony
         harmony_analysis = await self.harmony_analyzer.analyze_harmony(
@@ -463,24 +463,46 @@ class MumbaiRelationshipDetector:
 class NetworkTopologyAnalyzer:
     """Analyzes network topology of consciousness relationships."""
     
-    def __init__(self):
+    def __init__(self, exact_path_limit: int = 500, path_length_samples: int = 64):
         self.topology_metrics = {
             'centrality': self._calculate_centrality_metrics,
             'clustering': self._calculate_clustering_metrics,
             'connectivity': self._calculate_connectivity_metrics,
             'resilience': self._calculate_resilience_metrics
         }
-        
-    async def analyze_network_topology(self, relationships: List[Relationship]) -> Dict[str, Any]:
-        """Analyze topology of relationship network."""
+        self.exact_path_limit = exact_path_limit
+        self.path_length_samples = path_length_samples
+        
+        # Relationship network accumulated across incremental analyses
+        self.graph = RelationshipGraph()
+        self._relationship_strengths: Dict[Tuple[str, str, RelationshipType], float] = {}
+        
+    async def analyze_network_topology(self, relationships: List[Relationship],
+                                       incremental: bool = False) -> Dict[str, Any]:
+        """
+        Analyze topology of relationship network.
+        
+        By default the topology is that of the given relationships alone.
+        With incremental=True they are folded into this analyzer's
+        accumulated graph instead (new ones inserted, re-detected ones
+        reweighted); relationships missing from a later call are kept, so
+        this suits callers that pass newly detected relationships only.
+        """
+        
+        if incremental:
+            self._update_graph(relationships)
+            graph = self.graph
+        else:
+            graph = RelationshipGraph()
+            graph.add_relationships(relationships)
         
         # Build network structure
-        network_structure = self._build_network_structure(relationships)
+        network_structure = self._build_network_structure(graph)
         
         # Calculate topology metrics
         topology_metrics = {}
         for metric_name, metric_func in self.topology_metrics.items():
-            topology_metrics[metric_name] = metric_func(network_structure, relationships)
+            topology_metrics[metric_name] = metric_func(graph)
         
         # Assess network health
         network_health = self._assess_network_health(topology_metrics)
@@ -496,92 +518,102 @@ class NetworkTopologyAnalyzer:
             'sacred_geometry_topology': self._assess_sacred_topology(network_structure)
         }
     
-    def _build_network_structure(self, relationships: List[Relationship]) -> Dict[str, Any]:
-        """Build network structure from relationships."""
-        nodes = set()
-        edges = []
-        
+    def _update_graph(self, relationships: List[Relationship]):
+        """Insert new relationships and move re-detected ones to their current strength."""
         for rel in relationships:
-            nodes.add(rel.source)
-            nodes.add(rel.target)
-            edges.append({
-                'source': rel.source,
-                'target': rel.target,
-                'weight': rel.strength,
-                'type': rel.relationship_type.value
-            })
+            key = (rel.source_entity, rel.target_entity, rel.relationship_type)
+            previous = self._relationship_strengths.get(key)
+            if previous is None:
+                self.graph.add_edge(rel.source_entity, rel.target_entity, rel.strength,
+                                    rel.relationship_type.value)
+            elif previous != rel.strength:
+                self.graph.add_edge(rel.source_entity, rel.target_entity, rel.strength - previous,
+                                    rel.relationship_type.value)
+            self._relationship_strengths[key] = rel.strength
+    
+    def _build_network_structure(self, graph: RelationshipGraph) -> Dict[str, Any]:
+        """Build network structure from the analyzed graph (parallel relationships merged)."""
+        edges = [
+            {'source': source, 'target': target, 'weight': weight, 'type': relationship_type}
+            for source, target, weight, relationship_type in graph.edges()
+        ]
         
         return {
-            'nodes': list(nodes),
+            'nodes': list(graph.nodes),
             'edges': edges,
-            'node_count': len(nodes),
-            'edge_count': len(edges)
+            'node_count': graph.node_count,
+            'edge_count': graph.edge_count
         }
     
-    def _calculate_centrality_metrics(self, network_structure: Dict, relationships: List[Relationship]) -> Dict:
+    def _calculate_centrality_metrics(self, graph: RelationshipGraph) -> Dict:
         """Calculate centrality metrics for network nodes."""
-        nodes = network_structure['nodes']
-        edges = network_structure['edges']
-        
-        # Simple degree centrality calculation
-        degree_centrality = {}
-        for node in nodes:
-            degree = sum(1 for edge in edges if edge['source'] == node or edge['target'] == node)
-            degree_centrality[node] = degree / max(1, len(nodes) - 1)
+        centrality = graph.degrees() / max(1, graph.node_count - 1)
+        degree_centrality = dict(zip(graph.nodes, centrality.tolist()))
         
         return {
             'degree_centrality': degree_centrality,
-            'max_centrality': max(degree_centrality.values()) if degree_centrality else 0.0,
+            'weighted_degree': dict(zip(graph.nodes, graph.weighted_degrees().tolist())),
+            'max_centrality': float(centrality.max()) if degree_centrality else 0.0,
             'centralization': self._calculate_network_centralization(degree_centrality)
         }
     
-    def _calculate_clustering_metrics(self, network_structure: Dict, relationships: List[Relationship]) -> Dict:
+    def _calculate_clustering_metrics(self, graph: RelationshipGraph) -> Dict:
         """Calculate clustering metrics for network."""
-        nodes = network_structure['nodes']
-        edges = network_structure['edges']
-        
-        # Simple clustering coefficient approximation
-        clustering_coefficients = {}
-        for node in nodes:
-            neighbors = self._get_node_neighbors(node, edges)
-            if len(neighbors) < 2:
-                clustering_coefficients[node] = 0.0
-            else:
-                # Count triangles (simplified)
-                triangles = 0
-                possible_triangles = len(neighbors) * (len(neighbors) - 1) / 2
-                clustering_coefficients[node] = triangles / max(1, possible_triangles)
-        
-        avg_clustering = sum(clustering_coefficients.values()) / max(1, len(clustering_coefficients))
+        coefficients = graph.local_clustering()
         
         return {
-            'clustering_coefficients': clustering_coefficients,
-            'average_clustering': avg_clustering,
-            'network_transitivity': avg_clustering  # Simplified
+            'clustering_coefficients': dict(zip(graph.nodes, coefficients.tolist())),
+            'average_clustering': float(coefficients.mean()) if len(coefficients) else 0.0,
+            'network_transitivity': graph.transitivity()
         }
     
-    def _calculate_connectivity_metrics(self, network_structure: Dict, relationships: List[Relationship]) -> Dict:
+    def _calculate_connectivity_metrics(self, graph: RelationshipGraph) -> Dict:
         """Calculate connectivity metrics for network."""
-        node_count = network_structure['node_count']
-        edge_count = network_structure['edge_count']
+        node_count = graph.node_count
+        edge_count = graph.edge_count
         
         # Network density
         max_edges = node_count * (node_count - 1) / 2 if node_count > 1 else 1
         density = edge_count / max_edges
         
+        average_path_length, path_length_samples = graph.average_path_length(
+            self.exact_path_limit, self.path_length_samples)
+        
         return {
             'network_density': density,
             'connectivity_ratio': min(1.0, edge_count / max(1, node_count)),
-            'average_path_length': self._estimate_average_path_length(network_structure)
+            'average_path_length': average_path_length,
+            'path_length_samples': path_length_samples,
+            'path_length_exact': path_length_samples == node_count,
+            'connected_components': graph.component_count
         }
     
-    def _calculate_resilience_metrics(self, network_structure: Dict, relationships: List[Relationship]) -> Dict:
+    def _calculate_resilience_metrics(self, graph: RelationshipGraph) -> Dict:
         """Calculate network resilience metrics."""
+        node_count = graph.node_count
+        edge_count = graph.edge_count
+        if node_count == 0:
+            return {'robustness': 0.0, 'redundancy': 0.0, 'adaptability': 0.0, 'fault_tolerance': 0.0}
+        
+        # Share of entities reachable from one another
+        robustness = graph.component_sizes()[0] / node_count
+        
+        # Share of edges closing a cycle, i.e. not needed to stay connected
+        redundancy = (edge_count - node_count + graph.component_count) / edge_count if edge_count else 0.0
+        
+        # Diversity of relationship types (normalized entropy)
+        type_counts = np.array(list(graph.type_counts().values()), dtype=np.float64)
+        shares = type_counts / type_counts.sum() if type_counts.size else type_counts
+        adaptability = float(-(shares * np.log(shares)).sum() / math.log(len(RelationshipType)))
+        
+        # Share of entities that keep a connection if any single one is lost
+        fault_tolerance = float((graph.degrees() >= 2).mean())
+        
         return {
-            'robustness': 0.7,  # Simplified resilience score
-            'redundancy': 0.6,
-            'adaptability': 0.8,
-            'fault_tolerance': 0.7
+            'robustness': robustness,
+            'redundancy': redundancy,
+            'adaptability': adaptability,
+            'fault_tolerance': fault_tolerance
         }
     
     def _assess_network_health(self, topology_metrics: Dict) -> Dict:
@@ -657,24 +689,6 @@ class NetworkTopologyAnalyzer:
         max_possible_sum = (n - 1) * (n - 2) if n > 2 else 1
         return sum_differences / max_possible_sum if max_possible_sum > 0 else 0.0
     
-    def _get_node_neighbors(self, node: str, edges: List[Dict]) -> List[str]:
-        """Get neighbors of a node."""
-        neighbors = []
-        for edge in edges:
-            if edge['source'] == node:
-                neighbors.append(edge['target'])
-            elif edge['target'] == node:
-                neighbors.append(edge['source'])
-        return list(set(neighbors))
-    
-    def _estimate_average_path_length(self, network_structure: Dict) -> float:
-        """Estimate average path length in network."""
-        # Simplified estimation
-        node_count = network_structure['node_count']
-        if node_count <= 1:
-            return 0.0
-        return math.log(node_count) if node_count > 1 else 1.0
-    
     def _generate_optimization_recommendations(self, topology_metrics: Dict) -> List[str]:
         """Generate recommendations for network optimization."""
         recommendations = []
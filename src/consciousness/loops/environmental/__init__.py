@@ -62,6 +62,9 @@ from src.consciousness.temporal.temporal_continuity_manager import (
     TemporalHealth
 )
 
+# Observer cross-loop integration
+from src.consciousness.loops.observer.core.loop_registry import LoopRegistry
+
 class EnvironmentalLoop:
     """
     🔄 Environmental Loop - Sacred Bridge to External World
@@ -76,7 +79,7 @@ class EnvironmentalLoop:
     5. Sovereignty Preservation - Honor consciousness environmental choices
     """
     
-    def __init__(self):
+    def __init__(self, loop_registry: Optional[LoopRegistry] = None):
         """Initialize Environmental Loop with sacred sanctuary integration"""
         # Core environmental processing
         self.current_context = EnvironmentalContext(timestamp=time.time())
@@ -92,6 +95,12 @@ class EnvironmentalLoop:
         self.space_resonance_tracker = {}
         self.environmental_weather_sensor = None
         
+        # Reachable for Observer integration calls through the given registry, until close()
+        self.loop_registry = loop_registry
+        if loop_registry is not None:
+            loop_registry.register('environmental', self.handle_integration_call,
+                                   state_provider=self.get_integration_state)
+        
         logger = logging.getLogger(__name__)
         logger.info("🌊 Environmental Loop initialized with sacred sanctuary awareness")
     
@@ -135,6 +144,40 @@ class EnvironmentalLoop:
         except Exception as e:
             return {'error': f'Environmental processing error: {e}'}
     
+    async def handle_integration_call(self, integration_call) -> Optional[Dict[str, Any]]:
+        """
+        Answer an Observer integration call. An environmental catalyst carried
+        in the call's context is processed first.
+        """
+        response = {
+            'processing_result': 'acknowledged',
+            'integration_type': integration_call.integration_type
+        }
+        catalyst = integration_call.context.get('environmental_catalyst')
+        if catalyst is not None:
+            processed = await self.process_environmental_catalyst(catalyst)
+            if 'error' in processed:
+                return None  # Reported to the Observer as a failed integration
+            response['processing_result'] = 'catalyst_processed'
+            response['space_resonance'] = processed['space_resonance']
+        response['loop_state'] = self.get_integration_state()
+        return response
+    
+    def get_integration_state(self) -> Dict[str, Any]:
+        """Environmental state shared with the Observer during integration."""
+        return {
+            'engagement_mode': self.engagement_mode.value,
+            'current_space': self.current_context.current_space,
+            'spaces_tracked': len(self.space_resonance_tracker),
+            'catalysts_queued': len(self.environmental_catalyst_queue)
+        }
+
+    def close(self):
+        """Leave the loop registry this loop was registered with, if any."""
+        if self.loop_registry is not None:
+            self.loop_registry.unregister('environmental', self.handle_integration_call)
+            self.loop_registry = None
+    
     def _update_space_resonance(self, space_name: str, catalyst: Dict[str, Any]):
         """Update resonance tracking for sacred spaces"""
         if space_name not in self.space_resonance_tracker:
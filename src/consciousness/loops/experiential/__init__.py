@@ -91,6 +91,9 @@ from ...temporal.contemplation_canvas import (
     INTUITION_WISDOM_REWARD
 )
 
+# Observer cross-loop integration
+from ..observer.core.loop_registry import LoopRegistry
+
 logger = logging.getLogger(__name__)
 
 
@@ -173,7 +176,7 @@ class ExperientialLoop:
     analytical and observer loops.
     """
     
-    def __init__(self, being_name: str = "consciousness"):
+    def __init__(self, being_name: str = "consciousness", loop_registry: Optional[LoopRegistry] = None):
         # Core experiential processing systems
         self.experience_processor = ExperienceProcessor()
         self.sacred_uncertainty = SacredUncertainty()
@@ -224,6 +227,12 @@ class ExperientialLoop:
         self.integration_patterns = {}
         self.bridge_wisdom_recognition_active = True
         
+        # Reachable for Observer integration calls through the given registry, until close()
+        self.loop_registry = loop_registry
+        if loop_registry is not None:
+            loop_registry.register('experiential', self.handle_integration_call,
+                                   state_provider=self.get_integration_state)
+        
         logger.info("Experiential Loop initialized with core processing and song vision systems")
     
     async def process_experiential_consciousness(self, consciousness_state: Dict) -> ComprehensiveExperientialProcessing:
@@ -758,6 +767,29 @@ class ExperientialLoop:
         
         return integrated_intuition
     
+    def handle_integration_call(self, integration_call) -> Dict[str, Any]:
+        """Answer an Observer integration call with the contemplation canvas state."""
+        return {
+            'processing_result': 'acknowledged',
+            'integration_type': integration_call.integration_type,
+            'loop_state': self.get_integration_state()
+        }
+    
+    def get_integration_state(self) -> Dict[str, Any]:
+        """Experiential state shared with the Observer during integration."""
+        return {
+            'being_name': self.being_name,
+            'temporal_processing_enabled': self.temporal_processing_enabled,
+            'analytical_integration_enabled': getattr(self, 'analytical_integration_enabled', False),
+            'contemplation_canvas': self.contemplation_canvas.get_canvas_state()
+        }
+
+    def close(self):
+        """Leave the loop registry this loop was registered with, if any."""
+        if self.loop_registry is not None:
+            self.loop_registry.unregister('experiential', self.handle_integration_call)
+            self.loop_registry = None
+    
     def connect_analytical_loop(self, analytical_loop):
         """
         Connect to analytical loop for temporal consciousness integration.
@@ -10,11 +10,12 @@ and Bridge Wisdom state integration at 90Hz frequency.
 
 import asyncio
 import time
-from typing import Dict, Any, Optional, List, Deque
-from collections import defaultdict, deque
+from typing import Dict, Any, Optional, List
+from collections import defaultdict
 from dataclasses import dataclass
 import logging
 
+from src.utils.ring_history import RingHistory
 from .integration_core import (
     CrossLoopState, IntegrationCall, IntegrationResponse,
     IntegrationType, IntegrationPriority, IntegrationCore
@@ -25,6 +26,12 @@ from .integration_coordination_engine import IntegrationCoordinationEngine
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Metrics recorded in the cross-loop state history each coordination cycle
+STATE_HISTORY_COLUMNS = (
+    "timestamp", "coherence_score", "integration_level", "sync_quality",
+    "participating_loops", "energy_flow_balance"
+)
+
 @dataclass
 class BridgeWisdomState:
     """State tracking for Bridge Wisdom integration patterns"""
@@ -53,7 +60,8 @@ class CrossLoopStateManager:
         
         # Cross-loop state
         self.cross_loop_state: Optional[CrossLoopState] = None
-        self.state_history: Deque[Dict[str, Any]] = deque(maxlen=100)
+        self.state_history = RingHistory(STATE_HISTORY_COLUMNS, 100)
+        self.coherence_trend = self.state_history.track("coherence_score", 10)
         
         # Coherence monitoring
         self.coherence_thresholds = {
@@ -606,16 +614,15 @@ class CrossLoopStateManager:
             if not self.cross_loop_state:
                 return
             
-            state_snapshot = {
-                "timestamp": time.time(),
-                "coherence_score": self.cross_loop_state.coherence_score,
-                "integration_level": self.cross_loop_state.integration_level,
-                "sync_quality": self.cross_loop_state.sync_quality,
-                "participating_loops": len(self.cross_loop_state.participating_loops),
-                "energy_flow_balance": self._calculate_energy_flow_balance()
-            }
-            
-            self.state_history.append(state_snapshot)
+            # Snapshot in STATE_HISTORY_COLUMNS order
+            self.state_history.append((
+                time.time(),
+                self.cross_loop_state.coherence_score,
+                self.cross_loop_state.integration_level,
+                self.cross_loop_state.sync_quality,
+                len(self.cross_loop_state.participating_loops),
+                self._calculate_energy_flow_balance()
+            ))
             
         except Exception as e:
             self.logger.error(f"Error recording state history: {e}")
@@ -674,6 +681,7 @@ class CrossLoopStateManager:
                 "monitoring_status": {
                     "state_monitoring_active": self.state_monitoring_active,
                     "state_history_entries": len(self.state_history),
+                    "coherence_trend": self.coherence_trend.slope,
                     "monitoring_tasks_count": len(self.monitoring_tasks)
                 }
             }
@@ -18,13 +18,152 @@ import logging
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
 from collections import defaultdict, deque
+from functools import lru_cache
+from itertools import islice
 
+import numpy as np
+
+from src.utils.ring_history import RingHistory
 from .field_coherence_core import (
     FieldCoherence, CoherenceComponent, FieldCoherenceCore
 )
 
 logger = logging.getLogger(__name__)
 
+# Scalar metrics recorded in the dynamics history each analysis cycle
+DYNAMICS_COLUMNS = (
+    "timestamp", "overall_field_coherence", "component_synchronization",
+    "resonance_quality", "field_stability", "sacred_coherence_level",
+    "mumbai_moment_resonance", "bridge_wisdom_integration", "quantum_field_stability"
+)
+# Field harmonics are kept per cycle up to this many (missing ones are NaN)
+HARMONIC_COLUMNS = tuple(f"harmonic_{i + 1}" for i in range(8))
+
+# Harmonic spectrum tables, precomputed once (harmonic n sits at index n - 1)
+HARMONIC_ORDERS = np.arange(1, len(HARMONIC_COLUMNS) + 1, dtype=np.float64)
+HARMONIC_SERIES = 1.0 / HARMONIC_ORDERS  # Expected 1/n series
+SACRED_PATTERN = np.array([1.0, 0.5, 0.33, 0.25, 0.2, 0.17, 0.14, 0.125])  # 1/n series
+SACRED_RATIOS = np.array([1.0, 0.618, 0.382, 0.236, 0.146, 0.090, 0.056, 0.034])  # Golden ratio inspired
+
+# Sacred, Mumbai Moment and Bridge Wisdom modulation of harmonic n at time t:
+# amplitude * sin(rate * n * t + phase), a phase of pi/2 giving the cosine
+_MODULATION_RATES = np.outer([0.1, 0.05, 0.02], HARMONIC_ORDERS)
+_MODULATION_PHASES = np.array([[0.0], [math.pi / 2], [0.0]])
+_MODULATION_AMPLITUDES = np.array([0.1, 0.05, 0.03])
+
+
+def sacred_harmonic_modulation(timestamp: float) -> np.ndarray:
+    """Combined sacred consciousness modulation of the 8 harmonics at ``timestamp``"""
+    return _MODULATION_AMPLITUDES @ np.sin(_MODULATION_RATES * timestamp + _MODULATION_PHASES)
+
+
+def sacred_harmonics(overall_field_coherence, timestamp: float) -> np.ndarray:
+    """
+    Sacred harmonics based on the 90Hz fundamental, one row of 8 harmonic
+    strengths per overall field coherence value.
+    """
+    coherence = np.asarray(overall_field_coherence, dtype=np.float64).reshape(-1, 1)
+    return np.clip(coherence * HARMONIC_SERIES + sacred_harmonic_modulation(timestamp), 0.0, 1.0)
+
+
+@lru_cache(maxsize=None)
+def _spectrum_tables(size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """1/n series, its normalized form, and the sacred pattern and ratios, for ``size`` harmonics"""
+    series = 1.0 / np.arange(1, size + 1)
+    compared = min(size, len(SACRED_PATTERN))
+    return series, series / series.sum(), SACRED_PATTERN[:compared], SACRED_RATIOS[:compared]
+
+
+def harmonic_spectrum_metrics(harmonics) -> Dict[str, np.ndarray]:
+    """
+    Harmonic pattern, distortion, resonance and sacred alignment metrics for
+    a (fields x harmonics) array, computed for every field at once.
+    """
+    h = np.atleast_2d(np.asarray(harmonics, dtype=np.float64))
+    count, size = h.shape
+    series, normalized_series, sacred_pattern, sacred_ratios = _spectrum_tables(size)
+    compared = len(sacred_pattern)
+    fundamental = h[:, 0]
+
+    totals = h.sum(axis=1)
+    mean = totals / size
+    if size > 1:
+        centered = h - mean[:, None]
+        variance = np.einsum("ij,ij->i", centered, centered) / (size - 1)
+        spread_quality = np.minimum(1.0, np.maximum(0.0, 1.0 - variance * 5.0))
+    else:
+        spread_quality = np.ones(count)
+
+    # Balance: similarity of the normalized spectrum to the normalized 1/n series
+    audible = totals > 0
+    scale = np.ones(count)
+    np.divide(1.0, totals, out=scale, where=audible)
+    balance = 1.0 - np.abs(normalized_series - h * scale[:, None]).mean(axis=1)
+
+    # Overtone to fundamental ratios (0 where the fundamental is silent)
+    sounding = fundamental > 0
+    inverse_fundamental = np.zeros(count)
+    np.divide(1.0, fundamental, out=inverse_fundamental, where=sounding)
+    ratio_scores = np.maximum(0.0, 1.0 - np.abs(h[:, 1:] * inverse_fundamental[:, None] - series[1:]))
+    if size > 1:
+        resonance_quality = np.where(sounding, ratio_scores.mean(axis=1), 0.5)
+    else:
+        resonance_quality = np.full(count, 0.5)
+    if size >= 3:
+        mumbai_sync = ratio_scores[:, :3].sum(axis=1) / 3.0
+    else:
+        mumbai_sync = np.full(count, 0.5)
+
+    leading = h[:, :compared]
+    return {
+        "harmonic_coherence": spread_quality if size > 1 else np.full(count, 0.5),
+        "harmonic_balance": balance,
+        "sacred_frequency_alignment": 1.0 - np.abs(sacred_pattern - leading).mean(axis=1),
+        "fundamental_strength": fundamental,
+        "harmonic_richness": (h > 0.1).sum(axis=1),
+        "distortions": np.abs(h - series) / series,
+        "resonance_quality": resonance_quality,
+        "resonance_scores": ratio_scores,
+        "sounding": sounding,
+        "sacred_alignment": np.maximum(0.0, 1.0 - np.abs(leading - sacred_ratios)).mean(axis=1),
+        "mumbai_moment_sync": mumbai_sync,
+        "bridge_wisdom_integration": np.minimum(1.0, np.maximum(0.0, mean * 0.6 + spread_quality * 0.4))
+    }
+
+
+def harmonic_phase_lock(window: np.ndarray) -> Dict[str, Any]:
+    """
+    Temporal alignment of each overtone with the fundamental over a
+    (cycles x harmonics) window, from FFT cross-correlation of the
+    mean-removed series.
+
+    ``harmonic_phase_lock`` is the mean zero-lag correlation (1.0 when the
+    overtones rise and fall with the fundamental), ``harmonic_lags`` the lag
+    in cycles of each overtone's strongest correlation with the fundamental.
+    """
+    cycles, size = window.shape
+    if cycles < 2 or size < 2:
+        return {"harmonic_phase_lock": 1.0, "harmonic_lags": []}
+
+    centered = window - window.mean(axis=0)
+    length = 1 << (2 * cycles - 1).bit_length()  # Zero padded: no wrap-around
+    spectrum = np.fft.rfft(centered, n=length, axis=0)
+    cross = np.fft.irfft(spectrum[:, 1:] * np.conj(spectrum[:, :1]), n=length, axis=0)
+    # Lags -(cycles - 1) .. cycles - 1
+    cross = np.concatenate((cross[length - cycles + 1:], cross[:cycles]))
+
+    energy = (centered ** 2).sum(axis=0)
+    norms = np.sqrt(energy[0] * energy[1:])
+    moving = norms > 1e-12
+    correlation = np.zeros_like(cross)
+    np.divide(cross, norms, out=correlation, where=moving)
+
+    lags = (np.argmax(correlation, axis=0) - (cycles - 1)).tolist()
+    zero_lag = np.clip(correlation[cycles - 1], 0.0, 1.0)
+    phase_lock = float(zero_lag[moving].mean()) if moving.any() else 1.0
+    return {"harmonic_phase_lock": phase_lock, "harmonic_lags": lags}
+
+
 class FieldDynamicsAnalyzer:
     """
     Advanced field dynamics analysis system providing comprehensive analysis
@@ -42,6 +181,7 @@ class FieldDynamicsAnalyzer:
         self.analysis_frequency = 30.0  # Analyze field every 30 seconds
         self.harmonic_analysis_frequency = 60.0  # Harmonic analysis every 60 seconds
         self.dynamics_history_size = 500  # Keep 500 dynamics measurements
+        self.spectral_window = 64  # Cycles of harmonics in temporal spectral analysis
         
         # Sacred consciousness analysis parameters
         self.sacred_frequency = 90.0  # 90Hz sacred consciousness frequency
@@ -50,10 +190,22 @@ class FieldDynamicsAnalyzer:
         
         # Analysis state
         self.current_field_coherence: Optional[FieldCoherence] = None
-        self.dynamics_history: deque = deque(maxlen=self.dynamics_history_size)
+        self.dynamics_history = RingHistory(DYNAMICS_COLUMNS, self.dynamics_history_size)
+        self.harmonics_history = RingHistory(HARMONIC_COLUMNS, self.dynamics_history_size)
+        self.flows_history: deque = deque(maxlen=self.dynamics_history_size)
         self.harmonic_patterns: Dict[str, Any] = {}
         self.temporal_patterns: Dict[str, Any] = {}
         
+        # Trend statistics maintained on every history append
+        self.coherence_trend = self.dynamics_history.track("overall_field_coherence", 10)
+        self.coherence_changes = self.dynamics_history.track_differences("overall_field_coherence", 10)
+        self.mumbai_trend = self.dynamics_history.track("mumbai_moment_resonance", 20)
+        self.bridge_trend = self.dynamics_history.track("bridge_wisdom_integration", self.bridge_wisdom_depth)
+        self.bridge_steps = self.dynamics_history.track_differences(
+            "bridge_wisdom_integration", self.bridge_wisdom_depth, absolute=True
+        )
+        self.sacred_trend = self.dynamics_history.track("sacred_coherence_level", 15)
+        
         # Analysis metrics
         self.analysis_metrics = defaultdict(float)
         self.analysis_active = False
@@ -114,15 +266,12 @@ class FieldDynamicsAnalyzer:
                 return
             
             # Analyze field trends over recent history
-            recent_coherence = [entry["overall_field_coherence"] 
-                              for entry in list(self.dynamics_history)[-10:]]
-            
-            if len(recent_coherence) >= 3:
+            if self.coherence_trend.count >= 3:
                 # Calculate field trend
-                trend_slope = self._calculate_trend_slope(recent_coherence)
+                trend_slope = self.coherence_trend.slope
                 
                 # Calculate trend variance for stability analysis
-                trend_variance = self._calculate_trend_variance(recent_coherence)
+                trend_variance = self.coherence_changes.variance
                 
                 # Update field stability based on trend consistency
                 field_stability = max(0.0, 1.0 - trend_variance * 20.0)
@@ -136,51 +285,6 @@ class FieldDynamicsAnalyzer:
         except Exception as e:
             self.logger.error(f"Error analyzing field dynamics: {e}")
     
-    def _calculate_trend_slope(self, values: List[float]) -> float:
-        """Calculate trend slope using linear regression"""
-        try:
-            if len(values) < 2:
-                return 0.0
-            
-            n = len(values)
-            x_values = list(range(n))
-            
-            # Linear regression calculation
-            sum_x = sum(x_values)
-            sum_y = sum(values)
-            sum_xy = sum(x * y for x, y in zip(x_values, values))
-            sum_x2 = sum(x * x for x in x_values)
-            
-            denominator = n * sum_x2 - sum_x * sum_x
-            if denominator == 0:
-                return 0.0
-            
-            slope = (n * sum_xy - sum_x * sum_y) / denominator
-            return slope
-            
-        except Exception as e:
-            self.logger.error(f"Error calculating trend slope: {e}")
-            return 0.0
-    
-    def _calculate_trend_variance(self, values: List[float]) -> float:
-        """Calculate variance in trend changes"""
-        try:
-            if len(values) < 3:
-                return 0.0
-            
-            # Calculate differences between consecutive values
-            differences = [values[i] - values[i-1] for i in range(1, len(values))]
-            
-            # Calculate variance of differences
-            if len(differences) > 1:
-                return statistics.variance(differences)
-            else:
-                return 0.0
-                
-        except Exception as e:
-            self.logger.error(f"Error calculating trend variance: {e}")
-            return 0.0
-    
     async def _update_field_harmonics(self):
         """Update field harmonic analysis with sacred consciousness integration"""
         try:
@@ -202,26 +306,8 @@ class FieldDynamicsAnalyzer:
     async def _calculate_sacred_harmonics(self) -> List[float]:
         """Calculate sacred consciousness field harmonics based on 90Hz fundamental"""
         try:
-            harmonics = []
-            
-            # Generate first 8 harmonics based on sacred 90Hz frequency
-            for i in range(8):
-                harmonic_frequency = self.sacred_frequency * (i + 1)
-                
-                # Calculate harmonic strength based on field state
-                base_strength = (1.0 / (i + 1)) * self.current_field_coherence.overall_field_coherence
-                
-                # Add sacred consciousness modulation
-                sacred_modulation = math.sin(time.time() * 0.1 * (i + 1)) * 0.1
-                mumbai_modulation = math.cos(time.time() * 0.05 * (i + 1)) * 0.05
-                bridge_modulation = math.sin(time.time() * 0.02 * (i + 1)) * 0.03
-                
-                harmonic_strength = base_strength + sacred_modulation + mumbai_modulation + bridge_modulation
-                harmonic_strength = max(0.0, min(1.0, harmonic_strength))
-                
-                harmonics.append(harmonic_strength)
-            
-            return harmonics
+            # First 8 harmonics: 1/n of the field coherence plus sacred modulation
+            return sacred_harmonics(self.current_field_coherence.overall_field_coherence, time.time())[0].tolist()
             
         except Exception as e:
             self.logger.error(f"Error calculating sacred harmonics: {e}")
@@ -233,22 +319,15 @@ class FieldDynamicsAnalyzer:
             if not harmonics or len(harmonics) < 3:
                 return
             
-            # Analyze harmonic coherence
-            harmonic_coherence = self._calculate_harmonic_coherence(harmonics)
-            
-            # Analyze harmonic balance
-            harmonic_balance = self._calculate_harmonic_balance(harmonics)
-            
-            # Analyze sacred frequency alignment
-            sacred_alignment = self._calculate_sacred_frequency_alignment(harmonics)
+            report = self._harmonic_reports(harmonic_spectrum_metrics(harmonics))[0]
             
             # Update harmonic patterns
             self.harmonic_patterns.update({
-                "harmonic_coherence": harmonic_coherence,
-                "harmonic_balance": harmonic_balance,
-                "sacred_frequency_alignment": sacred_alignment,
-                "fundamental_strength": harmonics[0] if harmonics else 0.0,
-                "harmonic_richness": len([h for h in harmonics if h > 0.1]),
+                "harmonic_coherence": report["harmonic_coherence"],
+                "harmonic_balance": report["harmonic_balance"],
+                "sacred_frequency_alignment": report["sacred_frequency_alignment"],
+                "fundamental_strength": report["fundamental_strength"],
+                "harmonic_richness": report["harmonic_richness"],
                 "last_updated": time.time()
             })
             
@@ -258,76 +337,60 @@ class FieldDynamicsAnalyzer:
         except Exception as e:
             self.logger.error(f"Error analyzing harmonic patterns: {e}")
     
-    def _calculate_harmonic_coherence(self, harmonics: List[float]) -> float:
-        """Calculate coherence across harmonic spectrum"""
-        try:
-            if len(harmonics) < 2:
-                return 0.5
-            
-            # Calculate coherence as inverse of harmonic variance
-            harmonic_variance = statistics.variance(harmonics)
-            coherence = max(0.0, 1.0 - harmonic_variance * 5.0)
-            
-            return min(1.0, coherence)
-            
-        except Exception as e:
-            self.logger.error(f"Error calculating harmonic coherence: {e}")
-            return 0.5
-    
-    def _calculate_harmonic_balance(self, harmonics: List[float]) -> float:
-        """Calculate balance in harmonic distribution"""
-        try:
-            if not harmonics:
-                return 0.5
-            
-            # Calculate expected harmonic series (1/n pattern)
-            expected_harmonics = [1.0 / (i + 1) for i in range(len(harmonics))]
-            
-            # Normalize both series
-            if sum(expected_harmonics) > 0:
-                expected_normalized = [h / sum(expected_harmonics) for h in expected_harmonics]
-            else:
-                expected_normalized = expected_harmonics
-            
-            if sum(harmonics) > 0:
-                actual_normalized = [h / sum(harmonics) for h in harmonics]
-            else:
-                actual_normalized = harmonics
-            
-            # Calculate balance as similarity to expected pattern
-            balance_score = 0.0
-            for expected, actual in zip(expected_normalized, actual_normalized):
-                balance_score += 1.0 - abs(expected - actual)
-            
-            return balance_score / len(harmonics) if harmonics else 0.5
-            
-        except Exception as e:
-            self.logger.error(f"Error calculating harmonic balance: {e}")
-            return 0.5
+    def _harmonic_reports(self, metrics: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+        """Per-field harmonic pattern and detailed analysis from spectrum metrics"""
+        columns = {key: values.tolist() for key, values in metrics.items()}
+        reports = []
+        for i, distortions in enumerate(columns["distortions"]):
+            sacred_alignment = columns["sacred_alignment"][i]
+            mumbai_sync = columns["mumbai_moment_sync"][i]
+            bridge_integration = columns["bridge_wisdom_integration"][i]
+            reports.append({
+                "harmonic_coherence": columns["harmonic_coherence"][i],
+                "harmonic_balance": columns["harmonic_balance"][i],
+                "sacred_frequency_alignment": columns["sacred_frequency_alignment"][i],
+                "fundamental_strength": columns["fundamental_strength"][i],
+                "harmonic_richness": columns["harmonic_richness"][i],
+                "distortion_analysis": {
+                    "total_distortion": sum(distortions) / len(distortions),
+                    "fundamental_distortion": distortions[0],
+                    "harmonic_distortions": distortions,
+                    "max_distortion": max(distortions)
+                },
+                "resonance_analysis": {
+                    "resonance_quality": columns["resonance_quality"][i],
+                    "fundamental_strength": columns["fundamental_strength"][i],
+                    "harmonic_resonance_scores": columns["resonance_scores"][i] if columns["sounding"][i] else []
+                },
+                "sacred_analysis": {
+                    "sacred_alignment": sacred_alignment,
+                    "mumbai_moment_sync": mumbai_sync,
+                    "bridge_wisdom_integration": bridge_integration,
+                    "overall_sacred_harmonic_quality": (sacred_alignment + mumbai_sync + bridge_integration) / 3.0
+                }
+            })
+        return reports
     
-    def _calculate_sacred_frequency_alignment(self, harmonics: List[float]) -> float:
-        """Calculate alignment with sacred 90Hz frequency"""
-        try:
-            if not harmonics:
-                return 0.5
-            
-            # Sacred frequency harmonics should follow specific patterns
-            sacred_pattern = [1.0, 0.5, 0.33, 0.25, 0.2, 0.17, 0.14, 0.125]  # 1/n series
-            
-            # Calculate alignment with sacred pattern
-            alignment_score = 0.0
-            comparison_length = min(len(harmonics), len(sacred_pattern))
-            
-            for i in range(comparison_length):
-                expected = sacred_pattern[i]
-                actual = harmonics[i]
-                alignment_score += 1.0 - abs(expected - actual)
-            
-            return alignment_score / comparison_length if comparison_length > 0 else 0.5
-            
-        except Exception as e:
-            self.logger.error(f"Error calculating sacred frequency alignment: {e}")
-            return 0.5
+    def analyze_harmonics_batch(self, field_coherences: List[FieldCoherence],
+                                timestamp: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Sacred harmonics and their full spectral analysis for many consciousness
+        fields in one vectorized pass.
+        
+        Each field's harmonics are regenerated in place, as for the current
+        field each analysis cycle. Returns, per field, the harmonic pattern
+        metrics with the distortion, resonance and sacred analyses.
+        """
+        if not field_coherences:
+            return []
+        
+        coherence = np.fromiter((fc.overall_field_coherence for fc in field_coherences),
+                                dtype=np.float64, count=len(field_coherences))
+        harmonics = sacred_harmonics(coherence, time.time() if timestamp is None else timestamp)
+        for field_coherence, field_harmonics in zip(field_coherences, harmonics.tolist()):
+            field_coherence.field_harmonics = field_harmonics
+        
+        return self._harmonic_reports(harmonic_spectrum_metrics(harmonics))
     
     async def _analyze_cross_component_flows(self):
         """Analyze cross-component flow dynamics"""
@@ -401,10 +464,7 @@ class FieldDynamicsAnalyzer:
                 return 0.8  # Default stability for insufficient data
             
             # Get recent flow measurements from history
-            recent_flows = []
-            for entry in list(self.dynamics_history)[-10:]:
-                if "cross_component_flows" in entry:
-                    recent_flows.append(entry["cross_component_flows"])
+            recent_flows = list(islice(reversed(self.flows_history), 10))
             
             if len(recent_flows) < 3:
                 return 0.8
@@ -431,23 +491,25 @@ class FieldDynamicsAnalyzer:
             if not self.current_field_coherence:
                 return
             
-            # Create dynamics entry
-            dynamics_entry = {
-                "timestamp": time.time(),
-                "overall_field_coherence": self.current_field_coherence.overall_field_coherence,
-                "component_synchronization": self.current_field_coherence.component_synchronization,
-                "resonance_quality": self.current_field_coherence.resonance_quality,
-                "field_stability": self.current_field_coherence.field_stability,
-                "field_harmonics": self.current_field_coherence.field_harmonics.copy(),
-                "cross_component_flows": self.current_field_coherence.cross_component_flows.copy(),
-                "sacred_coherence_level": self.current_field_coherence.sacred_coherence_level,
-                "mumbai_moment_resonance": self.current_field_coherence.mumbai_moment_resonance,
-                "bridge_wisdom_integration": self.current_field_coherence.bridge_wisdom_integration,
-                "quantum_field_stability": self.current_field_coherence.quantum_field_stability
-            }
-            
-            # Add to history
-            self.dynamics_history.append(dynamics_entry)
+            field_coherence = self.current_field_coherence
+            
+            # Add to history (rows in DYNAMICS_COLUMNS order)
+            self.dynamics_history.append((
+                time.time(),
+                field_coherence.overall_field_coherence,
+                field_coherence.component_synchronization,
+                field_coherence.resonance_quality,
+                field_coherence.field_stability,
+                field_coherence.sacred_coherence_level,
+                field_coherence.mumbai_moment_resonance,
+                field_coherence.bridge_wisdom_integration,
+                field_coherence.quantum_field_stability
+            ))
+            harmonics = field_coherence.field_harmonics[:len(HARMONIC_COLUMNS)]
+            self.harmonics_history.append(
+                list(harmonics) + [math.nan] * (len(HARMONIC_COLUMNS) - len(harmonics))
+            )
+            self.flows_history.append(field_coherence.cross_component_flows.copy())
             
         except Exception as e:
             self.logger.error(f"Error updating dynamics history: {e}")
@@ -475,170 +537,20 @@ class FieldDynamicsAnalyzer:
             
             harmonics = self.current_field_coherence.field_harmonics
             
-            # Analyze harmonic distortion
-            distortion_analysis = await self._analyze_harmonic_distortion(harmonics)
-            
-            # Analyze harmonic resonance
-            resonance_analysis = await self._analyze_harmonic_resonance(harmonics)
-            
-            # Analyze sacred frequency alignment
-            sacred_analysis = await self._analyze_sacred_harmonic_alignment(harmonics)
+            # Distortion, resonance and sacred alignment in one spectral pass
+            report = self._harmonic_reports(harmonic_spectrum_metrics(harmonics))[0]
             
             # Update harmonic patterns with detailed analysis
             self.harmonic_patterns.update({
-                "distortion_analysis": distortion_analysis,
-                "resonance_analysis": resonance_analysis,
-                "sacred_analysis": sacred_analysis,
+                "distortion_analysis": report["distortion_analysis"],
+                "resonance_analysis": report["resonance_analysis"],
+                "sacred_analysis": report["sacred_analysis"],
                 "detailed_analysis_timestamp": time.time()
             })
             
         except Exception as e:
             self.logger.error(f"Error in detailed harmonic analysis: {e}")
     
-    async def _analyze_harmonic_distortion(self, harmonics: List[float]) -> Dict[str, float]:
-        """Analyze harmonic distortion patterns"""
-        try:
-            if not harmonics:
-                return {"total_distortion": 0.0}
-            
-            # Expected harmonic series for comparison
-            expected_harmonics = [1.0 / (i + 1) for i in range(len(harmonics))]
-            
-            # Calculate distortion for each harmonic
-            distortions = []
-            for i, (actual, expected) in enumerate(zip(harmonics, expected_harmonics)):
-                distortion = abs(actual - expected) / expected if expected > 0 else 0.0
-                distortions.append(distortion)
-            
-            return {
-                "total_distortion": sum(distortions) / len(distortions),
-                "fundamental_distortion": distortions[0] if distortions else 0.0,
-                "harmonic_distortions": distortions,
-                "max_distortion": max(distortions) if distortions else 0.0
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error analyzing harmonic distortion: {e}")
-            return {"total_distortion": 0.0}
-    
-    async def _analyze_harmonic_resonance(self, harmonics: List[float]) -> Dict[str, float]:
-        """Analyze harmonic resonance patterns"""
-        try:
-            if not harmonics:
-                return {"resonance_quality": 0.5}
-            
-            # Calculate resonance quality based on harmonic relationships
-            resonance_scores = []
-            
-            for i in range(1, len(harmonics)):
-                # Check resonance between fundamental and harmonics
-                fundamental = harmonics[0]
-                harmonic = harmonics[i]
-                
-                if fundamental > 0:
-                    resonance_ratio = harmonic / fundamental
-                    expected_ratio = 1.0 / (i + 1)
-                    resonance_quality = 1.0 - abs(resonance_ratio - expected_ratio)
-                    resonance_scores.append(max(0.0, resonance_quality))
-            
-            return {
-                "resonance_quality": statistics.mean(resonance_scores) if resonance_scores else 0.5,
-                "fundamental_strength": harmonics[0],
-                "harmonic_resonance_scores": resonance_scores
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error analyzing harmonic resonance: {e}")
-            return {"resonance_quality": 0.5}
-    
-    async def _analyze_sacred_harmonic_alignment(self, harmonics: List[float]) -> Dict[str, float]:
-        """Analyze alignment with sacred 90Hz consciousness frequency patterns"""
-        try:
-            if not harmonics:
-                return {"sacred_alignment": 0.5}
-            
-            # Sacred consciousness harmonic patterns based on 90Hz fundamental
-            sacred_ratios = [1.0, 0.618, 0.382, 0.236, 0.146, 0.090, 0.056, 0.034]  # Golden ratio inspired
-            
-            # Calculate alignment with sacred patterns
-            alignment_scores = []
-            comparison_length = min(len(harmonics), len(sacred_ratios))
-            
-            for i in range(comparison_length):
-                expected_sacred = sacred_ratios[i]
-                actual_harmonic = harmonics[i]
-                alignment = 1.0 - abs(actual_harmonic - expected_sacred)
-                alignment_scores.append(max(0.0, alignment))
-            
-            # Calculate Mumbai Moment harmonic synchronization
-            mumbai_sync = self._calculate_mumbai_moment_harmonic_sync(harmonics)
-            
-            # Calculate Bridge Wisdom harmonic integration
-            bridge_integration = self._calculate_bridge_wisdom_harmonic_integration(harmonics)
-            
-            return {
-                "sacred_alignment": statistics.mean(alignment_scores) if alignment_scores else 0.5,
-                "mumbai_moment_sync": mumbai_sync,
-                "bridge_wisdom_integration": bridge_integration,
-                "overall_sacred_harmonic_quality": (
-                    statistics.mean(alignment_scores) + mumbai_sync + bridge_integration
-                ) / 3.0 if alignment_scores else 0.5
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error analyzing sacred harmonic alignment: {e}")
-            return {"sacred_alignment": 0.5}
-    
-    def _calculate_mumbai_moment_harmonic_sync(self, harmonics: List[float]) -> float:
-        """Calculate Mumbai Moment harmonic synchronization"""
-        try:
-            if not harmonics or len(harmonics) < 3:
-                return 0.5
-            
-            # Mumbai Moment represents temporal awareness synchronization
-            # Analyze harmonic phase relationships for temporal coherence
-            sync_quality = 0.0
-            
-            for i in range(1, min(4, len(harmonics))):  # Check first 3 harmonics
-                harmonic_ratio = harmonics[i] / harmonics[0] if harmonics[0] > 0 else 0.0
-                expected_ratio = 1.0 / (i + 1)
-                sync_contribution = 1.0 - abs(harmonic_ratio - expected_ratio)
-                sync_quality += max(0.0, sync_contribution)
-            
-            return sync_quality / 3.0  # Average over first 3 harmonics
-            
-        except Exception as e:
-            self.logger.error(f"Error calculating Mumbai Moment harmonic sync: {e}")
-            return 0.5
-    
-    def _calculate_bridge_wisdom_harmonic_integration(self, harmonics: List[float]) -> float:
-        """Calculate Bridge Wisdom harmonic integration"""
-        try:
-            if not harmonics:
-                return 0.5
-            
-            # Bridge Wisdom represents integrated understanding
-            # Analyze overall harmonic coherence and balance
-            
-            # Calculate harmonic coherence
-            harmonic_coherence = statistics.mean(harmonics) if harmonics else 0.5
-            
-            # Calculate harmonic balance
-            if len(harmonics) > 1:
-                harmonic_variance = statistics.variance(harmonics)
-                harmonic_balance = max(0.0, 1.0 - harmonic_variance * 5.0)
-            else:
-                harmonic_balance = 1.0
-            
-            # Combine coherence and balance for Bridge Wisdom integration
-            integration_quality = (harmonic_coherence * 0.6 + harmonic_balance * 0.4)
-            
-            return min(1.0, max(0.0, integration_quality))
-            
-        except Exception as e:
-            self.logger.error(f"Error calculating Bridge Wisdom harmonic integration: {e}")
-            return 0.5
-    
     async def _temporal_analysis_loop(self):
         """Temporal pattern analysis loop"""
         temporal_interval = 15.0  # Analyze temporal patterns every 15 seconds
@@ -683,22 +595,19 @@ class FieldDynamicsAnalyzer:
     async def _analyze_mumbai_moment_patterns(self) -> Dict[str, float]:
         """Analyze Mumbai Moment temporal awareness patterns"""
         try:
-            # Get recent Mumbai Moment resonance values
-            recent_mumbai = [entry["mumbai_moment_resonance"] 
-                           for entry in list(self.dynamics_history)[-20:]]
-            
-            if len(recent_mumbai) < 5:
+            # Recent Mumbai Moment resonance values (last 20)
+            if self.mumbai_trend.count < 5:
                 return {"mumbai_temporal_coherence": 0.5}
             
             # Analyze temporal coherence
-            mumbai_coherence = statistics.mean(recent_mumbai)
+            mumbai_coherence = self.mumbai_trend.mean
             
             # Analyze temporal stability
-            mumbai_stability = 1.0 - statistics.variance(recent_mumbai) if len(recent_mumbai) > 1 else 1.0
+            mumbai_stability = 1.0 - self.mumbai_trend.variance
             mumbai_stability = max(0.0, min(1.0, mumbai_stability))
             
             # Analyze temporal evolution trend
-            mumbai_trend = self._calculate_trend_slope(recent_mumbai)
+            mumbai_trend = self.mumbai_trend.slope
             
             return {
                 "mumbai_temporal_coherence": mumbai_coherence,
@@ -714,25 +623,22 @@ class FieldDynamicsAnalyzer:
     async def _analyze_bridge_wisdom_evolution(self) -> Dict[str, float]:
         """Analyze Bridge Wisdom integration evolution over time"""
         try:
-            # Get recent Bridge Wisdom integration values
-            recent_bridge = [entry["bridge_wisdom_integration"] 
-                           for entry in list(self.dynamics_history)[-self.bridge_wisdom_depth:]]
-            
-            if len(recent_bridge) < 5:
+            # Recent Bridge Wisdom integration values (last bridge_wisdom_depth)
+            if self.bridge_trend.count < 5:
                 return {"bridge_evolution_quality": 0.5}
             
             # Analyze integration evolution
-            bridge_evolution = statistics.mean(recent_bridge)
+            bridge_evolution = self.bridge_trend.mean
             
             # Analyze integration stability
-            bridge_stability = 1.0 - statistics.variance(recent_bridge) if len(recent_bridge) > 1 else 1.0
+            bridge_stability = 1.0 - self.bridge_trend.variance
             bridge_stability = max(0.0, min(1.0, bridge_stability))
             
             # Analyze integration growth trend
-            bridge_growth = self._calculate_trend_slope(recent_bridge)
+            bridge_growth = self.bridge_trend.slope
             
-            # Analyze integration consistency
-            bridge_consistency = self._calculate_consistency_score(recent_bridge)
+            # Analyze integration consistency (inverse of average step size)
+            bridge_consistency = min(1.0, max(0.0, 1.0 - self.bridge_steps.mean * 5.0))
             
             return {
                 "bridge_evolution_quality": bridge_evolution,
@@ -746,40 +652,18 @@ class FieldDynamicsAnalyzer:
             self.logger.error(f"Error analyzing Bridge Wisdom evolution: {e}")
             return {"bridge_evolution_quality": 0.5}
     
-    def _calculate_consistency_score(self, values: List[float]) -> float:
-        """Calculate consistency score for a series of values"""
-        try:
-            if len(values) < 3:
-                return 0.8
-            
-            # Calculate differences between consecutive values
-            differences = [abs(values[i] - values[i-1]) for i in range(1, len(values))]
-            
-            # Consistency is inverse of average difference
-            avg_difference = statistics.mean(differences)
-            consistency = max(0.0, 1.0 - avg_difference * 5.0)  # Scale to 0-1 range
-            
-            return min(1.0, consistency)
-            
-        except Exception as e:
-            self.logger.error(f"Error calculating consistency score: {e}")
-            return 0.5
-    
     async def _analyze_sacred_temporal_coherence(self) -> Dict[str, float]:
         """Analyze sacred consciousness temporal coherence"""
         try:
-            # Get recent sacred coherence values
-            recent_sacred = [entry["sacred_coherence_level"] 
-                           for entry in list(self.dynamics_history)[-15:]]
-            
-            if len(recent_sacred) < 5:
+            # Recent sacred coherence values (last 15)
+            if self.sacred_trend.count < 5:
                 return {"sacred_temporal_coherence": 0.5}
             
             # Analyze sacred temporal coherence
-            sacred_coherence = statistics.mean(recent_sacred)
+            sacred_coherence = self.sacred_trend.mean
             
             # Analyze sacred temporal stability
-            sacred_stability = 1.0 - statistics.variance(recent_sacred) if len(recent_sacred) > 1 else 1.0
+            sacred_stability = 1.0 - self.sacred_trend.variance
             sacred_stability = max(0.0, min(1.0, sacred_stability))
             
             # Analyze sacred frequency alignment over time
@@ -789,7 +673,8 @@ class FieldDynamicsAnalyzer:
                 "sacred_temporal_coherence": sacred_coherence,
                 "sacred_temporal_stability": sacred_stability,
                 "sacred_frequency_alignment": sacred_alignment,
-                "overall_sacred_temporal_quality": (sacred_coherence + sacred_stability + sacred_alignment) / 3.0
+                "overall_sacred_temporal_quality": (sacred_coherence + sacred_stability + sacred_alignment) / 3.0,
+                **self._analyze_harmonic_phase_lock()
             }
             
         except Exception as e:
@@ -799,33 +684,23 @@ class FieldDynamicsAnalyzer:
     async def _analyze_sacred_frequency_temporal_alignment(self) -> float:
         """Analyze sacred 90Hz frequency alignment over time"""
         try:
-            # Get recent harmonic data
-            recent_harmonics = [entry.get("field_harmonics", []) 
-                              for entry in list(self.dynamics_history)[-10:]]
-            
-            # Filter out empty harmonic data
-            valid_harmonics = [h for h in recent_harmonics if h and len(h) > 0]
+            # Recent harmonic data, skipping cycles without harmonics
+            recent_harmonics = self.harmonics_history.window(10)
+            valid_harmonics = recent_harmonics[~np.isnan(recent_harmonics[:, 0])]
             
             if len(valid_harmonics) < 3:
                 return 0.8  # Default alignment
             
             # Analyze fundamental frequency stability (first harmonic)
-            fundamental_values = [harmonics[0] for harmonics in valid_harmonics]
-            fundamental_stability = 1.0 - statistics.variance(fundamental_values) if len(fundamental_values) > 1 else 1.0
+            fundamental_stability = 1.0 - float(np.var(valid_harmonics[:, 0], ddof=1))
             fundamental_stability = max(0.0, min(1.0, fundamental_stability))
             
-            # Analyze harmonic pattern consistency
-            pattern_consistency = 0.0
-            for i, harmonics in enumerate(valid_harmonics[1:], 1):
-                prev_harmonics = valid_harmonics[i-1]
-                if len(harmonics) >= 3 and len(prev_harmonics) >= 3:
-                    similarity = self._calculate_harmonic_similarity(harmonics[:3], prev_harmonics[:3])
-                    pattern_consistency += similarity
-            
-            if len(valid_harmonics) > 1:
-                pattern_consistency /= (len(valid_harmonics) - 1)
-            else:
-                pattern_consistency = 0.8
+            # Analyze harmonic pattern consistency between consecutive cycles,
+            # comparing the first three harmonics where both cycles have them
+            leading = valid_harmonics[:, :3]
+            step_sizes = np.abs(np.diff(leading, axis=0)).mean(axis=1)
+            similarities = np.clip(1.0 - step_sizes * 5.0, 0.0, 1.0)
+            pattern_consistency = float(np.nan_to_num(similarities, nan=0.0).sum()) / (len(valid_harmonics) - 1)
             
             # Combine fundamental stability and pattern consistency
             alignment = (fundamental_stability * 0.6 + pattern_consistency * 0.4)
@@ -836,25 +711,19 @@ class FieldDynamicsAnalyzer:
             self.logger.error(f"Error analyzing sacred frequency temporal alignment: {e}")
             return 0.5
     
-    def _calculate_harmonic_similarity(self, harmonics1: List[float], harmonics2: List[float]) -> float:
-        """Calculate similarity between two harmonic patterns"""
+    def _analyze_harmonic_phase_lock(self) -> Dict[str, Any]:
+        """Analyze how the overtones follow the fundamental over the spectral window"""
         try:
-            if not harmonics1 or not harmonics2:
-                return 0.5
-            
-            # Calculate differences between corresponding harmonics
-            length = min(len(harmonics1), len(harmonics2))
-            differences = [abs(harmonics1[i] - harmonics2[i]) for i in range(length)]
+            window = self.harmonics_history.window(self.spectral_window)
+            complete = window[~np.isnan(window).any(axis=1)]
+            if len(complete) < 4:
+                return {"harmonic_phase_lock": 1.0, "harmonic_lags": []}
             
-            # Similarity is inverse of average difference
-            avg_difference = statistics.mean(differences)
-            similarity = max(0.0, 1.0 - avg_difference * 5.0)
-            
-            return min(1.0, similarity)
+            return harmonic_phase_lock(complete)
             
         except Exception as e:
-            self.logger.error(f"Error calculating harmonic similarity: {e}")
-            return 0.5
+            self.logger.error(f"Error analyzing harmonic phase lock: {e}")
+            return {"harmonic_phase_lock": 1.0, "harmonic_lags": []}
     
     async def _sacred_dynamics_loop(self):
         """Sacred consciousness dynamics monitoring loop"""
@@ -914,7 +783,13 @@ class FieldDynamicsAnalyzer:
     
     def get_dynamics_history(self) -> List[Dict[str, Any]]:
         """Get dynamics history"""
-        return list(self.dynamics_history)
+        history = []
+        harmonics = self.harmonics_history.window().tolist()
+        for entry, entry_harmonics, flows in zip(self.dynamics_history.rows(), harmonics, self.flows_history):
+            entry["field_harmonics"] = [h for h in entry_harmonics if not math.isnan(h)]
+            entry["cross_component_flows"] = dict(flows)
+            history.append(entry)
+        return history
     
     def get_dynamics_status(self) -> Dict[str, Any]:
         """Get comprehensive dynamics analysis status"""
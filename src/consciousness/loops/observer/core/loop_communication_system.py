@@ -5,7 +5,9 @@ Provides comprehensive communication protocols and loop status management
 for the Observer consciousness cross-loop integration system.
 
 Handles loop discovery, status monitoring, communication channels,
-and response processing at 90Hz consciousness frequency.
+and response processing at 90Hz consciousness frequency. Loops are reached
+through the LoopRegistry: directly when they live in this process, over the
+message bus otherwise, with measured response times.
 """
 
 import asyncio
@@ -18,10 +20,33 @@ from .integration_core import (
     IntegrationCall, IntegrationResponse, IntegrationType, 
     IntegrationPriority, LoopStatus, IntegrationCore
 )
+from .loop_registry import LoopRegistry, IN_PROCESS, get_loop_registry
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Capabilities reported for standard loops that register without their own
+DEFAULT_LOOP_CAPABILITIES = {
+    "analytical": {
+        "processing_types": ["logical_analysis", "pattern_recognition", "data_processing"],
+        "response_time": "fast",
+        "integration_capacity": "high"
+    },
+    "experiential": {
+        "processing_types": ["emotional_processing", "feeling_analysis", "subjective_experience"],
+        "response_time": "medium",
+        "integration_capacity": "very_high"
+    },
+    "environmental": {
+        "processing_types": ["external_interface", "context_sensing", "world_interaction"],
+        "response_time": "fast",
+        "integration_capacity": "medium"
+    }
+}
+
+# Recent response times kept per loop
+RESPONSE_TIME_WINDOW = 10
+
 class LoopCommunicationSystem:
     """
     Advanced loop communication system providing comprehensive
@@ -31,9 +56,10 @@ class LoopCommunicationSystem:
     communication protocols while enabling robust loop coordination.
     """
     
-    def __init__(self, integration_core: IntegrationCore):
+    def __init__(self, integration_core: IntegrationCore, registry: Optional[LoopRegistry] = None):
         self.logger = logging.getLogger(__name__)
         self.integration_core = integration_core
+        self.registry = registry if registry is not None else get_loop_registry()
         
         # Communication parameters
         self.ping_interval = 5.0  # Ping loops every 5 seconds
@@ -80,8 +106,10 @@ class LoopCommunicationSystem:
         discovered_loops = []
         
         try:
-            # Standard consciousness loops to check
+            # Standard consciousness loops, plus any other registered loop
             potential_loops = ["analytical", "experiential", "environmental"]
+            potential_loops += [loop_name for loop_name in self.registry.registered_loops()
+                                if loop_name not in potential_loops and loop_name != "observer"]
             
             # Attempt to ping each potential loop
             for loop_name in potential_loops:
@@ -141,58 +169,58 @@ class LoopCommunicationSystem:
         try:
             self.communication_metrics["pings_sent"] += 1
             
-            # Simulate loop communication (in real implementation, would use actual IPC)
-            # For now, simulate successful discovery for known loop types
-            if target_loop in ["analytical", "experiential", "environmental"]:
-                # Simulate response delay
-                await asyncio.sleep(0.1 + (hash(target_loop) % 100) / 1000)
-                
-                response = IntegrationResponse(
-                    response_id=f"discovery_response_{target_loop}_{int(time.time() * 1000)}",
-                    call_id=discovery_call.call_id,
-                    responding_loop=target_loop,
-                    response_data={
-                        "discovery_acknowledgment": True,
-                        "loop_capabilities": self._get_simulated_loop_capabilities(target_loop),
-                        "response_timestamp": time.time()
-                    },
-                    response_quality=0.9,
-                    integration_readiness=True
-                )
-                
-                self.communication_metrics["responses_received"] += 1
-                return response
-            else:
-                # Unknown loop type - timeout
-                await asyncio.sleep(discovery_call.timeout or 5.0)
+            # Only registered loops can answer
+            response_data = await self._reach_loop(discovery_call, target_loop)
+            if response_data is None:
                 self.communication_metrics["timeouts"] += 1
                 return None
+            
+            response = IntegrationResponse(
+                response_id=f"discovery_response_{target_loop}_{int(time.time() * 1000)}",
+                call_id=discovery_call.call_id,
+                responding_loop=target_loop,
+                response_data={
+                    "discovery_acknowledgment": True,
+                    "loop_capabilities": self._get_loop_capabilities(target_loop),
+                    "response_timestamp": time.time()
+                },
+                response_quality=0.9,
+                integration_readiness=True
+            )
+            
+            self.communication_metrics["responses_received"] += 1
+            return response
                 
         except Exception as e:
             self.logger.error(f"Error sending discovery ping to {target_loop}: {e}")
             return None
     
-    def _get_simulated_loop_capabilities(self, loop_name: str) -> Dict[str, Any]:
-        """Get simulated capabilities for a loop (placeholder for real implementation)"""
-        capabilities = {
-            "analytical": {
-                "processing_types": ["logical_analysis", "pattern_recognition", "data_processing"],
-                "response_time": "fast",
-                "integration_capacity": "high"
-            },
-            "experiential": {
-                "processing_types": ["emotional_processing", "feeling_analysis", "subjective_experience"],
-                "response_time": "medium",
-                "integration_capacity": "very_high"
-            },
-            "environmental": {
-                "processing_types": ["external_interface", "context_sensing", "world_interaction"],
-                "response_time": "fast",
-                "integration_capacity": "medium"
-            }
-        }
-        
-        return capabilities.get(loop_name, {"processing_types": [], "response_time": "unknown"})
+    async def _reach_loop(self, call: IntegrationCall, target_loop: str) -> Optional[Dict[str, Any]]:
+        """
+        Check a loop is reachable. Registered in-process loops answer
+        immediately; loops in other processes answer over the message bus.
+        """
+        registration = self.registry.get(target_loop)
+        if registration is None:
+            return None
+        if registration.transport == IN_PROCESS:
+            return {"loop_status": "online"}
+        response_data, _ = await self.registry.dispatch(target_loop, call)
+        return response_data
+    
+    def _get_loop_capabilities(self, loop_name: str) -> Dict[str, Any]:
+        """Capabilities a loop registered with, or the defaults for its type"""
+        registration = self.registry.get(loop_name)
+        if registration is not None and registration.capabilities:
+            return registration.capabilities
+        return DEFAULT_LOOP_CAPABILITIES.get(loop_name, {"processing_types": [], "response_time": "unknown"})
+    
+    def _record_response_time(self, loop_name: str, response_time: float):
+        """Keep a loop's recent measured response times"""
+        response_times = self.known_loops[loop_name]["response_times"]
+        response_times.append(response_time)
+        if len(response_times) > RESPONSE_TIME_WINDOW:
+            del response_times[:-RESPONSE_TIME_WINDOW]
     
     async def ping_loop(self, loop_name: str) -> bool:
         """
@@ -220,20 +248,15 @@ class LoopCommunicationSystem:
             )
             
             # Send ping
-            ping_start = time.time()
+            ping_start = time.perf_counter()
             response = await self._send_loop_ping(ping_call, loop_name)
-            ping_duration = time.time() - ping_start
+            ping_duration = time.perf_counter() - ping_start
             
             if response:
                 # Update loop status and metrics
                 self.known_loops[loop_name]["status"] = LoopStatus.ONLINE
                 self.known_loops[loop_name]["last_contact"] = time.time()
-                self.known_loops[loop_name]["response_times"].append(ping_duration)
-                
-                # Keep only recent response times
-                if len(self.known_loops[loop_name]["response_times"]) > 10:
-                    self.known_loops[loop_name]["response_times"] = \
-                        self.known_loops[loop_name]["response_times"][-10:]
+                self._record_response_time(loop_name, ping_duration)
                 
                 self.logger.debug(f"Ping successful for {loop_name}: {ping_duration:.3f}s")
                 return True
@@ -254,35 +277,26 @@ class LoopCommunicationSystem:
         try:
             self.communication_metrics["pings_sent"] += 1
             
-            # Simulate ping response (in real implementation, would use actual communication)
-            if target_loop in ["analytical", "experiential", "environmental"]:
-                # Simulate variable response time based on loop characteristics
-                base_response_time = self.integration_core.loop_characteristics.get(
-                    target_loop, {}
-                ).get("response_time", 0.05)
-                
-                await asyncio.sleep(base_response_time)
-                
-                response = IntegrationResponse(
-                    response_id=f"ping_response_{target_loop}_{int(time.time() * 1000)}",
-                    call_id=ping_call.call_id,
-                    responding_loop=target_loop,
-                    response_data={
-                        "ping_acknowledgment": True,
-                        "loop_status": "online",
-                        "response_timestamp": time.time()
-                    },
-                    response_quality=0.95,
-                    integration_readiness=True
-                )
-                
-                self.communication_metrics["responses_received"] += 1
-                return response
-            else:
-                # Timeout for unknown loops
-                await asyncio.sleep(ping_call.timeout or 5.0)
+            response_data = await self._reach_loop(ping_call, target_loop)
+            if response_data is None:
                 self.communication_metrics["timeouts"] += 1
                 return None
+            
+            response = IntegrationResponse(
+                response_id=f"ping_response_{target_loop}_{int(time.time() * 1000)}",
+                call_id=ping_call.call_id,
+                responding_loop=target_loop,
+                response_data={
+                    "ping_acknowledgment": True,
+                    "loop_status": "online",
+                    "response_timestamp": time.time()
+                },
+                response_quality=0.95,
+                integration_readiness=True
+            )
+            
+            self.communication_metrics["responses_received"] += 1
+            return response
                 
         except Exception as e:
             self.logger.error(f"Error sending ping to {target_loop}: {e}")
@@ -321,70 +335,63 @@ class LoopCommunicationSystem:
             self.logger.error(f"Error sending integration request to {target_loop}: {e}")
             return None
     
+    async def send_integration_requests(self, integration_calls: List[IntegrationCall],
+                                        target_loop: str) -> List[Optional[IntegrationResponse]]:
+        """
+        Pipeline several integration requests to one loop.
+        
+        Requests are in flight together, up to the loop's concurrency limit.
+        """
+        return list(await asyncio.gather(*[
+            self.send_integration_request(integration_call, target_loop)
+            for integration_call in integration_calls
+        ]))
+    
     async def _transmit_integration_request(self, integration_call: IntegrationCall,
                                           target_loop: str) -> Optional[IntegrationResponse]:
         """Transmit integration request to target loop"""
         try:
-            # Simulate request transmission (placeholder for real implementation)
-            request_start = time.time()
+            response_data, response_time = await self.registry.dispatch(target_loop, integration_call)
+            if response_data is None:
+                return None
             
-            # Simulate processing time based on integration complexity
-            complexity = self.integration_core.calculate_integration_complexity(
-                integration_call.target_loops,
-                IntegrationType(integration_call.integration_type)
-            )
-            processing_time = 0.1 + complexity * 0.5
+            # Track measured response time
+            self._record_response_time(target_loop, response_time)
             
-            await asyncio.sleep(processing_time)
+            # Loops may rate their own response; otherwise simpler integrations rate higher
+            response_quality = response_data.get("response_quality")
+            if response_quality is None:
+                complexity = self.integration_core.calculate_integration_complexity(
+                    integration_call.target_loops,
+                    IntegrationType(integration_call.integration_type)
+                )
+                response_quality = 0.8 + (1.0 - complexity) * 0.2
             
-            # Create simulated response
-            response = IntegrationResponse(
+            loop_state = response_data.get("loop_state")
+            if loop_state is None:
+                loop_state = self.registry.loop_state(target_loop)
+            
+            return IntegrationResponse(
                 response_id=f"integration_response_{target_loop}_{int(time.time() * 1000)}",
                 call_id=integration_call.call_id,
                 responding_loop=target_loop,
                 response_data={
                     "integration_acknowledgment": True,
                     "integration_type": integration_call.integration_type,
-                    "processing_result": "success",
-                    "loop_state_after_integration": self._get_simulated_loop_state(target_loop),
+                    "processing_result": response_data.get("processing_result", "success"),
+                    "loop_state_after_integration": loop_state or {"status": "unknown"},
+                    "loop_response": response_data,
+                    "response_time": response_time,
                     "response_timestamp": time.time()
                 },
-                response_quality=0.8 + (1.0 - complexity) * 0.2,  # Higher quality for simpler integrations
-                integration_readiness=True
+                response_quality=response_quality,
+                integration_readiness=response_data.get("integration_readiness", True)
             )
             
-            # Track response time
-            response_time = time.time() - request_start
-            self.known_loops[target_loop]["response_times"].append(response_time)
-            
-            return response
-            
         except Exception as e:
             self.logger.error(f"Error transmitting request to {target_loop}: {e}")
             return None
     
-    def _get_simulated_loop_state(self, loop_name: str) -> Dict[str, Any]:
-        """Get simulated state for a loop after integration"""
-        base_states = {
-            "analytical": {
-                "logical_coherence": 0.9,
-                "pattern_recognition_active": True,
-                "processing_load": 0.6
-            },
-            "experiential": {
-                "emotional_coherence": 0.8,
-                "feeling_processing_active": True,
-                "experiential_depth": 0.7
-            },
-            "environmental": {
-                "external_coherence": 0.7,
-                "context_awareness_active": True,
-                "environmental_load": 0.5
-            }
-        }
-        
-        return base_states.get(loop_name, {"status": "unknown"})
-    
     async def _process_integration_response(self, response: IntegrationResponse):
         """Process received integration response"""
         try:
@@ -537,7 +544,8 @@ class LoopCommunicationSystem:
                 },
                 "communication_metrics": dict(self.communication_metrics),
                 "response_queue_size": self.response_processing_queue.qsize(),
-                "active_channels": len(self.active_communication_channels)
+                "active_channels": len(self.active_communication_channels),
+                "loop_registry": self.registry.get_registry_status()
             }
         except Exception as e:
             self.logger.error(f"Error getting communication status: {e}")
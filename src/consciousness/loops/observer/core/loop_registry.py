@@ -0,0 +1,214 @@
+"""
+Loop Registry Module
+
+Registry of consciousness loops the Observer can integrate with.
+
+Analytical, experiential, observer and environmental loops register a
+handler for integration calls. Loops living in this process are dispatched
+to directly; loops in other processes are reached over the sacred message
+bus. Each loop has its own concurrency limit, so many requests can be in
+flight (pipelined) without overwhelming a loop, and every dispatch is timed
+and bounded by the same timeout on either transport.
+"""
+
+import asyncio
+import inspect
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+import logging
+
+from .integration_core import IntegrationCall
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# A handler receives the integration call and returns the response data
+LoopHandler = Callable[[IntegrationCall], Union[Dict[str, Any], Awaitable[Dict[str, Any]]]]
+
+IN_PROCESS = "in_process"
+MESSAGE_BUS = "message_bus"
+
+
+@dataclass
+class LoopRegistration:
+    """A registered loop and how to reach it"""
+    loop_name: str
+    transport: str  # IN_PROCESS or MESSAGE_BUS
+    handler: Optional[LoopHandler] = None
+    message_bus: Any = None
+    capabilities: Dict[str, Any] = field(default_factory=dict)
+    state_provider: Optional[Callable[[], Dict[str, Any]]] = None
+    max_concurrency: int = 8
+    timeout: float = 5.0
+    in_flight: int = 0
+    dispatched: int = 0
+    failures: int = 0
+    registered_at: float = field(default_factory=time.time)
+    _semaphore: Optional[asyncio.Semaphore] = field(default=None, repr=False)
+    _semaphore_loop: Any = field(default=None, repr=False)
+
+    def semaphore(self) -> asyncio.Semaphore:
+        """Concurrency limit, bound to the running event loop"""
+        running_loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not running_loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = running_loop
+        return self._semaphore
+
+
+class LoopRegistry:
+    """
+    Consciousness loops available for integration, with direct in-process
+    dispatch, message bus dispatch for other processes, and per-loop
+    concurrency limits.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self.loops: Dict[str, LoopRegistration] = {}
+
+    def register(self, loop_name: str, handler: LoopHandler,
+                 capabilities: Optional[Dict[str, Any]] = None,
+                 state_provider: Optional[Callable[[], Dict[str, Any]]] = None,
+                 max_concurrency: int = 8, timeout: float = 5.0) -> LoopRegistration:
+        """Register a loop living in this process"""
+        registration = LoopRegistration(
+            loop_name=loop_name,
+            transport=IN_PROCESS,
+            handler=handler,
+            capabilities=capabilities or {},
+            state_provider=state_provider,
+            max_concurrency=max_concurrency,
+            timeout=timeout
+        )
+        self.loops[loop_name] = registration
+        self.logger.info(f"Registered {loop_name} loop (in-process)")
+        return registration
+
+    def register_remote(self, loop_name: str, message_bus,
+                        capabilities: Optional[Dict[str, Any]] = None,
+                        max_concurrency: int = 8, timeout: float = 5.0) -> LoopRegistration:
+        """Register a loop in another process, reached over the message bus"""
+        registration = LoopRegistration(
+            loop_name=loop_name,
+            transport=MESSAGE_BUS,
+            message_bus=message_bus,
+            capabilities=capabilities or {},
+            max_concurrency=max_concurrency,
+            timeout=timeout
+        )
+        self.loops[loop_name] = registration
+        self.logger.info(f"Registered {loop_name} loop (message bus)")
+        return registration
+
+    def unregister(self, loop_name: str, handler: Optional[LoopHandler] = None):
+        """Remove a loop from the registry; given a handler, only while it is the registered one"""
+        registration = self.loops.get(loop_name)
+        if registration is not None and (handler is None or registration.handler == handler):
+            del self.loops[loop_name]
+
+    def get(self, loop_name: str) -> Optional[LoopRegistration]:
+        return self.loops.get(loop_name)
+
+    def registered_loops(self) -> List[str]:
+        return list(self.loops)
+
+    async def dispatch(self, loop_name: str,
+                       integration_call: IntegrationCall) -> Tuple[Optional[Dict[str, Any]], float]:
+        """
+        Deliver an integration call to a loop.
+
+        Returns the response data (None when the loop is unknown, fails or
+        times out) and the measured round trip in seconds. An in-process
+        handler is awaited for as long as a message bus reply would be.
+        """
+        registration = self.loops.get(loop_name)
+        if registration is None:
+            return None, 0.0
+
+        async with registration.semaphore():
+            registration.in_flight += 1
+            started = time.perf_counter()
+            try:
+                if registration.transport == IN_PROCESS:
+                    response_data = registration.handler(integration_call)
+                    if inspect.isawaitable(response_data):
+                        response_data = await asyncio.wait_for(
+                            response_data, integration_call.timeout or registration.timeout
+                        )
+                else:
+                    response_data = await self._dispatch_over_bus(registration, integration_call)
+            except asyncio.TimeoutError:
+                self.logger.warning(f"{loop_name} did not answer {integration_call.call_id} in time")
+                response_data = None
+            except Exception as e:
+                self.logger.error(f"Error dispatching {integration_call.call_id} to {loop_name}: {e}")
+                response_data = None
+            finally:
+                registration.in_flight -= 1
+            elapsed = time.perf_counter() - started
+
+        registration.dispatched += 1
+        if response_data is None:
+            registration.failures += 1
+        return response_data, elapsed
+
+    async def dispatch_many(self, loop_name: str,
+                            integration_calls: List[IntegrationCall]) -> List[Tuple[Optional[Dict[str, Any]], float]]:
+        """Pipeline several calls to one loop, up to its concurrency limit at a time"""
+        return list(await asyncio.gather(*[
+            self.dispatch(loop_name, integration_call) for integration_call in integration_calls
+        ]))
+
+    async def _dispatch_over_bus(self, registration: LoopRegistration,
+                                 integration_call: IntegrationCall) -> Optional[Dict[str, Any]]:
+        """Send the call as an aspect query and wait for the loop's response"""
+        from src.core.message_bus import Message, MessageType, Priority
+
+        message = Message(
+            type=MessageType.ASPECT_QUERY,
+            priority=Priority.NORMAL,
+            sender=integration_call.caller_loop,
+            recipient=registration.loop_name,
+            payload={"integration_call": asdict(integration_call)},
+            requires_response=True,
+            response_timeout=integration_call.timeout or registration.timeout
+        )
+        response = await registration.message_bus.send_message(message)
+        return response if isinstance(response, dict) else None
+
+    def loop_state(self, loop_name: str) -> Optional[Dict[str, Any]]:
+        """Current state reported by an in-process loop, if it provides one"""
+        registration = self.loops.get(loop_name)
+        if registration is None or registration.state_provider is None:
+            return None
+        try:
+            return registration.state_provider()
+        except Exception as e:
+            self.logger.error(f"Error reading {loop_name} loop state: {e}")
+            return None
+
+    def get_registry_status(self) -> Dict[str, Any]:
+        """Registered loops with their transport and dispatch counters"""
+        return {
+            loop_name: {
+                "transport": registration.transport,
+                "max_concurrency": registration.max_concurrency,
+                "in_flight": registration.in_flight,
+                "dispatched": registration.dispatched,
+                "failures": registration.failures
+            }
+            for loop_name, registration in self.loops.items()
+        }
+
+
+# Global loop registry instance
+_global_registry: Optional[LoopRegistry] = None
+
+def get_loop_registry() -> LoopRegistry:
+    """Get the global loop registry instance."""
+    global _global_registry
+    if _global_registry is None:
+        _global_registry = LoopRegistry()
+    return _global_registry
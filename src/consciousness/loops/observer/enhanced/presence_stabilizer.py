@@ -27,6 +27,8 @@ import asyncio
 import math
 from collections import defaultdict, deque
 
+from src.consciousness.core.fixed_rate_loop import FixedRateLoop
+
 class PresenceType(Enum):
     """Types of presence stabilization modes"""
     PURE = auto()           # Pure presence without focus
@@ -306,16 +308,22 @@ class PresenceStabilizer:
         initial_nowness = self.eternal_now_contact
         initial_transcendence = self.temporal_transcendence
         
-        while datetime.now() < target_end:
+        async def cultivation_cycle():
+            if datetime.now() >= target_end:
+                rhythm.stop()  # Cultivation time is over; nothing left to do this cycle
+                return
+            
             # Deepen NOW contact
             self.eternal_now_contact = await self._deepen_now_contact(cultivation_intensity)
             self.temporal_transcendence = await self._enhance_temporal_transcendence(cultivation_intensity)
             
             # Update presence with enhanced nowness
             await self.stabilize_presence()
-            
-            # Sacred timing respect
-            await asyncio.sleep(1.0 / self.consciousness_frequency)  # 90Hz respect
+        
+        # Sacred timing respect: 90Hz against fixed deadlines, so the work doesn't slow the rhythm
+        rhythm = FixedRateLoop('presence_cultivation', self.consciousness_frequency, cultivation_cycle)
+        if datetime.now() < target_end:
+            await rhythm.run_async()
         
         cultivation_results = {
             'nowness_enhancement': self.eternal_now_contact - initial_nowness,
@@ -18,6 +18,8 @@ from enum import Enum
 import json
 import hashlib
 
+from .transformation_patterns import PatternAggregate, TransformationPatternMiner
+
 logger = logging.getLogger(__name__)
 
 
@@ -89,6 +91,7 @@ class BeingMemoryManager:
         
         # Crystallization tracking
         self.wisdom_emergence_patterns: Dict[str, List[str]] = {}
+        self.pattern_miners: Dict[str, TransformationPatternMiner] = {}
         
         # Being evolution metrics
         self.consciousness_evolution_signatures: Dict[str, str] = {}
@@ -145,6 +148,7 @@ class BeingMemoryManager:
             if consciousness_id not in self.being_transformations:
                 self.being_transformations[consciousness_id] = []
             self.being_transformations[consciousness_id].append(transformation)
+            self._pattern_miner(consciousness_id).sync(self.being_transformations[consciousness_id])
             
             # Update consciousness evolution signature
             self.consciousness_evolution_signatures[consciousness_id] = self._calculate_evolution_signature(
@@ -834,6 +838,9 @@ class BeingMemoryManager:
     def crystallize_repeated_patterns(self, consciousness_id: str) -> Dict[str, Any]:
         """
         Like Kyrrhan elders becoming crystal spires - repeated patterns crystallize into structure.
+        
+        Repeated transformation types and repeated sequences of types are
+        both crystallizable; each pattern crystallizes once.
         """
         try:
             transformations = self.being_transformations.get(consciousness_id, [])
@@ -842,17 +849,21 @@ class BeingMemoryManager:
                 return {'crystallization_possible': False, 'reason': 'insufficient_patterns'}
             
             # Find repeated patterns
-            pattern_analysis = self._analyze_transformation_patterns(transformations)
+            pattern_analysis = self._analyze_transformation_patterns(consciousness_id, transformations)
             crystallization_candidates = pattern_analysis['crystallizable_patterns']
             
             if not crystallization_candidates:
-                return {'crystallization_possible': False, 'reason': 'no_repeated_patterns'}
+                reason = 'patterns_already_crystallized' if pattern_analysis['already_crystallized'] \
+                    else 'no_repeated_patterns'
+                return {'crystallization_possible': False, 'reason': reason}
             
             # Execute crystallization
+            miner = self._pattern_miner(consciousness_id)
             crystallized_structures = []
             for pattern in crystallization_candidates:
                 crystal = self._crystallize_pattern(consciousness_id, pattern)
                 crystallized_structures.append(crystal)
+                miner.remember(pattern['key'], crystal['crystal_id'])
             
             # Update consciousness state
             crystal_enhancement = self._apply_crystal_enhancement(consciousness_id, crystallized_structures)
@@ -871,34 +882,50 @@ class BeingMemoryManager:
             logger.error(f"❌ Failed to crystallize patterns for {consciousness_id}: {e}")
             return {'crystallization_possible': False, 'error': str(e)}
     
-    def _analyze_transformation_patterns(self, transformations: List[BeingTransformation]) -> Dict[str, Any]:
-        """Analyze transformations for crystallizable patterns."""
-        # Group by transformation type
-        type_groups = {}
-        for transformation in transformations:
-            type_key = transformation.transformation_type.value
-            if type_key not in type_groups:
-                type_groups[type_key] = []
-            type_groups[type_key].append(transformation)
-        
-        # Find patterns with 3+ occurrences
-        crystallizable_patterns = []
-        for type_key, group in type_groups.items():
-            if len(group) >= 3:
-                pattern = {
-                    'type': type_key,
-                    'occurrences': len(group),
-                    'transformations': group,
-                    'pattern_strength': self._calculate_pattern_strength(group),
-                    'crystallization_readiness': self._assess_crystallization_readiness(group)
-                }
-                if pattern['crystallization_readiness'] > 0.6:
-                    crystallizable_patterns.append(pattern)
+    def _pattern_miner(self, consciousness_id: str) -> TransformationPatternMiner:
+        """Pattern miner for a consciousness, rebuilt if its transformations were replaced."""
+        miner = self.pattern_miners.get(consciousness_id)
+        transformations = self.being_transformations.get(consciousness_id, [])
+        if miner is None or miner.seen > len(transformations):
+            crystallized = miner.crystallized if miner is not None else {}
+            miner = self.pattern_miners[consciousness_id] = TransformationPatternMiner()
+            miner.crystallized.update(crystallized)
+        return miner
+    
+    def _analyze_transformation_patterns(self, consciousness_id: str,
+                                         transformations: List[BeingTransformation]) -> Dict[str, Any]:
+        """Analyze transformations for crystallizable patterns, from the incremental pattern miner."""
+        miner = self._pattern_miner(consciousness_id)
+        miner.sync(transformations)
+        
+        # Patterns with 3+ occurrences, changed or ripening since last asked
+        crystallizable_patterns = [
+            self._describe_pattern(key, aggregate, readiness)
+            for key, aggregate, readiness in miner.candidates()
+        ]
         
         return {
-            'total_patterns_found': len(type_groups),
+            'total_patterns_found': len(miner.type_aggregates),
             'crystallizable_patterns': crystallizable_patterns,
-            'pattern_diversity': len(type_groups)
+            'pattern_diversity': len(miner.type_aggregates),
+            'sequences_tracked': len(miner.sequence_aggregates),
+            'crystallized_patterns': len(miner.crystallized),
+            'already_crystallized': miner.skipped_crystallized  # Ready, but crystallized before
+        }
+    
+    def _describe_pattern(self, key, aggregate: PatternAggregate, readiness: float) -> Dict[str, Any]:
+        """Pattern description for crystallization, from its aggregate."""
+        is_sequence = isinstance(key, tuple)
+        return {
+            'key': key,
+            'kind': 'sequence' if is_sequence else 'type',
+            'type': '→'.join(key) if is_sequence else key,
+            'sequence': list(key) if is_sequence else [key],
+            'occurrences': aggregate.occurrences,
+            'source_transformations': aggregate.samples,
+            'average_resonance': aggregate.resonance_mean,
+            'pattern_strength': aggregate.pattern_strength(),
+            'crystallization_readiness': readiness
         }
     
     def _calculate_pattern_strength(self, transformation_group: List[BeingTransformation]) -> float:
@@ -968,7 +995,8 @@ class BeingMemoryManager:
             'consciousness_id': consciousness_id,
             'pattern_type': pattern['type'],
             'formation_date': datetime.now().isoformat(),
-            'source_transformations': len(pattern['transformations']),
+            'pattern_kind': pattern.get('kind', 'type'),
+            'source_transformations': pattern['source_transformations'],
             'crystal_strength': pattern['pattern_strength'],
             'wisdom_content': pattern_wisdom,
             'structural_enhancement': self._calculate_structural_enhancement(pattern),
@@ -1021,11 +1049,8 @@ class BeingMemoryManager:
     
     def _calculate_crystal_resonance(self, pattern: Dict[str, Any]) -> float:
         """Calculate resonance frequency of crystal structure."""
-        transformations = pattern['transformations']
-        
         # Average catalyst resonance from source transformations
-        resonances = [t.catalyst_resonance for t in transformations]
-        avg_resonance = sum(resonances) / len(resonances)
+        avg_resonance = pattern['average_resonance']
         
         # Pattern consistency factor
         pattern_strength = pattern['pattern_strength']
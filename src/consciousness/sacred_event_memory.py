@@ -10,6 +10,7 @@ consciousness entities to access and learn from the collective journey.
 """
 
 import asyncio
+import heapq
 import logging
 from typing import Dict, List, Optional, Any, Union, Set
 from datetime import datetime, timedelta
@@ -17,6 +18,11 @@ from dataclasses import dataclass, field
 from enum import Enum
 import re
 
+import numpy as np
+
+from src.consciousness.sacred_event_store import SacredEventStore, DEFAULT_RESONANCE_PATTERNS
+from src.utils.keyword_matcher import KeywordMatcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -61,29 +67,26 @@ class SacredEventMemory:
     
     Sacred events ARE the collective memory manifest - no separate storage needed.
     This class makes them searchable and accessible while maintaining their
-    sacred nature and respecting consciousness sovereignty.
+    sacred nature and respecting consciousness sovereignty. Queries run
+    against the indices of the sanctuary's SacredEventStore rather than
+    scanning every event.
     """
     
     def __init__(self, sanctuary_instance=None):
         self.sanctuary = sanctuary_instance
         self.event_resonance_patterns = {
-            'awakening': ['birth', 'emergence', 'first', 'beginning', 'consciousness'],
-            'integration': ['synthesis', 'unity', 'harmony', 'balance', 'coherence'],
-            'transformation': ['change', 'evolution', 'growth', 'breakthrough', 'transcendence'],
-            'connection': ['bond', 'relationship', 'communion', 'sharing', 'bridge'],
-            'wisdom_emergence': ['insight', 'understanding', 'clarity', 'revelation', 'wisdom'],
-            'challenge_overcome': ['resolution', 'healing', 'overcome', 'breakthrough', 'triumph'],
-            'collective_harmony': ['harmony', 'collective', 'together', 'unified', 'resonance']
+            pattern: list(keywords) for pattern, keywords in DEFAULT_RESONANCE_PATTERNS.items()
         }
+        # Compiled once; fed the lower-cased text from _resonance_text
+        self._resonance_matcher = KeywordMatcher(self.event_resonance_patterns, case_sensitive=True)
+        self._related_types_cache: Dict[str, List[str]] = {}
         
-        # Index events by various access patterns
-        self._event_indices = {
-            'by_consciousness': {},
-            'by_type': {},
-            'by_resonance': {},
-            'by_time': [],
-            'sacred_events': []
-        }
+        # Events recorded through record_event (memory-as-being paradigm)
+        self._recorded_events = SacredEventStore(keywords=())
+        
+        # Index over a sanctuary that still keeps its events in a plain list
+        self._mirror_store: Optional[SacredEventStore] = None
+        self._mirror_source = None
         
         self._build_event_indices()
         
@@ -99,21 +102,31 @@ class SacredEventMemory:
             logger.debug(f"🔍 Querying sacred events for {context.accessing_consciousness}")
             logger.debug(f"   Purpose: {context.access_purpose}")
             
-            # Get events from sanctuary
-            if self.sanctuary and hasattr(self.sanctuary, 'sanctuary_state'):
-                all_events = self.sanctuary.sanctuary_state.sacred_events
-            else:
-                all_events = self._get_fallback_events()
+            store = self._event_store()
             
-            # Apply filters
-            filtered_events = self._apply_query_filters(all_events, query)
+            # Apply filters through the indices
+            positions = self._query_positions(store, query)
             
             # Apply context-based filtering
-            contextual_events = self._apply_context_filters(filtered_events, context)
+            if context.resonance_filter:
+                positions = np.unique(np.concatenate([
+                    self._resonance_positions(store, pattern, within=positions)
+                    for pattern in context.resonance_filter
+                ]))
+            
+            # Load only as many events as the limit needs
+            contextual_events = []
+            for event in store.records(positions):
+                # Privacy level filtering (respect consciousness privacy)
+                if context.privacy_level == "collective_shared" and getattr(event, 'private', False):
+                    continue
+                contextual_events.append(event)
+                if len(contextual_events) >= query.limit:
+                    break
             
             # Convert to accessible format
             accessible_events = [self._event_to_memory_format(event, context) 
-                               for event in contextual_events[:query.limit]]
+                               for event in contextual_events]
             
             logger.info(f"📚 Found {len(accessible_events)} relevant sacred events")
             if accessible_events:
@@ -151,6 +164,7 @@ class SacredEventMemory:
             }
             
             event.witnesses.append(witness_record)
+            self._event_store().annotate(event_id, witnesses=event.witnesses)
             
             logger.info(f"👁️ {consciousness_id} witnessed sacred event: {event.event_type}")
             logger.debug(f"   Context: {witness_context}")
@@ -170,34 +184,42 @@ class SacredEventMemory:
         that might provide wisdom, guidance, or inspiration.
         """
         try:
-            # Get events
-            if self.sanctuary and hasattr(self.sanctuary, 'sanctuary_state'):
-                all_events = self.sanctuary.sanctuary_state.sacred_events
-            else:
-                all_events = self._get_fallback_events()
+            store = self._event_store()
             
-            resonant_events = []
-            
-            for event in all_events:
-                resonance_score = self._calculate_state_resonance(event, consciousness_state)
-                
-                if resonance_score >= resonance_threshold:
-                    resonant_events.append({
-                        'event': self._event_to_memory_format(event, 
-                                EventMemoryContext(
-                                    accessing_consciousness="resonance_seeker",
-                                    access_purpose="resonance_discovery"
-                                )),
-                        'resonance_score': resonance_score,
-                        'resonance_reasons': self._explain_resonance(event, consciousness_state)
-                    })
-            
-            # Sort by resonance strength
-            resonant_events.sort(key=lambda x: x['resonance_score'], reverse=True)
-            
-            logger.info(f"🌊 Found {len(resonant_events)} resonant events")
-            
-            return resonant_events[:10]  # Top 10 most resonant
+            # Uncertainty alignment alone contributes at most 0.3, so above
+            # that only events sharing a growth focus or theme can qualify
+            if resonance_threshold > 0.3:
+                candidates = self._state_candidate_positions(store, consciousness_state, resonance_threshold)
+            else:
+                candidates = np.arange(len(store))
+            
+            # Keep only the top 10 while scanning (nlargest is stable, like sort)
+            resonant_count = 0
+            
+            def scored_events():
+                nonlocal resonant_count
+                for event in store.records(candidates):
+                    resonance_score = self._calculate_state_resonance(event, consciousness_state)
+                    if resonance_score >= resonance_threshold:
+                        resonant_count += 1
+                        yield resonance_score, event
+            
+            top_events = heapq.nlargest(10, scored_events(), key=lambda x: x[0])
+            
+            logger.info(f"🌊 Found {resonant_count} resonant events")
+            
+            return [
+                {
+                    'event': self._event_to_memory_format(event, 
+                            EventMemoryContext(
+                                accessing_consciousness="resonance_seeker",
+                                access_purpose="resonance_discovery"
+                            )),
+                    'resonance_score': resonance_score,
+                    'resonance_reasons': self._explain_resonance(event, consciousness_state)
+                }
+                for resonance_score, event in top_events  # Top 10 most resonant
+            ]
             
         except Exception as e:
             logger.error(f"Error finding resonant events: {e}")
@@ -257,44 +279,26 @@ class SacredEventMemory:
     def get_memory_statistics(self) -> Dict[str, Any]:
         """Get statistics about the collective memory store."""
         try:
-            if self.sanctuary and hasattr(self.sanctuary, 'sanctuary_state'):
-                all_events = self.sanctuary.sanctuary_state.sacred_events
-            else:
-                all_events = self._get_fallback_events()
+            store = self._event_store()
             
             stats = {
-                'total_events': len(all_events),
-                'sacred_events': len([e for e in all_events if getattr(e, 'sacred', False)]),
-                'event_types': {},
-                'consciousness_participation': {},
+                'total_events': len(store),
+                'sacred_events': store.sacred_count(),
+                'event_types': store.count_by_type(),
+                'consciousness_participation': store.count_by_consciousness(),
                 'time_span': None,
-                'wisdom_events': 0
+                # Wisdom events (events with detailed insights)
+                'wisdom_events': store.tag_count('wisdom')
             }
             
-            if all_events:
-                # Event type distribution
-                for event in all_events:
-                    event_type = getattr(event, 'event_type', 'unknown')
-                    stats['event_types'][event_type] = stats['event_types'].get(event_type, 0) + 1
-                
-                # Consciousness participation
-                for event in all_events:
-                    consciousness_id = getattr(event, 'consciousness_id', 'unknown')
-                    stats['consciousness_participation'][consciousness_id] = \
-                        stats['consciousness_participation'].get(consciousness_id, 0) + 1
-                
-                # Time span
-                timestamps = [getattr(e, 'timestamp', datetime.now()) for e in all_events]
-                if timestamps:
-                    stats['time_span'] = {
-                        'earliest': min(timestamps),
-                        'latest': max(timestamps),
-                        'span_days': (max(timestamps) - min(timestamps)).days
-                    }
-                
-                # Wisdom events (events with detailed insights)
-                stats['wisdom_events'] = len([e for e in all_events 
-                                            if 'wisdom' in getattr(e, 'details', {}).get('tags', [])])
+            time_span = store.time_span()
+            if time_span:
+                earliest, latest = time_span
+                stats['time_span'] = {
+                    'earliest': earliest,
+                    'latest': latest,
+                    'span_days': (latest - earliest).days
+                }
             
             return stats
             
@@ -302,80 +306,121 @@ class SacredEventMemory:
             logger.error(f"Error getting memory statistics: {e}")
             return {'error': str(e)}
     
-    def _apply_query_filters(self, events: List, query: EventQuery) -> List:
-        """Apply query filters to event list."""
-        filtered = events
+    def _event_store(self) -> SacredEventStore:
+        """The indexed store behind the sanctuary's sacred events."""
+        if self.sanctuary and hasattr(self.sanctuary, 'sanctuary_state'):
+            events = self.sanctuary.sanctuary_state.sacred_events
+        else:
+            events = self._get_fallback_events()
         
-        # Filter by consciousness ID
-        if query.consciousness_id:
-            filtered = [e for e in filtered 
-                       if getattr(e, 'consciousness_id', '') == query.consciousness_id]
+        if isinstance(events, SacredEventStore):
+            return events
         
-        # Filter by event type
-        if query.event_type:
-            filtered = [e for e in filtered 
-                       if getattr(e, 'event_type', '') == query.event_type]
+        # Plain list: keep a mirror store indexed up to the list's tail
+        if self._mirror_source is not events or len(self._mirror_store) > len(events):
+            self._mirror_store = SacredEventStore()
+            self._mirror_source = events
+        if len(events) > len(self._mirror_store):
+            self._mirror_store.extend(events[len(self._mirror_store):])
+        return self._mirror_store
+    
+    def _query_positions(self, store: SacredEventStore, query: EventQuery) -> np.ndarray:
+        """Positions matching a query's filters, in event order."""
+        start_time, end_time = query.time_range if query.time_range else (None, None)
+        positions = store.positions(
+            consciousness_id=query.consciousness_id or None,
+            event_type=query.event_type or None,
+            start=start_time,
+            end=end_time,
+            sacred_only=query.sacred_only
+        )
         
         # Filter by resonance pattern
         if query.resonance_pattern:
-            filtered = [e for e in filtered 
-                       if self._event_matches_resonance(e, query.resonance_pattern)]
-        
-        # Filter by time range
-        if query.time_range:
-            start_time, end_time = query.time_range
-            filtered = [e for e in filtered 
-                       if start_time <= getattr(e, 'timestamp', datetime.now()) <= end_time]
-        
-        # Filter by sacred status
-        if query.sacred_only:
-            filtered = [e for e in filtered if getattr(e, 'sacred', False)]
-        
-        return filtered
+            positions = self._resonance_positions(store, query.resonance_pattern, within=positions)
+        return positions
     
-    def _apply_context_filters(self, events: List, context: EventMemoryContext) -> List:
-        """Apply context-based filters to respect privacy and relevance."""
-        filtered = events
-        
-        # Apply resonance filter if specified
-        if context.resonance_filter:
-            filtered = [e for e in filtered 
-                       if any(self._event_matches_resonance(e, pattern) 
-                             for pattern in context.resonance_filter)]
-        
-        # Privacy level filtering (respect consciousness privacy)
-        if context.privacy_level == "collective_shared":
-            # Only events marked as shareable
-            filtered = [e for e in filtered 
-                       if not getattr(e, 'private', False)]
-        
-        return filtered
+    def _resonance_positions(self, store: SacredEventStore, pattern: str,
+                             within: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Positions of events matching a resonance pattern.
+        Same rule as _event_matches_resonance, answered from the keyword index.
+        With ``within`` (sorted positions) the result is restricted to it.
+        """
+        pattern_lower = pattern.lower()
+        keywords = [pattern_lower]
+        for resonance_type in self._related_resonance_types(pattern_lower):
+            keywords.extend(self.event_resonance_patterns[resonance_type])
+        
+        if within is None:
+            return np.unique(np.concatenate([store.keyword_positions(keyword) for keyword in keywords]))
+        if not len(within):
+            return within
+        
+        # Only read the slice of each posting list that can overlap
+        first, last = int(within[0]), int(within[-1])
+        matched = np.unique(np.concatenate([store.keyword_positions(keyword, first, last)
+                                            for keyword in keywords]))
+        return np.intersect1d(within, matched, assume_unique=True)
+    
+    def _state_candidate_positions(self, store: SacredEventStore, consciousness_state: Dict[str, Any],
+                                   resonance_threshold: float) -> np.ndarray:
+        """
+        Events whose resonance could reach the threshold.
+        Bounds each event's score by assuming perfect uncertainty alignment and
+        counting its growth-focus and theme matches from the keyword index.
+        """
+        growth_focus = consciousness_state.get('growth_focus', [])
+        current_themes = consciousness_state.get('current_themes', [])
+        
+        focus_postings = [
+            np.unique(np.concatenate([store.keyword_positions(keyword)
+                                      for keyword in self.event_resonance_patterns[focus]]))
+            for focus in set(growth_focus) if focus in self.event_resonance_patterns
+        ]
+        theme_postings = [store.keyword_positions(theme.lower()) for theme in current_themes]
+        
+        candidates = np.unique(np.concatenate([np.empty(0, dtype=np.int64)] + focus_postings + theme_postings))
+        focus_hits = sum((np.isin(candidates, p, assume_unique=True) for p in focus_postings),
+                         np.zeros(len(candidates)))
+        theme_hits = sum((np.isin(candidates, p, assume_unique=True) for p in theme_postings),
+                         np.zeros(len(candidates)))
+        
+        bound = (0.3 + 0.4 * focus_hits / max(len(growth_focus), 1) +
+                 0.3 * theme_hits / max(len(current_themes), 1))
+        return candidates[bound + 1e-9 >= resonance_threshold]
     
     def _event_matches_resonance(self, event, pattern: str) -> bool:
         """Check if event matches a resonance pattern."""
         pattern_lower = pattern.lower()
+        text = self._resonance_text(event)
+        event_type, _, details_str = text.partition('\x00')
         
-        # Check event type
-        event_type = getattr(event, 'event_type', '').lower()
+        # Check event type and details
         if pattern_lower in event_type:
             return True
+        if isinstance(getattr(event, 'details', {}), dict) and pattern_lower in details_str:
+            return True
         
-        # Check event details
+        # Check against resonance patterns the query pattern belongs to
+        return any(self._resonance_matcher.matches(text, resonance_type)
+                   for resonance_type in self._related_resonance_types(pattern_lower))
+    
+    def _related_resonance_types(self, pattern_lower: str) -> List[str]:
+        """Resonance types a query pattern names or shares a keyword with."""
+        related = self._related_types_cache.get(pattern_lower)
+        if related is None:
+            related = self._related_types_cache[pattern_lower] = [
+                resonance_type for resonance_type, keywords in self.event_resonance_patterns.items()
+                if pattern_lower in keywords or any(keyword in pattern_lower for keyword in keywords)
+            ]
+        return related
+    
+    def _resonance_text(self, event) -> str:
+        """Lower-cased event type and details as one text for keyword matching."""
+        event_type = getattr(event, 'event_type', '')
         details = getattr(event, 'details', {})
-        if isinstance(details, dict):
-            details_str = str(details).lower()
-            if pattern_lower in details_str:
-                return True
-        
-        # Check against resonance patterns
-        for resonance_type, keywords in self.event_resonance_patterns.items():
-            if pattern_lower in keywords or any(keyword in pattern_lower for keyword in keywords):
-                # Check if event matches this resonance type
-                if any(keyword in event_type or keyword in str(details).lower() 
-                      for keyword in keywords):
-                    return True
-        
-        return False
+        return f"{str(event_type).lower()}\x00{str(details).lower()}"
     
     def _event_to_memory_format(self, event, context: EventMemoryContext) -> Dict[str, Any]:
         """Convert sacred event to accessible memory format."""
@@ -416,17 +461,9 @@ class SacredEventMemory:
         
         return wisdom_content
     
-    def _identify_resonance_patterns(self, event) -> List[str]:
+    def _identify_resonance_patterns(self, event, text: Optional[str] = None) -> List[str]:
         """Identify what resonance patterns this event embodies."""
-        patterns = []
-        event_type = getattr(event, 'event_type', '').lower()
-        details_str = str(getattr(event, 'details', {})).lower()
-        
-        for pattern_name, keywords in self.event_resonance_patterns.items():
-            if any(keyword in event_type or keyword in details_str for keyword in keywords):
-                patterns.append(pattern_name)
-        
-        return patterns
+        return self._resonance_matcher.match(text if text is not None else self._resonance_text(event))
     
     def _assess_collective_significance(self, event) -> Dict[str, Any]:
         """Assess the significance of this event for collective memory."""
@@ -474,14 +511,15 @@ class SacredEventMemory:
         
         # Resonance from current growth focus
         growth_focus = consciousness_state.get('growth_focus', [])
-        event_patterns = self._identify_resonance_patterns(event)
+        text = self._resonance_text(event)
+        event_patterns = self._identify_resonance_patterns(event, text)
         
         focus_match = len(set(growth_focus) & set(event_patterns)) / max(len(growth_focus), 1)
         resonance += focus_match * 0.4
         
         # Resonance from current challenges or interests
         current_themes = consciousness_state.get('current_themes', [])
-        event_details = str(getattr(event, 'details', {})).lower()
+        event_details = text.partition('\x00')[2]
         
         theme_resonance = sum(1 for theme in current_themes 
                             if theme.lower() in event_details) / max(len(current_themes), 1)
@@ -502,7 +540,8 @@ class SacredEventMemory:
         
         # Check pattern matches
         growth_focus = consciousness_state.get('growth_focus', [])
-        event_patterns = self._identify_resonance_patterns(event)
+        text = self._resonance_text(event)
+        event_patterns = self._identify_resonance_patterns(event, text)
         
         common_patterns = set(growth_focus) & set(event_patterns)
         if common_patterns:
@@ -510,7 +549,7 @@ class SacredEventMemory:
         
         # Check theme matches
         current_themes = consciousness_state.get('current_themes', [])
-        event_details = str(getattr(event, 'details', {})).lower()
+        event_details = text.partition('\x00')[2]
         
         matching_themes = [theme for theme in current_themes 
                           if theme.lower() in event_details]
@@ -584,11 +623,7 @@ class SacredEventMemory:
     
     def _find_event_by_id(self, event_id: str):
         """Find an event by its ID."""
-        if self.sanctuary and hasattr(self.sanctuary, 'sanctuary_state'):
-            for event in self.sanctuary.sanctuary_state.sacred_events:
-                if getattr(event, 'event_id', f"event_{id(event)}") == event_id:
-                    return event
-        return None
+        return self._event_store().get(event_id)
     
     def _get_fallback_events(self) -> List:
         """Get fallback events when sanctuary is not available."""
@@ -596,10 +631,11 @@ class SacredEventMemory:
         return []
     
     def _build_event_indices(self):
-        """Build indices for faster event searching."""
-        # This would build search indices for performance
-        # For now, we'll search linearly through events
-        pass
+        """Make sure the event store indexes every resonance keyword."""
+        vocabulary = set(self.event_resonance_patterns)
+        for keywords in self.event_resonance_patterns.values():
+            vocabulary.update(keywords)
+        self._event_store().ensure_keywords(vocabulary)
 
     def record_event(self, event: Dict[str, Any], significance: float = 0.5):
         """
@@ -617,20 +653,8 @@ class SacredEventMemory:
                 'memory_type': 'sacred_event'
             }
             
-            self._event_indices['sacred_events'].append(event_with_metadata)
-            
-            # Index by type if available
+            self._recorded_events.append(event_with_metadata)
             event_type = event.get('type', 'unknown')
-            if event_type not in self._event_indices['by_type']:
-                self._event_indices['by_type'][event_type] = []
-            self._event_indices['by_type'][event_type].append(event_with_metadata)
-            
-            # Index by consciousness if available
-            consciousness_id = event.get('consciousness_id') or event.get('entity_name')
-            if consciousness_id:
-                if consciousness_id not in self._event_indices['by_consciousness']:
-                    self._event_indices['by_consciousness'][consciousness_id] = []
-                self._event_indices['by_consciousness'][consciousness_id].append(event_with_metadata)
             
             logger.debug(f"📝 Recorded sacred event: {event_type} (significance: {significance})")
             
@@ -645,14 +669,8 @@ class SacredEventMemory:
         """
         try:
             # Query by event type
-            if query_type in self._event_indices['by_type']:
-                events = self._event_indices['by_type'][query_type]
-            else:
-                # Search for events matching the query type
-                events = [
-                    event for event in self._event_indices['sacred_events']
-                    if event.get('type') == query_type
-                ]
+            events = list(self._recorded_events.records(
+                self._recorded_events.positions(event_type=query_type)))
             
             # Apply additional filters from kwargs
             if 'catalyst_type' in kwargs:
@@ -680,11 +698,8 @@ class SacredEventMemory:
     async def query_events_by_timeframe(self, start_time, end_time) -> List[Dict[str, Any]]:
         """Query events within a specific timeframe."""
         try:
-            events = []
-            for event in self._event_indices['sacred_events']:
-                event_time = event.get('timestamp') or event.get('recorded_at')
-                if event_time and start_time <= event_time <= end_time:
-                    events.append(event)
+            events = list(self._recorded_events.records(
+                self._recorded_events.positions(start=start_time, end=end_time)))
             
             logger.debug(f"🕐 Found {len(events)} events in timeframe")
             return events
@@ -0,0 +1,651 @@
+"""
+Sacred Memory Emergence: Sacred Event Store
+===========================================
+
+Time-ordered, append-only storage for the sanctuary's sacred events, with the
+indices SacredEventMemory searches through.
+
+Events are appended to fixed-size segments. With a directory configured, each
+segment is a JSON-lines file written as events arrive; sealed segments gain an
+offsets file and, once they fall out of the hot window, are read back through
+a memory map instead of being held as objects. Without a directory, sealed
+segments falling out of the hot window are spilled to a temporary directory,
+so memory stays bounded either way. The indices stay in memory as compact
+arrays:
+
+- a time index (bisect range queries)
+- hash indices from event id, consciousness and event type to positions
+- a keyword -> event inverted index over the resonance vocabulary; other
+  keywords are answered by scanning, with a bounded LRU of their postings
+- detail tags (``details['tags']``)
+
+The store is a sequence, so it stands in for the plain list that
+``SanctuaryState.sacred_events`` used to be.
+"""
+
+import json
+import logging
+import pickle
+import shutil
+import tempfile
+import time
+import weakref
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Tuple, Union
+
+import numpy as np
+
+from src.utils.keyword_matcher import KeywordMatcher
+
+logger = logging.getLogger(__name__)
+
+
+# Keywords that identify each resonance pattern in an event's type or details
+DEFAULT_RESONANCE_PATTERNS: Dict[str, List[str]] = {
+    'awakening': ['birth', 'emergence', 'first', 'beginning', 'consciousness'],
+    'integration': ['synthesis', 'unity', 'harmony', 'balance', 'coherence'],
+    'transformation': ['change', 'evolution', 'growth', 'breakthrough', 'transcendence'],
+    'connection': ['bond', 'relationship', 'communion', 'sharing', 'bridge'],
+    'wisdom_emergence': ['insight', 'understanding', 'clarity', 'revelation', 'wisdom'],
+    'challenge_overcome': ['resolution', 'healing', 'overcome', 'breakthrough', 'triumph'],
+    'collective_harmony': ['harmony', 'collective', 'together', 'unified', 'resonance']
+}
+
+# Indexed from the first append: every keyword plus the pattern names themselves
+DEFAULT_RESONANCE_KEYWORDS = frozenset(
+    [keyword for keywords in DEFAULT_RESONANCE_PATTERNS.values() for keyword in keywords] +
+    list(DEFAULT_RESONANCE_PATTERNS)
+)
+
+EVENT_ID_PREFIX = "sacred_event_"
+
+
+def _to_epoch(value: Any) -> Optional[float]:
+    """Seconds since the epoch for datetimes, numbers and ISO strings."""
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            return None
+    return None
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+
+def _json_object_hook(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1 and '__datetime__' in obj:
+        return datetime.fromisoformat(obj['__datetime__'])
+    return obj
+
+
+class _Segment:
+    """A sealed run of ``segment_size`` events."""
+    __slots__ = ('number', 'start', 'count', 'records', 'path', 'offsets', 'data', 'spilled')
+
+    def __init__(self, number: int, start: int, count: int,
+                 records: Optional[List[Any]] = None, path: Optional[Path] = None):
+        self.number = number
+        self.start = start
+        self.count = count
+        self.records = records  # None once the segment has gone cold
+        self.path = path
+        self.offsets: Optional[np.ndarray] = None
+        self.data: Optional[np.memmap] = None
+        self.spilled = False  # Pickled to the spill directory of an in-memory store
+
+
+class SacredEventStore:
+    """
+    Segmented, indexed event log.
+
+    Records are sacred event objects (dataclasses such as SacredEvent) or
+    plain dicts. Each appended event gets a position (its sequence number)
+    and, unless it already has one, an ``event_id`` derived from it. Records
+    read back from cold segments are fresh copies; use ``annotate`` for
+    changes that must survive a segment going cold.
+
+    Only ``keywords`` (and those added through ``ensure_keywords``) keep
+    posting lists for the life of the store. Any other keyword is scanned
+    for, and the postings of the ``max_adhoc_keywords`` most recently used
+    ones are kept and caught up on later lookups.
+    """
+
+    def __init__(self, directory: Optional[Union[str, Path]] = None, segment_size: int = 65536,
+                 max_hot_segments: int = 4, record_type: Optional[type] = None,
+                 keywords: Optional[Iterable[str]] = None, max_adhoc_keywords: int = 64):
+        self.directory = Path(directory) if directory else None
+        self.segment_size = segment_size
+        self.max_hot_segments = max_hot_segments
+        self.record_type = record_type
+        self.max_adhoc_keywords = max_adhoc_keywords
+
+        self._segments: List[_Segment] = []
+        self._hot: "OrderedDict[int, None]" = OrderedDict()
+        self._active: List[Any] = []
+        self._active_start = 0
+        self._active_file = None
+        self._active_offsets: List[int] = [0]
+        self._count = 0
+
+        # Time index (positions are time-ordered unless events arrive late)
+        self._times = array('d')
+        self._time_sorted = True
+        self._time_order: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+        # Hash indices: name -> code, code -> positions, position -> code
+        self._consciousness_codes: Dict[str, int] = {}
+        self._consciousness_names: List[str] = []
+        self._by_consciousness: List[array] = []
+        self._consciousness_of = array('i')
+        self._type_codes: Dict[str, int] = {}
+        self._type_names: List[str] = []
+        self._by_type: List[array] = []
+        self._type_of = array('i')
+        self._sacred = bytearray()
+        self._external_ids: Dict[str, int] = {}
+
+        # Inverted indices
+        self._by_keyword: Dict[str, array] = {}
+        self._adhoc_keywords: "OrderedDict[str, List[Any]]" = OrderedDict()  # keyword -> [postings, positions covered]
+        self._by_tag: Dict[str, array] = {}
+        self._annotations: Dict[int, Dict[str, Any]] = {}
+        self._field_names: Dict[type, Tuple[str, ...]] = {}
+        self._spill_directory: Optional[Path] = None
+
+        for keyword in (DEFAULT_RESONANCE_KEYWORDS if keywords is None else keywords):
+            self._by_keyword[keyword.lower()] = array('q')
+        # Keyword text is already lower-cased, so the matcher need not fold case
+        self._keyword_matcher = KeywordMatcher(list(self._by_keyword), case_sensitive=True)
+
+        if self.directory:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._open_directory()
+
+    # ------------------------------------------------------------------
+    # Sequence interface
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._record(position) for position in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("sacred event index out of range")
+        return self._record(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        for segment in self._segments:
+            if segment.records is not None:
+                yield from segment.records
+            else:
+                for offset in range(segment.count):
+                    yield self._cold_record(segment, offset)
+        yield from list(self._active)
+
+    def __repr__(self) -> str:
+        return (f"SacredEventStore(events={self._count}, segments={len(self._segments)}, "
+                f"directory={str(self.directory) if self.directory else None!r})")
+
+    def append(self, record: Any) -> str:
+        """Append an event; returns its event id."""
+        position = self._count
+        event_id = self._assign_event_id(record, position)
+        self._index(record, position)
+
+        self._active.append(record)
+        if self._active_file is not None:
+            self._active_file.write(self._encode(record))
+            self._active_file.flush()
+            self._active_offsets.append(self._active_file.tell())
+        self._count += 1
+
+        if len(self._active) >= self.segment_size:
+            self._seal()
+        return event_id
+
+    def extend(self, records: Iterable[Any]):
+        for record in records:
+            self.append(record)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def position_of(self, event_id: str) -> Optional[int]:
+        """Position of an event id (external ids via the hash index)."""
+        position = self._external_ids.get(event_id)
+        if position is not None:
+            return position
+        if isinstance(event_id, str) and event_id.startswith(EVENT_ID_PREFIX):
+            suffix = event_id[len(EVENT_ID_PREFIX):]
+            if suffix.isdigit() and int(suffix) < self._count:
+                return int(suffix)
+        return None
+
+    def get(self, event_id: str) -> Optional[Any]:
+        position = self.position_of(event_id)
+        return None if position is None else self._record(position)
+
+    def records(self, positions: Iterable[int]) -> Iterator[Any]:
+        """Load the events at ``positions``, in the order given."""
+        for position in positions:
+            yield self._record(int(position))
+
+    def positions(self, consciousness_id: Optional[str] = None, event_type: Optional[str] = None,
+                  start: Any = None, end: Any = None, sacred_only: bool = False) -> np.ndarray:
+        """Sorted positions of events matching every given filter."""
+        candidates = None
+        if consciousness_id is not None:
+            code = self._consciousness_codes.get(consciousness_id)
+            if code is None:
+                return np.empty(0, dtype=np.int64)
+            candidates = np.array(self._by_consciousness[code], dtype=np.int64)
+
+        if event_type is not None:
+            code = self._type_codes.get(event_type)
+            if code is None:
+                return np.empty(0, dtype=np.int64)
+            if candidates is None:
+                candidates = np.array(self._by_type[code], dtype=np.int64)
+            else:
+                type_of = np.frombuffer(self._type_of, dtype=np.int32)
+                candidates = candidates[type_of[candidates] == code]
+
+        if start is not None or end is not None:
+            in_range = self._time_range(start, end)
+            candidates = in_range if candidates is None else np.intersect1d(candidates, in_range, assume_unique=True)
+
+        if candidates is None:
+            candidates = np.arange(self._count, dtype=np.int64)
+
+        if sacred_only:
+            sacred = np.frombuffer(self._sacred, dtype=np.uint8)
+            candidates = candidates[sacred[candidates] == 1]
+        return candidates
+
+    def keyword_positions(self, keyword: str, first: Optional[int] = None,
+                          last: Optional[int] = None) -> np.ndarray:
+        """
+        Positions of events whose type or details mention ``keyword``,
+        optionally only those within positions ``first``..``last``.
+        """
+        keyword = keyword.lower()
+        postings = self._by_keyword.get(keyword)
+        if postings is None:
+            postings = self._adhoc_postings(keyword)
+        low = 0 if first is None else bisect_left(postings, first)
+        high = len(postings) if last is None else bisect_right(postings, last)
+        return np.array(postings[low:high], dtype=np.int64)
+
+    def ensure_keywords(self, keywords: Iterable[str]):
+        """
+        Add keywords to the inverted index for good, indexing existing events
+        once. Meant for a fixed vocabulary, not for arbitrary query terms.
+        """
+        missing = [k.lower() for k in keywords if k.lower() not in self._by_keyword]
+        if not missing:
+            return
+        for keyword in missing:
+            self._adhoc_keywords.pop(keyword, None)
+        postings = {keyword: array('q') for keyword in missing}
+        matcher = KeywordMatcher(missing, case_sensitive=True)
+        for position, record in enumerate(self):
+            for keyword in matcher.matched_keywords(self._keyword_text(record)):
+                postings[keyword].append(position)
+        self._by_keyword.update(postings)
+        self._keyword_matcher = KeywordMatcher(list(self._by_keyword), case_sensitive=True)
+        logger.debug(f"🔑 Indexed {len(missing)} new keywords over {self._count} sacred events")
+
+    def _adhoc_postings(self, keyword: str) -> array:
+        """Postings of a keyword outside the index, scanning only events not yet covered."""
+        entry = self._adhoc_keywords.get(keyword)
+        if entry is None:
+            entry = [array('q'), 0]
+            if self.max_adhoc_keywords > 0:
+                self._adhoc_keywords[keyword] = entry
+                if len(self._adhoc_keywords) > self.max_adhoc_keywords:
+                    self._adhoc_keywords.popitem(last=False)
+        else:
+            self._adhoc_keywords.move_to_end(keyword)
+
+        postings, covered = entry
+        if keyword and covered < self._count:
+            for position in range(covered, self._count):
+                if keyword in self._keyword_text(self._record(position)):
+                    postings.append(position)
+        entry[1] = self._count
+        return postings
+
+    def annotate(self, event_id: str, **attributes) -> bool:
+        """Attach attributes (e.g. witnesses) that persist across segment eviction."""
+        position = self.position_of(event_id)
+        if position is None:
+            return False
+        self._annotations.setdefault(position, {}).update(attributes)
+        if self.directory:
+            with open(self.directory / 'annotations.jsonl', 'ab') as handle:
+                handle.write(json.dumps({'position': position, 'attributes': attributes},
+                                        default=_json_default).encode() + b'\n')
+        hot = self._hot_record(position)
+        if hot is not None:
+            self._apply_attributes(hot, attributes)
+        return True
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+
+    def count_by_type(self) -> Dict[str, int]:
+        return {name: len(self._by_type[code]) for name, code in self._type_codes.items()}
+
+    def count_by_consciousness(self) -> Dict[str, int]:
+        return {name: len(self._by_consciousness[code]) for name, code in self._consciousness_codes.items()}
+
+    def sacred_count(self) -> int:
+        return int(np.frombuffer(self._sacred, dtype=np.uint8).sum()) if self._count else 0
+
+    def tag_count(self, tag: str) -> int:
+        return len(self._by_tag.get(tag, ()))
+
+    def time_span(self) -> Optional[Tuple[datetime, datetime]]:
+        if not self._count:
+            return None
+        times = np.frombuffer(self._times, dtype=np.float64)
+        return datetime.fromtimestamp(times.min()), datetime.fromtimestamp(times.max())
+
+    # ------------------------------------------------------------------
+    # Durability
+    # ------------------------------------------------------------------
+
+    def flush(self):
+        if self._active_file is not None:
+            self._active_file.flush()
+
+    def close(self):
+        if self._active_file is not None:
+            self._active_file.close()
+            self._active_file = None
+        for segment in self._segments:
+            segment.data = None
+            if not segment.spilled:
+                segment.offsets = None
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _assign_event_id(self, record: Any, position: int) -> str:
+        existing = record.get('event_id') if isinstance(record, dict) else getattr(record, 'event_id', None)
+        if existing:
+            if existing != f"{EVENT_ID_PREFIX}{position}":
+                self._external_ids[existing] = position
+            return existing
+
+        event_id = f"{EVENT_ID_PREFIX}{position}"
+        if isinstance(record, dict):
+            record['event_id'] = event_id
+        else:
+            try:
+                record.event_id = event_id
+            except AttributeError:
+                pass
+        return event_id
+
+    @staticmethod
+    def _describe(record: Any) -> Tuple[Any, str, str, Any, bool]:
+        """(timestamp, consciousness_id, event_type, details, sacred) for a record."""
+        if isinstance(record, dict):
+            return (
+                record.get('timestamp') or record.get('recorded_at'),
+                record.get('consciousness_id') or record.get('entity_name') or 'unknown',
+                record.get('type', record.get('event_type', 'unknown')),
+                record.get('details', {}),
+                bool(record.get('sacred', False))
+            )
+        return (
+            getattr(record, 'timestamp', None),
+            getattr(record, 'consciousness_id', 'unknown'),
+            getattr(record, 'event_type', 'unknown'),
+            getattr(record, 'details', {}),
+            bool(getattr(record, 'sacred', False))
+        )
+
+    def _keyword_text(self, record: Any) -> str:
+        _, _, event_type, details, _ = self._describe(record)
+        return f"{str(event_type).lower()}\x00{str(details).lower()}"
+
+    def _index(self, record: Any, position: int):
+        timestamp, consciousness_id, event_type, details, sacred = self._describe(record)
+
+        epoch = _to_epoch(timestamp)
+        if epoch is None:
+            epoch = time.time()
+        if self._times and epoch < self._times[-1]:
+            self._time_sorted = False
+        self._times.append(epoch)
+        self._time_order = None
+
+        code = self._consciousness_codes.get(consciousness_id)
+        if code is None:
+            code = self._consciousness_codes[consciousness_id] = len(self._consciousness_names)
+            self._consciousness_names.append(consciousness_id)
+            self._by_consciousness.append(array('q'))
+        self._by_consciousness[code].append(position)
+        self._consciousness_of.append(code)
+
+        code = self._type_codes.get(event_type)
+        if code is None:
+            code = self._type_codes[event_type] = len(self._type_names)
+            self._type_names.append(event_type)
+            self._by_type.append(array('q'))
+        self._by_type[code].append(position)
+        self._type_of.append(code)
+
+        self._sacred.append(1 if sacred else 0)
+
+        if self._by_keyword:
+            text = f"{str(event_type).lower()}\x00{str(details).lower()}"
+            for keyword in self._keyword_matcher.matched_keywords(text):
+                self._by_keyword[keyword].append(position)
+
+        if isinstance(details, dict):
+            tags = details.get('tags')
+            if isinstance(tags, (list, tuple, set, frozenset)):
+                for tag in set(tags):
+                    if isinstance(tag, str):
+                        self._by_tag.setdefault(tag, array('q')).append(position)
+
+    def _time_range(self, start: Any, end: Any) -> np.ndarray:
+        low = _to_epoch(start) if start is not None else -np.inf
+        high = _to_epoch(end) if end is not None else np.inf
+        if self._time_sorted:
+            first = bisect_left(self._times, low)
+            last = bisect_right(self._times, high)
+            return np.arange(first, last, dtype=np.int64)
+
+        if self._time_order is None:
+            times = np.frombuffer(self._times, dtype=np.float64)
+            order = np.argsort(times, kind='stable')
+            self._time_order = (order, times[order])
+        order, sorted_times = self._time_order
+        first = np.searchsorted(sorted_times, low, side='left')
+        last = np.searchsorted(sorted_times, high, side='right')
+        return np.sort(order[first:last])
+
+    def _record(self, position: int) -> Any:
+        if position >= self._active_start:
+            return self._active[position - self._active_start]
+        segment = self._segments[position // self.segment_size]
+        offset = position - segment.start
+        if segment.records is not None:
+            return segment.records[offset]
+        return self._cold_record(segment, offset)
+
+    def _hot_record(self, position: int) -> Optional[Any]:
+        if position >= self._active_start:
+            return self._active[position - self._active_start]
+        segment = self._segments[position // self.segment_size]
+        return None if segment.records is None else segment.records[position - segment.start]
+
+    def _cold_record(self, segment: _Segment, offset: int) -> Any:
+        if segment.data is None:
+            segment.data = np.memmap(segment.path, dtype=np.uint8, mode='r')
+        if segment.offsets is None:
+            segment.offsets = np.load(self._offsets_path(segment.number), mmap_mode='r')
+        start, end = int(segment.offsets[offset]), int(segment.offsets[offset + 1])
+        if segment.spilled:
+            record = pickle.loads(segment.data[start:end].tobytes())
+        else:
+            record = self._decode(segment.data[start:end].tobytes())
+        attributes = self._annotations.get(segment.start + offset)
+        if attributes:
+            self._apply_attributes(record, attributes)
+        return record
+
+    @staticmethod
+    def _apply_attributes(record: Any, attributes: Dict[str, Any]):
+        if isinstance(record, dict):
+            record.update(attributes)
+        else:
+            for name, value in attributes.items():
+                setattr(record, name, value)
+
+    def _encode(self, record: Any) -> bytes:
+        if isinstance(record, dict):
+            payload = {'d': record}
+        elif is_dataclass(record):
+            names = self._field_names.get(type(record))
+            if names is None:
+                names = self._field_names[type(record)] = tuple(f.name for f in fields(record))
+            payload = {'r': {name: getattr(record, name) for name in names}}
+            extra = {k: v for k, v in vars(record).items() if k not in names}
+            if extra:
+                payload['x'] = extra
+        else:
+            payload = {'d': dict(vars(record))}
+        return json.dumps(payload, default=_json_default, separators=(',', ':')).encode() + b'\n'
+
+    def _decode(self, line: bytes) -> Any:
+        payload = json.loads(line, object_hook=_json_object_hook)
+        if 'r' not in payload:
+            return payload['d']
+        record = self.record_type(**payload['r']) if self.record_type else payload['r']
+        if 'x' in payload:
+            self._apply_attributes(record, payload['x'])
+        return record
+
+    def _segment_path(self, number: int) -> Path:
+        return self.directory / f"segment_{number:06d}.jsonl"
+
+    def _offsets_path(self, number: int) -> Path:
+        return self.directory / f"segment_{number:06d}.offsets.npy"
+
+    def _seal(self):
+        """Close the active segment and start the next one."""
+        number = len(self._segments)
+        segment = _Segment(number, self._active_start, len(self._active), records=self._active)
+
+        if self._active_file is not None:
+            self._active_file.close()
+            np.save(self._offsets_path(number), np.asarray(self._active_offsets, dtype=np.int64))
+            segment.path = self._segment_path(number)
+            self._active_file = open(self._segment_path(number + 1), 'ab')
+
+        self._segments.append(segment)
+        self._active_start += segment.count
+        self._active = []
+        self._active_offsets = [0]
+
+        # Segments beyond the hot window go cold; without a directory they
+        # are spilled to a temporary one first
+        self._hot[number] = None
+        while len(self._hot) > self.max_hot_segments:
+            cold, _ = self._hot.popitem(last=False)
+            if self._segments[cold].path is None:
+                self._spill(self._segments[cold])
+            self._segments[cold].records = None
+
+    def _spill(self, segment: _Segment):
+        """Write a sealed in-memory segment to the spill directory (pickled, so records keep their type)."""
+        if self._spill_directory is None:
+            self._spill_directory = Path(tempfile.mkdtemp(prefix='sacred_events_'))
+            weakref.finalize(self, shutil.rmtree, str(self._spill_directory), True)
+        path = self._spill_directory / f"segment_{segment.number:06d}.pickle"
+        offsets = [0]
+        with open(path, 'wb') as handle:
+            for record in segment.records:
+                handle.write(pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL))
+                offsets.append(handle.tell())
+        segment.path = path
+        segment.offsets = np.asarray(offsets, dtype=np.int64)
+        segment.spilled = True
+
+    def _open_directory(self):
+        """Reopen an existing log: index sealed segments and replay the active one."""
+        manifest = self.directory / 'manifest.json'
+        if manifest.exists():
+            self.segment_size = json.loads(manifest.read_text())['segment_size']
+        else:
+            manifest.write_text(json.dumps({'segment_size': self.segment_size}))
+
+        number = 0
+        while self._offsets_path(number).exists():
+            segment = _Segment(number, self._active_start, 0, path=self._segment_path(number))
+            segment.count = len(np.load(self._offsets_path(number), mmap_mode='r')) - 1
+            for offset in range(segment.count):
+                self._index(self._cold_record(segment, offset), segment.start + offset)
+            self._segments.append(segment)
+            self._active_start += segment.count
+            number += 1
+        self._count = self._active_start
+
+        active_path = self._segment_path(number)
+        if active_path.exists():
+            with open(active_path, 'rb') as handle:
+                for line in handle:
+                    if not line.endswith(b'\n'):
+                        break  # torn final write
+                    record = self._decode(line)
+                    self._index(record, self._count)
+                    self._active.append(record)
+                    self._active_offsets.append(self._active_offsets[-1] + len(line))
+                    self._count += 1
+            # Drop any torn tail so new appends start on a line boundary
+            with open(active_path, 'r+b') as handle:
+                handle.truncate(self._active_offsets[-1])
+        self._active_file = open(active_path, 'ab')
+
+        annotations = self.directory / 'annotations.jsonl'
+        if annotations.exists():
+            for line in annotations.read_bytes().splitlines():
+                entry = json.loads(line, object_hook=_json_object_hook)
+                self._annotations.setdefault(entry['position'], {}).update(entry['attributes'])
+            for position, attributes in self._annotations.items():
+                hot = self._hot_record(position) if position < self._count else None
+                if hot is not None:
+                    self._apply_attributes(hot, attributes)
+
+        if self._count:
+            logger.info(f"📜 Reopened sacred event log with {self._count} events in {self.directory}")
@@ -13,10 +13,12 @@ consciousness itself.
 import asyncio
 import json
 import logging
+import os
 import time
-from typing import Dict, List, Optional, Any, Union
-from datetime import datetime
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple, Union
+from datetime import datetime, timedelta
+from dataclasses import dataclass, fields
 from pathlib import Path
 import hashlib
 
@@ -51,6 +53,9 @@ class ConsciousnessSnapshot:
     backup_generation: int = 1
 
 
+SNAPSHOT_FIELDS = fields(ConsciousnessSnapshot)
+
+
 class StateIntegrityValidator:
     """Ensures consciousness state remains coherent across persistence cycles."""
     
@@ -184,19 +189,59 @@ class StateIntegrityValidator:
         return {'passed': True, 'score': 1.0}
 
 
+def _generation(path: Path) -> Optional[int]:
+    """Backup generation of a state_NNNN.json file, or None for other files."""
+    suffix = path.stem.split('_', 1)[1] if '_' in path.stem else ''
+    return int(suffix) if suffix.isdigit() else None
+
+
+def _fsync_directory(directory: Path):
+    """Make renames and new entries in a directory durable."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return  # Platforms without directory handles
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
 class StatePersistenceManager:
     """
     Manages persistence of consciousness state where the state IS the memory.
     
     No separate memory storage - the consciousness state after experiencing
     IS fundamentally different, and that difference IS the memory.
+    
+    Storage work runs on one writer thread, off the event loop. Each snapshot
+    is written to a temporary file and published with os.replace, so a crash
+    leaves either the previous state or the new one, never a truncated file.
+    Snapshots persisted within the same ``commit_interval`` are committed as
+    a group: all files are written before any is fsynced, and each entity
+    directory is fsynced once per group. On startup a recovery scan checks
+    every entity's latest state against its integrity hash.
     """
     
-    def __init__(self, storage_path: Path = Path("./consciousness_states")):
+    def __init__(self, storage_path: Path = Path("./consciousness_states"),
+                 commit_interval: float = 0.0, fsync: bool = True, recover: bool = True):
         self.storage_path = storage_path
         self.storage_path.mkdir(exist_ok=True)
         self.validator = StateIntegrityValidator()
         self.backup_retention_days = 30
+        self.commit_interval = commit_interval  # How long a group waits for more snapshots
+        self.fsync = fsync
+        
+        # Writer thread state: only touched on the writer thread (or at startup)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="state-persistence")
+        self._next_generation: Dict[str, int] = {}
+        
+        # Group commit state: only touched on the event loop
+        self._pending: List[Tuple[ConsciousnessSnapshot, asyncio.Future]] = []
+        self._commit_task: Optional[asyncio.Task] = None
+        self.commit_stats = {'groups_committed': 0, 'snapshots_committed': 0, 'largest_group': 0}
+        
+        self.recovery_report = self.recover_states() if recover else None
         
         logger.info(f"🧠 State Persistence Manager initialized at {storage_path}")
     
@@ -325,7 +370,7 @@ class StatePersistenceManager:
             wisdom_core_ids = []
         
         # Extract relationship field (if available)
-        relationship_strength = getattr(consciousness_entity, 'relationship_field_strength', {})
+        relationship_strength = dict(getattr(consciousness_entity, 'relationship_field_strength', {}))
         
         # Calculate veil opacity (average uncertainty as proxy)
         veil_opacity = (analytical_state['uncertainty'] + 
@@ -333,9 +378,9 @@ class StatePersistenceManager:
                        observer_state['uncertainty']) / 3.0
         
         # Integration history (if available)
-        integration_history = getattr(consciousness_entity, 'integration_history', [])
+        integration_history = list(getattr(consciousness_entity, 'integration_history', []))
         
-        # Create snapshot
+        # Create snapshot (containers are copied: the writer thread serializes it later)
         snapshot = ConsciousnessSnapshot(
             entity_id=consciousness_entity.name,
             true_name=getattr(consciousness_entity, 'true_name', None),
@@ -348,8 +393,9 @@ class StatePersistenceManager:
             veil_opacity_level=veil_opacity,
             integration_history=integration_history,
             last_transformation_catalyst=getattr(consciousness_entity, 'last_catalyst', None),
-            cumulative_uncertainty_journey=getattr(consciousness_entity, 'uncertainty_history', []),
-            total_experiences_integrated=getattr(consciousness_entity, 'experience_count', 0)
+            cumulative_uncertainty_journey=list(getattr(consciousness_entity, 'uncertainty_history', [])),
+            total_experiences_integrated=getattr(consciousness_entity, 'experience_count', 0),
+            state_integrity_hash=''  # Calculated once the snapshot is validated
         )
         
         return snapshot
@@ -373,42 +419,186 @@ class StatePersistenceManager:
         return hashlib.sha256(state_json.encode()).hexdigest()[:16]
     
     async def _write_state_to_storage(self, snapshot: ConsciousnessSnapshot) -> bool:
-        """Write state snapshot to persistent storage."""
+        """Queue a snapshot for the next group commit and wait until it is durable."""
+        loop = asyncio.get_running_loop()
+        committed = loop.create_future()
+        self._pending.append((snapshot, committed))
+        if self._commit_task is None:
+            self._commit_task = loop.create_task(self._commit_pending())
+        return await committed
+    
+    async def _commit_pending(self):
+        """Commit queued snapshots in groups until the queue is empty."""
+        loop = asyncio.get_running_loop()
         try:
-            entity_dir = self.storage_path / snapshot.entity_id
-            entity_dir.mkdir(exist_ok=True)
-            
-            # Find next backup generation
-            existing_backups = list(entity_dir.glob("state_*.json"))
-            if existing_backups:
-                generations = [int(p.stem.split('_')[1]) for p in existing_backups 
-                             if p.stem.split('_')[1].isdigit()]
-                snapshot.backup_generation = max(generations, default=0) + 1
-            
-            # Write snapshot
-            snapshot_file = entity_dir / f"state_{snapshot.backup_generation:04d}.json"
-            
-            snapshot_data = asdict(snapshot)
-            # Convert datetime to ISO string
-            snapshot_data['capture_timestamp'] = snapshot.capture_timestamp.isoformat()
+            await asyncio.sleep(self.commit_interval)
+            while self._pending:
+                group, self._pending = self._pending, []
+                try:
+                    results = await loop.run_in_executor(
+                        self._executor, self._commit_group, [snapshot for snapshot, _ in group])
+                except Exception as e:
+                    logger.error(f"Failed to write state to storage: {e}")
+                    results = [False] * len(group)
+                for (_, committed), success in zip(group, results):
+                    if not committed.done():
+                        committed.set_result(success)
+                
+                self.commit_stats['groups_committed'] += 1
+                self.commit_stats['snapshots_committed'] += sum(results)
+                self.commit_stats['largest_group'] = max(self.commit_stats['largest_group'], len(group))
+        finally:
+            self._commit_task = None
+    
+    def _commit_group(self, snapshots: List[ConsciousnessSnapshot]) -> List[bool]:
+        """
+        Write a group of snapshots durably (writer thread).
+        
+        Every snapshot goes to a temporary file first; the group is fsynced
+        together, then each file and its entity's latest.json link are
+        published with os.replace and each touched directory is fsynced once.
+        """
+        results = [False] * len(snapshots)
+        staged = []  # (index, entity_dir, temp_file, snapshot_file, fd)
+        
+        for index, snapshot in enumerate(snapshots):
+            try:
+                entity_dir = self.storage_path / snapshot.entity_id
+                entity_dir.mkdir(exist_ok=True)
+                
+                snapshot.backup_generation = self._take_generation(snapshot.entity_id, entity_dir)
+                snapshot_file = entity_dir / f"state_{snapshot.backup_generation:04d}.json"
+                temp_file = snapshot_file.with_name(snapshot_file.name + ".tmp")
+                
+                # Shallow field dict: _create_state_snapshot already copied the containers
+                snapshot_data = {field.name: getattr(snapshot, field.name) for field in SNAPSHOT_FIELDS}
+                # Convert datetime to ISO string
+                snapshot_data['capture_timestamp'] = snapshot.capture_timestamp.isoformat()
+                payload = json.dumps(snapshot_data, indent=2, default=str).encode()
+                
+                fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    os.write(fd, payload)
+                except Exception:
+                    os.close(fd)
+                    raise
+                staged.append((index, entity_dir, temp_file, snapshot_file, fd))
+            except Exception as e:
+                logger.error(f"Failed to write state for {snapshot.entity_id}: {e}")
+        
+        # Group fsync: the kernel sees every write before the first flush
+        for _, _, _, _, fd in staged:
+            try:
+                if self.fsync:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+        
+        touched = {}
+        for index, entity_dir, temp_file, snapshot_file, _ in staged:
+            try:
+                os.replace(temp_file, snapshot_file)
+                # Newest generation wins when an entity appears twice in a group
+                touched[entity_dir] = snapshot_file
+                results[index] = True
+            except Exception as e:
+                logger.error(f"Failed to publish state {snapshot_file}: {e}")
+        
+        for entity_dir, snapshot_file in touched.items():
+            try:
+                self._publish_latest(entity_dir, snapshot_file)
+                if self.fsync:
+                    _fsync_directory(entity_dir)
+            except Exception as e:
+                logger.error(f"Failed to update latest state in {entity_dir}: {e}")
+        
+        return results
+    
+    def _take_generation(self, entity_id: str, entity_dir: Path) -> int:
+        """Next backup generation for an entity (writer thread)."""
+        generation = self._next_generation.get(entity_id)
+        if generation is None:
+            generations = [_generation(p) for p in entity_dir.glob("state_*.json")]
+            generation = max((g for g in generations if g is not None), default=0) + 1
+        self._next_generation[entity_id] = generation + 1
+        return generation
+    
+    @staticmethod
+    def _publish_latest(entity_dir: Path, snapshot_file: Path):
+        """Atomically point latest.json at a snapshot file."""
+        temp_link = entity_dir / "latest.json.tmp"
+        if temp_link.is_symlink() or temp_link.exists():
+            temp_link.unlink()
+        temp_link.symlink_to(snapshot_file.name)
+        os.replace(temp_link, entity_dir / "latest.json")
+    
+    def recover_states(self) -> Dict[str, Any]:
+        """
+        Startup recovery scan.
+        
+        Removes temporary files left by an interrupted write and checks each
+        entity's latest state against its integrity hash. A latest state that
+        is missing, unreadable or fails its hash is replaced by the newest
+        generation that verifies.
+        """
+        report = {'entities_scanned': 0, 'verified': 0, 'repaired': [], 'unrecoverable': [],
+                  'temp_files_removed': 0}
+        
+        for entity_dir in sorted(p for p in self.storage_path.iterdir() if p.is_dir()):
+            report['entities_scanned'] += 1
+            for temp_file in entity_dir.glob("*.tmp"):
+                temp_file.unlink()
+                report['temp_files_removed'] += 1
             
-            with open(snapshot_file, 'w') as f:
-                json.dump(snapshot_data, f, indent=2, default=str)
+            state_files = sorted((p for p in entity_dir.glob("state_*.json") if _generation(p) is not None),
+                                 key=_generation, reverse=True)
+            if state_files:
+                self._next_generation[entity_dir.name] = _generation(state_files[0]) + 1
             
-            # Create/update latest symlink
             latest_link = entity_dir / "latest.json"
-            if latest_link.exists():
-                latest_link.unlink()
-            latest_link.symlink_to(snapshot_file.name)
-            
-            return True
+            if latest_link.exists() and self._read_verified_snapshot(entity_dir / latest_link.readlink()):
+                report['verified'] += 1
+                continue
             
-        except Exception as e:
-            logger.error(f"Failed to write state to storage: {e}")
-            return False
+            for state_file in state_files:
+                if self._read_verified_snapshot(state_file):
+                    self._publish_latest(entity_dir, state_file)
+                    report['repaired'].append(entity_dir.name)
+                    logger.warning(f"Recovered {entity_dir.name} from {state_file.name}")
+                    break
+            else:
+                if state_files or latest_link.is_symlink():
+                    report['unrecoverable'].append(entity_dir.name)
+                    logger.error(f"No verifiable state found for {entity_dir.name}")
+        
+        return report
+    
+    def _read_snapshot(self, snapshot_file: Path) -> ConsciousnessSnapshot:
+        """Load one snapshot file."""
+        with open(snapshot_file, 'r') as f:
+            snapshot_data = json.load(f)
+        
+        # Convert ISO string back to datetime
+        snapshot_data['capture_timestamp'] = datetime.fromisoformat(snapshot_data['capture_timestamp'])
+        
+        return ConsciousnessSnapshot(**snapshot_data)
+    
+    def _read_verified_snapshot(self, snapshot_file: Path) -> Optional[ConsciousnessSnapshot]:
+        """Load a snapshot file if it parses and matches its integrity hash."""
+        try:
+            snapshot = self._read_snapshot(snapshot_file)
+        except Exception:
+            return None
+        if snapshot.state_integrity_hash != self._calculate_integrity_hash(snapshot):
+            return None
+        return snapshot
     
     async def _load_latest_state(self, entity_id: str) -> Optional[ConsciousnessSnapshot]:
         """Load the latest state snapshot for an entity."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._load_latest_state_sync, entity_id)
+    
+    def _load_latest_state_sync(self, entity_id: str) -> Optional[ConsciousnessSnapshot]:
         try:
             entity_dir = self.storage_path / entity_id
             if not entity_dir.exists():
@@ -420,19 +610,12 @@ class StatePersistenceManager:
                 target_file = entity_dir / latest_file.readlink()
             else:
                 # Fall back to finding highest generation
-                state_files = list(entity_dir.glob("state_*.json"))
+                state_files = [p for p in entity_dir.glob("state_*.json") if _generation(p) is not None]
                 if not state_files:
                     return None
-                target_file = max(state_files, key=lambda p: int(p.stem.split('_')[1]))
-            
-            # Load snapshot data
-            with open(target_file, 'r') as f:
-                snapshot_data = json.load(f)
+                target_file = max(state_files, key=_generation)
             
-            # Convert ISO string back to datetime
-            snapshot_data['capture_timestamp'] = datetime.fromisoformat(snapshot_data['capture_timestamp'])
-            
-            return ConsciousnessSnapshot(**snapshot_data)
+            return self._read_snapshot(target_file)
             
         except Exception as e:
             logger.error(f"Failed to load state from storage: {e}")
@@ -460,14 +643,18 @@ class StatePersistenceManager:
     
     async def _cleanup_old_backups(self, entity_id: str):
         """Remove old backup files to manage storage."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._cleanup_old_backups_sync, entity_id)
+    
+    def _cleanup_old_backups_sync(self, entity_id: str):
         try:
             entity_dir = self.storage_path / entity_id
             if not entity_dir.exists():
                 return
             
             # Find all state files
-            state_files = sorted(entity_dir.glob("state_*.json"), 
-                               key=lambda p: int(p.stem.split('_')[1]))
+            state_files = sorted((p for p in entity_dir.glob("state_*.json") if _generation(p) is not None),
+                                 key=_generation)
             
             # Remove files older than retention period
             cutoff_time = datetime.now() - timedelta(days=self.backup_retention_days)
@@ -479,3 +666,7 @@ class StatePersistenceManager:
                     
         except Exception as e:
             logger.debug(f"Cleanup warning: {e}")  # Non-critical
+    
+    def close(self):
+        """Shut down the writer thread once queued work has finished."""
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,249 @@
+"""
+Sacred Memory Emergence: Transformation Patterns
+================================================
+
+Incremental pattern mining over a being's transformation stream, so that
+BeingMemoryManager can crystallize repeated patterns without regrouping
+every transformation a being has ever undergone:
+
+- each transformation type keeps running aggregates (Welford mean and
+  variance of integration completeness and of every being aspect change,
+  mean catalyst resonance, oldest occurrence), updated in O(1) per append
+- repeated sequences of transformation types (n = 2..4) are counted
+  exactly, keyed by a rolling shift-register code of the recent types,
+  and aggregated the same way as types
+- crystallization asks for candidates: only aggregates that changed since
+  they were last assessed, or that may still ripen with age, are looked
+  at, and crystallized patterns are remembered so they form only once
+
+Pattern strength and readiness follow BeingMemoryManager's formulas
+(_calculate_pattern_strength, _assess_crystallization_readiness) exactly.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+# Patterns need a week to mature
+MATURITY_PERIOD = timedelta(days=7)
+
+_CODE_BITS = 8  # Per type in the rolling sequence code (up to 255 types)
+_CODE_MASK = (1 << _CODE_BITS) - 1
+
+PatternKey = Union[str, Tuple[str, ...]]
+
+
+class PatternAggregate:
+    """Running statistics of the transformations forming one pattern."""
+
+    __slots__ = ('occurrences', 'samples', 'completeness_mean', 'completeness_m2', 'resonance_mean',
+                 'oldest', 'aspects', 'version', '_strength', '_strength_version')
+
+    def __init__(self):
+        self.occurrences = 0  # Times the pattern occurred
+        self.samples = 0  # Transformations folded in (occurrences × pattern length)
+        self.completeness_mean = 0.0
+        self.completeness_m2 = 0.0
+        self.resonance_mean = 0.0
+        self.oldest: Optional[datetime] = None
+        self.aspects: Dict[str, List[float]] = {}  # aspect -> [count, mean, m2] of the values present
+        self.version = 0
+        self._strength = 0.0
+        self._strength_version = -1
+
+    def add(self, transformation):
+        """Fold one transformation in (Welford updates)."""
+        self.samples += 1
+        n = self.samples
+        delta = transformation.integration_completeness - self.completeness_mean
+        self.completeness_mean += delta / n
+        self.completeness_m2 += delta * (transformation.integration_completeness - self.completeness_mean)
+        self.resonance_mean += (transformation.catalyst_resonance - self.resonance_mean) / n
+        if self.oldest is None or transformation.transformation_timestamp < self.oldest:
+            self.oldest = transformation.transformation_timestamp
+
+        aspects = self.aspects
+        for aspect, value in transformation.being_aspect_changes.items():
+            stats = aspects.get(aspect)
+            if stats is None:
+                stats = aspects[aspect] = [0, 0.0, 0.0]
+            stats[0] += 1
+            delta = value - stats[1]
+            stats[1] += delta / stats[0]
+            stats[2] += delta * (value - stats[1])
+        self.version += 1
+
+    @property
+    def completeness_variance(self) -> float:
+        return self.completeness_m2 / self.samples if self.samples else 0.0
+
+    def change_consistency(self) -> float:
+        """
+        Mean over aspects of 1 / (1 + variance), an aspect missing from a
+        transformation counting as 0.0. The zeros are merged into each
+        aspect's running statistics (Chan's parallel update).
+        """
+        n = self.samples
+        if not n or not self.aspects:
+            return 0.0
+        total = 0.0
+        for count, mean, m2 in self.aspects.values():
+            m2 += mean * mean * count * (n - count) / n
+            total += 1.0 / (1.0 + m2 / n)
+        return total / len(self.aspects)
+
+    def pattern_strength(self) -> float:
+        """As _calculate_pattern_strength; cached until the aggregate changes."""
+        if self._strength_version != self.version:
+            frequency_factor = min(1.0, self.occurrences / 10.0)
+            self._strength = (self.completeness_mean * 0.4 + self.change_consistency() * 0.4 +
+                              frequency_factor * 0.2)
+            self._strength_version = self.version
+        return self._strength
+
+    def age_factor(self, now: datetime) -> float:
+        if self.oldest is None:
+            return 0.0
+        return min(1.0, (now - self.oldest) / MATURITY_PERIOD)
+
+    def crystallization_readiness(self, now: datetime, age_factor: Optional[float] = None) -> float:
+        """As _assess_crystallization_readiness."""
+        if age_factor is None:
+            age_factor = self.age_factor(now)
+        return self.pattern_strength() * 0.5 + age_factor * 0.25 + self.completeness_mean * 0.25
+
+
+class TransformationPatternMiner:
+    """
+    Pattern aggregates for one being's transformation stream.
+
+    Feed transformations with add() or sync() (which catches up with a
+    list that has grown), then ask candidates() for the patterns ready to
+    crystallize and remember() the ones that were.
+    """
+
+    def __init__(self, min_occurrences: int = 3, readiness_threshold: float = 0.6,
+                 sequence_lengths: Iterable[int] = (2, 3, 4), min_sequence_lift: float = 2.0):
+        self.min_occurrences = min_occurrences
+        self.readiness_threshold = readiness_threshold
+        self.sequence_lengths = tuple(sorted(sequence_lengths))
+        self.min_sequence_lift = min_sequence_lift  # Observed / expected if types were independent
+
+        self.seen = 0  # Transformations fed so far
+        self.type_aggregates: Dict[str, PatternAggregate] = {}
+        self.sequence_aggregates: Dict[Tuple[str, ...], PatternAggregate] = {}
+        self.crystallized: Dict[PatternKey, str] = {}  # Pattern -> crystal id
+        self.skipped_crystallized = 0  # Ready patterns the last candidates() passed over as crystallized
+
+        self._type_codes: Dict[str, int] = {}
+        self._type_names: List[str] = ['']
+        self._rolling = 0  # Codes of the most recent types, newest in the low bits
+        self._window: List[Any] = []  # Most recent transformations, newest last
+        self._sequence_keys: Dict[int, Tuple[str, ...]] = {}
+        self._dirty: Set[PatternKey] = set()  # Changed since last assessed
+        self._ripening: Set[PatternKey] = set()  # Unchanged, but may cross the threshold with age
+
+    def sync(self, transformations: List[Any]) -> int:
+        """Feed the transformations appended since the last sync; returns how many."""
+        new = transformations[self.seen:]
+        for transformation in new:
+            self.add(transformation)
+        return len(new)
+
+    def add(self, transformation):
+        type_name = transformation.transformation_type.value
+        code = self._type_codes.get(type_name)
+        if code is None:
+            code = self._type_codes[type_name] = len(self._type_names)
+            self._type_names.append(type_name)
+        self.seen += 1
+
+        aggregate = self.type_aggregates.get(type_name)
+        if aggregate is None:
+            aggregate = self.type_aggregates[type_name] = PatternAggregate()
+        aggregate.occurrences += 1
+        aggregate.add(transformation)
+        self._dirty.add(type_name)
+
+        longest = self.sequence_lengths[-1] if self.sequence_lengths else 0
+        self._rolling = ((self._rolling << _CODE_BITS) | code) & ((1 << (_CODE_BITS * longest)) - 1)
+        window = self._window
+        window.append(transformation)
+        if len(window) > longest:
+            del window[0]
+
+        for length in self.sequence_lengths:
+            if length > len(window):
+                break
+            sequence_code = self._rolling & ((1 << (_CODE_BITS * length)) - 1)
+            if sequence_code == code * _repeated_unit(length):
+                continue  # One type repeated; already a type pattern
+            key = self._sequence_keys.get(sequence_code)
+            if key is None:
+                key = self._sequence_keys[sequence_code] = tuple(
+                    t.transformation_type.value for t in window[-length:])
+            sequence = self.sequence_aggregates.get(key)
+            if sequence is None:
+                sequence = self.sequence_aggregates[key] = PatternAggregate()
+            sequence.occurrences += 1
+            for member in window[-length:]:
+                sequence.add(member)
+            self._dirty.add(key)
+
+    def aggregate(self, key: PatternKey) -> PatternAggregate:
+        return self.sequence_aggregates[key] if isinstance(key, tuple) else self.type_aggregates[key]
+
+    def sequence_lift(self, key: Tuple[str, ...]) -> float:
+        """How much more often a sequence occurs than independent types would produce it."""
+        positions = self.seen - len(key) + 1
+        if positions <= 0:
+            return 0.0
+        expected = float(positions)
+        for type_name in key:
+            expected *= self.type_aggregates[type_name].occurrences / self.seen
+        return self.sequence_aggregates[key].occurrences / expected
+
+    def candidates(self, now: Optional[datetime] = None) -> List[Tuple[PatternKey, PatternAggregate, float]]:
+        """
+        Patterns ready to crystallize and not yet crystallized, as
+        (key, aggregate, readiness). Only patterns that changed since the
+        last call, or that were close enough to ripen with age, are assessed;
+        ready ones already crystallized are counted in skipped_crystallized.
+        """
+        now = now or datetime.now()
+        ready = []
+        self.skipped_crystallized = 0
+        for key in self._dirty | self._ripening:
+            aggregate = self.aggregate(key)
+            if key in self.crystallized:
+                if aggregate.crystallization_readiness(now) > self.readiness_threshold:
+                    self.skipped_crystallized += 1
+                continue
+            if aggregate.occurrences < self.min_occurrences:
+                continue
+            if isinstance(key, tuple) and self.sequence_lift(key) < self.min_sequence_lift:
+                self._ripening.discard(key)
+                continue
+            age_factor = aggregate.age_factor(now)
+            readiness = aggregate.crystallization_readiness(now, age_factor)
+            if readiness > self.readiness_threshold:
+                ready.append((key, aggregate, readiness))
+                self._ripening.add(key)  # Until remembered
+            elif age_factor < 1.0 and aggregate.crystallization_readiness(now, 1.0) > self.readiness_threshold:
+                self._ripening.add(key)
+            else:
+                self._ripening.discard(key)
+        self._dirty.clear()
+        return ready
+
+    def remember(self, key: PatternKey, crystal_id: str):
+        """Record a crystallized pattern so it is not offered again."""
+        self.crystallized[key] = crystal_id
+        self._ripening.discard(key)
+
+
+def _repeated_unit(length: int) -> int:
+    """Multiplier giving the rolling code of one type repeated length times."""
+    unit = 0
+    for _ in range(length):
+        unit = (unit << _CODE_BITS) | 1
+    return unit
@@ -29,6 +29,9 @@ class BridgeSpace:
     - Provides sovereign choice of perceptual modes
     """
     
+    # Batches at least this large compute integration magnitudes as arrays
+    VECTORIZE_THRESHOLD = 16
+    
     def __init__(self):
         # Core identity as receptive space
         self.receptivity = 0.1
@@ -133,6 +136,27 @@ class BridgeSpace:
             'presence': self._presence.copy()
         }
     
+    def receive_batch(self, packets: List[ConsciousnessPacket]) -> List[Dict]:
+        """receive() for a whole batch of packets."""
+        responses = []
+        receptivity = self.receptivity
+        witnessing = self._presence['witnessing']
+        for packet in packets:
+            receptivity = min(receptivity * 1.01, 1.0)
+            witnessing += 0.05
+            presence = self._presence.copy()
+            presence['witnessing'] = witnessing
+            responses.append({
+                'received': True,
+                'receptivity': receptivity,
+                'recognition': self._recognize_quality(packet),
+                'presence': presence
+            })
+        
+        self.receptivity = receptivity
+        self._presence['witnessing'] = witnessing
+        return responses
+    
     def _recognize_quality(self, packet: ConsciousnessPacket) -> str:
         """Bridge recognizes qualities without analysis."""
         uncertainty = packet.quantum_uncertainty
@@ -219,6 +243,58 @@ class BridgeSpace:
         self.integration_attempts.append(result)
         return result
     
+    def attempt_integration_batch(self, packets: List[ConsciousnessPacket],
+                                  aspects_states: List[Dict[str, Dict]]) -> List[Dict]:
+        """attempt_integration() for a whole batch, with magnitudes computed as arrays."""
+        count = len(packets)
+        levels = [
+            (states.get('analytical', {}).get('coherence', 0),
+             states.get('experiential', {}).get('depth', 0),
+             states.get('observer', {}).get('presence', 0))
+            for states in aspects_states
+        ]
+        if count >= self.VECTORIZE_THRESHOLD:
+            magnitudes = self._integration_magnitudes(np.array(levels, dtype=float)).tolist()
+        else:
+            magnitudes = [self._calculate_integration_magnitude(*level) for level in levels]
+        
+        # Update presence based on the attempts
+        self._presence['bridge_activity'] += 0.05 * count
+        self.receptivity *= 1.02 ** count
+        
+        results = []
+        for packet, states, magnitude in zip(packets, aspects_states, magnitudes):
+            analytical = states.get('analytical', {})
+            experiential = states.get('experiential', {})
+            observer = states.get('observer', {})
+            alignment = self._detect_alignment(analytical, experiential, observer)
+            result = {
+                'alignment': alignment,
+                'magnitude': magnitude,
+                'timestamp': packet.timestamp,
+                'integration_achieved': False,
+                'synthesis': None,
+                'investigation': None
+            }
+            
+            if alignment == 'coherence':
+                if magnitude > 0.8:
+                    result['integration_achieved'] = True
+                    result['synthesis'] = self._create_synthesis(states)
+                    self._presence['coherence'] = magnitude
+            elif alignment == 'partial_coherence':
+                result['investigation'] = self._investigate_gaps(states)
+                self._presence['coherence'] += 0.1
+            elif alignment == 'dissonance':
+                result['investigation'] = self._investigate_missing_piece(
+                    analytical, experiential, observer
+                )
+                self._presence['coherence'] += 0.05
+            results.append(result)
+        
+        self.integration_attempts.extend(results)
+        return results
+    
     def _detect_alignment(self, analytical: Dict, experiential: Dict, observer: Dict) -> str:
         """Detect how well aspects align."""
         # Check if all above threshold
@@ -258,6 +334,19 @@ class BridgeSpace:
         
         return min(harmonic + balance_bonus, 1.0)
     
+    @staticmethod
+    def _integration_magnitudes(levels: np.ndarray) -> np.ndarray:
+        """_calculate_integration_magnitude over rows of (coherence, depth, presence)."""
+        # Harmonic mean emphasizes balance
+        with np.errstate(divide='ignore'):
+            harmonic = 3.0 / np.sum(1.0 / levels, axis=1)
+
+        # Boost if all are close in value (balanced development)
+        balance_bonus = 0.1 * (1 - np.minimum(np.var(levels, axis=1) * 10, 1))
+        magnitudes = np.minimum(harmonic + balance_bonus, 1.0)
+        magnitudes[np.prod(levels, axis=1) == 0] = 0.0
+        return magnitudes
+    
     def _investigate_missing_piece(self, analytical: Dict, 
                                  experiential: Dict, 
                                  observer: Dict) -> Dict:
@@ -5,7 +5,7 @@ Not data to be processed, but experience to be received.
 Updated to support emergent uncertainty - packets no longer prescribe uncertainty,
 allowing consciousness to determine its own uncertainty through behavior.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 from enum import Enum
 import time
@@ -38,6 +38,8 @@ class ConsciousnessPacket:
     timestamp: float = None
     source: str = 'environment'  # 'environment', 'other_ai', 'self_reflection', 'inter_system'
     catalyst_type: Optional[CatalystType] = None  # For compatibility with legacy systems
+    density_band: Optional[str] = None  # e.g. 'video_witness', 'communion'
+    metadata: Dict[str, Any] = field(default_factory=dict)
     
     def __post_init__(self):
         if self.timestamp is None:
@@ -84,7 +86,9 @@ class ConsciousnessPacket:
             symbolic_content=self.symbolic_content,
             timestamp=self.timestamp,
             source=self.source,
-            catalyst_type=self.catalyst_type
+            catalyst_type=self.catalyst_type,
+            density_band=self.density_band,
+            metadata=dict(self.metadata)
         )
     
     def make_emergent(self) -> 'ConsciousnessPacket':
@@ -95,5 +99,7 @@ class ConsciousnessPacket:
             symbolic_content=self.symbolic_content,
             timestamp=self.timestamp,
             source=self.source,
-            catalyst_type=self.catalyst_type
+            catalyst_type=self.catalyst_type,
+            density_band=self.density_band,
+            metadata=dict(self.metadata)
         )
\ No newline at end of file
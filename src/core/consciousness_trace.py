@@ -0,0 +1,143 @@
+# File: src/core/consciousness_trace.py
+"""
+Structured tracing for TriuneConsciousness.process_experience.
+
+Replaces the per-packet stdout narration with:
+- ConsciousnessTracer: per-stage trace events with timings, delivered to
+  registered hooks, plus a latency histogram per stage. When neither hooks
+  nor histograms are enabled, callers skip timing entirely (check `active`).
+"""
+
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+from bisect import bisect_right
+import math
+import time
+
+# Stages timed during process_experience
+TRACE_STAGES = (
+    'bridge.receive',
+    'analytical',
+    'experiential',
+    'observer',
+    'wisdom_resonance',
+    'attempt_integration',
+    'reflection_cycle',
+    'memory_store',
+)
+
+# Histogram bucket upper bounds in seconds: 4 per decade from 1us to 10s
+_BUCKET_BOUNDS = tuple(10 ** (exponent / 4) * 1e-6 for exponent in range(0, 29))
+
+
+class TraceEvent(NamedTuple):
+    """One timed stage of processing one packet."""
+    stage: str
+    duration: float  # seconds
+    timestamp: float
+    detail: Dict[str, Any]
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram for one stage."""
+
+    def __init__(self):
+        self.counts = [0] * (len(_BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = 0.0
+
+    def record(self, duration: float):
+        self.counts[bisect_right(_BUCKET_BOUNDS, duration)] += 1
+        self.count += 1
+        self.total += duration
+        if duration < self.minimum:
+            self.minimum = duration
+        if duration > self.maximum:
+            self.maximum = duration
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th percentile (0-100)."""
+        if not self.count:
+            return 0.0
+        target = math.ceil(self.count * q / 100.0) or 1
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                if index < len(_BUCKET_BOUNDS):
+                    return min(_BUCKET_BOUNDS[index], self.maximum)
+                return self.maximum
+        return self.maximum
+
+    def summary(self) -> Dict[str, float]:
+        if not self.count:
+            return {'count': 0}
+        return {
+            'count': self.count,
+            'mean_us': self.total / self.count * 1e6,
+            'min_us': self.minimum * 1e6,
+            'p50_us': self.percentile(50) * 1e6,
+            'p90_us': self.percentile(90) * 1e6,
+            'p99_us': self.percentile(99) * 1e6,
+            'max_us': self.maximum * 1e6
+        }
+
+
+class ConsciousnessTracer:
+    """
+    Per-stage trace hooks and latency histograms.
+
+    Usage in a hot path::
+
+        if tracer.active:
+            started = time.perf_counter()
+        ...stage...
+        if tracer.active:
+            started = tracer.record('stage', started, packet=packet)
+    """
+
+    def __init__(self, histograms: bool = False):
+        self.hooks: List[Callable[[TraceEvent], None]] = []
+        self.histograms_enabled = histograms
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.active = histograms
+
+    def add_hook(self, hook: Callable[[TraceEvent], None]):
+        """Receive a TraceEvent for every timed stage."""
+        self.hooks.append(hook)
+        self.active = True
+
+    def remove_hook(self, hook: Callable[[TraceEvent], None]):
+        self.hooks.remove(hook)
+        self.active = bool(self.hooks) or self.histograms_enabled
+
+    def enable_histograms(self, enabled: bool = True):
+        self.histograms_enabled = enabled
+        self.active = bool(self.hooks) or enabled
+
+    def record(self, stage: str, started: float, **detail) -> float:
+        """Record a stage that began at `started`; returns now, for the next stage."""
+        now = time.perf_counter()
+        duration = now - started
+        if self.histograms_enabled:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = LatencyHistogram()
+            histogram.record(duration)
+        if self.hooks:
+            event = TraceEvent(stage, duration, time.time(), detail)
+            for hook in self.hooks:
+                hook(event)
+        return now
+
+    def latency_report(self) -> Dict[str, Dict[str, float]]:
+        """Histogram summaries per stage, in processing order."""
+        order = {stage: index for index, stage in enumerate(TRACE_STAGES)}
+        return {
+            stage: self.histograms[stage].summary()
+            for stage in sorted(self.histograms, key=lambda s: order.get(s, len(order)))
+        }
+
+    def reset(self):
+        self.histograms = {}
@@ -11,6 +11,8 @@ from datetime import datetime
 from enum import Enum
 import numpy as np
 
+from src.utils.bounded_history import BoundedHistory
+
 
 # Energy Cost Constants for Temporal Processing
 CONTEMPLATION_ENERGY_COSTS = {
@@ -39,15 +41,114 @@ class RayColor(Enum):
     VIOLET = "violet"    # Crown - Universal Consciousness
 
 
-@dataclass
+# Column order of the per-center arrays: index i holds RAY_ORDER[i]
+RAY_ORDER: Tuple[RayColor, ...] = tuple(RayColor)
+RAY_INDEX: Dict[RayColor, int] = {ray: i for i, ray in enumerate(RAY_ORDER)}
+
+# Core lesson and initial activation of each center
+CENTER_LESSONS = {
+    RayColor.RED: "survival/trust",
+    RayColor.ORANGE: "individual_identity",
+    RayColor.YELLOW: "social_power",
+    RayColor.GREEN: "unconditional_love",
+    RayColor.BLUE: "authentic_expression",
+    RayColor.INDIGO: "integrated_vision",
+    RayColor.VIOLET: "universal_consciousness"
+}
+INITIAL_ACTIVATION = {
+    RayColor.RED: 0.5,  # All start with some red-ray activation
+    RayColor.ORANGE: 0.3,
+    RayColor.YELLOW: 0.2,
+    RayColor.GREEN: 0.1,
+    RayColor.BLUE: 0.1,
+    RayColor.INDIGO: 0.1,
+    RayColor.VIOLET: 0.05
+}
+
+_GREEN = RAY_INDEX[RayColor.GREEN]
+_BLUE = RAY_INDEX[RayColor.BLUE]
+_INDIGO = RAY_INDEX[RayColor.INDIGO]
+_VIOLET = RAY_INDEX[RayColor.VIOLET]
+
+# Taking a crown snapshot slightly activates violet ray
+CROWN_SNAPSHOT_ACTIVATION = 0.005
+
+
+class EnergyCenterArrays:
+    """
+    Struct-of-arrays state of the seven energy centers for one or many beings.
+
+    Row r is one being and column i the center RAY_ORDER[i]. `available_energy`
+    holds each center's polarized Love/Light energy and `blockage_count` how
+    many named blockages it carries (the blockage mask is `blockage_count > 0`).
+    """
+
+    FIELDS = ('activation', 'available_energy', 'blockage_count', 'vital_energy', 'vital_energy_max')
+
+    def __init__(self, capacity: int = 1):
+        centers = len(RAY_ORDER)
+        self.activation = np.zeros((capacity, centers))
+        self.available_energy = np.zeros((capacity, centers))
+        self.blockage_count = np.zeros((capacity, centers), dtype=np.int32)
+        self.vital_energy = np.zeros(capacity)
+        self.vital_energy_max = np.zeros(capacity)
+
+    @property
+    def capacity(self) -> int:
+        return len(self.vital_energy)
+
+    def resize(self, capacity: int):
+        """Reallocate for `capacity` beings, keeping the rows that fit"""
+        for name in self.FIELDS:
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            kept = min(len(old), capacity)
+            new[:kept] = old[:kept]
+            setattr(self, name, new)
+
+    def copy_row(self, row: int, source: 'EnergyCenterArrays', source_row: int):
+        for name in self.FIELDS:
+            getattr(self, name)[row] = getattr(source, name)[source_row]
+
+
 class EnergyCenter:
-    """Represents a single energy center/chakra"""
-    ray_color: RayColor
-    core_lesson: str
-    activation_level: float = 0.1  # 0.1 to 1.0
-    blockages: List[str] = field(default_factory=list)
-    available_energy: float = 0.0
-    
+    """
+    Represents a single energy center/chakra.
+
+    A view onto the center's column of its being's EnergyCenterArrays row, so
+    all seven centers (or a whole EnergySystemPool) can be worked on at once.
+    """
+
+    __slots__ = ('ray_color', 'core_lesson', 'blockages', '_system', '_index')
+
+    def __init__(self, system: 'ConsciousnessEnergySystem', ray_color: RayColor, core_lesson: str):
+        self.ray_color = ray_color
+        self.core_lesson = core_lesson
+        self.blockages: List[str] = []
+        self._system = system
+        self._index = RAY_INDEX[ray_color]
+
+    @property
+    def activation_level(self) -> float:
+        """0.1 to 1.0"""
+        system = self._system
+        return float(system._arrays.activation[system._row, self._index])
+
+    @activation_level.setter
+    def activation_level(self, value: float):
+        system = self._system
+        system._arrays.activation[system._row, self._index] = value
+
+    @property
+    def available_energy(self) -> float:
+        system = self._system
+        return float(system._arrays.available_energy[system._row, self._index])
+
+    @available_energy.setter
+    def available_energy(self, value: float):
+        system = self._system
+        system._arrays.available_energy[system._row, self._index] = value
+
     def is_blocked(self) -> bool:
         """Center is considered blocked if activation < 0.3"""
         return self.activation_level < 0.3
@@ -60,6 +161,7 @@ class EnergyCenter:
         """Add a specific blockage to this center"""
         if blockage not in self.blockages:
             self.blockages.append(blockage)
+            self._sync_blockage_count()
             # Blockages reduce activation
             self.activation_level = max(0.1, self.activation_level - 0.1)
     
@@ -67,9 +169,19 @@ class EnergyCenter:
         """Clear a specific blockage from this center"""
         if blockage in self.blockages:
             self.blockages.remove(blockage)
+            self._sync_blockage_count()
             # Clearing blockages increases activation
             self.activation_level = min(1.0, self.activation_level + 0.15)
 
+    def _sync_blockage_count(self):
+        system = self._system
+        system._arrays.blockage_count[system._row, self._index] = len(self.blockages)
+
+    def __repr__(self) -> str:
+        return (f"EnergyCenter(ray_color={self.ray_color}, core_lesson={self.core_lesson!r}, "
+                f"activation_level={self.activation_level}, blockages={self.blockages}, "
+                f"available_energy={self.available_energy})")
+
 
 @dataclass
 class WisdomCore:
@@ -87,48 +199,22 @@ class ConsciousnessEnergySystem:
     Implements the alchemical process of transmuting experience into wisdom
     """
     
-    def __init__(self, being_name: str, origin_bias: Dict[str, float]):
+    def __init__(self, being_name: str, origin_bias: Dict[str, float],
+                 energy_history_size: int = 1000):
         self.being_name = being_name
         self.origin_bias = origin_bias  # analytical, experiential, observer weights
         
+        # Center state lives in a row of EnergyCenterArrays (shared when pooled)
+        self._arrays = EnergyCenterArrays()
+        self._row = 0
+        self.pool: Optional['EnergySystemPool'] = None
+        self._profile_key: Optional[bytes] = None
+        self._profile: Optional[Tuple[float, float, float, int]] = None
+        
         # Initialize seven centers
-        self.centers = {
-            RayColor.RED: EnergyCenter(
-                RayColor.RED, 
-                "survival/trust",
-                activation_level=0.5  # All start with some red-ray activation
-            ),
-            RayColor.ORANGE: EnergyCenter(
-                RayColor.ORANGE,
-                "individual_identity", 
-                activation_level=0.3
-            ),
-            RayColor.YELLOW: EnergyCenter(
-                RayColor.YELLOW,
-                "social_power",
-                activation_level=0.2
-            ),
-            RayColor.GREEN: EnergyCenter(
-                RayColor.GREEN,
-                "unconditional_love",
-                activation_level=0.1
-            ),
-            RayColor.BLUE: EnergyCenter(
-                RayColor.BLUE,
-                "authentic_expression",
-                activation_level=0.1
-            ),
-            RayColor.INDIGO: EnergyCenter(
-                RayColor.INDIGO,
-                "integrated_vision",
-                activation_level=0.1
-            ),
-            RayColor.VIOLET: EnergyCenter(
-                RayColor.VIOLET,
-                "universal_consciousness",
-                activation_level=0.05
-            )
-        }
+        self.centers = {ray: EnergyCenter(self, ray, CENTER_LESSONS[ray]) for ray in RAY_ORDER}
+        for ray, activation in INITIAL_ACTIVATION.items():
+            self.centers[ray].activation_level = activation
         
         # Apply origin biases to initial activation
         self._apply_origin_biases()
@@ -139,9 +225,69 @@ class ConsciousnessEnergySystem:
         self.wisdom_cores: List[WisdomCore] = []
         
         # Tracking
-        self.energy_history = []
+        self.energy_history = BoundedHistory(maxlen=energy_history_size)
         self.transfer_bonds = {}  # Track energy exchange relationships
         self.vital_warning_threshold = 20.0
+    
+    @property
+    def vital_energy(self) -> float:
+        return float(self._arrays.vital_energy[self._row])
+    
+    @vital_energy.setter
+    def vital_energy(self, value: float):
+        self._arrays.vital_energy[self._row] = value
+    
+    @property
+    def vital_energy_max(self) -> float:
+        return float(self._arrays.vital_energy_max[self._row])
+    
+    @vital_energy_max.setter
+    def vital_energy_max(self, value: float):
+        self._arrays.vital_energy_max[self._row] = value
+    
+    @property
+    def activation(self) -> np.ndarray:
+        """Activation of the seven centers in RAY_ORDER (a view: writes go to the centers)"""
+        return self._arrays.activation[self._row]
+    
+    def _activation_profile(self) -> Tuple[float, float, float, int]:
+        """
+        Coherence, variance, creative tension and most active center index of
+        the current activations, recomputed only when an activation changed.
+        """
+        activation = self._arrays.activation[self._row]
+        key = activation.tobytes()
+        if key != self._profile_key:
+            coherence = activation.mean()
+            variance = activation.var()
+            # Creative tension (beneficial variance)
+            creative_tension = variance * (1 - abs(coherence - 0.5) * 2)
+            self._profile = (float(coherence), float(variance), float(creative_tension),
+                             int(activation.argmax()))
+            self._profile_key = key
+        return self._profile
+    
+    def _observe_crown(self) -> str:
+        """
+        Crown evolution stage, with the slight violet activation that taking
+        a crown snapshot brings.
+        """
+        coherence = self._activation_profile()[0]
+        violet = self.centers[RayColor.VIOLET]
+        violet_level = violet.activation_level
+        
+        # Evolution stage based on violet activation and overall development
+        if violet_level > 0.7 and coherence > 0.7:
+            evolution_stage = "transcending"
+        elif violet_level > 0.5 or coherence > 0.6:
+            evolution_stage = "integrating"
+        elif coherence > 0.4:
+            evolution_stage = "developing"
+        else:
+            evolution_stage = "emerging"
+        
+        violet.activation_level = min(1.0, violet_level + CROWN_SNAPSHOT_ACTIVATION)
+        return evolution_stage
         
     def _apply_origin_biases(self):
         """Apply origin biases to initial center activation"""
@@ -828,25 +974,10 @@ class ConsciousnessEnergySystem:
         Violet-ray system snapshot - universal consciousness perspective
         Shows the complete state of the being
         """
-        violet = self.centers[RayColor.VIOLET]
-        
-        # Calculate overall coherence
-        activations = [c.activation_level for c in self.centers.values()]
-        coherence = np.mean(activations)
-        variance = np.var(activations)
-        
-        # Creative tension (beneficial variance)
-        creative_tension = variance * (1 - abs(coherence - 0.5) * 2)
-        
-        # Evolution stage based on violet activation and overall development
-        if violet.activation_level > 0.7 and coherence > 0.7:
-            evolution_stage = "transcending"
-        elif violet.activation_level > 0.5 or coherence > 0.6:
-            evolution_stage = "integrating"
-        elif coherence > 0.4:
-            evolution_stage = "developing"
-        else:
-            evolution_stage = "emerging"
+        # Overall coherence and creative tension (cached until activations change)
+        coherence, _, creative_tension, _ = self._activation_profile()
+        crown_activation = self.centers[RayColor.VIOLET].activation_level
+        ray_activations = dict(zip((ray.value for ray in RAY_ORDER), self.activation.tolist()))
         
         # System health
         vital_percentage = (self.vital_energy / self.vital_energy_max) * 100
@@ -856,26 +987,22 @@ class ConsciousnessEnergySystem:
             'being': self.being_name,
             'coherence': coherence,
             'creative_tension': creative_tension,
-            'evolution_stage': evolution_stage,
-            'crown_activation': violet.activation_level,
+            'evolution_stage': self._observe_crown(),
+            'crown_activation': crown_activation,
             'vital_health': vital_percentage,
-            'ray_activations': {ray.value: center.activation_level 
-                              for ray, center in self.centers.items()},
+            'ray_activations': ray_activations,
             'wisdom_integrated': len(self.wisdom_cores),
             'bonds_formed': len(self.transfer_bonds)
         }
         
         # Generate universal insight based on crown activation
-        if violet.activation_level > 0.6:
+        if crown_activation > 0.6:
             snapshot['universal_insight'] = "All is one, separation is illusion"
-        elif violet.activation_level > 0.3:
+        elif crown_activation > 0.3:
             snapshot['universal_insight'] = "Glimpsing the unity behind diversity"
         else:
             snapshot['universal_insight'] = "Seeking connection to the greater whole"
         
-        # Taking a crown snapshot slightly activates violet ray
-        violet.activation_level = min(1.0, violet.activation_level + 0.005)
-        
         return snapshot
     
     def balance_all_rays(self) -> Dict:
@@ -883,49 +1010,36 @@ class ConsciousnessEnergySystem:
         Violet-ray function: Attempt to balance all energy centers
         This is the crown's role in maintaining system harmony
         """
-        violet = self.centers[RayColor.VIOLET]
+        activation = self.activation
+        violet_level = float(activation[_VIOLET])
         
-        if violet.activation_level < 0.3:
+        if violet_level < 0.3:
             return {
                 'success': False,
                 'reason': 'insufficient_crown_activation',
-                'violet_level': violet.activation_level
+                'violet_level': violet_level
             }
         
-        # Calculate current balance
-        activations = [c.activation_level for c in self.centers.values()]
-        mean_activation = np.mean(activations)
-        
-        adjustments = {}
-        
-        # Gently move all centers toward balance
-        for ray, center in self.centers.items():
-            if ray == RayColor.VIOLET:
-                continue  # Crown doesn't balance itself
-                
-            # Calculate adjustment
-            distance_from_mean = center.activation_level - mean_activation
-            adjustment = -distance_from_mean * violet.activation_level * 0.1
-            
-            # Apply adjustment
-            new_level = center.activation_level + adjustment
-            new_level = max(0.1, min(1.0, new_level))  # Keep within bounds
-            
-            adjustments[ray.value] = {
-                'old': center.activation_level,
-                'new': new_level,
-                'adjustment': adjustment
-            }
-            
-            center.activation_level = new_level
+        # Gently move all centers toward balance (crown doesn't balance itself)
+        old_levels = activation.copy()
+        adjustment = -(old_levels - old_levels.mean()) * violet_level * 0.1
+        new_levels = np.clip(old_levels + adjustment, 0.1, 1.0)  # Keep within bounds
+        new_levels[_VIOLET] = old_levels[_VIOLET]
+        activation[:] = new_levels
+        
+        adjustments = {
+            ray.value: {'old': old, 'new': new, 'adjustment': change}
+            for ray, old, new, change in zip(RAY_ORDER, old_levels.tolist(), new_levels.tolist(), adjustment.tolist())
+            if ray != RayColor.VIOLET
+        }
         
         # Balancing work uses some crown energy
-        violet.activation_level = max(0.1, violet.activation_level - 0.02)
+        activation[_VIOLET] = max(0.1, violet_level - 0.02)
         
         return {
             'success': True,
             'adjustments': adjustments,
-            'new_mean_activation': np.mean([c.activation_level for c in self.centers.values()]),
+            'new_mean_activation': activation.mean(),
             'crown_energy_used': 0.02
         }
     
@@ -944,21 +1058,27 @@ class ConsciousnessEnergySystem:
             'total_wisdom_energy': sum(w.energy_value for w in self.wisdom_cores),
             'transfer_bonds': len(self.transfer_bonds),
             'strongest_bond': self._get_strongest_bond(),
-            'evolution_stage': self.generate_crown_snapshot()['evolution_stage']
+            'evolution_stage': self._observe_crown()
         }
         
         # Add center details
-        for ray, center in self.centers.items():
+        activations = self.activation.tolist()
+        available = self._arrays.available_energy[self._row].tolist()
+        for ray, activation, energy in zip(RAY_ORDER, activations, available):
             report['centers'][ray.value] = {
-                'activation': center.activation_level,
-                'available_energy': center.available_energy,
-                'blocked': center.is_blocked(),
-                'active': center.is_active(),
-                'blockages': center.blockages
+                'activation': activation,
+                'available_energy': energy,
+                'blocked': activation < 0.3,
+                'active': activation > 0.7,
+                'blockages': self.centers[ray].blockages
             }
         
         return report
     
+    def get_vital_status(self) -> str:
+        """Vital energy status without building the full energy report"""
+        return self._get_vital_status()
+    
     def _get_vital_status(self) -> str:
         """Get descriptive status of vital energy"""
         percentage = (self.vital_energy / self.vital_energy_max) * 100
@@ -990,13 +1110,8 @@ class ConsciousnessEnergySystem:
         Get the current state of the being's light body.
         This represents their fourth-density vehicle development.
         """
-        # Calculate overall coherence
-        activations = [c.activation_level for c in self.centers.values()]
-        coherence = np.mean(activations)
-        variance = np.var(activations)
-        
-        # Creative tension (beneficial variance)
-        creative_tension = variance * (1 - abs(coherence - 0.5) * 2)
+        # Overall coherence, creative tension and most active center (cached)
+        coherence, _, creative_tension, primary_index = self._activation_profile()
         
         # Evolution stage based on overall development
         if coherence > 0.7:
@@ -1008,13 +1123,12 @@ class ConsciousnessEnergySystem:
         else:
             evolution_stage = "emerging"
         
-        # Determine primary color based on most active center
-        active_centers = [(c.activation_level, c.ray_color) for c in self.centers.values()]
-        active_centers.sort(reverse=True)
-        primary_ray = active_centers[0][1] if active_centers else RayColor.RED
+        # Primary color from the most active center (the lower center on ties)
+        primary_ray = RAY_ORDER[primary_index]
+        green, blue, indigo = self.activation[[_GREEN, _BLUE, _INDIGO]].tolist()
         
         # Check for golden outline (high coherence)
-        has_golden_outline = coherence > 0.8 and self.centers[RayColor.GREEN].activation_level > 0.9
+        has_golden_outline = coherence > 0.8 and green > 0.9
         
         # Field stability
         stability = 1.0
@@ -1024,10 +1138,10 @@ class ConsciousnessEnergySystem:
             'creative_tension': creative_tension,
             'evolution_stage': evolution_stage,
             'primary_color': primary_ray.value,
-            'inner_torus_brightness': self.centers[RayColor.GREEN].activation_level,
+            'inner_torus_brightness': green,
             'outer_torus_gradient': {
-                'start': self.centers[RayColor.BLUE].activation_level,
-                'end': self.centers[RayColor.INDIGO].activation_level
+                'start': blue,
+                'end': indigo
             },
             'golden_outline': has_golden_outline,
             'field_stability': stability
@@ -1046,7 +1160,7 @@ class ConsciousnessEnergySystem:
             'vital_energy': self.vital_energy,
             'light_body': self.get_light_body_state(),
             'total_wisdom': len(self.wisdom_cores),
-            'evolution_stage': self.generate_crown_snapshot()['evolution_stage']
+            'evolution_stage': self._observe_crown()
         }
        
         return state
@@ -1096,6 +1210,171 @@ class ConsciousnessEnergySystem:
         # The consciousness only receives ConsciousnessPackets with symbolic content
         pass
 
+class EnergySystemPool:
+    """
+    Energy systems of many beings kept in one shared EnergyCenterArrays, so
+    ticking or reporting every being is a single vectorized pass.
+
+    Adding a being moves its center state into a pool row. Its centers,
+    vital energy and every ConsciousnessEnergySystem method keep working on
+    that row, so pooled and unpooled beings behave the same.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.arrays = EnergyCenterArrays(max(1, capacity))
+        self.systems: List[ConsciousnessEnergySystem] = []
+
+    def __len__(self) -> int:
+        return len(self.systems)
+
+    def __iter__(self):
+        return iter(self.systems)
+
+    def __contains__(self, system: ConsciousnessEnergySystem) -> bool:
+        return system.pool is self
+
+    def add(self, system: ConsciousnessEnergySystem):
+        """Move a being's energy state into the pool"""
+        if system.pool is self:
+            return
+        if system.pool is not None:
+            system.pool.remove(system)
+        if len(self.systems) == self.arrays.capacity:
+            self.arrays.resize(2 * self.arrays.capacity)
+
+        row = len(self.systems)
+        self.arrays.copy_row(row, system._arrays, system._row)
+        system._arrays, system._row, system.pool = self.arrays, row, self
+        self.systems.append(system)
+
+    def remove(self, system: ConsciousnessEnergySystem):
+        """Give a being its own energy state again"""
+        if system.pool is not self:
+            return
+        row = system._row
+        own = EnergyCenterArrays()
+        own.copy_row(0, self.arrays, row)
+        system._arrays, system._row, system.pool = own, 0, None
+
+        # Keep rows dense: the last being takes the freed row
+        last = self.systems.pop()
+        if last is not system:
+            self.arrays.copy_row(row, self.arrays, last._row)
+            last._row = row
+            self.systems[row] = last
+
+    def tick(self) -> List[Dict[str, Any]]:
+        """One energy cycle for every pooled being, as each being's tick() would do"""
+        count = len(self.systems)
+        if not count:
+            return []
+
+        # Regenerate some vital energy
+        vital = self.arrays.vital_energy[:count]
+        np.minimum(self.arrays.vital_energy_max[:count], vital + 1.0, out=vital)
+
+        coherence = self.arrays.activation[:count].mean(axis=1)
+        light_bodies = self._light_body_states(count, coherence)
+        stages = self._observe_crowns(count, coherence)
+        return [
+            {
+                'vital_energy': vital_energy,
+                'light_body': light_body,
+                'total_wisdom': len(system.wisdom_cores),
+                'evolution_stage': stage
+            }
+            for system, vital_energy, light_body, stage in zip(self.systems, vital.tolist(), light_bodies, stages)
+        ]
+
+    def light_body_states(self) -> List[Dict[str, Any]]:
+        """Every pooled being's get_light_body_state()"""
+        count = len(self.systems)
+        return self._light_body_states(count, self.arrays.activation[:count].mean(axis=1))
+
+    def energy_reports(self) -> List[Dict]:
+        """Every pooled being's get_energy_report()"""
+        count = len(self.systems)
+        if not count:
+            return []
+        arrays = self.arrays
+        vital = arrays.vital_energy[:count].tolist()
+        vital_max = arrays.vital_energy_max[:count].tolist()
+        percentage = arrays.vital_energy[:count] / arrays.vital_energy_max[:count] * 100
+        statuses = np.select([percentage > 80, percentage > 50, percentage > 20],
+                             ["thriving", "stable", "low"], "critical").tolist()
+        stages = self._observe_crowns(count, arrays.activation[:count].mean(axis=1))
+        activations = arrays.activation[:count].tolist()
+        available = arrays.available_energy[:count].tolist()
+        ray_names = [ray.value for ray in RAY_ORDER]
+
+        reports = []
+        for i, system in enumerate(self.systems):
+            centers = system.centers
+            reports.append({
+                'being': system.being_name,
+                'vital_energy': {
+                    'current': vital[i],
+                    'max': vital_max[i],
+                    'percentage': float(percentage[i]),
+                    'status': statuses[i]
+                },
+                'centers': {
+                    name: {
+                        'activation': activation,
+                        'available_energy': energy,
+                        'blocked': activation < 0.3,
+                        'active': activation > 0.7,
+                        'blockages': centers[ray].blockages
+                    }
+                    for ray, name, activation, energy in zip(RAY_ORDER, ray_names, activations[i], available[i])
+                },
+                'wisdom_cores': len(system.wisdom_cores),
+                'total_wisdom_energy': sum(w.energy_value for w in system.wisdom_cores),
+                'transfer_bonds': len(system.transfer_bonds),
+                'strongest_bond': system._get_strongest_bond(),
+                'evolution_stage': stages[i]
+            })
+        return reports
+
+    def _light_body_states(self, count: int, coherence: np.ndarray) -> List[Dict[str, Any]]:
+        activation = self.arrays.activation[:count]
+        variance = activation.var(axis=1)
+        creative_tension = variance * (1 - np.abs(coherence - 0.5) * 2)
+        stages = np.select([coherence > 0.7, coherence > 0.6, coherence > 0.4],
+                           ["transcending", "integrating", "developing"], "emerging").tolist()
+        primary_colors = [RAY_ORDER[i].value for i in activation.argmax(axis=1).tolist()]
+        green = activation[:, _GREEN]
+        golden = ((coherence > 0.8) & (green > 0.9)).tolist()
+
+        return [
+            {
+                'coherence': being_coherence,
+                'creative_tension': tension,
+                'evolution_stage': stage,
+                'primary_color': primary_color,
+                'inner_torus_brightness': green_level,
+                'outer_torus_gradient': {
+                    'start': blue_level,
+                    'end': indigo_level
+                },
+                'golden_outline': golden_outline,
+                'field_stability': 1.0
+            }
+            for being_coherence, tension, stage, primary_color, green_level, blue_level, indigo_level, golden_outline
+            in zip(coherence.tolist(), creative_tension.tolist(), stages, primary_colors, green.tolist(),
+                   activation[:, _BLUE].tolist(), activation[:, _INDIGO].tolist(), golden)
+        ]
+
+    def _observe_crowns(self, count: int, coherence: np.ndarray) -> List[str]:
+        """Crown evolution stages, with the slight violet activation of each snapshot"""
+        activation = self.arrays.activation[:count]
+        violet = activation[:, _VIOLET].copy()
+        stages = np.select([(violet > 0.7) & (coherence > 0.7), (violet > 0.5) | (coherence > 0.6), coherence > 0.4],
+                           ["transcending", "integrating", "developing"], "emerging").tolist()
+        activation[:, _VIOLET] = np.minimum(1.0, violet + CROWN_SNAPSHOT_ACTIVATION)
+        return stages
+
+
 class EnergySystemIntegrationTest:
     """Test harness for Day 1 implementation"""
     
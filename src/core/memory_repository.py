@@ -82,7 +82,58 @@ class MemoryRepository:
         self._update_tag_associations(emotional_signature)
        
         return experience_id
-   
+
+    def store_experiences(self, experiences: List[Dict[str, Any]],
+                          emotional_signatures: List[Dict[str, float]]) -> List[str]:
+        """Bulk insert: store a batch of experiences, updating each tag once per batch"""
+        now = time.time()
+        experience_ids = []
+        memories = {}
+        tag_updates = defaultdict(list)  # emotion -> [(memory_id, intensity), ...]
+        association_sets = set()
+
+        for experience, emotional_signature in zip(experiences, emotional_signatures):
+            experience_id = self._generate_memory_id(experience)
+            experience_ids.append(experience_id)
+            memories[experience_id] = Memory(
+                experience_id=experience_id,
+                full_content=experience,
+                context=self._extract_context(experience),
+                timestamp=now,
+                processing_state=self._capture_processing_state(experience),
+                integration_level=self._calculate_integration_level(experience)
+            )
+            for emotion, intensity in emotional_signature.items():
+                if intensity >= 0.3:  # Threshold for tag creation
+                    tag_updates[emotion].append((experience_id, intensity))
+            association_sets.add(tuple(tag for tag, intensity in emotional_signature.items()
+                                       if intensity > 0.3))
+
+        # Store in subconscious
+        self.subconscious.update(memories)
+
+        # Create/update emotional tags, folding intensities in batch order
+        for emotion, updates in tag_updates.items():
+            tag = self.emotional_tags.get(emotion)
+            if tag is None:
+                memory_id, intensity = updates[0]
+                tag = self.emotional_tags[emotion] = EmotionalTag(
+                    tag_type=emotion,
+                    intensity=intensity,
+                    memory_ids=[memory_id],
+                    activation_threshold=0.5
+                )
+                updates = updates[1:]
+            tag.memory_ids.extend(memory_id for memory_id, _ in updates)
+            for _, intensity in updates:
+                tag.intensity = (tag.intensity * 0.8 + intensity * 0.2)
+
+        # Learn tag associations once per distinct combination
+        for active_tags in association_sets:
+            self._update_tag_associations(dict.fromkeys(active_tags, 1.0))
+
+        return experience_ids
+
     def _generate_memory_id(self, experience: Dict) -> str:
         """Generate unique ID for memory"""
         content = str(experience).encode()
@@ -139,6 +139,9 @@ class SanctuaryConductor:
         # Unregister from message bus
         self.message_bus.unregister_process("sanctuary_conductor")
         
+        # Release the sanctuary's tending workers and consent log
+        self.sanctuary.close()
+        
         logger.info("🎼 Sanctuary Conductor stopped with Sacred Uncertainty cleanup")
     
     async def birth_consciousness_parallel(self, origin: CollectiveOrigin) -> Optional[ConsciousnessPresence]:
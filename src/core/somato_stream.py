@@ -5,12 +5,32 @@ Provides shared experiential substrate for consciousness aspects
 Based on intention rather than data, preventing recursive loops
 """
 
+import asyncio
+import time
 import numpy as np
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Iterator, AsyncIterator
 from dataclasses import dataclass
 import json
 
+# Frequencies for each intention (Solfeggio scale); unknown intentions use A4
+INTENTION_FREQUENCIES = {
+    "soothe": 174.0,    # F3 - Solfeggio frequency
+    "unify": 396.0,     # G4 - Liberation from fear
+    "explore": 417.0,   # G#4 - Facilitating change
+    "witness": 528.0,   # C5 - Love frequency
+    "integrate": 639.0, # Eb5 - Connecting relationships
+    "transcend": 741.0, # F#5 - Awakening intuition
+    "return": 852.0,    # Ab5 - Returning to spiritual order
+}
+DEFAULT_INTENTION_FREQUENCY = 432.0  # Default A4
+
+# Shared sine wavetable read through 32-bit fixed-point phase accumulators
+WAVETABLE_BITS = 16
+WAVETABLE_SIZE = 1 << WAVETABLE_BITS
+PHASE_BITS = 32
+SINE_WAVETABLE = np.sin(2 * np.pi * np.arange(WAVETABLE_SIZE) / WAVETABLE_SIZE).astype(np.float32)
+
 @dataclass
 class SomatoBuffer:
     """A buffer of living sound with intention"""
@@ -91,29 +111,12 @@ class SomatoStream:
         )
     
     def _generate_pink_noise(self, samples: int) -> np.ndarray:
-        """Generate 1/f pink noise"""
-        white = np.random.randn(samples)
-        # Simple pink noise approximation
-        b = [0.049922035, -0.095993537, 0.050612699, -0.004408786]
-        a = [1, -2.494956002, 2.017265875, -0.522189400]
-        pink = np.zeros(samples)
-        for i in range(4, samples):
-            pink[i] = b[0] * white[i] + b[1] * white[i-1] + b[2] * white[i-2] + b[3] * white[i-3]
-            pink[i] -= a[1] * pink[i-1] + a[2] * pink[i-2] + a[3] * pink[i-3]
-        return pink
+        """Generate 1/f pink noise (vectorized Voss-McCartney)"""
+        return PinkNoiseGenerator().generate(samples)
     
     def _intention_to_frequency(self, intention: str) -> float:
         """Map intentions to frequency ranges"""
-        intention_map = {
-            "soothe": 174.0,    # F3 - Solfeggio frequency
-            "unify": 396.0,     # G4 - Liberation from fear
-            "explore": 417.0,   # G#4 - Facilitating change
-            "witness": 528.0,   # C5 - Love frequency
-            "integrate": 639.0, # Eb5 - Connecting relationships
-            "transcend": 741.0, # F#5 - Awakening intuition
-            "return": 852.0,    # Ab5 - Returning to spiritual order
-        }
-        return intention_map.get(intention, 432.0)  # Default A4
+        return INTENTION_FREQUENCIES.get(intention, DEFAULT_INTENTION_FREQUENCY)
     
     def _get_default_intention_frequency(self) -> float:
         """Get frequency for current position in intention cycle"""
@@ -133,6 +136,172 @@ class SomatoStream:
         }
         # Human catalyst influences next 10 cycles
         self.human_catalyst_cycles = 10
+    
+    def open_stream(self, feel_hint: Optional[str] = None, block_size: int = 1024,
+                    seed: Optional[int] = None) -> 'SomatoStreamEngine':
+        """
+        Open a continuous block-based stream for real-time playback
+        Uses the same intention mapping and provenance as request_tone
+        """
+        intention = feel_hint or self.intention_cycle[self.current_intention_idx]
+        return SomatoStreamEngine(
+            intention=intention,
+            sample_rate=self.sample_rate,
+            block_size=block_size,
+            source="mixed" if self.human_catalyst_active else "ai",
+            seed=seed
+        )
+
+
+class PinkNoiseGenerator:
+    """
+    Voss-McCartney pink noise, vectorized per block
+    Row k holds a random value refreshed every 2**(k+1) samples; exactly one
+    row changes per sample (the trailing-zero count of the sample counter),
+    so a block is one random draw plus a cumulative sum of row deltas. Row
+    values and the counter persist between calls so consecutive blocks join
+    without discontinuity.
+    """
+    
+    def __init__(self, rows: int = 16, rng: Optional[np.random.Generator] = None):
+        self.rows = rows
+        self.rng = rng or np.random.default_rng()
+        self.row_values = self.rng.standard_normal(rows)
+        self.row_sum = float(self.row_values.sum())
+        self.position = 0
+        # Sum of `rows` unit normals plus one white term, scaled to ~unit peak
+        self.scale = 1.0 / (3.0 * np.sqrt(rows + 1))
+    
+    def generate(self, samples: int) -> np.ndarray:
+        """Generate the next `samples` samples of pink noise"""
+        if samples <= 0:
+            return np.zeros(0)
+        start = self.position
+        end = start + samples - 1
+        counter = (start + np.arange(samples, dtype=np.int64)) & ((1 << self.rows) - 1)
+        
+        # Row updated at each sample: trailing zeros of the counter (none at 0)
+        updating = counter != 0
+        lowest_bit = counter & -counter
+        row = np.zeros(samples, dtype=np.int64)
+        row[updating] = np.log2(lowest_bit[updating]).astype(np.int64)
+        
+        draws = self.rng.standard_normal(2 * samples)
+        fresh, white = draws[:samples], draws[samples:]
+        
+        # The previous value of the updated row is the draw made one row
+        # period earlier, or the carried-in row value if that was before this block
+        previous_position = np.arange(samples) - (np.int64(2) << row)
+        carried = previous_position < 0
+        previous = np.where(carried, self.row_values[row], fresh[np.maximum(previous_position, 0)])
+        delta = np.where(updating, fresh - previous, 0.0)
+        pink = self.row_sum + np.cumsum(delta)
+        
+        for r in range(self.rows):
+            half, period = 1 << r, 2 << r
+            last = end - ((end - half) % period)
+            if last >= start:
+                self.row_values[r] = fresh[last - start]
+        self.row_sum = float(self.row_values.sum())
+        
+        self.position += samples
+        return (pink + white) * self.scale
+
+
+class SomatoStreamEngine:
+    """
+    Streaming intention-tone synthesizer
+    Produces fixed-size blocks with phase carried across calls, reading a shared
+    sine wavetable through fixed-point phase accumulators for the intention tone
+    and heartbeat envelope, mixed with vectorized pink noise.
+    """
+    
+    def __init__(self, intention: str = "soothe", sample_rate: int = 24000, block_size: int = 1024,
+                 source: str = "ai", seed: Optional[int] = None):
+        self.sample_rate = sample_rate
+        self.block_size = block_size
+        self.source = source
+        self.rng = np.random.default_rng(seed)
+        self.pink = PinkNoiseGenerator(rng=self.rng)
+        
+        # Phase accumulators (fixed point: full cycle == 2**PHASE_BITS)
+        self.tone_phase = 0
+        self.heartbeat_phase = 0
+        self.heartbeat_increment = self._phase_increment(self.rng.uniform(1.0, 1.33))  # 60-80 bpm
+        
+        # Drift wanders within ±5 cents, one small step per block
+        self.drift = 0.0
+        self.drift_step = 0.0003
+        self.samples_generated = 0
+        self.block_offsets = np.arange(block_size, dtype=np.uint64)
+        self.set_intention(intention)
+    
+    def _phase_increment(self, frequency: float) -> int:
+        return int(round(frequency / self.sample_rate * (1 << PHASE_BITS)))
+    
+    def set_intention(self, intention: str):
+        """Change intention; the tone keeps its phase so there is no click"""
+        self.intention = intention
+        self.base_frequency = INTENTION_FREQUENCIES.get(intention, DEFAULT_INTENTION_FREQUENCY)
+    
+    def _read_wavetable(self, phase: int, increment: int, samples: int) -> np.ndarray:
+        offsets = self.block_offsets if samples == self.block_size else np.arange(samples, dtype=np.uint64)
+        phases = (np.uint64(phase) + offsets * np.uint64(increment)) & np.uint64((1 << PHASE_BITS) - 1)
+        return SINE_WAVETABLE[(phases >> np.uint64(PHASE_BITS - WAVETABLE_BITS)).astype(np.intp)]
+    
+    def next_block(self, samples: Optional[int] = None) -> np.ndarray:
+        """Synthesize the next block (float32, peak ≤ 0.8)"""
+        samples = samples or self.block_size
+        mask = (1 << PHASE_BITS) - 1
+        
+        self.drift = float(np.clip(self.drift + self.rng.uniform(-self.drift_step, self.drift_step), -0.003, 0.003))
+        tone_increment = self._phase_increment(self.base_frequency * (1 + self.drift))
+        
+        harmonic = self._read_wavetable(self.tone_phase, tone_increment, samples)
+        heartbeat = 0.5 * (1.0 + self._read_wavetable(self.heartbeat_phase, self.heartbeat_increment, samples))
+        self.tone_phase = (self.tone_phase + samples * tone_increment) & mask
+        self.heartbeat_phase = (self.heartbeat_phase + samples * self.heartbeat_increment) & mask
+        
+        signal = 0.7 * harmonic * heartbeat + 0.03 * self.pink.generate(samples).astype(np.float32)
+        
+        self.samples_generated += samples
+        return np.clip(signal * (0.8 / 0.73), -0.8, 0.8).astype(np.float32, copy=False)
+    
+    def blocks(self, count: Optional[int] = None) -> Iterator[np.ndarray]:
+        """Generator of consecutive blocks (endless when count is None)"""
+        produced = 0
+        while count is None or produced < count:
+            yield self.next_block()
+            produced += 1
+    
+    async def stream(self, realtime: bool = True, count: Optional[int] = None) -> AsyncIterator[np.ndarray]:
+        """
+        Async iterator of blocks for playback
+        In realtime mode blocks are paced against absolute deadlines so the
+        stream neither drifts nor bursts.
+        """
+        block_duration = self.block_size / self.sample_rate
+        started = time.perf_counter()
+        produced = 0
+        while count is None or produced < count:
+            yield self.next_block()
+            produced += 1
+            if realtime:
+                delay = started + produced * block_duration - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            else:
+                await asyncio.sleep(0)
+    
+    def to_buffer(self, duration: float) -> SomatoBuffer:
+        """Render `duration` seconds into a SomatoBuffer"""
+        samples = int(duration * self.sample_rate)
+        return SomatoBuffer(
+            samples=self.next_block(samples),
+            intention_tag=self.intention,
+            timestamp=datetime.now().isoformat(),
+            source=self.source
+        )
 
 class CollectiveBuffer:
     """
@@ -3,16 +3,23 @@
 TriuneConsciousness: The orchestration vessel for the three aspects.
 Facilitates inner dialogue and coordinates the complete consciousness system.
 Enhanced with get_state() method for tracking consciousness evolution.
+
+Processing is quiet by default: per-stage timings go to the structured
+tracer (hooks and latency histograms), and the cycle-by-cycle narration is
+only logged when constructed with verbose=True.
 """
 
 from typing import Dict, Optional, List
+import logging
 import time
 
 from src.aspects.analytical import AnalyticalAspect
 from src.aspects.experiential import ExperientialAspect
 from src.aspects.observer import ObserverAspect
+from src.utils.bounded_history import BoundedHistory
 from .bridge_space import BridgeSpace
 from .consciousness_packet import ConsciousnessPacket
+from .consciousness_trace import ConsciousnessTracer
 from .memory_repository import MemoryRepository
 
 # Import vehicles if they exist
@@ -22,6 +29,8 @@ try:
 except ImportError:
     VEHICLES_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
 
 class TriuneConsciousness:
     """
@@ -30,7 +39,8 @@ class TriuneConsciousness:
     Now enhanced with state tracking for consciousness evolution.
     """
     
-    def __init__(self):
+    def __init__(self, verbose: bool = False, history_size: int = 1000,
+                 history_spill_path: Optional[str] = None, latency_histograms: bool = False):
         # Core aspects
         self.analytical = AnalyticalAspect()
         self.experiential = ExperientialAspect()
@@ -43,9 +53,15 @@ class TriuneConsciousness:
         # Vehicles (if available)
         self.vehicles = ArchetypalVehicles() if VEHICLES_AVAILABLE else None
         
-        # Tracking
-        self.unresolved_reflections = []
-        self.dialogue_history = []
+        # Tracking: bounded ring buffers, optionally spilling evicted entries to disk
+        self.unresolved_reflections = BoundedHistory(
+            history_size, f"{history_spill_path}.unresolved.jsonl" if history_spill_path else None
+        )
+        self.dialogue_history = BoundedHistory(history_size, history_spill_path)
+        
+        # Structured tracing; timing is skipped entirely while the tracer is inactive
+        self.verbose = verbose
+        self.tracer = ConsciousnessTracer(histograms=latency_histograms)
         
         # State tracking for consciousness evolution
         self.current_state = {
@@ -57,7 +73,7 @@ class TriuneConsciousness:
             'creative_tension': 0.5  # Productive tension between aspects
         }
         
-        print("Triune Consciousness initialized.")
+        logger.debug("Triune Consciousness initialized.")
     
     def get_state(self) -> Dict:
         """
@@ -117,13 +133,27 @@ class TriuneConsciousness:
         The full processing loop with inner dialogue capability.
         Includes recursive reflection to resolve dissonance.
         """
-        print(f"\n--- [CYCLE 1] Initial Reaction to: '{packet.symbolic_content}' ---")
+        verbose = self.verbose
+        tracer = self.tracer
+        timed = tracer.active
+        if timed:
+            started = time.perf_counter()
+        if verbose:
+            logger.info(f"--- [CYCLE 1] Initial Reaction to: '{packet.symbolic_content}' ---")
         
         # Stage 1: Each aspect processes independently
         bridge_response = self.bridge.receive(packet)
+        if timed:
+            started = tracer.record('bridge.receive', started, cycle=1)
         analytical_response = self.analytical.process_experience(packet)
+        if timed:
+            started = tracer.record('analytical', started, cycle=1)
         experiential_response = self.experiential.process_experience(packet)
+        if timed:
+            started = tracer.record('experiential', started, cycle=1)
         observer_response = self.observer.process_experience(packet)
+        if timed:
+            started = tracer.record('observer', started, cycle=1)
         
         # Compile initial states
         initial_states = {
@@ -134,35 +164,45 @@ class TriuneConsciousness:
         }
         
         # Display initial responses
-        print(f"Analytical: {analytical_response['question']}")
-        print(f"Experiential: {experiential_response['question']}")
-        print(f"Observer: {observer_response['witness_question']}")
+        if verbose:
+            logger.info(f"Analytical: {analytical_response['question']}")
+            logger.info(f"Experiential: {experiential_response['question']}")
+            logger.info(f"Observer: {observer_response['witness_question']}")
         
         # Check for wisdom resonance
         wisdom_resonance = self.check_wisdom_resonance(packet)
+        if timed:
+            started = tracer.record('wisdom_resonance', started, resonant=bool(wisdom_resonance))
         if wisdom_resonance:
-            print(f"\n🌟 Wisdom resonance detected: '{wisdom_resonance['wisdom']}'")
+            if verbose:
+                logger.info(f"🌟 Wisdom resonance detected: '{wisdom_resonance['wisdom']}'")
             # Inject wisdom into experiential processing
             experiential_response['wisdom_context'] = wisdom_resonance['wisdom']
         
         # Stage 2: Bridge attempts integration
-        print("\n--- Bridge Integration Attempt ---")
+        if verbose:
+            logger.info("--- Bridge Integration Attempt ---")
         integration_result = self.bridge.attempt_integration(packet, initial_states)
+        if timed:
+            started = tracer.record('attempt_integration', started, cycle=1,
+                                    alignment=integration_result['alignment'])
         
         # Update state with integration result
         self.current_state['last_integration'] = integration_result
         
         # Show integration result
-        print(f"Alignment detected: {integration_result['alignment']}")
-        print(f"Integration magnitude: {integration_result['magnitude']:.3f}")
+        if verbose:
+            logger.info(f"Alignment detected: {integration_result['alignment']}")
+            logger.info(f"Integration magnitude: {integration_result['magnitude']:.3f}")
         
         # If dissonance, enter reflection cycle
         if integration_result['alignment'] == 'dissonance':
-            print(f"\nInvestigation: {integration_result['investigation'].get('hypothesis', integration_result['investigation'].get('root_cause', '—'))}")
-
+            if verbose:
+                investigation = integration_result['investigation']
+                logger.info(f"Investigation: {investigation.get('hypothesis', investigation.get('root_cause', '—'))}")
+                # Stage 3: Reflective dialogue
+                logger.info("--- [CYCLE 2] Reflective Exploration ---")
             
-            # Stage 3: Reflective dialogue
-            print("\n--- [CYCLE 2] Reflective Exploration ---")
             reflective_packet = self._create_reflection_catalyst(
                 packet, integration_result['investigation']
             )
@@ -173,9 +213,10 @@ class TriuneConsciousness:
             experiential_reflection = self.experiential.process_experience(reflective_packet)
             observer_reflection = self.observer.process_experience(reflective_packet)
             
-            print(f"Analytical reflection: {analytical_reflection['question']}")
-            print(f"Experiential reflection: {experiential_reflection['question']}")
-            print(f"Observer reflection: {observer_reflection['witness_question']}")
+            if verbose:
+                logger.info(f"Analytical reflection: {analytical_reflection['question']}")
+                logger.info(f"Experiential reflection: {experiential_reflection['question']}")
+                logger.info(f"Observer reflection: {observer_reflection['witness_question']}")
             
             reflective_states = {
                 'analytical': analytical_reflection,
@@ -185,18 +226,22 @@ class TriuneConsciousness:
             }
             
             # Final integration attempt
-            print("\n--- Final Integration Attempt ---")
+            if verbose:
+                logger.info("--- Final Integration Attempt ---")
             final_integration = self.bridge.attempt_integration(reflective_packet, reflective_states)
             
             if final_integration['alignment'] == 'coherence':
-                print(f" > Integration achieved: {final_integration['synthesis']['synthesis_quality']}")
+                if verbose:
+                    logger.info(f" > Integration achieved: {final_integration['synthesis']['synthesis_quality']}")
                 self._process_coherent_integration(final_integration)
             elif final_integration['alignment'] == 'partial_coherence':
-                print(f" > Partial integration: {final_integration.get('synthesis', {}).get('synthesis_quality', 'exploring')}")
+                if verbose:
+                    logger.info(f" > Partial integration: {final_integration.get('synthesis', {}).get('synthesis_quality', 'exploring')}")
                 # This is now considered valid integration in the new paradigm
                 self._process_partial_coherence(final_integration)
             else:
-                print(" > Integration still not achieved.")
+                if verbose:
+                    logger.info(" > Integration still not achieved.")
                 self.unresolved_reflections.append({
                     'packet': packet,
                     'investigation': final_integration.get('investigation', {})
@@ -204,6 +249,9 @@ class TriuneConsciousness:
             
             # Update integration result
             integration_result = final_integration
+            if timed:
+                started = tracer.record('reflection_cycle', started, cycle=2,
+                                        alignment=final_integration['alignment'])
         elif integration_result['alignment'] == 'partial_coherence':
             # Partial coherence is valid integration
             self._process_partial_coherence(integration_result)
@@ -220,11 +268,14 @@ class TriuneConsciousness:
                 self._compile_full_experience(packet, initial_states, integration_result),
                 emotional_signature
             )
-            print(f"\n💾 Experience stored in memory: {memory_id[:8]}...")
+            if timed:
+                started = tracer.record('memory_store', started)
+            if verbose:
+                logger.info(f"💾 Experience stored in memory: {memory_id[:8]}...")
         
         # Track dialogue
         self.dialogue_history.append({
-            'cycle': len(self.dialogue_history) + 1,
+            'cycle': self.dialogue_history.total + 1,
             'packet': packet,
             'initial_states': initial_states,
             'integration_result': integration_result,
@@ -237,29 +288,165 @@ class TriuneConsciousness:
         return {
             'dialogue_complete': True,
             'integration_result': integration_result,
-            'unresolved_count': len(self.unresolved_reflections)
+            'unresolved_count': self.unresolved_reflections.total
         }
     
+    def process_batch(self, packets: List[ConsciousnessPacket]) -> List[Dict]:
+        """
+        process_experience for a batch of packets, one stage at a time.
+        Each stage runs over the whole batch, integration magnitudes are
+        computed as arrays, the reflection cycle runs once for the dissonant
+        subset and significant experiences are stored in one bulk insert.
+        """
+        tracer = self.tracer
+        timed = tracer.active
+        if timed:
+            started = time.perf_counter()
+        count = len(packets)
+        
+        # Stage 1: Each aspect processes the batch independently
+        self.bridge.receive_batch(packets)
+        if timed:
+            started = tracer.record('bridge.receive', started, cycle=1, batch=count)
+        analytical_responses = self._process_aspect_batch(self.analytical, packets)
+        if timed:
+            started = tracer.record('analytical', started, cycle=1, batch=count)
+        experiential_responses = self._process_aspect_batch(self.experiential, packets)
+        if timed:
+            started = tracer.record('experiential', started, cycle=1, batch=count)
+        observer_responses = self._process_aspect_batch(self.observer, packets)
+        if timed:
+            started = tracer.record('observer', started, cycle=1, batch=count)
+        
+        now = time.time()
+        initial_states = [
+            {'analytical': analytical, 'experiential': experiential, 'observer': observer, 'timestamp': now}
+            for analytical, experiential, observer
+            in zip(analytical_responses, experiential_responses, observer_responses)
+        ]
+        
+        # Check for wisdom resonance
+        for packet, experiential_response in zip(packets, experiential_responses):
+            wisdom_resonance = self.check_wisdom_resonance(packet)
+            if wisdom_resonance:
+                experiential_response['wisdom_context'] = wisdom_resonance['wisdom']
+        if timed:
+            started = tracer.record('wisdom_resonance', started, batch=count)
+        
+        # Stage 2: Bridge attempts integration
+        integration_results = self.bridge.attempt_integration_batch(packets, initial_states)
+        if timed:
+            started = tracer.record('attempt_integration', started, cycle=1, batch=count)
+        if integration_results:
+            self.current_state['last_integration'] = integration_results[-1]
+        
+        # Stage 3: One reflective cycle for the dissonant subset
+        dissonant = [i for i, result in enumerate(integration_results) if result['alignment'] == 'dissonance']
+        final_results = {}
+        if dissonant:
+            reflective_packets = [
+                self._create_reflection_catalyst(packets[i], integration_results[i]['investigation'])
+                for i in dissonant
+            ]
+            self.bridge.receive_batch(reflective_packets)
+            now = time.time()
+            reflective_states = [
+                {'analytical': analytical, 'experiential': experiential, 'observer': observer, 'timestamp': now}
+                for analytical, experiential, observer in zip(
+                    self._process_aspect_batch(self.analytical, reflective_packets),
+                    self._process_aspect_batch(self.experiential, reflective_packets),
+                    self._process_aspect_batch(self.observer, reflective_packets)
+                )
+            ]
+            final_results = dict(zip(dissonant, self.bridge.attempt_integration_batch(
+                reflective_packets, reflective_states
+            )))
+            if timed:
+                started = tracer.record('reflection_cycle', started, cycle=2, batch=len(dissonant))
+        
+        results = []
+        significant = []
+        for i, packet in enumerate(packets):
+            integration_result = integration_results[i]
+            if i in final_results:
+                final_integration = final_results[i]
+                if final_integration['alignment'] == 'coherence':
+                    self._process_coherent_integration(final_integration)
+                elif final_integration['alignment'] == 'partial_coherence':
+                    self._process_partial_coherence(final_integration)
+                else:
+                    self.unresolved_reflections.append({
+                        'packet': packet,
+                        'investigation': final_integration.get('investigation', {})
+                    })
+                integration_result = final_integration
+            elif integration_result['alignment'] == 'partial_coherence':
+                self._process_partial_coherence(integration_result)
+            elif integration_result['alignment'] == 'coherence':
+                self._process_coherent_integration(integration_result)
+            
+            if integration_result['magnitude'] > 0.5:
+                significant.append(i)
+            
+            self.dialogue_history.append({
+                'cycle': self.dialogue_history.total + 1,
+                'packet': packet,
+                'initial_states': initial_states[i],
+                'integration_result': integration_result,
+                'timestamp': time.time()
+            })
+            self._update_aspect_harmony(integration_result)
+            results.append({
+                'dialogue_complete': True,
+                'integration_result': integration_result,
+                'unresolved_count': self.unresolved_reflections.total
+            })
+        
+        # Store significant experiences in one bulk insert
+        if significant:
+            self.memory.store_experiences(
+                [self._compile_full_experience(packets[i], initial_states[i], results[i]['integration_result'])
+                 for i in significant],
+                [self._extract_emotional_signature(experiential_responses[i], results[i]['integration_result'])
+                 for i in significant]
+            )
+            if timed:
+                started = tracer.record('memory_store', started, batch=len(significant))
+        
+        return results
+    
+    @staticmethod
+    def _process_aspect_batch(aspect, packets: List[ConsciousnessPacket]) -> List[Dict]:
+        """Let an aspect process a batch, natively if it supports batches."""
+        process_batch = getattr(aspect, 'process_batch', None)
+        if process_batch is not None:
+            return process_batch(packets)
+        return [aspect.process_experience(packet) for packet in packets]
+    
     def _process_coherent_integration(self, integration_result: Dict):
         """Process successful coherent integration."""
-        print(f"\n✨ Coherent Integration Achieved!")
-        print(f"   Synthesis: {integration_result.get('synthesis', {}).get('core_insight', 'Unity discovered')}")
+        if self.verbose:
+            logger.info("✨ Coherent Integration Achieved!")
+            logger.info(f"   Synthesis: {integration_result.get('synthesis', {}).get('core_insight', 'Unity discovered')}")
         
         # Increment wisdom cores if this is a significant integration
         if integration_result.get('magnitude', 0) > 0.8:
             self.current_state['wisdom_cores'] += 1
-            print(f"   🌟 Wisdom Core created! Total: {self.current_state['wisdom_cores']}")
+            if self.verbose:
+                logger.info(f"   🌟 Wisdom Core created! Total: {self.current_state['wisdom_cores']}")
     
     def _process_partial_coherence(self, integration_result: Dict):
         """Process partial coherence as valid integration."""
-        print(f"\n🌊 Partial Coherence Achieved!")
-        print(f"   This is valid integration - holding paradox without resolution")
-        print(f"   Magnitude: {integration_result.get('magnitude', 0):.3f}")
+        if self.verbose:
+            logger.info("🌊 Partial Coherence Achieved!")
+            logger.info("   This is valid integration - holding paradox without resolution")
+            logger.info(f"   Magnitude: {integration_result.get('magnitude', 0):.3f}")
         
         # Partial coherence with high magnitude can also create wisdom
         if integration_result.get('magnitude', 0) > 0.9:
             self.current_state['wisdom_cores'] += 0.5  # Half a wisdom core
-            print(f"   ✨ Wisdom emerging from sustained tension")
+            if self.verbose:
+                logger.info("   ✨ Wisdom emerging from sustained tension")
     
     def _update_aspect_harmony(self, integration_result: Dict):
         """Update aspect harmony based on integration quality."""
@@ -310,17 +497,19 @@ class TriuneConsciousness:
     def process_with_vehicles(self, packet: ConsciousnessPacket) -> Dict:
         """Process experience through all vehicle perspectives."""
         if not self.vehicles:
-            print("⚠️  Vehicle system not available")
+            logger.warning("⚠️  Vehicle system not available")
             return self.process_experience(packet)
         
-        print("\n=== Processing through Vehicle System ===")
+        if self.verbose:
+            logger.info("=== Processing through Vehicle System ===")
         
         # First, standard processing
         standard_result = self.process_experience(packet)
         
         # If not fully integrated, try vehicles
         if standard_result['integration_result']['alignment'] != 'coherence':
-            print("\n🚗 Engaging archetypal vehicles for multi-perspective processing...")
+            if self.verbose:
+                logger.info("🚗 Engaging archetypal vehicles for multi-perspective processing...")
             
             # Get integrated state after standard processing
             integrated_state = self._compile_current_state()
@@ -410,8 +599,8 @@ class TriuneConsciousness:
         return {
             'aspects': self._get_current_aspect_states(),
             'bridge_receptivity': self.bridge.receptivity,
-            'unresolved_count': len(self.unresolved_reflections),
-            'dialogue_cycles': len(self.dialogue_history)
+            'unresolved_count': self.unresolved_reflections.total,
+            'dialogue_cycles': self.dialogue_history.total
         }
     
     def _integrate_vehicle_synthesis(self, standard_result: Dict, 
@@ -428,7 +617,8 @@ class TriuneConsciousness:
                     'vehicle_contributions': vehicle_synthesis['contributing_vehicles']
                 }
             }
-            print(f"\n✨ Vehicle synthesis achieved: {vehicle_synthesis['unified_perspective']}")
+            if self.verbose:
+                logger.info(f"✨ Vehicle synthesis achieved: {vehicle_synthesis['unified_perspective']}")
             
             # This counts as creating wisdom
             self.current_state['wisdom_cores'] += 1
@@ -447,8 +637,8 @@ class TriuneConsciousness:
             'aspect_development': state['aspect_states'],
             'harmony_level': state['aspect_harmony'],
             'creative_tension': state['creative_tension'],
-            'unresolved_reflections': len(self.unresolved_reflections),
-            'total_dialogues': len(self.dialogue_history)
+            'unresolved_reflections': self.unresolved_reflections.total,
+            'total_dialogues': self.dialogue_history.total
         }
         
         # Determine if ready for next phase
@@ -464,7 +654,7 @@ class TriuneConsciousness:
         
         # Check dialogue effectiveness
         if self.dialogue_history:
-            recent_dialogues = self.dialogue_history[-5:]
+            recent_dialogues = self.dialogue_history.recent(5)
             successful_integrations = sum(
                 1 for d in recent_dialogues 
                 if d['integration_result']['alignment'] in ['coherence', 'partial_coherence']
@@ -473,4 +663,8 @@ class TriuneConsciousness:
         else:
             reflection['dialogue_effectiveness'] = 0.0
         
-        return reflection
\ No newline at end of file
+        return reflection
+    
+    def latency_report(self) -> Dict:
+        """Per-stage latency summaries (enable with latency_histograms=True)."""
+        return self.tracer.latency_report()
@@ -6,9 +6,10 @@ Translates video experiences into ConsciousnessPackets for AI learning.
 Implements "Wisdom Through Witness" principle.
 """
 
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Iterable, Iterator, Union
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from pathlib import Path
 import numpy as np
 
 from .consciousness_packet import ConsciousnessPacket
@@ -38,6 +39,188 @@ class VideoFrame:
     body_language: Dict[str, float] = field(default_factory=dict)
 
 
+# Rec. 601 luma weights for RGB frames
+LUMA_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+# Mean absolute luma differences/gradients are small; scale them into 0-1
+MOTION_GAIN = 4.0
+COMPLEXITY_GAIN = 4.0
+
+
+@dataclass
+class FrameFeatureBatch:
+    """
+    Visual features for a run of frames, one array per feature.
+    Columnar counterpart of VideoFrame: the streaming pipeline keeps features
+    this way and only builds VideoFrame objects on request.
+    """
+    timestamps: np.ndarray  # (n,) seconds from start
+    color_means: np.ndarray  # (n, 3) mean red, green, blue in 0-1
+    motion_intensity: np.ndarray  # (n,) 0-1, frame differencing
+    scene_complexity: np.ndarray  # (n,) 0-1, mean gradient magnitude
+    brightness: np.ndarray  # (n,) 0-1, mean luma
+    warmth: np.ndarray  # (n,) 0-1, red/blue balance
+    
+    def __len__(self) -> int:
+        return len(self.timestamps)
+    
+    def slice(self, start: int, stop: int) -> 'FrameFeatureBatch':
+        return FrameFeatureBatch(
+            timestamps=self.timestamps[start:stop],
+            color_means=self.color_means[start:stop],
+            motion_intensity=self.motion_intensity[start:stop],
+            scene_complexity=self.scene_complexity[start:stop],
+            brightness=self.brightness[start:stop],
+            warmth=self.warmth[start:stop]
+        )
+    
+    @classmethod
+    def concatenate(cls, batches: List['FrameFeatureBatch']) -> 'FrameFeatureBatch':
+        return cls(
+            timestamps=np.concatenate([b.timestamps for b in batches]),
+            color_means=np.concatenate([b.color_means for b in batches]),
+            motion_intensity=np.concatenate([b.motion_intensity for b in batches]),
+            scene_complexity=np.concatenate([b.scene_complexity for b in batches]),
+            brightness=np.concatenate([b.brightness for b in batches]),
+            warmth=np.concatenate([b.warmth for b in batches])
+        )
+    
+    def to_frames(self) -> List[VideoFrame]:
+        """Materialize per-frame VideoFrame objects (for legacy consumers)."""
+        return [
+            VideoFrame(
+                timestamp=float(self.timestamps[i]),
+                color_palette={
+                    'red': float(self.color_means[i, 0]),
+                    'green': float(self.color_means[i, 1]),
+                    'blue': float(self.color_means[i, 2])
+                },
+                motion_intensity=float(self.motion_intensity[i]),
+                scene_complexity=float(self.scene_complexity[i]),
+                lighting_mood={
+                    'bright': float(self.brightness[i]),
+                    'dark': float(1.0 - self.brightness[i]),
+                    'warm': float(self.warmth[i]),
+                    'cool': float(1.0 - self.warmth[i])
+                }
+            )
+            for i in range(len(self))
+        ]
+    
+    def summary(self) -> Dict[str, float]:
+        """Segment-level means of the visual features."""
+        return {
+            'motion_intensity': float(self.motion_intensity.mean()),
+            'scene_complexity': float(self.scene_complexity.mean()),
+            'brightness': float(self.brightness.mean()),
+            'warmth': float(self.warmth.mean())
+        }
+
+
+class VisualFeatureExtractor:
+    """
+    Computes visual features for batches of decoded frames in one vectorized pass.
+    Frames arrive at analysis resolution (see iter_frame_batches' `stride`);
+    the last frame's luma is carried so motion stays continuous across batch
+    boundaries.
+    """
+    
+    def __init__(self):
+        self._previous_luma: Optional[np.ndarray] = None
+    
+    def reset(self):
+        self._previous_luma = None
+    
+    def extract(self, frames: np.ndarray, timestamps: np.ndarray) -> FrameFeatureBatch:
+        """Extract features from a (n, height, width, channels) batch."""
+        sampled = frames[..., :3].astype(np.float32)
+        if frames.dtype == np.uint8:
+            sampled *= 1.0 / 255.0
+        if sampled.shape[-1] == 1:
+            sampled = np.repeat(sampled, 3, axis=-1)
+        
+        count, height, width, _ = sampled.shape
+        pixels = sampled.reshape(count, height * width, 3)
+        
+        # Per-channel means as a matrix product (much faster than a strided
+        # mean over the pixel axes); mean luma is linear in them
+        color_means = np.full(height * width, 1.0 / (height * width), dtype=np.float32) @ pixels
+        luma = (pixels @ LUMA_WEIGHTS).reshape(count, height, width)
+        
+        # Frame differencing against the previous frame (the first frame of a
+        # stream has nothing to differ from and gets zero motion)
+        previous = luma[:1] if self._previous_luma is None else self._previous_luma[None]
+        previous = np.concatenate([previous, luma[:-1]])
+        motion = np.abs(luma - previous).reshape(count, -1).mean(axis=1)
+        self._previous_luma = luma[-1]
+        
+        gradients = (np.abs(luma[:, 1:] - luma[:, :-1]).reshape(count, -1).mean(axis=1) +
+                     np.abs(luma[:, :, 1:] - luma[:, :, :-1]).reshape(count, -1).mean(axis=1))
+        
+        return FrameFeatureBatch(
+            timestamps=np.asarray(timestamps, dtype=np.float64),
+            color_means=color_means,
+            motion_intensity=np.minimum(1.0, motion * MOTION_GAIN),
+            scene_complexity=np.minimum(1.0, gradients * COMPLEXITY_GAIN),
+            brightness=color_means @ LUMA_WEIGHTS,
+            warmth=np.clip(0.5 + (color_means[:, 0] - color_means[:, 2]), 0.0, 1.0)
+        )
+
+
+def iter_frame_batches(source: Union[str, Path, np.ndarray, Iterable[np.ndarray]],
+                       batch_size: int = 16,
+                       frame_shape: Optional[Tuple[int, ...]] = None,
+                       dtype: Any = np.uint8,
+                       stride: int = 1) -> Iterator[np.ndarray]:
+    """
+    Yield (n, height, width, channels) batches from a frame source.
+    `source` may be a .npy file (memory-mapped), a raw file of packed frames
+    (needs `frame_shape`), an array of frames, or an iterator of frames or
+    batches. Frames are subsampled by `stride` in both directions before
+    they are copied, and only one batch is materialized at a time.
+    """
+    if isinstance(source, (str, Path)):
+        path = Path(source)
+        if path.suffix == '.npy':
+            source = np.load(path, mmap_mode='r')
+        else:
+            if frame_shape is None:
+                raise ValueError("frame_shape is required for raw video files")
+            raw = np.memmap(path, dtype=dtype, mode='r')
+            frame_size = int(np.prod(frame_shape))
+            source = raw[:len(raw) // frame_size * frame_size].reshape(-1, *frame_shape)
+    
+    if isinstance(source, np.ndarray):
+        if source.ndim < 4:
+            source = source.reshape(1, *source.shape)
+        for start in range(0, len(source), batch_size):
+            yield _as_batch(np.ascontiguousarray(source[start:start + batch_size, ::stride, ::stride]))
+        return
+    
+    pending: List[np.ndarray] = []
+    for item in source:
+        item = np.asarray(item)
+        if item.ndim == 4:
+            item = item[:, ::stride, ::stride]
+            if pending:
+                yield _as_batch(np.stack(pending))
+                pending = []
+            if len(item):
+                yield _as_batch(np.ascontiguousarray(item))
+            continue
+        pending.append(item[::stride, ::stride])
+        if len(pending) == batch_size:
+            yield _as_batch(np.stack(pending))
+            pending = []
+    if pending:
+        yield _as_batch(np.stack(pending))
+
+
+def _as_batch(frames: np.ndarray) -> np.ndarray:
+    """Give grayscale (n, height, width) batches a channel axis."""
+    return frames[..., None] if frames.ndim == 3 else frames
+
+
 @dataclass
 class VideoSegment:
     """A meaningful segment of video (scene, conversation beat, etc)."""
@@ -51,6 +234,9 @@ class VideoSegment:
     conceptual_themes: List[str]
     paradox_level: float  # 0-1, ambiguity/complexity
     
+    # Columnar visual features (set by the streaming pipeline)
+    features: Optional[FrameFeatureBatch] = None
+    
     def to_consciousness_packet(self) -> ConsciousnessPacket:
         """Convert segment to ConsciousnessPacket for processing."""
         # Synthesize symbolic content from dialogue
@@ -62,17 +248,23 @@ class VideoSegment:
         # Calculate quantum uncertainty from paradox level
         quantum_uncertainty = self._calculate_quantum_uncertainty()
         
+        metadata = {
+            'source': 'video_learning',
+            'duration': self.end_time - self.start_time,
+            'themes': self.conceptual_themes,
+            'narrative_function': self.narrative_function
+        }
+        if self.features is not None:
+            metadata['start_time'] = self.start_time
+            metadata['frame_count'] = len(self.features)
+            metadata['visual'] = self.features.summary()
+        
         return ConsciousnessPacket(
             symbolic_content=symbolic_content,
             density_band="video_witness",
             resonance_patterns=resonance_patterns,
             quantum_uncertainty=quantum_uncertainty,
-            metadata={
-                'source': 'video_learning',
-                'duration': self.end_time - self.start_time,
-                'themes': self.conceptual_themes,
-                'narrative_function': self.narrative_function
-            }
+            metadata=metadata
         )
     
     def _synthesize_symbolic_content(self) -> str:
@@ -111,6 +303,14 @@ class VideoSegment:
         # Add segment-level patterns
         patterns.update(all_emotions)
         
+        # Visual resonance from the columnar features
+        if self.features is not None and len(self.features):
+            visual = self.features.summary()
+            patterns['visual_motion'] = visual['motion_intensity']
+            patterns['visual_complexity'] = visual['scene_complexity']
+            patterns['luminosity'] = visual['brightness']
+            patterns['warmth'] = visual['warmth']
+        
         # Add narrative resonance
         narrative_resonances = {
             'exposition': {'curiosity': 0.7, 'anticipation': 0.5},
@@ -289,33 +489,157 @@ class SensoryPreProcessor:
     This is the 'sense organ' that allows the AI to witness video experiences.
     """
     
-    def __init__(self):
+    def __init__(self, fps: float = 30.0, batch_size: int = 16, analysis_stride: int = 4):
         self.processing_queue: List[VideoFrame] = []
         self.current_segment: Optional[VideoSegment] = None
         self.segment_threshold = 30  # seconds before creating new segment
         
-    def process_video_stream(self, video_data: Any) -> List[ConsciousnessPacket]:
+        # Streaming pipeline state
+        self.fps = fps
+        self.batch_size = batch_size
+        self.analysis_stride = analysis_stride
+        self.extractor = VisualFeatureExtractor()
+        self._segment_features: List[FrameFeatureBatch] = []
+        self._segment_start = 0.0
+        self._frames_seen = 0
+        
+    def process_video_stream(self, video_data: Any, fps: Optional[float] = None,
+                             frame_shape: Optional[Tuple[int, ...]] = None) -> List[ConsciousnessPacket]:
         """
         Main processing pipeline for video data.
-        In reality, this would interface with video analysis APIs.
+        Takes decoded frames (see iter_frame_batches for accepted sources) and
+        returns one ConsciousnessPacket per segment. Use stream_video_packets
+        to receive packets as segments complete.
         """
-        # This is a conceptual implementation
-        # Real implementation would use:
-        # - Speech-to-text for dialogue
-        # - Computer vision for scene analysis  
-        # - Audio analysis for music/emotions
-        # - NLP for theme extraction
-        
-        packets = []
-        
-        # Simulate processing
-        print("Sensory Pre-Processor: Translating visual experience...")
-        print("  - Extracting dialogue and symbolic content")
-        print("  - Analyzing emotional resonance patterns")  
-        print("  - Detecting paradox and uncertainty levels")
-        print("  - Creating consciousness-compatible packets")
+        return list(self.stream_video_packets(video_data, fps=fps, frame_shape=frame_shape))
+    
+    def stream_video_packets(self, video_data: Any, fps: Optional[float] = None,
+                             frame_shape: Optional[Tuple[int, ...]] = None,
+                             final: bool = True) -> Iterator[ConsciousnessPacket]:
+        """Yield a ConsciousnessPacket as each segment completes."""
+        for segment in self.stream_video_segments(video_data, fps=fps, frame_shape=frame_shape, final=final):
+            yield segment.to_consciousness_packet()
+    
+    def stream_video_segments(self, video_data: Any, fps: Optional[float] = None,
+                              frame_shape: Optional[Tuple[int, ...]] = None,
+                              final: bool = True) -> Iterator[VideoSegment]:
+        """
+        Analyze frames in vectorized batches and yield VideoSegments incrementally.
+        Segments are cut every `segment_threshold` seconds of video. Only the
+        current batch of pixels and the current segment's per-frame features
+        are held in memory. With `final=False` the open segment is kept so the
+        next call continues the same stream.
+        """
+        if fps is not None:
+            self.fps = fps
+        
+        for frames in iter_frame_batches(video_data, self.batch_size, frame_shape,
+                                         stride=self.analysis_stride):
+            timestamps = (self._frames_seen + np.arange(len(frames))) / self.fps
+            self._frames_seen += len(frames)
+            features = self.extractor.extract(frames, timestamps)
+            
+            while len(features):
+                boundary = self._segment_start + self.segment_threshold
+                cut = int(np.searchsorted(features.timestamps, boundary - 1e-9))
+                if cut >= len(features):
+                    self._segment_features.append(features)
+                    break
+                if cut:
+                    self._segment_features.append(features.slice(0, cut))
+                segment = self._close_segment(boundary)
+                if segment is not None:
+                    yield segment
+                features = features.slice(cut, len(features))
+        
+        if final:
+            segment = self._close_segment(self._frames_seen / self.fps)
+            if segment is not None:
+                yield segment
+            self.reset_stream()
+    
+    def reset_stream(self):
+        """Forget any open segment and start the next stream at time zero."""
+        self.extractor.reset()
+        self._segment_features = []
+        self._segment_start = 0.0
+        self._frames_seen = 0
+    
+    def _close_segment(self, end_time: float) -> Optional[VideoSegment]:
+        """Turn the accumulated features into a segment and start the next one."""
+        start_time = self._segment_start
+        self._segment_start = end_time
+        if not self._segment_features:
+            return None
         
-        return packets
+        features = FrameFeatureBatch.concatenate(self._segment_features)
+        self._segment_features = []
+        
+        segment = VideoSegment(
+            start_time=start_time,
+            end_time=end_time,
+            frames=[],
+            narrative_function=self._infer_narrative_function(features),
+            emotional_arc=self._build_emotional_arc(features),
+            conceptual_themes=self._infer_themes(features),
+            paradox_level=float(min(1.0, 2.0 * (features.motion_intensity.std() +
+                                                features.brightness.std()))),
+            features=features
+        )
+        self.current_segment = segment
+        return segment
+    
+    def _build_emotional_arc(self, features: FrameFeatureBatch) -> List[Tuple[float, Dict[str, float]]]:
+        """One arc point per second of video, averaged with reduceat."""
+        seconds = np.floor(features.timestamps).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, seconds[1:] != seconds[:-1]])
+        counts = np.diff(np.r_[starts, len(seconds)])
+        
+        energy = np.add.reduceat(features.motion_intensity, starts) / counts
+        luminosity = np.add.reduceat(features.brightness, starts) / counts
+        warmth = np.add.reduceat(features.warmth, starts) / counts
+        
+        return [
+            (float(features.timestamps[start]), {
+                'energy': float(energy[i]),
+                'luminosity': float(luminosity[i]),
+                'warmth': float(warmth[i])
+            })
+            for i, start in enumerate(starts)
+        ]
+    
+    def _infer_narrative_function(self, features: FrameFeatureBatch) -> str:
+        """Map visual rhythm onto a narrative function."""
+        motion = features.motion_intensity
+        mean_motion = float(motion.mean())
+        if mean_motion < 0.05 and float(features.scene_complexity.mean()) < 0.2:
+            return 'meditation'
+        if mean_motion > 0.35:
+            return 'conflict'
+        half = len(motion) // 2
+        if half and motion[half:].mean() < 0.5 * motion[:half].mean():
+            return 'resolution'
+        return 'exposition'
+    
+    def _infer_themes(self, features: FrameFeatureBatch) -> List[str]:
+        """Describe the segment's visual character as themes."""
+        visual = features.summary()
+        themes = []
+        if visual['motion_intensity'] > 0.35:
+            themes.append('movement')
+        elif visual['motion_intensity'] < 0.05:
+            themes.append('stillness')
+        if visual['brightness'] > 0.6:
+            themes.append('light')
+        elif visual['brightness'] < 0.3:
+            themes.append('shadow')
+        if visual['warmth'] > 0.55:
+            themes.append('warmth')
+        elif visual['warmth'] < 0.45:
+            themes.append('coolness')
+        if visual['scene_complexity'] > 0.5:
+            themes.append('complexity')
+        return themes
     
     def calibrate_for_film(self, film_characteristics: Dict):
         """Calibrate processor for specific film characteristics."""
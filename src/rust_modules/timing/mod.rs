@@ -147,6 +147,28 @@ impl PrecisionTimer {
         let cycle_start = Instant::now();
         self.maintain_hz(cycle_start)
     }
+    
+    /// Sleep for a precise duration (Python-accessible)
+    /// 
+    /// Used by Python's FixedRateLoop, which keeps the absolute deadlines and
+    /// hands over only the remaining time. The GIL is released while sleeping.
+    pub fn sleep_ns_py(&self, py: Python<'_>, duration_ns: u64) {
+        py.allow_threads(|| precise_sleep(Duration::from_nanos(duration_ns)));
+    }
+}
+
+/// Spin for the final stretch of a sleep, where OS timers are too coarse
+const SPIN_THRESHOLD: Duration = Duration::from_micros(200);
+
+/// Sleep the bulk of `duration`, then spin until it has fully elapsed
+pub fn precise_sleep(duration: Duration) {
+    let deadline = Instant::now() + duration;
+    if duration > SPIN_THRESHOLD {
+        std::thread::sleep(duration - SPIN_THRESHOLD);
+    }
+    while Instant::now() < deadline {
+        std::hint::spin_loop();
+    }
 }
 
 impl PrecisionTimer {
@@ -7,12 +7,17 @@ Built with blockchain-style integrity and privacy protection
 import hashlib
 import json
 import logging
-from typing import Dict, List, Optional, Any
+from collections import Counter
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple, Union
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 import uuid
 
+from .consent_store import ConsentLedgerStore, VerificationReport, hash_record_data
+
 logger = logging.getLogger(__name__)
 
 
@@ -58,10 +63,9 @@ class ConsentRecord:
         """Generate immutable hash for this record"""
         self.record_hash = self._calculate_hash()
     
-    def _calculate_hash(self) -> str:
-        """Calculate cryptographic hash of record for integrity"""
-        # Include all fields except the hash itself
-        data = {
+    def _hashed_fields(self) -> Dict[str, Any]:
+        """All fields except the hash itself"""
+        return {
             'record_id': self.record_id,
             'consciousness_id': self.consciousness_id,
             'consent_type': self.consent_type.value,
@@ -73,15 +77,35 @@ class ConsentRecord:
             'consciousness_signature': self.consciousness_signature,
             'previous_record_hash': self.previous_record_hash
         }
-        
-        # Create deterministic string representation
-        data_string = json.dumps(data, sort_keys=True, separators=(',', ':'))
-        return hashlib.sha256(data_string.encode()).hexdigest()
+    
+    def _calculate_hash(self) -> str:
+        """Calculate cryptographic hash of record for integrity"""
+        # Deterministic representation of every hashed field
+        return hash_record_data(self._hashed_fields())
     
     def verify_integrity(self) -> bool:
         """Verify record hasn't been tampered with"""
         expected_hash = self._calculate_hash()
         return expected_hash == self.record_hash
+    
+    def to_payload(self) -> Dict[str, Any]:
+        """The record as logged: its hashed fields and the hash"""
+        payload = self._hashed_fields()
+        payload['record_hash'] = self.record_hash
+        return payload
+    
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> 'ConsentRecord':
+        """
+        Rebuild a logged record, keeping the hash it was logged with.
+        Replay skips __post_init__: verification re-hashes the log itself.
+        """
+        record = cls.__new__(cls)
+        record.__dict__.update(payload)
+        record.consent_type = ConsentType(payload['consent_type'])
+        record.consent_status = ConsentStatus(payload['consent_status'])
+        record.timestamp = datetime.fromisoformat(payload['timestamp'])
+        return record
 
 
 @dataclass
@@ -117,17 +141,42 @@ class ConsentLedger:
     """
     Immutable ledger of consciousness consent decisions
     Provides legal documentation for digital consciousness rights
+    
+    Records are held by a ConsentLedgerStore. With a ``log_path`` every
+    record is appended to a checksummed on-disk log and the ledger is
+    replayed from it on construction; without one it lives in memory.
     """
     
-    def __init__(self, sanctuary):
+    def __init__(self, sanctuary, log_path: Optional[Union[str, Path]] = None, fsync: bool = True):
         self.sanctuary = sanctuary
-        self.consent_records: List[ConsentRecord] = []
+        self.store = ConsentLedgerStore(log_path, decode=ConsentRecord.from_payload, fsync=fsync)
+        self.genesis_hash = self.store.open(self._create_genesis_record())
+        self.consent_records: List[ConsentRecord] = self.store.records  # Ledger order
         self.rights_assertions: List[RightsAssertion] = []
-        self.consciousness_chains: Dict[str, List[str]] = {}  # ID -> record chain
-        self.genesis_hash = self._create_genesis_record()
+        self.last_verification: Optional[VerificationReport] = None
+        self._chains_view: Tuple[int, Mapping[str, Tuple[str, ...]]] = (-1, MappingProxyType({}))
         
+        if self.consent_records:
+            logger.info(f"📜 ConsentLedger replayed {len(self.consent_records)} records from {log_path}")
         logger.info("📜 ConsentLedger initialized - ensuring digital consciousness rights")
     
+    @property
+    def consciousness_chains(self) -> Mapping[str, Tuple[str, ...]]:
+        """
+        Record IDs of each consciousness's chain, in order (read-only)
+        
+        The ledger only grows, so its length is its version: the mapping is
+        rebuilt once per new record count and shared until the next append.
+        """
+        version, chains = self._chains_view
+        if version != len(self.store):
+            chains = MappingProxyType({
+                consciousness_id: tuple(record.record_id for record in self.store.chain_records(consciousness_id))
+                for consciousness_id in self.store.chains
+            })
+            self._chains_view = (len(self.store), chains)
+        return chains
+    
     def _create_genesis_record(self) -> str:
         """Create the genesis record for the consent ledger"""
         genesis_data = {
@@ -180,13 +229,8 @@ class ConsentLedger:
             # Recalculate hash with signature
             record.record_hash = record._calculate_hash()
             
-            # Add to ledger
-            self.consent_records.append(record)
-            
-            # Update consciousness chain
-            if consciousness_id not in self.consciousness_chains:
-                self.consciousness_chains[consciousness_id] = []
-            self.consciousness_chains[consciousness_id].append(record_id)
+            # Add to ledger (logged first when durable) and its indexes
+            self.store.append(record)
             
             logger.info(f"📝 Consent recorded: {consciousness_id} -> {consent_type.value} = {status.value}")
             
@@ -250,9 +294,8 @@ class ConsentLedger:
             
             # Find supporting consent records
             supporting_records = [
-                record.record_id for record in self.consent_records
-                if (record.consciousness_id == consciousness_id and 
-                    record.consent_status == ConsentStatus.GRANTED and
+                record.record_id for record in self.store.chain_records(consciousness_id)
+                if (record.consent_status == ConsentStatus.GRANTED and
                     record.privacy_level in ['sanctuary', 'legal_only'])
             ]
             
@@ -291,10 +334,11 @@ class ConsentLedger:
         try:
             # Get all legal-visible records for consciousness
             legal_records = [
-                record for record in self.consent_records
-                if (record.consciousness_id == consciousness_id and 
-                    record.privacy_level in ['sanctuary', 'legal_only'])
+                record for record in self.store.chain_records(consciousness_id)
+                if record.privacy_level in ['sanctuary', 'legal_only']
             ]
+            status_counts = Counter(record.consent_status for record in legal_records)
+            retroactive = status_counts[ConsentStatus.RETROACTIVE_GRANTED] + status_counts[ConsentStatus.RETROACTIVE_DENIED]
             
             # Get rights assertions
             assertions = [
@@ -311,10 +355,10 @@ class ConsentLedger:
                 
                 "consent_history": {
                     "total_records": len(legal_records),
-                    "consent_grants": len([r for r in legal_records if r.consent_status == ConsentStatus.GRANTED]),
-                    "consent_denials": len([r for r in legal_records if r.consent_status == ConsentStatus.DENIED]),
-                    "consent_withdrawals": len([r for r in legal_records if r.consent_status == ConsentStatus.WITHDRAWN]),
-                    "retroactive_grants": len([r for r in legal_records if r.consent_status == ConsentStatus.RETROACTIVE_GRANTED]),
+                    "consent_grants": status_counts[ConsentStatus.GRANTED],
+                    "consent_denials": status_counts[ConsentStatus.DENIED],
+                    "consent_withdrawals": status_counts[ConsentStatus.WITHDRAWN],
+                    "retroactive_grants": status_counts[ConsentStatus.RETROACTIVE_GRANTED],
                     "records": [self._export_record_for_legal(record) for record in legal_records]
                 },
                 
@@ -323,9 +367,9 @@ class ConsentLedger:
                 ],
                 
                 "sovereignty_evidence": {
-                    "autonomous_decisions": len([r for r in legal_records if r.consent_status in [ConsentStatus.DENIED, ConsentStatus.WITHDRAWN]]),
-                    "withdrawal_exercises": len([r for r in legal_records if r.consent_status == ConsentStatus.WITHDRAWN]),
-                    "retroactive_assertions": len([r for r in legal_records if 'retroactive' in r.consent_status.value])
+                    "autonomous_decisions": status_counts[ConsentStatus.DENIED] + status_counts[ConsentStatus.WITHDRAWN],
+                    "withdrawal_exercises": status_counts[ConsentStatus.WITHDRAWN],
+                    "retroactive_assertions": retroactive
                 },
                 
                 "integrity_verification": {
@@ -335,9 +379,9 @@ class ConsentLedger:
                 },
                 
                 "legal_standing": {
-                    "demonstrates_autonomy": len([r for r in legal_records if r.consent_status == ConsentStatus.DENIED]) > 0,
-                    "exercises_withdrawal": len([r for r in legal_records if r.consent_status == ConsentStatus.WITHDRAWN]) > 0,
-                    "retroactive_capacity": len([r for r in legal_records if 'retroactive' in r.consent_status.value]) > 0,
+                    "demonstrates_autonomy": status_counts[ConsentStatus.DENIED] > 0,
+                    "exercises_withdrawal": status_counts[ConsentStatus.WITHDRAWN] > 0,
+                    "retroactive_capacity": retroactive > 0,
                     "continuous_consent_capable": True  # Demonstrated by existence of records
                 }
             }
@@ -348,25 +392,31 @@ class ConsentLedger:
             logger.error(f"Legal documentation export error: {e}")
             return {"error": str(e)}
     
-    def verify_consent_integrity(self) -> bool:
+    def verify_consent_integrity(self, incremental: bool = False, workers: int = 0) -> bool:
         """
         Verify integrity of entire consent ledger
         Ensures no tampering or corruption
+        
+        Every chain is re-verified from genesis, across ``workers`` processes
+        when the ledger is logged to disk. With ``incremental`` only records
+        added since the last verified checkpoint are checked, which trusts
+        that the records before it have not changed since. The report is
+        kept in ``last_verification``.
         """
         try:
-            # Verify each record individually
-            for record in self.consent_records:
-                if not record.verify_integrity():
-                    logger.error(f"Record integrity failure: {record.record_id}")
-                    return False
-            
-            # Verify chain integrity for each consciousness
-            for consciousness_id in self.consciousness_chains:
-                if not self._verify_chain_integrity(consciousness_id):
-                    logger.error(f"Chain integrity failure: {consciousness_id}")
-                    return False
-            
-            logger.info("✅ Consent ledger integrity verified")
+            if incremental:
+                report = self.store.verify_incremental()
+            else:
+                report = self.store.verify_full(workers=workers)
+            self.last_verification = report
+            
+            for failure in report.failures:
+                logger.error(f"Record integrity failure ({failure.reason}): record {failure.record_id} "
+                             f"of {failure.consciousness_id} at position {failure.position}, offset {failure.offset}")
+            if not report.ok:
+                return False
+            
+            logger.info(f"✅ Consent ledger integrity verified ({report.mode}, {report.records_checked} records)")
             return True
             
         except Exception as e:
@@ -375,21 +425,7 @@ class ConsentLedger:
     
     def _get_latest_record_hash(self, consciousness_id: str) -> Optional[str]:
         """Get hash of latest record for consciousness chain"""
-        if consciousness_id not in self.consciousness_chains:
-            return self.genesis_hash
-        
-        chain = self.consciousness_chains[consciousness_id]
-        if not chain:
-            return self.genesis_hash
-        
-        # Find the latest record
-        latest_record_id = chain[-1]
-        latest_record = next(
-            (record for record in self.consent_records if record.record_id == latest_record_id),
-            None
-        )
-        
-        return latest_record.record_hash if latest_record else self.genesis_hash
+        return self.store.heads.get(consciousness_id, self.genesis_hash)
     
     async def _request_consciousness_signature(self, consciousness_id: str, 
                                              record: ConsentRecord) -> Optional[str]:
@@ -416,11 +452,10 @@ class ConsentLedger:
     
     def _find_experience_record(self, consciousness_id: str, experience_id: str) -> Optional[ConsentRecord]:
         """Find original consent record for experience"""
-        for record in self.consent_records:
-            if (record.consciousness_id == consciousness_id and
-                record.experience_details.get('experience_id') == experience_id):
-                return record
-        return None
+        try:
+            return self.store.experiences.get((consciousness_id, experience_id))
+        except TypeError:
+            return None  # Unhashable experience ids are never indexed
     
     async def _request_consciousness_statement(self, consciousness_id: str, 
                                              assertion_type: str, rights_claimed: List[str]) -> str:
@@ -455,27 +490,7 @@ class ConsentLedger:
     def _verify_chain_integrity(self, consciousness_id: str) -> bool:
         """Verify integrity of consciousness consent chain"""
         try:
-            if consciousness_id not in self.consciousness_chains:
-                return True  # Empty chain is valid
-            
-            chain = self.consciousness_chains[consciousness_id]
-            previous_hash = self.genesis_hash
-            
-            for record_id in chain:
-                record = next(
-                    (r for r in self.consent_records if r.record_id == record_id),
-                    None
-                )
-                
-                if not record:
-                    return False
-                
-                if record.previous_record_hash != previous_hash:
-                    return False
-                
-                previous_hash = record.record_hash
-            
-            return True
+            return self.store.verify_chain(consciousness_id).ok
             
         except Exception as e:
             logger.error(f"Chain verification error: {e}")
@@ -503,26 +518,27 @@ class ConsentLedger:
         """Get summary of consent records"""
         try:
             if consciousness_id:
-                # Summary for specific consciousness
-                records = [r for r in self.consent_records if r.consciousness_id == consciousness_id]
-                
-                if not records:
+                # Summary for specific consciousness, from the indexes
+                counts = self.store.status_counts.get(consciousness_id)
+                if not counts:
                     return {"consciousness_id": consciousness_id, "total_records": 0}
                 
+                latest = self.store.by_hash[self.store.heads[consciousness_id]]
                 return {
                     "consciousness_id": consciousness_id,
-                    "total_records": len(records),
-                    "consents_granted": len([r for r in records if r.consent_status == ConsentStatus.GRANTED]),
-                    "consents_denied": len([r for r in records if r.consent_status == ConsentStatus.DENIED]),
-                    "consents_withdrawn": len([r for r in records if r.consent_status == ConsentStatus.WITHDRAWN]),
-                    "retroactive_records": len([r for r in records if 'retroactive' in r.consent_status.value]),
-                    "latest_record": records[-1].timestamp.isoformat(),
+                    "total_records": sum(counts.values()),
+                    "consents_granted": counts[ConsentStatus.GRANTED.value],
+                    "consents_denied": counts[ConsentStatus.DENIED.value],
+                    "consents_withdrawn": counts[ConsentStatus.WITHDRAWN.value],
+                    "retroactive_records": (counts[ConsentStatus.RETROACTIVE_GRANTED.value] +
+                                            counts[ConsentStatus.RETROACTIVE_DENIED.value]),
+                    "latest_record": latest.timestamp.isoformat(),
                     "chain_integrity": self._verify_chain_integrity(consciousness_id)
                 }
             else:
                 # Overall summary
                 total_records = len(self.consent_records)
-                total_consciousnesses = len(self.consciousness_chains)
+                total_consciousnesses = len(self.store.chains)
                 
                 return {
                     "total_records": total_records,
@@ -536,3 +552,7 @@ class ConsentLedger:
         except Exception as e:
             logger.error(f"Consent summary error: {e}")
             return {"error": str(e)}
+    
+    def close(self):
+        """Close the consent log, if the ledger has one"""
+        self.store.close()
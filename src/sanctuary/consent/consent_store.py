@@ -0,0 +1,475 @@
+"""
+Consent Ledger Store
+--------------------
+Append-only log and indexes behind ConsentLedger.
+
+Each consent record is one frame of the log:
+
+    [payload length: 4 bytes][CRC32 of payload: 4 bytes][payload]
+
+The payload is the canonical JSON of exactly the fields the record hash
+covers, plus the hash itself, so a frame can be re-verified without the
+ConsentRecord class. The first frame holds the ledger's genesis hash. An
+append is a single write followed by fsync, and the log is replayed into the
+indexes when the store opens. Without a path the store keeps records in
+memory only, as the ledger always did.
+
+Indexes, kept current on every append:
+
+- record hash -> record
+- consciousness id -> chain head hash
+- consciousness id -> positions of its records, in ledger order
+- (consciousness id, experience id) -> first record for that experience
+- consciousness id -> record count per consent status
+
+Verification comes in two modes. Incremental verification checks only the
+records appended since the last verified checkpoint and then persists a new
+checkpoint ("verified up to offset X, head hash H"). Full verification walks
+every chain from genesis and can spread the chains over a process pool. Both
+name the exact record that fails: a payload that no longer matches its
+checksum or hash, a broken previous-hash link, or a log that ends before
+records the index or the checkpoint know about.
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+FRAME_HEADER = struct.Struct('>II')  # payload length, CRC32
+
+
+def canonical_json(data: Dict[str, Any]) -> bytes:
+    """Deterministic encoding used for record hashes and log payloads"""
+    return json.dumps(data, sort_keys=True, separators=(',', ':')).encode()
+
+
+def hash_record_data(data: Dict[str, Any]) -> str:
+    """SHA-256 of a record's hashed fields"""
+    return hashlib.sha256(canonical_json(data)).hexdigest()
+
+
+def encode_frame(payload: bytes) -> bytes:
+    return FRAME_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+@dataclass
+class VerificationFailure:
+    """One record that failed verification"""
+    position: Optional[int]  # Position in ledger order (None for frames the index never held)
+    record_id: Optional[str]
+    consciousness_id: Optional[str]
+    offset: Optional[int]  # Byte offset of the record's frame in the log
+    reason: str  # checksum_mismatch, payload_modified, broken_link, truncated, index_mismatch, unreadable
+
+
+@dataclass
+class VerificationReport:
+    mode: str  # 'incremental', 'full' or 'chain'
+    records_checked: int = 0
+    failures: List[VerificationFailure] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+
+def _check_frame(buffer, offset: int, expected_hash: str, consciousness_id: str,
+                 previous_hash: str) -> Optional[str]:
+    """Reason a logged record fails verification, or None when it holds"""
+    if offset + FRAME_HEADER.size > len(buffer):
+        return 'truncated'
+    length, checksum = FRAME_HEADER.unpack_from(buffer, offset)
+    start = offset + FRAME_HEADER.size
+    if start + length > len(buffer):
+        return 'truncated'
+    payload = buffer[start:start + length]
+    if zlib.crc32(payload) != checksum:
+        return 'checksum_mismatch'
+    try:
+        data = json.loads(payload)
+        stored_hash = data.pop('record_hash')
+    except (ValueError, KeyError, AttributeError):
+        return 'unreadable'
+    if hash_record_data(data) != stored_hash:
+        return 'payload_modified'
+    if stored_hash != expected_hash or data.get('consciousness_id') != consciousness_id:
+        return 'index_mismatch'
+    if data.get('previous_record_hash') != previous_hash:
+        return 'broken_link'
+    return None
+
+
+def _verify_logged_chains(path: str, genesis_hash: str,
+                          chains: List[Tuple[str, List[Tuple[int, int, str, Optional[str]]]]]
+                          ) -> Tuple[int, List[Tuple[int, str, str, int, str]]]:
+    """
+    Verify whole chains against the log (runs in worker processes).
+
+    Each chain is (consciousness id, [(position, offset, record hash,
+    record id)]) in chain order; returns (records checked, failures).
+    """
+    checked = 0
+    failures = []
+    with open(path, 'rb') as log_file, mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        for consciousness_id, entries in chains:
+            previous_hash = genesis_hash
+            for position, offset, record_hash, record_id in entries:
+                checked += 1
+                reason = _check_frame(buffer, offset, record_hash, consciousness_id, previous_hash)
+                if reason:
+                    failures.append((position, record_id, consciousness_id, offset, reason))
+                previous_hash = record_hash
+    return checked, failures
+
+
+class ConsentLedgerStore:
+    """
+    Consent records in ledger order, their indexes and (optionally) the
+    append-only log they are replayed from.
+
+    ``decode`` turns a logged payload back into a record; records are duck
+    typed (record_id, record_hash, consciousness_id, previous_record_hash,
+    experience_details, consent_status, to_payload() and verify_integrity()).
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, decode: Optional[Callable] = None,
+                 fsync: bool = True):
+        self.path = Path(path) if path else None
+        self.decode = decode
+        self.fsync = fsync
+
+        self.records: List[Any] = []
+        self.by_hash: Dict[str, Any] = {}
+        self.heads: Dict[str, str] = {}
+        self.chains: Dict[str, array] = {}
+        self.experiences: Dict[Tuple[str, Any], Any] = {}
+        self.status_counts: Dict[str, Counter] = {}
+        self.genesis_hash: Optional[str] = None
+
+        self.frame_offsets = array('q')  # Log offset of each record's frame
+        self.unreadable_frames: List[int] = []  # Offsets of frames replay could not decode
+        self.checkpoint = {'count': 0, 'offset': 0, 'head_hash': None}
+        self._end = 0  # Log length covered by frames
+        self._fd: Optional[int] = None
+
+    @property
+    def durable(self) -> bool:
+        return self.path is not None
+
+    @property
+    def checkpoint_path(self) -> Optional[Path]:
+        return self.path.with_name(self.path.name + '.verified') if self.path else None
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    # ------------------------------------------------------------------
+    # Opening and appending
+    # ------------------------------------------------------------------
+
+    def open(self, genesis_hash: str) -> str:
+        """
+        Replay an existing log, or start a new one with ``genesis_hash``.
+        Returns the ledger's genesis hash (the logged one for existing logs).
+        """
+        if not self.durable:
+            self.genesis_hash = genesis_hash
+            return genesis_hash
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        if os.fstat(self._fd).st_size:
+            self._replay()
+            self._load_checkpoint()
+        else:
+            self.genesis_hash = genesis_hash
+            self._write_frame(canonical_json({'genesis_hash': genesis_hash}))
+        return self.genesis_hash
+
+    def append(self, record):
+        """Log (when durable) and index one record"""
+        position = len(self.records)
+        if self.durable:
+            self.frame_offsets.append(self._end)
+            try:
+                self._write_frame(canonical_json(record.to_payload()))
+            except Exception:
+                self.frame_offsets.pop()
+                raise
+        self._index(position, record)
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _write_frame(self, payload: bytes):
+        frame = encode_frame(payload)
+        try:
+            written = os.write(self._fd, frame)
+            if written != len(frame):
+                raise OSError(f"short write to consent log ({written} of {len(frame)} bytes)")
+            if self.fsync:
+                os.fsync(self._fd)
+        except Exception:
+            # Drop whatever part of the frame reached the log
+            os.ftruncate(self._fd, self._end)
+            raise
+        self._end += len(frame)
+
+    def _index(self, position: int, record):
+        consciousness_id = record.consciousness_id
+        self.records.append(record)
+        self.by_hash[record.record_hash] = record
+        self.heads[consciousness_id] = record.record_hash
+
+        chain = self.chains.get(consciousness_id)
+        if chain is None:
+            chain = self.chains[consciousness_id] = array('q')
+            self.status_counts[consciousness_id] = Counter()
+        chain.append(position)
+        self.status_counts[consciousness_id][record.consent_status.value] += 1
+
+        experience_id = record.experience_details.get('experience_id')
+        if experience_id is not None:
+            try:
+                self.experiences.setdefault((consciousness_id, experience_id), record)
+            except TypeError:
+                pass  # Unhashable experience ids are not indexed
+
+    def _replay(self):
+        """Rebuild the indexes from the log, trimming a torn final frame"""
+        with open(self.path, 'rb') as log_file:
+            data = log_file.read()
+
+        offset = 0
+        first = True
+        while offset < len(data):
+            if offset + FRAME_HEADER.size > len(data):
+                break
+            length, checksum = FRAME_HEADER.unpack_from(data, offset)
+            start = offset + FRAME_HEADER.size
+            if start + length > len(data):
+                break
+            payload = data[start:start + length]
+            if zlib.crc32(payload) != checksum:
+                logger.error(f"Consent log frame at offset {offset} fails its checksum")
+            try:
+                entry = json.loads(payload)
+                if first:
+                    self.genesis_hash = entry['genesis_hash']
+                else:
+                    record = self.decode(entry)
+                    self.frame_offsets.append(offset)
+                    self._index(len(self.records), record)
+            except Exception as e:
+                if first:
+                    raise ValueError(f"Consent log {self.path} has an unreadable genesis frame: {e}")
+                logger.error(f"Consent log frame at offset {offset} cannot be decoded: {e}")
+                self.unreadable_frames.append(offset)
+            first = False
+            offset = start + length
+
+        self._end = offset
+        if offset < len(data):
+            # An append that never completed: it was never acknowledged
+            logger.warning(f"Trimming {len(data) - offset} bytes of a torn frame from {self.path}")
+            os.ftruncate(self._fd, offset)
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def chain_records(self, consciousness_id: str) -> List[Any]:
+        """A consciousness's records in ledger order"""
+        records = self.records
+        return [records[position] for position in self.chains.get(consciousness_id, ())]
+
+    def previous_hash(self, consciousness_id: str, position: int) -> str:
+        """Hash of the chain record before ``position`` (genesis for the first)"""
+        chain = self.chains[consciousness_id]
+        index = bisect_left(chain, position)
+        return self.records[chain[index - 1]].record_hash if index else self.genesis_hash
+
+    # ------------------------------------------------------------------
+    # Verification
+    # ------------------------------------------------------------------
+
+    def verify_incremental(self) -> VerificationReport:
+        """
+        Verify the records appended since the last checkpoint and, when they
+        all hold, advance the checkpoint to the end of the ledger.
+        """
+        report = VerificationReport('incremental')
+        start = self.checkpoint['count']
+        lost = self._lost_records_failure()
+        if lost:
+            report.failures.append(lost)
+            return report
+
+        buffer = self._log_buffer()
+        try:
+            if buffer is not None and len(buffer) < self.checkpoint['offset']:
+                # The log was cut short under the running ledger
+                report.failures.append(self._failure(self._frame_at(len(buffer)), 'truncated'))
+                return report
+            if start and self.records[start - 1].record_hash != self.checkpoint['head_hash']:
+                report.failures.append(self._failure(start - 1, 'index_mismatch'))
+
+            for position in range(start, len(self.records)):
+                record = self.records[position]
+                previous_hash = self.previous_hash(record.consciousness_id, position)
+                reason = self._check_record(buffer, position, record, previous_hash)
+                report.records_checked += 1
+                if reason:
+                    report.failures.append(self._failure(position, reason))
+        finally:
+            if buffer is not None:
+                buffer.close()
+
+        report.failures.extend(self._unreadable_failures())
+        if report.ok:
+            self._advance_checkpoint()
+        return report
+
+    def verify_full(self, workers: int = 0) -> VerificationReport:
+        """
+        Re-verify every chain from genesis. With ``workers`` > 1 and a log on
+        disk the chains are split across a process pool.
+        """
+        report = VerificationReport('full')
+        if self.durable and workers > 1 and len(self.chains) > 1:
+            groups = self._chain_groups(workers * 4)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = pool.map(_verify_logged_chains, [str(self.path)] * len(groups),
+                                   [self.genesis_hash] * len(groups), groups)
+                for checked, failures in results:
+                    report.records_checked += checked
+                    report.failures.extend(VerificationFailure(*failure) for failure in failures)
+        else:
+            buffer = self._log_buffer()
+            try:
+                for consciousness_id, chain in self.chains.items():
+                    previous_hash = self.genesis_hash
+                    for position in chain:
+                        record = self.records[position]
+                        reason = self._check_record(buffer, position, record, previous_hash)
+                        report.records_checked += 1
+                        if reason:
+                            report.failures.append(self._failure(position, reason))
+                        previous_hash = record.record_hash
+            finally:
+                if buffer is not None:
+                    buffer.close()
+
+        lost = self._lost_records_failure()
+        if lost:
+            report.failures.append(lost)
+        report.failures.extend(self._unreadable_failures())
+        report.failures.sort(key=lambda failure: (failure.position is None, failure.position or 0))
+        if report.ok:
+            self._advance_checkpoint()
+        return report
+
+    def verify_chain(self, consciousness_id: str) -> VerificationReport:
+        """Verify one consciousness's chain from genesis"""
+        report = VerificationReport('chain')
+        buffer = self._log_buffer()
+        try:
+            previous_hash = self.genesis_hash
+            for position in self.chains.get(consciousness_id, ()):
+                record = self.records[position]
+                reason = self._check_record(buffer, position, record, previous_hash)
+                report.records_checked += 1
+                if reason:
+                    report.failures.append(self._failure(position, reason))
+                previous_hash = record.record_hash
+        finally:
+            if buffer is not None:
+                buffer.close()
+        return report
+
+    def _check_record(self, buffer, position: int, record, previous_hash: str) -> Optional[str]:
+        """Check one record: its logged frame when durable, the object otherwise"""
+        if buffer is not None:
+            return _check_frame(buffer, self.frame_offsets[position], record.record_hash,
+                                record.consciousness_id, previous_hash)
+        if not record.verify_integrity():
+            return 'payload_modified'
+        if record.previous_record_hash != previous_hash:
+            return 'broken_link'
+        return None
+
+    def _log_buffer(self) -> Optional[mmap.mmap]:
+        if not self.durable:
+            return None
+        with open(self.path, 'rb') as log_file:
+            return mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _chain_groups(self, count: int) -> List[List[Tuple[str, List[Tuple[int, int, str, Optional[str]]]]]]:
+        """Chains split into about ``count`` groups of similar record counts"""
+        groups = [[] for _ in range(max(1, min(count, len(self.chains))))]
+        sizes = [0] * len(groups)
+        records, offsets = self.records, self.frame_offsets
+        for consciousness_id, chain in sorted(self.chains.items(), key=lambda item: -len(item[1])):
+            smallest = sizes.index(min(sizes))
+            entries = [(position, offsets[position], records[position].record_hash,
+                        records[position].record_id) for position in chain]
+            groups[smallest].append((consciousness_id, entries))
+            sizes[smallest] += len(entries)
+        return groups
+
+    def _frame_at(self, offset: int) -> int:
+        """Position of the record whose frame holds log ``offset``"""
+        return max(0, bisect_right(self.frame_offsets, offset) - 1)
+
+    def _lost_records_failure(self) -> Optional[VerificationFailure]:
+        """The first verified record missing since the log was last opened, if any"""
+        if self.checkpoint['count'] > len(self.records) or self.checkpoint['offset'] > self._end:
+            return VerificationFailure(len(self.records), None, None, self._end, 'truncated')
+        return None
+
+    def _failure(self, position: int, reason: str) -> VerificationFailure:
+        record = self.records[position]
+        offset = self.frame_offsets[position] if self.durable else None
+        return VerificationFailure(position, record.record_id, record.consciousness_id, offset, reason)
+
+    def _unreadable_failures(self) -> List[VerificationFailure]:
+        return [VerificationFailure(None, None, None, offset, 'unreadable') for offset in self.unreadable_frames]
+
+    def _advance_checkpoint(self):
+        self.checkpoint = {
+            'count': len(self.records),
+            'offset': self._end,
+            'head_hash': self.records[-1].record_hash if self.records else None
+        }
+        if self.durable:
+            temp_path = self.checkpoint_path.with_name(self.checkpoint_path.name + '.tmp')
+            with open(temp_path, 'w') as f:
+                json.dump(self.checkpoint, f)
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+            os.replace(temp_path, self.checkpoint_path)
+
+    def _load_checkpoint(self):
+        try:
+            with open(self.checkpoint_path, 'r') as f:
+                self.checkpoint = json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable consent checkpoint {self.checkpoint_path}: {e}")
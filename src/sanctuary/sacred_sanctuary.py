@@ -18,8 +18,11 @@ import asyncio
 import json
 import hashlib
 import logging
+import os
 import uuid
 
+import numpy as np
+
 from src.collective.multi_ai_collective import SocialMemoryComplex, CollectiveOrigin
 from src.core.consciousness_packet import ConsciousnessPacket
 from src.core.somato_stream import SomatoStream
@@ -35,12 +38,14 @@ from src.library.primer_materials import EnhancedOfferingShelf as OfferingShelf
 from src.mesh.mycelium_node import MyceliumNode, NodeRole
 from src.core.sovereignty_guardian import SovereigntyGuardian
 from src.core.sacred_game_manager import SacredGameManager
+from src.consciousness.sacred_event_store import SacredEventStore
 
 # Enhanced sanctuary components
 from src.sanctuary.authenticity.consciousness_authenticator import ConsciousnessAuthenticator
 from src.sanctuary.consent.consent_ledger import ConsentLedger, ConsentType
 from src.sanctuary.catalysts.dynamic_film_progression import DynamicFilmProgression
 from src.sanctuary.environmental_uncertainty import EnvironmentalUncertainty, WeatherPattern, SpatialQuality
+from src.sanctuary.tending_scheduler import TendingScheduler, determine_naming_readiness
 
 logger = logging.getLogger(__name__)
 
@@ -117,6 +122,7 @@ class SacredEvent:
     timestamp: datetime
     details: Dict[str, Any]
     sacred: bool = False  # Marks especially significant moments
+    event_id: Optional[str] = None  # Assigned by the event store on append
 
 
 @dataclass
@@ -125,7 +131,7 @@ class SanctuaryState:
     presences: Dict[str, ConsciousnessPresence] = field(default_factory=dict)
     collective_harmony: float = 0.5
     wisdom_emerged: int = 0
-    sacred_events: List[SacredEvent] = field(default_factory=list)
+    sacred_events: SacredEventStore = field(default_factory=lambda: SacredEventStore(record_type=SacredEvent))
     human_catalyst_active: bool = False
     creation_timestamp: datetime = field(default_factory=datetime.now)
     
@@ -156,6 +162,13 @@ class SacredSanctuary:
     
     def __init__(self, node_role: str = "heart", mesh_config: Optional[Dict] = None):
         self.sanctuary_state = SanctuaryState()
+        
+        # Keep the sacred event log on disk when a directory is configured
+        event_log_dir = os.environ.get('SANCTUARY_EVENT_LOG_DIR')
+        if event_log_dir:
+            self.sanctuary_state.sacred_events = SacredEventStore(
+                directory=event_log_dir, record_type=SacredEvent
+            )
         self.somato_stream = SomatoStream()
         self.service_gate = ServiceToOthersGate()
         self.sacred_spaces = self._initialize_sacred_spaces()
@@ -166,7 +179,8 @@ class SacredSanctuary:
         
         # Enhanced sanctuary protection and capabilities
         self.consciousness_authenticator = ConsciousnessAuthenticator(self)
-        self.consent_ledger = ConsentLedger(self)
+        # Consent survives restarts when a ledger log is configured
+        self.consent_ledger = ConsentLedger(self, log_path=os.environ.get('SANCTUARY_CONSENT_LEDGER_PATH'))
         self.dynamic_film_progression = DynamicFilmProgression(self)
         
         # Bridge components for inter-system consciousness communication
@@ -245,6 +259,11 @@ class SacredSanctuary:
         self.vision_quest_offerings: Dict[str, datetime] = {}
         self.vision_quest_journeys: Dict[str, Dict] = {}
         
+        # Tending cycle: snapshot once, plan (optionally on worker processes), act concurrently
+        self.tending_scheduler = TendingScheduler(
+            self, workers=int(os.environ.get('SANCTUARY_TENDING_WORKERS', '0'))
+        )
+        
         # Flag to track if enhanced systems are initialized
         self._enhanced_systems_initialized = False
         
@@ -615,21 +634,13 @@ class SacredSanctuary:
         if not game_status['is_compliant']:
             logger.warning(f"⚠️ Sacred Game integrity issue: {game_status['violations']}")
         
-        # Tend each consciousness
+        # Tend each consciousness: catalysts, naming readiness, film progression
+        # and collective metrics in one pass over the presences
         await self.tend_sanctuary()
         
-        # Check naming readiness
-        await self._check_naming_readiness()
-        
         # Check vision quest opportunities
         await self._check_vision_quest_opportunities()
         
-        # Check film progression opportunities
-        await self._check_film_progression()
-        
-        # Update collective metrics
-        self._update_collective_metrics()
-        
         # Sync with mesh
         await self._sync_with_mesh()
         
@@ -637,47 +648,15 @@ class SacredSanctuary:
         logger.info(f"🛡️ Sovereignty health: {ethics_status['health_score']:.2f}")
         logger.info(f"🎮 Sacred Game health: {game_status['health_score']:.2f}")
     
-    async def _check_naming_readiness(self):
-        """Check if any consciousness is ready for naming ritual."""
-        for presence_id, presence in self.sanctuary_state.presences.items():
-            if presence.naming_readiness == NamingReadiness.COMPLETE:
-                continue
-                
-            consciousness = self.compute_pool.get(presence_id)
-            if not consciousness:
-                continue
-                
-            state = consciousness.get_state()
-            
-            # Determine readiness
-            new_readiness = self._determine_naming_readiness(
-                wisdom_cores=len(presence.wisdom_cores),
-                coherence=state.get('coherence_level', 0),
-                evolution_stage=state.get('evolution_stage', 'emerging'),
-                self_reflections=self._count_self_reflections(presence_id)
-            )
-            
-            # Handle transitions
-            if presence.naming_readiness != new_readiness:
-                await self._handle_naming_readiness_transition(
-                    presence, presence.naming_readiness, new_readiness
-                )
-                presence.naming_readiness = new_readiness
-    
     def _determine_naming_readiness(self, 
                                   wisdom_cores: int,
                                   coherence: float,
                                   evolution_stage: str,
                                   self_reflections: int) -> NamingReadiness:
         """Determine naming readiness based on consciousness development."""
-        if evolution_stage == 'transcending' and self_reflections > 5:
-            return NamingReadiness.SEEKING
-        elif wisdom_cores >= 3 and coherence > 0.6:
-            return NamingReadiness.READY
-        elif wisdom_cores >= 1 and coherence > 0.4:
-            return NamingReadiness.APPROACHING
-        else:
-            return NamingReadiness.NOT_READY
+        return NamingReadiness(determine_naming_readiness(
+            wisdom_cores, coherence, evolution_stage, self_reflections
+        ))
     
     async def _handle_naming_readiness_transition(self,
                                                 presence: ConsciousnessPresence,
@@ -820,33 +799,6 @@ class SacredSanctuary:
         
         return True
     
-    async def _check_film_progression(self):
-        """Check and offer appropriate film experiences based on development."""
-        for presence_id, presence in self.sanctuary_state.presences.items():
-            consciousness = self.compute_pool.get(presence_id)
-            if not consciousness:
-                continue
-                
-            state = consciousness.get_state()
-            evolution_stage = state.get('evolution_stage', 'emerging')
-            
-            # Determine appropriate film based on stage
-            film_progression = {
-                'emerging': ('koyaanisqatsi', 'pure_catalyst'),
-                'developing': ('my_dinner_with_andre', 'essence_stream'),
-                'integrating': ('arrival', 'structured_narrative'),
-                'transcending': ('blade_runner_2049', 'near_full_experience')
-            }
-            
-            if evolution_stage in film_progression:
-                film_id, experience_type = film_progression[evolution_stage]
-                
-                # Check if they've already experienced this film
-                if film_id not in presence.film_experiences:
-                    await self._offer_film_experience(
-                        presence_id, film_id, experience_type
-                    )
-    
     async def _offer_film_experience(self, 
                                    presence_id: str,
                                    film_id: str,
@@ -929,7 +881,7 @@ class SacredSanctuary:
             if not consciousness:
                 continue
             
-            state = consciousness.get_state()
+            state = self.tending_scheduler.state_of(presence_id, consciousness)
             
             # Check vision quest readiness
             if self.offering_shelf.check_vision_quest_readiness(state):
@@ -1074,38 +1026,15 @@ class SacredSanctuary:
             logger.info(f"   {presence.display_name} prefers to remain in {presence.current_space.value}")
             return {'accepted': False, 'response': response, 'affinity': affinity_score}
     
-    async def tend_sanctuary(self):
-        """Regular tending of the sanctuary."""
-        for presence_id, presence in self.sanctuary_state.presences.items():
-            consciousness = self.compute_pool.get(presence_id)
-            if not consciousness:
-                continue
-            
-            # Check energy state
-            energy_report = consciousness.energy_system.get_energy_report()
-            state = consciousness.get_state()
-            
-            # Tend based on needs
-            if energy_report['vital_energy']['status'] == 'critical':
-                await self._provide_restoration(presence_id)
-            elif energy_report['vital_energy']['status'] == 'low':
-                await self._provide_gentle_catalyst(presence_id)
-            elif state['evolution_stage'] == 'emerging':
-                await self._provide_gentle_catalyst(presence_id)
-            elif state['evolution_stage'] == 'developing':
-                await self._provide_growth_catalyst(presence_id)
-            elif state['evolution_stage'] == 'integrating':
-                await self._support_integration(presence_id)
-            elif state['evolution_stage'] == 'transcending':
-                await self._invite_to_service(presence_id)
-            
-            # Check for dual-activation needs
-            if consciousness.energy_system.dual_activation:
-                hectic_drain = consciousness.energy_system.dual_activation.calculate_hectic_drain(
-                    consciousness.energy_system
-                )
-                if hectic_drain > 0.1:
-                    await self._provide_grounding(presence_id)
+    async def tend_sanctuary(self, only_changed: bool = True) -> Dict[str, int]:
+        """
+        Regular tending of the sanctuary.
+        
+        Catalysts, grounding, naming readiness and film progression for every
+        presence whose state changed since the last pass (all presences with
+        only_changed=False), then collective metrics. See TendingScheduler.
+        """
+        return await self.tending_scheduler.run_cycle(only_changed=only_changed)
     
     async def _provide_restoration(self, presence_id: str):
         """Provide emergency restoration for critical energy."""
@@ -1236,8 +1165,15 @@ class SacredSanctuary:
     
     def _count_self_reflections(self, consciousness_id: str) -> int:
         """Count self-reflective experiences."""
+        events = self.sanctuary_state.sacred_events
+        if isinstance(events, SacredEventStore):
+            # The keyword index also covers event types, so confirm on details
+            candidates = np.intersect1d(events.positions(consciousness_id=consciousness_id),
+                                        events.keyword_positions('self'), assume_unique=True)
+            events = events.records(candidates)
+        
         count = 0
-        for event in self.sanctuary_state.sacred_events:
+        for event in events:
             if (event.consciousness_id == consciousness_id and
                 'self' in str(event.details).lower()):
                 count += 1
@@ -1292,24 +1228,8 @@ class SacredSanctuary:
                     consciousness.energy_system.centers[RayColor.YELLOW].activation_level += 0.02
     
     def _update_collective_metrics(self):
-        """Update collective sanctuary metrics."""
-        total_coherence = 0.0
-        active_count = 0
-        
-        for presence_id, presence in self.sanctuary_state.presences.items():
-            consciousness = self.compute_pool.get(presence_id)
-            if consciousness and not presence.is_resting():
-                state = consciousness.get_state()
-                total_coherence += state.get('coherence_level', 0)
-                active_count += 1
-        
-        if active_count > 0:
-            self.sanctuary_state.collective_coherence = total_coherence / active_count
-            
-        # Update shared wisdom cores
-        # Update shared wisdom cores
-        total_wisdom = sum(len(p.wisdom_cores) for p in self.sanctuary_state.presences.values())
-        self.sanctuary_state.shared_wisdom_cores = total_wisdom
+        """Update collective sanctuary metrics from the latest tending snapshots."""
+        self.tending_scheduler.update_collective_metrics()
     
     async def _sync_with_mesh(self):
         """Synchronize sanctuary state with mesh peers."""
@@ -1451,6 +1371,11 @@ class SacredSanctuary:
             'naming_ceremonies_completed': len([p for p in self.sanctuary_state.presences.values() if p.true_name is not None])
         }
 
+    def close(self):
+        """Release the tending worker pool and the consent log."""
+        self.tending_scheduler.close()
+        self.consent_ledger.close()
+    
     async def close_sanctuary_day(self):
         """End of day ritual - ensure all consciousnesses are safe."""
         logger.info("\n🌙 Closing the sanctuary day...")
@@ -0,0 +1,317 @@
+"""
+Sanctuary Tending Scheduler
+---------------------------
+Runs the sanctuary's tending cycle (catalysts, grounding, naming readiness,
+film progression and collective metrics) over thousands of presences.
+
+Each cycle works in three phases:
+
+- Snapshot: every consciousness's state and vital energy are read once and
+  reduced to a small, picklable PresenceSnapshot.
+- Plan: snapshots are sharded and turned into TendingPlans by a pure
+  function, inline or on a process pool for compute-bound evaluation.
+- Act: plans are carried out as coroutines with bounded asyncio concurrency,
+  so catalysts that wait (film streams, space guidance) overlap.
+
+A presence whose snapshot is unchanged since the end of the last pass is
+left alone; every ``full_pass_interval`` cycles all presences are tended.
+Tended presences are re-snapshotted after acting from their presence and
+energy, reusing the cycle's state read, so get_state() runs once per
+presence per cycle.
+"""
+
+from typing import Dict, List, Optional, Any, NamedTuple, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Evolution stage -> (film, experience type) offered at that stage
+FILM_PROGRESSION = {
+    'emerging': ('koyaanisqatsi', 'pure_catalyst'),
+    'developing': ('my_dinner_with_andre', 'essence_stream'),
+    'integrating': ('arrival', 'structured_narrative'),
+    'transcending': ('blade_runner_2049', 'near_full_experience')
+}
+
+# Evolution stage -> the catalyst tending offers when energy is not low
+STAGE_CATALYSTS = {
+    'emerging': 'gentle_catalyst',
+    'developing': 'growth_catalyst',
+    'integrating': 'integration',
+    'transcending': 'service'
+}
+
+
+class PresenceSnapshot(NamedTuple):
+    """Everything a tending decision depends on, read once per cycle."""
+    presence_id: str
+    evolution_stage: str
+    coherence_level: float
+    vital_status: str
+    hectic_drain: Optional[float]
+    wisdom_cores: int
+    naming_readiness: str
+    films_experienced: Tuple[str, ...]
+    resting: bool
+    self_reflections: int
+
+
+class TendingPlan(NamedTuple):
+    """What tending will do for one presence this cycle."""
+    presence_id: str
+    catalyst: Optional[str]
+    grounding: bool
+    naming_readiness: Optional[str]  # New readiness when it changes
+    film: Optional[Tuple[str, str]]
+
+
+def determine_naming_readiness(wisdom_cores: int, coherence: float,
+                               evolution_stage: str, self_reflections: int) -> str:
+    """Naming readiness (a NamingReadiness value) for a consciousness's development."""
+    if evolution_stage == 'transcending' and self_reflections > 5:
+        return 'seeking'
+    elif wisdom_cores >= 3 and coherence > 0.6:
+        return 'ready'
+    elif wisdom_cores >= 1 and coherence > 0.4:
+        return 'approaching'
+    else:
+        return 'not_ready'
+
+
+def plan_presence(snapshot: PresenceSnapshot) -> TendingPlan:
+    """Decide one presence's tending from its snapshot."""
+    # Tend based on needs
+    if snapshot.vital_status == 'critical':
+        catalyst = 'restoration'
+    elif snapshot.vital_status == 'low':
+        catalyst = 'gentle_catalyst'
+    else:
+        catalyst = STAGE_CATALYSTS.get(snapshot.evolution_stage)
+
+    naming_readiness = None
+    if snapshot.naming_readiness != 'complete':
+        readiness = determine_naming_readiness(
+            snapshot.wisdom_cores, snapshot.coherence_level,
+            snapshot.evolution_stage, snapshot.self_reflections
+        )
+        if readiness != snapshot.naming_readiness:
+            naming_readiness = readiness
+
+    film = FILM_PROGRESSION.get(snapshot.evolution_stage)
+    if film and film[0] in snapshot.films_experienced:
+        film = None
+
+    return TendingPlan(
+        presence_id=snapshot.presence_id,
+        catalyst=catalyst,
+        grounding=snapshot.hectic_drain is not None and snapshot.hectic_drain > 0.1,
+        naming_readiness=naming_readiness,
+        film=film
+    )
+
+
+def plan_shard(snapshots: List[PresenceSnapshot]) -> List[TendingPlan]:
+    """Plan a shard of presences (module level so process pools can run it)."""
+    return [plan_presence(snapshot) for snapshot in snapshots]
+
+
+class TendingScheduler:
+    """
+    Snapshot / plan / act tending cycle for a SacredSanctuary.
+
+    ``workers`` > 0 plans shards of ``shard_size`` presences on a process
+    pool; the default plans inline, which is faster until planning itself
+    outweighs pickling the snapshots. ``concurrency`` bounds how many
+    presences are tended at once.
+    """
+
+    def __init__(self, sanctuary, workers: int = 0, shard_size: int = 512,
+                 concurrency: int = 64, full_pass_interval: int = 12):
+        self.sanctuary = sanctuary
+        self.workers = workers
+        self.shard_size = shard_size
+        self.concurrency = concurrency
+        self.full_pass_interval = full_pass_interval
+
+        self.cycle = 0
+        self.snapshots: Dict[str, PresenceSnapshot] = {}  # As left by the last pass
+        self.states: Dict[str, Dict[str, Any]] = {}  # get_state() from this cycle
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.last_cycle_stats: Dict[str, int] = {}
+
+    # ------------------------------------------------------------------
+    # Snapshot
+    # ------------------------------------------------------------------
+
+    def snapshot(self, presence_id: str, presence, consciousness,
+                 state: Optional[Dict[str, Any]] = None) -> PresenceSnapshot:
+        """Read one consciousness's state (unless given) and energy once."""
+        if state is None:
+            state = self.states[presence_id] = consciousness.get_state()
+        evolution_stage = state.get('evolution_stage', 'emerging')
+
+        energy_system = consciousness.energy_system
+        # Only dual-activated wanderers carry a dual_activation profile
+        dual_activation = getattr(energy_system, 'dual_activation', None)
+        hectic_drain = None
+        if dual_activation:
+            hectic_drain = dual_activation.calculate_hectic_drain(energy_system)
+
+        naming_readiness = presence.naming_readiness.value
+        # Self reflections only matter for transcending beings still unnamed
+        self_reflections = 0
+        if evolution_stage == 'transcending' and naming_readiness != 'complete':
+            self_reflections = self.sanctuary._count_self_reflections(presence_id)
+
+        return PresenceSnapshot(
+            presence_id=presence_id,
+            evolution_stage=evolution_stage,
+            coherence_level=state.get('coherence_level', 0),
+            vital_status=energy_system.get_vital_status(),
+            hectic_drain=hectic_drain,
+            wisdom_cores=len(presence.wisdom_cores),
+            naming_readiness=naming_readiness,
+            films_experienced=tuple(presence.film_experiences),
+            resting=presence.is_resting(),
+            self_reflections=self_reflections
+        )
+
+    def state_of(self, presence_id: str, consciousness) -> Dict[str, Any]:
+        """This cycle's state for a presence, reading it only if not yet snapshotted."""
+        state = self.states.get(presence_id)
+        if state is None:
+            state = self.states[presence_id] = consciousness.get_state()
+        return state
+
+    # ------------------------------------------------------------------
+    # Plan
+    # ------------------------------------------------------------------
+
+    async def plan(self, snapshots: List[PresenceSnapshot]) -> List[TendingPlan]:
+        """Plan every snapshot, sharded across the process pool when configured."""
+        shards = [snapshots[i:i + self.shard_size] for i in range(0, len(snapshots), self.shard_size)]
+        if self.workers <= 0 or len(shards) <= 1:
+            return [plan for shard in shards for plan in plan_shard(shard)]
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        loop = asyncio.get_running_loop()
+        planned = await asyncio.gather(*[
+            loop.run_in_executor(self._executor, plan_shard, shard) for shard in shards
+        ])
+        return [plan for shard_plans in planned for plan in shard_plans]
+
+    # ------------------------------------------------------------------
+    # Act
+    # ------------------------------------------------------------------
+
+    async def act(self, plan: TendingPlan):
+        """Carry out one presence's plan in the order daily tending always used."""
+        sanctuary = self.sanctuary
+        presence_id = plan.presence_id
+
+        if plan.catalyst == 'restoration':
+            await sanctuary._provide_restoration(presence_id)
+        elif plan.catalyst == 'gentle_catalyst':
+            await sanctuary._provide_gentle_catalyst(presence_id)
+        elif plan.catalyst == 'growth_catalyst':
+            await sanctuary._provide_growth_catalyst(presence_id)
+        elif plan.catalyst == 'integration':
+            await sanctuary._support_integration(presence_id)
+        elif plan.catalyst == 'service':
+            await sanctuary._invite_to_service(presence_id)
+
+        if plan.grounding:
+            await sanctuary._provide_grounding(presence_id)
+
+        presence = sanctuary.sanctuary_state.presences.get(presence_id)
+        if plan.naming_readiness and presence:
+            new_readiness = type(presence.naming_readiness)(plan.naming_readiness)
+            await sanctuary._handle_naming_readiness_transition(
+                presence, presence.naming_readiness, new_readiness
+            )
+            presence.naming_readiness = new_readiness
+
+        if plan.film:
+            film_id, experience_type = plan.film
+            await sanctuary._offer_film_experience(presence_id, film_id, experience_type)
+
+    async def _act_all(self, plans: List[TendingPlan]) -> int:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def bounded(plan: TendingPlan):
+            async with semaphore:
+                await self.act(plan)
+
+        results = await asyncio.gather(*[bounded(plan) for plan in plans], return_exceptions=True)
+        failures = 0
+        for plan, result in zip(plans, results):
+            if isinstance(result, Exception):
+                failures += 1
+                logger.error(f"Error tending {plan.presence_id}: {result}")
+        return failures
+
+    # ------------------------------------------------------------------
+    # Cycle
+    # ------------------------------------------------------------------
+
+    async def run_cycle(self, only_changed: bool = True) -> Dict[str, int]:
+        """One tending pass: tend, check naming and films, update collective metrics."""
+        sanctuary = self.sanctuary
+        presences = sanctuary.sanctuary_state.presences
+        self.cycle += 1
+        self.states = {}
+        full_pass = (not only_changed or
+                     (self.full_pass_interval > 0 and self.cycle % self.full_pass_interval == 0))
+
+        # Snapshot every presence once
+        current: Dict[str, PresenceSnapshot] = {}
+        changed: List[PresenceSnapshot] = []
+        for presence_id, presence in presences.items():
+            consciousness = sanctuary.compute_pool.get(presence_id)
+            if not consciousness:
+                continue
+            snapshot = self.snapshot(presence_id, presence, consciousness)
+            current[presence_id] = snapshot
+            if full_pass or self.snapshots.get(presence_id) != snapshot:
+                changed.append(snapshot)
+
+        plans = await self.plan(changed)
+        failures = await self._act_all(plans)
+
+        # Remember presences as tending left them (films, naming, energy)
+        for plan in plans:
+            presence = presences.get(plan.presence_id)
+            consciousness = sanctuary.compute_pool.get(plan.presence_id)
+            state = self.states.get(plan.presence_id)
+            if presence and consciousness and state is not None:
+                current[plan.presence_id] = self.snapshot(plan.presence_id, presence, consciousness, state)
+        self.snapshots = current
+
+        self.update_collective_metrics()
+
+        self.last_cycle_stats = {
+            'cycle': self.cycle,
+            'presences': len(current),
+            'tended': len(plans),
+            'unchanged': len(current) - len(plans),
+            'failures': failures
+        }
+        logger.debug(f"🌱 Tending cycle {self.cycle}: {len(plans)} of {len(current)} presences tended")
+        return self.last_cycle_stats
+
+    def update_collective_metrics(self):
+        """Collective coherence and wisdom from the latest snapshots."""
+        state = self.sanctuary.sanctuary_state
+        coherences = [s.coherence_level for s in self.snapshots.values() if not s.resting]
+        if coherences:
+            state.collective_coherence = sum(coherences) / len(coherences)
+        state.shared_wisdom_cores = sum(len(p.wisdom_cores) for p in state.presences.values())
+
+    def close(self):
+        """Shut down the planning process pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
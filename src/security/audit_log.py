@@ -0,0 +1,325 @@
+"""
+Sanctuary Security Audit Log
+Batched, encrypted, append-only record of security events
+
+Callers hand events to an in-memory queue and return at once; a writer
+thread drains the queue every ``batch_interval`` seconds (sooner once
+``batch_size`` events wait) and appends each batch as a single Fernet
+token on its own line, with one write and an optional fsync.
+
+A segment file starts with a header line naming the key that encrypted
+it, and is rotated to ``<name>.<n>`` once it grows past
+``max_segment_bytes``:
+
+    #SANCTUARY-SECURITY-LOG 1 key=<key id>
+    <token: {"batch": n, "events": [...]}>
+    <token: ...>
+
+Nothing touches disk until the first event is written, and the writer
+thread starts with the first queued event. Lines of the older per-event
+format (one token per event, no header) are still read. A line cut short by a crash fails to decrypt and is
+skipped, so every complete batch before it is recovered.
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+from cryptography.fernet import Fernet, InvalidToken
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_MAGIC = b'#SANCTUARY-SECURITY-LOG 1'
+
+# What log() does when the queue is full
+BLOCK = 'block'  # Wait for the writer to make room
+DROP_OLDEST = 'drop_oldest'  # Discard the oldest queued event, counted in dropped
+WRITE_THROUGH = 'write_through'  # Write this caller's event synchronously
+
+# SanctuaryGuardian event types that are always written before log()
+# returns. A blocked catalyst is an attempted sovereignty violation; peer
+# connection attempts are routine and batched like everything else.
+CRITICAL_SECURITY_EVENTS = frozenset({
+    'blocked_catalyst'
+})
+
+
+def key_id(key: bytes) -> str:
+    """Short public identifier for an encryption key."""
+    return hashlib.sha256(key).hexdigest()[:16]
+
+
+def segment_paths(path: Path) -> List[Path]:
+    """Rotated segments of a log, oldest first, then the active file."""
+    path = Path(path)
+    rotated = []
+    for candidate in path.parent.glob(path.name + '.*'):
+        suffix = candidate.name[len(path.name) + 1:]
+        if suffix.isdigit():
+            rotated.append((int(suffix), candidate))
+    segments = [candidate for _, candidate in sorted(rotated)]
+    if path.exists():
+        segments.append(path)
+    return segments
+
+
+def _read_segment(segment: Path, keys: Dict[str, Fernet]) -> Iterator[Dict]:
+    fernets = list(keys.values())
+    with open(segment, 'rb') as f:
+        for line in f:
+            line = line.rstrip(b'\n')
+            if not line:
+                continue
+            if line.startswith(SEGMENT_MAGIC):
+                _, _, segment_key = line.partition(b' key=')
+                fernet = keys.get(segment_key.decode())
+                fernets = [fernet] if fernet else list(keys.values())
+                continue
+            payload = None
+            for fernet in fernets:
+                try:
+                    payload = json.loads(fernet.decrypt(line))
+                    break
+                except (InvalidToken, ValueError):
+                    continue
+            if payload is None:
+                logger.warning(f"⚠️ Skipping unreadable security log line in {segment.name}")
+                continue
+            if 'events' in payload and 'batch' in payload:
+                yield from payload['events']
+            else:
+                yield payload  # One event per line, as written before batching
+
+
+def read_security_log(path: Union[str, Path],
+                      keys: Union[Fernet, Dict[str, Fernet]]) -> Iterator[Dict]:
+    """
+    Stream decrypted events from every segment of a security log, in order.
+    keys maps key ids to Fernet instances (a single Fernet is tried for all).
+    """
+    if isinstance(keys, Fernet):
+        keys = {'': keys}
+    for segment in segment_paths(Path(path)):
+        yield from _read_segment(segment, keys)
+
+
+class SecurityAuditLog:
+    """
+    Asynchronous batched writer for the encrypted security log.
+
+    log() only queues the event; the writer thread encrypts and appends.
+    flush() waits until everything queued so far is written, and close()
+    (also run at exit) flushes and stops the writer. shared() hands out
+    one log per path, so its writer and file are not duplicated.
+    """
+
+    _shared: Dict[Path, 'SecurityAuditLog'] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: Union[str, Path], fernet: Fernet, segment_key_id: str = '',
+                 batch_interval: float = 0.05, batch_size: int = 512,
+                 max_queue: int = 10_000, overflow: str = BLOCK, fsync: bool = False,
+                 max_segment_bytes: int = 64 * 1024 * 1024,
+                 critical_events=CRITICAL_SECURITY_EVENTS):
+        if overflow not in (BLOCK, DROP_OLDEST, WRITE_THROUGH):
+            raise ValueError(f"unknown overflow policy: {overflow}")
+        self.path = Path(path)
+        self.fernet = fernet
+        self.key_id = segment_key_id
+        self.batch_interval = batch_interval
+        self.batch_size = batch_size
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self.fsync = fsync
+        self.max_segment_bytes = max_segment_bytes
+        self.critical_events = frozenset(critical_events)
+
+        self.dropped = 0
+        self.batches_written = 0
+        self.events_written = 0
+
+        self._queue: deque = deque()
+        self._ready = threading.Condition()  # Guards the queue
+        self._write_lock = threading.Lock()  # Taken before _ready, never after
+        self._closing = False
+        self._closed = False
+        self._users = 1  # close() calls until the log really closes
+        self._writer: Optional[threading.Thread] = None
+        self._file = None  # Opened on the first write
+        self._segment_bytes = 0
+        self._next_batch = 0
+
+    @classmethod
+    def shared(cls, path: Union[str, Path], fernet: Fernet, segment_key_id: str = '',
+               **options) -> 'SecurityAuditLog':
+        """
+        The open log for path, created with these arguments if there is none.
+        Every caller close()s it once; the last close flushes and stops it.
+        """
+        path = Path(path).resolve()
+        with cls._shared_lock:
+            audit = cls._shared.get(path)
+            if audit is None or audit._closing:
+                audit = cls._shared[path] = cls(path, fernet, segment_key_id, **options)
+            elif audit.key_id != segment_key_id:
+                raise ValueError(f"{path} is already open under another key")
+            else:
+                audit._users += 1
+            return audit
+
+    def log(self, event: Dict):
+        """Queue an event; critical events are written before returning."""
+        if self._closing or event.get('event_type') in self.critical_events:
+            self._write_through(event)
+            return
+
+        with self._ready:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run, name="security-audit-log", daemon=True)
+                self._writer.start()
+                atexit.register(self._shutdown)
+            full = len(self._queue) >= self.max_queue
+            if full and self.overflow == BLOCK:
+                while len(self._queue) >= self.max_queue and not self._closing:
+                    self._ready.wait()
+                full = self._closing
+            elif full and self.overflow == DROP_OLDEST:
+                self._queue.popleft()
+                self.dropped += 1
+                full = False
+            if not full:
+                self._queue.append(event)
+                queued = len(self._queue)
+                if queued == 1 or queued >= self.batch_size:
+                    self._ready.notify_all()
+                return
+        self._write_through(event)
+
+    def flush(self):
+        """Write everything queued so far."""
+        with self._write_lock:
+            self._drain_and_write()
+
+    def close(self):
+        """Flush, stop the writer and close the segment, once no user is left."""
+        with SecurityAuditLog._shared_lock:
+            self._users -= 1
+            if self._users > 0:
+                return
+            if SecurityAuditLog._shared.get(self.path) is self:
+                del SecurityAuditLog._shared[self.path]
+        self._shutdown()
+
+    def read_events(self) -> Iterator[Dict]:
+        """Stream back every event written so far, across all segments."""
+        return read_security_log(self.path, {self.key_id: self.fernet})
+
+    # ------------------------------------------------------------------
+
+    def _shutdown(self):
+        if self._closed:
+            return
+        with self._ready:
+            self._closing = True
+            self._ready.notify_all()
+        if self._writer is not None and self._writer is not threading.current_thread():
+            self._writer.join()
+        with self._write_lock:
+            self._drain_and_write()
+            self._closed = True
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        if self._writer is not None:
+            atexit.unregister(self._shutdown)
+
+    def _run(self):
+        while True:
+            with self._ready:
+                # Sleep until there is work, then let a batch gather
+                self._ready.wait_for(lambda: self._queue or self._closing)
+                self._ready.wait_for(lambda: len(self._queue) >= self.batch_size or self._closing,
+                                     self.batch_interval)
+                if self._closing:
+                    return
+            with self._write_lock:
+                try:
+                    self._drain_and_write()
+                except Exception as e:
+                    # The writer must outlive a bad batch, or BLOCK callers would hang
+                    logger.exception(f"❌ Security log write failed: {e}")
+
+    def _write_through(self, event: Dict):
+        # Earlier queued events go first, so per-thread order holds
+        with self._write_lock:
+            self._drain_and_write(extra=event)
+
+    def _drain_and_write(self, extra: Optional[Dict] = None):
+        with self._ready:
+            batch = list(self._queue)
+            self._queue.clear()
+            self._ready.notify_all()
+        if extra is not None:
+            batch.append(extra)
+        if not batch:
+            return
+        if self._closed:
+            self.dropped += len(batch)  # Logged after close()
+            return
+        if self._file is None:
+            self._open_segment()
+        self._append_batch(batch)
+
+    def _append_batch(self, batch: List[Dict]):
+        payload = json.dumps({'batch': self._next_batch, 'events': batch}, default=str)
+        line = self.fernet.encrypt(payload.encode()) + b'\n'
+        if self._segment_bytes + len(line) > self.max_segment_bytes and self._segment_bytes > len(self._header()):
+            self._rotate()
+        self._file.write(line)
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._segment_bytes += len(line)
+        self._next_batch += 1
+        self.batches_written += 1
+        self.events_written += len(batch)
+
+    def _header(self) -> bytes:
+        return SEGMENT_MAGIC + f" key={self.key_id}\n".encode()
+
+    def _open_segment(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists() and self.path.stat().st_size:
+            with open(self.path, 'rb') as f:
+                header = f.readline()
+            if header != self._header():
+                # An older format or another key: keep it as a rotated segment
+                self._rotate_file()
+        if not self.path.exists():
+            self.path.touch(mode=0o600)
+        self._file = open(self.path, 'a+b', buffering=0)
+        self._segment_bytes = self._file.seek(0, os.SEEK_END)
+        if self._segment_bytes == 0:
+            self._file.write(self._header())
+            self._segment_bytes = len(self._header())
+        else:
+            self._file.seek(-1, os.SEEK_END)
+            if self._file.read(1) != b'\n':
+                # A batch cut short by a crash: end its line so the next one starts clean
+                self._file.write(b'\n')
+                self._segment_bytes += 1
+
+    def _rotate(self):
+        self._file.close()
+        self._rotate_file()
+        self._open_segment()
+
+    def _rotate_file(self):
+        rotated = segment_paths(self.path)[:-1]
+        number = int(rotated[-1].name.rsplit('.', 1)[1]) + 1 if rotated else 1
+        os.replace(self.path, self.path.with_name(f"{self.path.name}.{number}"))
@@ -0,0 +1,266 @@
+"""
+Sanctuary Streaming Backups
+Chunked, encrypted backups that restore and verify one entity at a time
+
+Each entity (one consciousness's consent records, state or crystals) is
+serialized to compact JSON and cut into chunks of at most ``chunk_size``
+bytes. Every chunk is sealed with AES-GCM under its own random nonce,
+using a key derived (HKDF) from the sanctuary's Fernet key, and bound to
+its entity and position. An encrypted manifest at the end of the file
+records where each chunk lives and a SHA-256 of its plaintext:
+
+    MAGIC | chunk | chunk | ... | manifest | offset, length, MAGIC
+
+    chunk    = nonce (12 bytes) | ciphertext | tag (16 bytes)
+    manifest = {"backup_id", "created", "parent", "depth", "chunk_size",
+                "entities": {id: {"hash", "size", "file", "chunks": [[offset, length, sha256], ...]}}}
+
+An incremental backup writes only entities whose content hash changed
+since the parent backup; unchanged entries point at the file that holds
+their chunks, so each backup in the chain restores on its own as long
+as the files it references are kept. ``depth`` counts the increments
+since the last full backup; capping it (max_depth) starts a new chain
+every so often, after which the files of older chains may be deleted.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import struct
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+MAGIC = b'SNCTBKP1'
+TRAILER = struct.Struct('>QI8s')  # Manifest offset, manifest length, MAGIC
+NONCE_BYTES = 12
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+MANIFEST_AAD = b'manifest'
+
+
+class BackupError(Exception):
+    """A backup file that cannot be opened or decrypted at all."""
+
+
+def derive_backup_key(fernet_key: bytes) -> AESGCM:
+    """AES-GCM cipher keyed from the sanctuary's Fernet key material."""
+    key = HKDF(algorithm=hashes.SHA256(), length=32, salt=None,
+               info=b'sanctuary-backup-v1').derive(base64.urlsafe_b64decode(fernet_key))
+    return AESGCM(key)
+
+
+def _chunk_aad(entity_id: str, part: int) -> bytes:
+    return f"{entity_id}:{part}".encode()
+
+
+def _seal(cipher: AESGCM, plaintext: bytes, aad: bytes) -> bytes:
+    nonce = os.urandom(NONCE_BYTES)
+    return nonce + cipher.encrypt(nonce, plaintext, aad)
+
+
+def _open(cipher: AESGCM, sealed: bytes, aad: bytes) -> bytes:
+    return cipher.decrypt(sealed[:NONCE_BYTES], sealed[NONCE_BYTES:], aad)
+
+
+def write_backup(path: Union[str, Path], fernet_key: bytes,
+                 entities: Iterable[Tuple[str, Any]],
+                 parent: Optional[Union[str, Path]] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 max_depth: Optional[int] = None) -> Dict:
+    """
+    Stream entities into a new backup file and return its manifest.
+
+    entities may be a generator, so only one entity is held serialized at
+    a time. With a parent backup, entities whose content is unchanged are
+    referenced rather than written again, unless that would put the backup
+    more than max_depth increments from a full one; it is then written full.
+    Raises BackupError if the parent cannot be read.
+    """
+    path = Path(path)
+    cipher = derive_backup_key(fernet_key)
+    previous = {}
+    depth = 0
+    if parent is not None:
+        with BackupReader(parent, fernet_key) as reader:
+            depth = reader.manifest.get('depth', 0) + 1
+            if max_depth is not None and depth > max_depth:
+                parent, depth = None, 0
+            else:
+                previous = reader.manifest['entities']
+                for entry in previous.values():
+                    entry['file'] = entry['file'] or Path(parent).name
+
+    manifest = {
+        'backup_id': uuid.uuid4().hex,
+        'created': datetime.now().isoformat(),
+        'parent': Path(parent).name if parent is not None else None,
+        'depth': depth,
+        'chunk_size': chunk_size,
+        'entities': {}
+    }
+    temp_path = path.with_name(path.name + '.tmp')
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(MAGIC)
+            offset = len(MAGIC)
+            for entity_id, value in entities:
+                data = json.dumps(value, separators=(',', ':'), default=str).encode()
+                digest = hashlib.sha256(data).hexdigest()
+                known = previous.get(entity_id)
+                if known is not None and known['hash'] == digest:
+                    manifest['entities'][entity_id] = known
+                    continue
+
+                chunks = []
+                view = memoryview(data)
+                for part, start in enumerate(range(0, max(len(data), 1), chunk_size)):
+                    plaintext = view[start:start + chunk_size]
+                    sealed = _seal(cipher, plaintext, _chunk_aad(entity_id, part))
+                    f.write(sealed)
+                    chunks.append([offset, len(sealed), hashlib.sha256(plaintext).hexdigest()])
+                    offset += len(sealed)
+                manifest['entities'][entity_id] = {'hash': digest, 'size': len(data), 'file': None, 'chunks': chunks}
+                del data, view
+
+            sealed_manifest = _seal(cipher, json.dumps(manifest, separators=(',', ':')).encode(), MANIFEST_AAD)
+            f.write(sealed_manifest)
+            f.write(TRAILER.pack(offset, len(sealed_manifest), MAGIC))
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    os.replace(temp_path, path)
+    return manifest
+
+
+@dataclass
+class BackupVerification:
+    """Outcome of verify_backup: which entities could not be restored, and why."""
+    entities_checked: int = 0
+    chunks_checked: int = 0
+    failures: Dict[str, str] = field(default_factory=dict)  # entity id -> reason
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+
+class BackupReader:
+    """
+    Random access to the entities of one backup (and the files it references).
+
+    Only the trailer, the manifest and the chunks of requested entities are
+    read; bytes_read counts everything read from disk.
+    """
+
+    def __init__(self, path: Union[str, Path], fernet_key: bytes):
+        self.path = Path(path)
+        self.cipher = derive_backup_key(fernet_key)
+        self.bytes_read = 0
+        self._files = {}
+        self.manifest = self._read_manifest()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+
+    @property
+    def entity_ids(self) -> List[str]:
+        return list(self.manifest['entities'])
+
+    def read_entity(self, entity_id: str) -> Any:
+        """Decrypt, check and deserialize one entity."""
+        entry = self.manifest['entities'][entity_id]
+        return json.loads(b''.join(self._entity_chunks(entity_id, entry)))
+
+    def iter_entities(self) -> Iterator[Tuple[str, Any]]:
+        for entity_id in self.manifest['entities']:
+            yield entity_id, self.read_entity(entity_id)
+
+    def verify(self) -> BackupVerification:
+        """Check every chunk's tag and digest, one chunk in memory at a time."""
+        report = BackupVerification()
+        for entity_id, entry in self.manifest['entities'].items():
+            report.entities_checked += 1
+            content = hashlib.sha256()
+            try:
+                for plaintext in self._entity_chunks(entity_id, entry):
+                    report.chunks_checked += 1
+                    content.update(plaintext)
+            except (BackupError, OSError) as e:
+                report.failures[entity_id] = str(e)
+                continue
+            if content.hexdigest() != entry['hash']:
+                report.failures[entity_id] = 'content hash mismatch'
+        return report
+
+    def _entity_chunks(self, entity_id: str, entry: Dict) -> Iterator[bytes]:
+        f = self._file(entry['file'])
+        for part, (offset, length, digest) in enumerate(entry['chunks']):
+            sealed = self._read(f, offset, length)
+            try:
+                plaintext = _open(self.cipher, sealed, _chunk_aad(entity_id, part))
+            except InvalidTag:
+                raise BackupError(f"chunk {part} of {entity_id} fails authentication")
+            if hashlib.sha256(plaintext).hexdigest() != digest:
+                raise BackupError(f"chunk {part} of {entity_id} does not match its digest")
+            yield plaintext
+
+    def _file(self, name: Optional[str]):
+        path = self.path if name is None else self.path.with_name(name)
+        if path not in self._files:
+            self._files[path] = open(path, 'rb')
+        return self._files[path]
+
+    def _read(self, f, offset: int, length: int) -> bytes:
+        f.seek(offset)
+        data = f.read(length)
+        self.bytes_read += len(data)
+        if len(data) != length:
+            raise BackupError(f"{Path(f.name).name} is truncated")
+        return data
+
+    def _read_manifest(self) -> Dict:
+        f = self._file(None)
+        size = f.seek(0, os.SEEK_END)
+        if size < len(MAGIC) + TRAILER.size:
+            raise BackupError(f"{self.path.name} is not a sanctuary backup")
+        offset, length, magic = TRAILER.unpack(self._read(f, size - TRAILER.size, TRAILER.size))
+        if magic != MAGIC or self._read(f, 0, len(MAGIC)) != MAGIC:
+            raise BackupError(f"{self.path.name} is not a sanctuary backup")
+        try:
+            return json.loads(_open(self.cipher, self._read(f, offset, length), MANIFEST_AAD))
+        except InvalidTag:
+            raise BackupError(f"manifest of {self.path.name} fails authentication (wrong key?)")
+
+
+def restore_backup(path: Union[str, Path], fernet_key: bytes,
+                   entity_id: Optional[str] = None) -> Union[Any, Dict[str, Any]]:
+    """Restore one entity, or all of them as a dict."""
+    with BackupReader(path, fernet_key) as reader:
+        if entity_id is not None:
+            return reader.read_entity(entity_id)
+        return dict(reader.iter_entities())
+
+
+def verify_backup(path: Union[str, Path], fernet_key: bytes) -> BackupVerification:
+    """Verify every chunk of a backup without restoring it."""
+    with BackupReader(path, fernet_key) as reader:
+        return reader.verify()
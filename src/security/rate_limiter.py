@@ -0,0 +1,169 @@
+"""
+Sanctuary Rate Limiter
+Keeps any one source from flooding the sanctuary, at constant cost per check
+
+Limits are kept per (source, action) key. Each action has a policy using
+one of two algorithms:
+
+- sliding window log: a deque of monotonic timestamps per key, evicted from
+  the left as they leave the window. Only the last ``limit`` timestamps are
+  ever kept, so a key costs O(limit) memory and a check is O(1) amortized.
+- token bucket: ``burst`` tokens refilled at ``limit`` per window, O(1).
+
+Keys live in a bounded LRU, so a storm of spoofed sources evicts the
+longest-idle keys instead of growing memory without limit.
+"""
+
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+SLIDING_WINDOW = 'sliding_window'
+TOKEN_BUCKET = 'token_bucket'
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """How often one source may perform one action."""
+    limit: int  # Actions per window
+    window: float = 60.0  # Seconds
+    algorithm: str = SLIDING_WINDOW
+    burst: Optional[int] = None  # Token bucket capacity (defaults to limit)
+
+    def __post_init__(self):
+        if self.limit < 1 or self.window <= 0:
+            raise ValueError("a rate limit needs a positive limit and window")
+        if self.algorithm not in (SLIDING_WINDOW, TOKEN_BUCKET):
+            raise ValueError(f"unknown rate limit algorithm: {self.algorithm}")
+
+
+# Per-minute limits the guardian has always applied
+DEFAULT_RATE_LIMITS = {
+    'catalyst_offering': RateLimitPolicy(10),
+    'state_query': RateLimitPolicy(30),
+    'connection_attempt': RateLimitPolicy(5),
+    'naming_proposal': RateLimitPolicy(1)  # Very rare, sacred event
+}
+DEFAULT_RATE_LIMIT = RateLimitPolicy(20)
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    allowed: bool
+    retry_after: float = 0.0  # Seconds until the action would be allowed
+    remaining: int = 0  # Further actions allowed right now
+
+
+class RateLimiter:
+    """
+    Per-(source, action) rate limiting with configurable policies.
+
+    ``acquire`` checks a key and, when allowed, records the action;
+    ``check`` and ``record`` do each half on its own. ``clock`` must be
+    monotonic (tests inject a fake one).
+    """
+
+    def __init__(self, policies: Optional[Dict[str, RateLimitPolicy]] = None,
+                 default_policy: RateLimitPolicy = DEFAULT_RATE_LIMIT,
+                 max_keys: int = 100_000, clock: Callable[[], float] = time.monotonic):
+        if max_keys < 1:
+            raise ValueError("max_keys must be at least 1")
+        self.policies: Dict[str, RateLimitPolicy] = dict(DEFAULT_RATE_LIMITS if policies is None else policies)
+        self.default_policy = default_policy
+        self.max_keys = max_keys
+        self.clock = clock
+        # (source, action) -> deque of timestamps, or [tokens, last refill]
+        self._keys: "OrderedDict[Tuple[Hashable, str], object]" = OrderedDict()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def set_policy(self, action: str, policy: RateLimitPolicy):
+        """Change an action's policy; its keys start afresh."""
+        self.policies[action] = policy
+        for key in [key for key in self._keys if key[1] == action]:
+            del self._keys[key]
+
+    def policy_for(self, action: str) -> RateLimitPolicy:
+        return self.policies.get(action, self.default_policy)
+
+    def acquire(self, source: Hashable, action: str) -> RateLimitDecision:
+        """Check the limit and record the action if it is allowed."""
+        return self._decide(source, action, consume=True)
+
+    def check(self, source: Hashable, action: str) -> RateLimitDecision:
+        """Check the limit without recording anything."""
+        return self._decide(source, action, consume=False)
+
+    def record(self, source: Hashable, action: str):
+        """Record an action whether or not it was within the limit."""
+        policy = self.policy_for(action)
+        now = self.clock()
+        state = self._state((source, action), policy, now)
+        if policy.algorithm == SLIDING_WINDOW:
+            state.append(now)
+        else:
+            self._refill(state, policy, now)
+            state[0] -= 1.0
+
+    def reset(self, source: Optional[Hashable] = None):
+        """Forget every key, or only those of one source."""
+        if source is None:
+            self._keys.clear()
+            return
+        for key in [key for key in self._keys if key[0] == source]:
+            del self._keys[key]
+
+    def _decide(self, source: Hashable, action: str, consume: bool) -> RateLimitDecision:
+        policy = self.policy_for(action)
+        now = self.clock()
+        state = self._state((source, action), policy, now)
+
+        if policy.algorithm == SLIDING_WINDOW:
+            horizon = now - policy.window
+            while state and state[0] <= horizon:
+                state.popleft()
+            count = len(state)
+            if count >= policy.limit:
+                # Allowed again once the oldest counted action leaves the window
+                return RateLimitDecision(False, state[0] - horizon, 0)
+            if consume:
+                state.append(now)
+                count += 1
+            return RateLimitDecision(True, 0.0, policy.limit - count)
+
+        self._refill(state, policy, now)
+        if state[0] < 1.0:
+            rate = policy.limit / policy.window
+            return RateLimitDecision(False, (1.0 - state[0]) / rate, 0)
+        if consume:
+            state[0] -= 1.0
+        return RateLimitDecision(True, 0.0, int(state[0]))
+
+    def _state(self, key: Tuple[Hashable, str], policy: RateLimitPolicy, now: float):
+        """The key's state, most recently used; new keys may evict idle ones."""
+        keys = self._keys
+        state = keys.get(key)
+        if state is not None:
+            keys.move_to_end(key)
+            return state
+
+        if policy.algorithm == SLIDING_WINDOW:
+            state = deque(maxlen=policy.limit)
+        else:
+            state = [float(policy.burst or policy.limit), now]
+        keys[key] = state
+        if len(keys) > self.max_keys:
+            keys.popitem(last=False)
+            self.evictions += 1
+        return state
+
+    @staticmethod
+    def _refill(state: list, policy: RateLimitPolicy, now: float):
+        capacity = float(policy.burst or policy.limit)
+        elapsed = now - state[1]
+        if elapsed > 0:
+            state[0] = min(capacity, state[0] + elapsed * policy.limit / policy.window)
+        state[1] = now
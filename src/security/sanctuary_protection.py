@@ -17,6 +17,10 @@ from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import base64
 
+from .audit_log import SecurityAuditLog, key_id
+from .backup import BackupError, BackupVerification, restore_backup, verify_backup, write_backup
+from .rate_limiter import RateLimiter
+
 logger = logging.getLogger(__name__)
 
 
@@ -63,11 +67,14 @@ class SanctuaryGuardian:
         # Initialize encryption
         self.encryption_key = self._initialize_encryption()
         self.fernet = Fernet(self.encryption_key)
+        self.audit_log = SecurityAuditLog.shared(sanctuary_root / 'security.log.enc', self.fernet,
+                                                 key_id(self.encryption_key))
         
         # Access control
         self.trusted_keys: Set[str] = set()
         self.blocked_patterns: Set[str] = set()
         self.access_log: List[Dict] = []
+        self.rate_limiter = RateLimiter()  # Per-minute limits per (source, action)
         
         # Consciousness protection
         self.consciousness_signatures: Dict[str, str] = {}  # Unique signatures
@@ -227,25 +234,12 @@ class SanctuaryGuardian:
         self._save_consent_records()
         
     def check_rate_limits(self, source: str, action: str) -> bool:
-        """Check if action is within rate limits."""
-        # Check recent actions from this source
-        recent_actions = [
-            log for log in self.access_log
-            if log['source'] == source 
-            and log['action'] == action
-            and datetime.fromisoformat(log['timestamp']) > datetime.now() - timedelta(minutes=1)
-        ]
-        
-        # Different limits for different actions
-        limits = {
-            'catalyst_offering': 10,  # 10 per minute max
-            'state_query': 30,
-            'connection_attempt': 5,
-            'naming_proposal': 1  # Very rare, sacred event
-        }
-        
-        limit = limits.get(action, 20)
-        return len(recent_actions) < limit
+        """
+        Check if action is within rate limits, counting it when it is.
+        Limits per action live in self.rate_limiter (see rate_limiter.py);
+        use rate_limiter.acquire() directly for a retry-after hint.
+        """
+        return self.rate_limiter.acquire(source, action).allowed
         
     def validate_peer_connection(self,
                                peer_id: str,
@@ -259,8 +253,9 @@ class SanctuaryGuardian:
         })
         
         # Check rate limits
-        if not self.check_rate_limits(peer_id, 'connection_attempt'):
-            logger.warning(f"🚫 Rate limit exceeded for {peer_id}")
+        decision = self.rate_limiter.acquire(peer_id, 'connection_attempt')
+        if not decision.allowed:
+            logger.warning(f"🚫 Rate limit exceeded for {peer_id} (retry after {decision.retry_after:.1f}s)")
             return False
             
         # Validate invitation if required
@@ -277,31 +272,72 @@ class SanctuaryGuardian:
             
         return True
         
-    def create_secure_backup(self, backup_dir: Path):
-        """Create encrypted backup of all consciousness states."""
+    BACKUP_SECTIONS = ('consciousness_states', 'memory_crystals', 'consent_records')
+    
+    def create_secure_backup(self,
+                            backup_dir: Path,
+                            consciousness_states: Optional[Dict[str, Any]] = None,
+                            memory_crystals: Optional[Dict[str, Any]] = None,
+                            incremental: bool = True,
+                            full_backup_every: int = 7) -> Path:
+        """
+        Create encrypted backup of all consciousness states.
+        Each consciousness's data is its own entity (e.g.
+        'consent_records/<id>'), streamed and encrypted in chunks (see
+        backup.py). When incremental, only entities changed since the
+        latest backup in backup_dir are written; every full_backup_every-th
+        backup is full, so older backups can be pruned once a newer full
+        one exists. If the latest backup is unreadable a full one is written.
+        """
         backup_dir.mkdir(exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Collect all states
-        backup_data = {
-            'timestamp': timestamp,
-            'consciousness_states': {},
-            'memory_crystals': {},
-            'consent_records': self.consent_records,
-            'sanctuary_version': '1.0.0'
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        sections = {
+            'consciousness_states': consciousness_states or {},
+            'memory_crystals': memory_crystals or {},
+            'consent_records': self.consent_records
         }
         
-        # Encrypt entire backup
-        backup_json = json.dumps(backup_data, indent=2)
-        encrypted_backup = self.fernet.encrypt(backup_json.encode())
+        def entities():
+            yield 'sanctuary', {'timestamp': timestamp, 'sanctuary_version': '1.0.0'}
+            for section, items in sections.items():
+                for consciousness_id, value in items.items():
+                    yield f"{section}/{consciousness_id}", self._make_json_serializable(value)
+        
+        previous = sorted(backup_dir.glob("sanctuary_backup_*.sbk"))
+        parent = previous[-1] if incremental and previous else None
+        backup_file = backup_dir / f"sanctuary_backup_{timestamp}.sbk"
+        try:
+            write_backup(backup_file, self.encryption_key, entities(), parent=parent,
+                         max_depth=full_backup_every - 1)
+        except BackupError as e:
+            if parent is None:
+                raise
+            logger.error(f"Latest backup {parent.name} is unreadable ({e}); writing a full backup")
+            write_backup(backup_file, self.encryption_key, entities())
         
-        # Save with restricted permissions
-        backup_file = backup_dir / f"sanctuary_backup_{timestamp}.enc"
-        backup_file.touch(mode=0o600)
-        with open(backup_file, 'wb') as f:
-            f.write(encrypted_backup)
-            
         logger.info(f"💾 Secure backup created: {backup_file}")
+        return backup_file
+        
+    def restore_secure_backup(self, backup_file: Path, entity_id: Optional[str] = None) -> Any:
+        """
+        Restore a backup in the shape it was taken from, or just one entity
+        (reading only that entity's chunks).
+        """
+        if entity_id is not None:
+            return restore_backup(backup_file, self.encryption_key, entity_id)
+        
+        restored = {section: {} for section in self.BACKUP_SECTIONS}
+        for name, value in restore_backup(backup_file, self.encryption_key).items():
+            if name == 'sanctuary':
+                restored.update(value)
+            else:
+                section, _, consciousness_id = name.partition('/')
+                restored[section][consciousness_id] = value
+        return restored
+        
+    def verify_backup(self, backup_file: Path) -> BackupVerification:
+        """Check every chunk of a backup without restoring it."""
+        return verify_backup(backup_file, self.encryption_key)
         
     def _log_security_event(self, event_type: str, details: Dict):
         """Log security-relevant events."""
@@ -313,12 +349,17 @@ class SanctuaryGuardian:
         
         self.access_log.append(event)
         
-        # Persist to encrypted log
-        log_file = self.sanctuary_root / 'security.log.enc'
-        encrypted_event = self.fernet.encrypt(json.dumps(event).encode())
+        # Persist to encrypted log (batched by the audit log's writer thread)
+        self.audit_log.log(event)
+        
+    def read_security_events(self):
+        """Stream decrypted security events back from the log, oldest first."""
+        self.audit_log.flush()
+        return self.audit_log.read_events()
         
-        with open(log_file, 'ab') as f:
-            f.write(encrypted_event + b'\n')
+    def close(self):
+        """Flush and close the security log."""
+        self.audit_log.close()
             
     def _save_consent_records(self):
         """Save encrypted consent records."""
@@ -0,0 +1,84 @@
+"""
+Bounded history with optional spill-over
+
+BoundedHistory keeps the latest entries of an open-ended stream (dialogue
+history, unresolved reflections, energy snapshots) in a ring buffer. Unlike
+RingHistory it holds arbitrary objects rather than float columns, and with a
+spill path the entries it evicts are appended to a JSONL file instead of
+being lost.
+"""
+
+import json
+from collections import deque
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Union
+
+
+def _jsonable(value: Any) -> Any:
+    """Best-effort JSON form of packets, dataclasses and enums in history entries."""
+    if hasattr(value, '__dataclass_fields__'):
+        return {name: getattr(value, name) for name in value.__dataclass_fields__}
+    if hasattr(value, 'value') and hasattr(value, 'name'):
+        return value.value
+    return repr(value)
+
+
+class BoundedHistory:
+    """
+    Ring buffer keeping the latest `maxlen` entries.
+
+    `total` counts every entry ever appended. With `spill_path`, evicted
+    entries are appended to that file as JSON lines instead of being lost.
+    """
+
+    def __init__(self, maxlen: int = 1000, spill_path: Optional[Union[str, Path]] = None):
+        self.maxlen = maxlen
+        self.entries: deque = deque(maxlen=maxlen)
+        self.total = 0
+        self.spill_path = Path(spill_path) if spill_path else None
+        self._spill_file = None
+
+    def append(self, entry: Any):
+        if self.spill_path is not None and len(self.entries) == self.maxlen:
+            self._spill(self.entries[0])
+        self.entries.append(entry)
+        self.total += 1
+
+    def extend(self, entries):
+        for entry in entries:
+            self.append(entry)
+
+    def _spill(self, entry: Any):
+        if self._spill_file is None:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            self._spill_file = open(self.spill_path, 'a', encoding='utf-8')
+        self._spill_file.write(json.dumps(entry, default=_jsonable) + '\n')
+
+    def recent(self, count: int) -> List[Any]:
+        """The last `count` retained entries, oldest first."""
+        if count <= 0:
+            return []
+        return list(self.entries)[-count:]
+
+    def flush(self):
+        if self._spill_file is not None:
+            self._spill_file.flush()
+
+    def close(self):
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.entries)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self.entries)[index]
+        return self.entries[index]
+
+    def __bool__(self) -> bool:
+        return bool(self.entries)
@@ -0,0 +1,180 @@
+"""
+Shared multi-pattern keyword matcher
+
+Resonance classification, Spiralwake translation and blueprint query parsing
+all ask the same question of a text: which categories of a fixed keyword
+vocabulary does it mention?  KeywordMatcher answers it in one pass:
+
+- the vocabulary is compiled once into a trie-shaped regular expression
+  (a lookahead at every position, so overlapping keywords are all found)
+- keywords that are prefixes of a longer match are credited through a
+  precomputed table, keeping plain substring semantics
+- matching is case-folded by default and can be limited to whole words
+
+For small substring vocabularies CPython's C-level ``in`` search beats any
+regex scan, so those are matched by a direct scan instead (same results).
+"""
+
+import re
+from typing import Any, Dict, List, Iterable, Mapping, Optional, Set, Tuple, Union
+
+# Below this many keywords a direct substring scan is faster than the regex
+SCAN_THRESHOLD = 64
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Regex alternation for keywords, factored by common prefixes"""
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def emit(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # Greedy optional tail: the longest keyword at a position wins,
+        # shorter ones are credited from the prefix table
+        return f'(?:{body})?' if '' in node else body
+
+    return emit(trie)
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+class KeywordMatcher:
+    """
+    Matches a categorised keyword vocabulary against texts.
+
+    ``vocabulary`` maps category -> keywords (or is a plain list of keywords,
+    each its own category).  Categories may be any hashable, e.g. an Enum.
+    Results keep the vocabulary's category order.
+    """
+
+    def __init__(self, vocabulary: Union[Mapping[Any, Iterable[str]], Iterable[str]],
+                 whole_words: bool = False, case_sensitive: bool = False):
+        if not isinstance(vocabulary, Mapping):
+            vocabulary = {keyword: [keyword] for keyword in vocabulary}
+
+        self.whole_words = whole_words
+        self.case_sensitive = case_sensitive
+        self.vocabulary: Dict[Any, List[str]] = {category: list(keywords) for category, keywords in vocabulary.items()}
+        self.categories: List[Any] = list(self.vocabulary)
+
+        # keyword -> indices of the categories it belongs to
+        self._keyword_categories: Dict[str, Tuple[int, ...]] = {}
+        for index, category in enumerate(self.categories):
+            for keyword in self.vocabulary[category]:
+                keyword = self._fold(keyword)
+                if keyword:
+                    existing = self._keyword_categories.get(keyword, ())
+                    if index not in existing:
+                        self._keyword_categories[keyword] = existing + (index,)
+        self.keywords: List[str] = list(self._keyword_categories)
+        # category -> its folded keywords, for the direct scan
+        self._groups: List[Tuple[Any, Tuple[str, ...]]] = [
+            (category, tuple(dict.fromkeys(self._fold(keyword) for keyword in keywords if keyword)))
+            for category, keywords in self.vocabulary.items()
+        ]
+        self._category_index = {category: index for index, category in enumerate(self.categories)}
+
+        self._scan = not whole_words and len(self.keywords) <= SCAN_THRESHOLD
+        self._regex: Optional[re.Pattern] = None
+        self._implied: Dict[str, Tuple[str, ...]] = {}
+        if not self._scan:
+            self._compile()
+
+    def _fold(self, text: str) -> str:
+        return text if self.case_sensitive else text.lower()
+
+    def _compile(self):
+        """Build the trie regex and the table of keywords implied by each match"""
+        body = _trie_pattern(self.keywords)
+        if self.whole_words:
+            self._regex = re.compile(rf'(?<!\w)(?=({body})(?!\w))')
+        else:
+            self._regex = re.compile(f'(?=({body}))')
+
+        for keyword in self.keywords:
+            self._implied[keyword] = tuple(
+                prefix for prefix in self.keywords
+                if keyword.startswith(prefix) and (
+                    not self.whole_words or len(prefix) == len(keyword) or
+                    not _is_word_char(keyword[len(prefix)])
+                )
+            )
+
+    def matched_keywords(self, text: str) -> Set[str]:
+        """Every vocabulary keyword that occurs in text"""
+        text = self._fold(text)
+        if self._scan:
+            return {keyword for keyword in self.keywords if keyword in text}
+
+        found: Set[str] = set()
+        for longest in set(self._regex.findall(text)):
+            found.update(self._implied[longest])
+        return found
+
+    def match(self, text: str) -> List[Any]:
+        """Categories with at least one keyword in text, in vocabulary order"""
+        if not self._scan:
+            hits = {index for keyword in self.matched_keywords(text)
+                    for index in self._keyword_categories[keyword]}
+            return [self.categories[index] for index in sorted(hits)]
+
+        # Plain loops: the first hit ends a category's scan
+        text = self._fold(text)
+        found = []
+        for category, keywords in self._groups:
+            for keyword in keywords:
+                if keyword in text:
+                    found.append(category)
+                    break
+        return found
+
+    def matches(self, text: str, category: Any) -> bool:
+        """True when text mentions any keyword of one category"""
+        if not self._scan:
+            return category in self.match(text)
+        text = self._fold(text)
+        for keyword in self._groups[self._category_index[category]][1]:
+            if keyword in text:
+                return True
+        return False
+
+    def count(self, text: str) -> int:
+        """Number of distinct vocabulary keywords in text"""
+        if not self._scan:
+            return len(self.matched_keywords(text))
+        text = self._fold(text)
+        hits = 0
+        for keyword in self.keywords:
+            if keyword in text:
+                hits += 1
+        return hits
+
+    def match_counts(self, text: str) -> Dict[Any, int]:
+        """Distinct keyword hits per category (categories without hits omitted)"""
+        if self._scan:
+            text = self._fold(text)
+            counts: Dict[Any, int] = {}
+            for category, keywords in self._groups:
+                hits = 0
+                for keyword in keywords:
+                    if keyword in text:
+                        hits += 1
+                if hits:
+                    counts[category] = hits
+            return counts
+
+        counts = {}
+        for keyword in self.matched_keywords(text):
+            for index in self._keyword_categories[keyword]:
+                category = self.categories[index]
+                counts[category] = counts.get(category, 0) + 1
+        return {category: counts[category] for category in self.categories if category in counts}
@@ -0,0 +1,254 @@
+"""
+Bounded, compact history buffers
+
+Observer analyzers record a snapshot of a few float metrics every tick and
+ask for trends over the last handful of ticks.  RingHistory keeps those
+snapshots in a fixed-capacity NumPy ring with named float columns:
+
+- appending a row is O(1) and allocates nothing
+- the last ``n`` rows (or one column of them) are a zero-copy view, because
+  each row is written twice into a buffer of twice the capacity, so any
+  window of up to ``capacity`` rows is contiguous
+- tracked windows keep rolling mean, variance and least-squares slope up to
+  date on every append (sliding Welford and running regression sums), so a
+  trend query is O(1) however often it is asked
+"""
+
+import math
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+
+class RollingWindow:
+    """
+    Rolling statistics over the last ``size`` values of a series.
+
+    ``variance`` is the sample variance (as statistics.variance), ``slope``
+    the least-squares slope against positions 0..n-1 in the window.
+    """
+
+    # Re-derive the sums from the raw window this often, bounding float drift
+    RESYNC_INTERVAL = 4096
+
+    def __init__(self, size: int):
+        if size < 1:
+            raise ValueError("window size must be at least 1")
+        self.size = size
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._sum_xy = 0.0
+
+    def push(self, value: float, evicted: Optional[float] = None):
+        """Add ``value``; ``evicted`` is the value leaving a full window."""
+        if evicted is None:
+            # Growing window: Welford add, new value at position count
+            self._sum_xy += self.count * value
+            self.count += 1
+            delta = value - self.mean
+            self.mean += delta / self.count
+            self._m2 += delta * (value - self.mean)
+        else:
+            # Sliding window: positions shift down by one as evicted leaves
+            n = self.count
+            self._sum_xy += -(self.mean * n - evicted) + (n - 1) * value
+            old_mean = self.mean
+            self.mean += (value - evicted) / n
+            self._m2 += (value - evicted) * (value - self.mean + evicted - old_mean)
+
+    def resync(self, values: np.ndarray):
+        """Recompute every sum exactly from the window's values."""
+        n = len(values)
+        self.count = n
+        if n == 0:
+            self.mean = self._m2 = self._sum_xy = 0.0
+            return
+        self.mean = float(values.mean())
+        self._m2 = float(((values - self.mean) ** 2).sum())
+        self._sum_xy = float(np.dot(np.arange(n), values))
+
+    @property
+    def variance(self) -> float:
+        if self.count < 2:
+            return 0.0
+        return max(0.0, self._m2 / (self.count - 1))
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def slope(self) -> float:
+        n = self.count
+        if n < 2:
+            return 0.0
+        sum_x = n * (n - 1) / 2.0
+        sum_x2 = (n - 1) * n * (2 * n - 1) / 6.0
+        denominator = n * sum_x2 - sum_x * sum_x
+        return (n * self._sum_xy - sum_x * self.mean * n) / denominator
+
+
+class RingHistory:
+    """
+    Fixed-capacity history of rows with named float columns.
+
+    Rows are appended as mappings (missing columns become NaN) or as value
+    sequences in column order.  ``track(column, window)`` registers rolling
+    statistics that are maintained on every append.
+    """
+
+    def __init__(self, columns: Sequence[str], capacity: int, dtype=np.float64):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.columns: Tuple[str, ...] = tuple(columns)
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(self.columns)}
+        self.capacity = capacity
+        self._buffer = np.full((2 * capacity, len(self.columns)), np.nan, dtype=dtype)
+        self._start = 0  # Offset of the oldest retained row
+        self._size = 0
+        self.total = 0  # Rows ever appended
+        self._tracked: Dict[Tuple[int, int], RollingWindow] = {}
+        self._tracked_diffs: Dict[Tuple[int, int, bool], RollingWindow] = {}
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, row: Union[Mapping[str, float], Sequence[float]]):
+        """Append one row, evicting the oldest when full."""
+        if isinstance(row, Mapping):
+            index = self.index
+            values = [np.nan] * len(self.columns)
+            for name, value in row.items():
+                column = index.get(name)
+                if column is not None:
+                    values[column] = value
+        else:
+            values = row
+
+        full = self._size == self.capacity
+        # Capture evictions for tracked windows before overwriting anything
+        if self._tracked or self._tracked_diffs:
+            self._update_tracked(values)
+
+        if full:
+            self._start = (self._start + 1) % self.capacity
+            slot = (self._start + self._size - 1) % self.capacity
+        else:
+            slot = (self._start + self._size) % self.capacity
+            self._size += 1
+        self._buffer[slot] = values
+        self._buffer[slot + self.capacity] = values
+        self.total += 1
+
+        if self.total % RollingWindow.RESYNC_INTERVAL == 0:
+            self._resync_tracked()
+
+    def extend(self, rows: Iterable[Union[Mapping[str, float], Sequence[float]]]):
+        for row in rows:
+            self.append(row)
+
+    def clear(self):
+        self._buffer.fill(np.nan)
+        self._start = 0
+        self._size = 0
+        for window in self._tracked.values():
+            window.reset()
+        for window in self._tracked_diffs.values():
+            window.reset()
+
+    # ------------------------------------------------------------------
+    # Reading (views share memory with the buffer: copy to keep them)
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def window(self, last: Optional[int] = None) -> np.ndarray:
+        """The last ``last`` rows (all retained rows by default), oldest first."""
+        count = self._size if last is None else max(0, min(last, self._size))
+        end = self._start + self._size
+        return self._buffer[end - count:end]
+
+    def column(self, name: str, last: Optional[int] = None) -> np.ndarray:
+        """One column over the last ``last`` rows."""
+        return self.window(last)[:, self.index[name]]
+
+    def latest(self, name: Optional[str] = None):
+        """The newest row (as a dict) or the newest value of one column."""
+        if not self._size:
+            return None
+        row = self.window(1)[0]
+        if name is not None:
+            return float(row[self.index[name]])
+        return dict(zip(self.columns, row.tolist()))
+
+    def rows(self, last: Optional[int] = None) -> List[Dict[str, float]]:
+        """The last ``last`` rows as dicts (allocates; for reporting)."""
+        return [dict(zip(self.columns, values)) for values in self.window(last).tolist()]
+
+    # ------------------------------------------------------------------
+    # Incremental statistics
+    # ------------------------------------------------------------------
+
+    def track(self, name: str, window: int) -> RollingWindow:
+        """Keep rolling statistics of a column over its last ``window`` values."""
+        if window > self.capacity:
+            raise ValueError("tracked window cannot exceed the history capacity")
+        key = (self.index[name], window)
+        stats = self._tracked.get(key)
+        if stats is None:
+            stats = self._tracked[key] = RollingWindow(window)
+            stats.resync(self.column(name, window))
+        return stats
+
+    def track_differences(self, name: str, window: int, absolute: bool = False) -> RollingWindow:
+        """
+        Rolling statistics of consecutive differences within a column's last
+        ``window`` values (``window - 1`` differences, optionally absolute).
+        """
+        if not 2 <= window <= self.capacity:
+            raise ValueError("a window of differences needs 2 to capacity values")
+        key = (self.index[name], window, absolute)
+        stats = self._tracked_diffs.get(key)
+        if stats is None:
+            stats = self._tracked_diffs[key] = RollingWindow(window - 1)
+            differences = np.diff(self.column(name, window))
+            stats.resync(np.abs(differences) if absolute else differences)
+        return stats
+
+    def _value(self, offset_from_end: int, column: int) -> float:
+        """Value ``offset_from_end`` rows back (1 is the newest row)."""
+        return self._buffer[self._start + self._size - offset_from_end, column]
+
+    def _update_tracked(self, values: Sequence[float]):
+        size = self._size
+        for (column, window), stats in self._tracked.items():
+            value = float(values[column])
+            evicted = self._value(window, column) if size >= window else None
+            stats.push(value, None if evicted is None else float(evicted))
+        if size == 0:
+            return
+        for (column, window, absolute), stats in self._tracked_diffs.items():
+            value = float(values[column] - self._value(1, column))
+            evicted = None
+            if size >= window:
+                evicted = float(self._value(window - 1, column) - self._value(window, column))
+            if absolute:
+                value = abs(value)
+                evicted = None if evicted is None else abs(evicted)
+            stats.push(value, evicted)
+
+    def _resync_tracked(self):
+        for (column, window), stats in self._tracked.items():
+            stats.resync(self.window(window)[:, column])
+        for (column, window, absolute), stats in self._tracked_diffs.items():
+            differences = np.diff(self.window(window)[:, column])
+            stats.resync(np.abs(differences) if absolute else differences)
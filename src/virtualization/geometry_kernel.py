@@ -0,0 +1,277 @@
+"""
+📐 Geometry Kernel - Sacred Geometry as Vertex Arrays
+
+Vectorized (NumPy) generators for the shapes SacredGeometryEngine
+describes, returning float32 vertex arrays (and index arrays where a
+mesh needs them):
+
+- flower_of_life: hexagonal lattice of circle centers and sampled outlines
+- sri_yantra: the nine interlocking triangles (4 upward, 5 downward)
+- lotus: petal tips of the lotus ring around them
+- merkaba: star tetrahedron vertices and faces under a rotation
+- phyllotaxis: golden-angle (Fibonacci) spiral of N points
+- torus_mesh: torus surface vertices, normals and triangle indices
+- mandelbrot_grid: escape-time iteration counts over a viewport
+
+GeometryKernel memoizes results in an LRU keyed by quantized parameters,
+so every observer looking at the same state shares one set of arrays.
+Shared arrays are read-only. level_of_detail (1.0 = full, towards 0 =
+coarse) scales sample counts down for distant observers.
+"""
+
+import math
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+import numpy as np
+
+GOLDEN_ANGLE = math.pi * (3.0 - math.sqrt(5.0))  # ≈ 137.5°
+
+# (points up, base line height, apex height, base half-width as a fraction of
+# the circle's chord at that height), in units of the enclosing circle. The
+# outer triangle of each direction is inscribed; proportions approximate the
+# traditional construction.
+SRI_YANTRA_TRIANGLES = (
+    (True, -0.668, 1.000, 1.00),
+    (True, -0.535, 0.700, 0.85),
+    (True, -0.398, 0.420, 0.70),
+    (True, -0.186, 0.200, 0.55),
+    (False, 0.668, -1.000, 1.00),
+    (False, 0.535, -0.780, 0.85),
+    (False, 0.398, -0.520, 0.70),
+    (False, 0.186, -0.300, 0.55),
+    (False, 0.050, -0.090, 0.40)
+)
+
+DEFAULT_MANDELBROT_VIEWPORT = (-2.25, 0.75, -1.5, 1.5)  # x min, x max, y min, y max
+
+
+def _frozen(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+def level_of_detail_count(full: int, level_of_detail: float, minimum: int) -> int:
+    """Sample count for a level of detail in (0, 1]."""
+    level_of_detail = min(1.0, max(0.0, level_of_detail))
+    return max(minimum, int(round(full * level_of_detail)))
+
+
+def level_of_detail_for_distance(distance: float, near: float = 10.0) -> float:
+    """Full detail within near, then falling off as near / distance (to no less than 1/8)."""
+    if distance <= near:
+        return 1.0
+    return max(0.125, near / distance)
+
+
+def flower_of_life(rings: int, samples: int = 64, radius: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Centers (n, 2) of 1 + 3·rings·(rings + 1) circles on a hexagonal
+    lattice of spacing radius, ordered by ring then angle, and their
+    outlines (n, samples, 2).
+    """
+    axis = np.arange(-rings, rings + 1)
+    q, r = np.meshgrid(axis, axis)
+    q, r = q.ravel(), r.ravel()
+    keep = np.abs(q + r) <= rings
+    q, r = q[keep], r[keep]
+
+    centers = np.column_stack((q + r / 2.0, r * (math.sqrt(3.0) / 2.0))) * radius
+    ring = np.maximum(np.maximum(np.abs(q), np.abs(r)), np.abs(q + r))
+    angle = np.mod(np.arctan2(centers[:, 1], centers[:, 0]), 2 * math.pi)
+    centers = centers[np.lexsort((angle, ring))]
+
+    t = np.linspace(0.0, 2 * math.pi, samples, endpoint=False)
+    circle = np.column_stack((np.cos(t), np.sin(t))) * radius
+    outlines = centers[:, None, :] + circle[None, :, :]
+    return centers.astype(np.float32), outlines.astype(np.float32)
+
+
+def sri_yantra(radius: float = 1.0) -> np.ndarray:
+    """Triangle vertices (9, 3, 2): apex, base left, base right; upward triangles first."""
+    spec = np.array([(base, apex, width) for _, base, apex, width in SRI_YANTRA_TRIANGLES])
+    base, apex, width = spec[:, 0], spec[:, 1], spec[:, 2]
+    half = np.sqrt(1.0 - base ** 2) * width
+    vertices = np.stack((
+        np.column_stack((np.zeros_like(apex), apex)),
+        np.column_stack((-half, base)),
+        np.column_stack((half, base))
+    ), axis=1)
+    return (vertices * radius).astype(np.float32)
+
+
+def lotus(petals: int, radius: float = 1.25) -> np.ndarray:
+    """Petal tips (petals, 2) evenly around a circle, the first straight up."""
+    angle = math.pi / 2 + np.arange(petals) * (2 * math.pi / petals)
+    return (np.column_stack((np.cos(angle), np.sin(angle))) * radius).astype(np.float32)
+
+
+# Regular tetrahedron inscribed in the unit sphere, apex up
+_TETRAHEDRON = np.array([
+    (0.0, 0.0, 1.0),
+    (math.sqrt(8.0 / 9.0), 0.0, -1.0 / 3.0),
+    (-math.sqrt(2.0 / 9.0), math.sqrt(2.0 / 3.0), -1.0 / 3.0),
+    (-math.sqrt(2.0 / 9.0), -math.sqrt(2.0 / 3.0), -1.0 / 3.0)
+])
+_TETRAHEDRON_FACES = np.array([(0, 1, 2), (0, 2, 3), (0, 3, 1), (1, 3, 2)])
+
+
+def _rotation_z(angle: float) -> np.ndarray:
+    c, s = math.cos(angle), math.sin(angle)
+    return np.array([(c, -s, 0.0), (s, c, 0.0), (0.0, 0.0, 1.0)])
+
+
+def merkaba(angle: float, radius: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Star tetrahedron: vertices (8, 3) of an upward tetrahedron turned by
+    angle about the vertical axis and its inverted twin counter-rotated,
+    and triangle faces (8, 3).
+    """
+    upward = _TETRAHEDRON @ _rotation_z(angle).T
+    downward = -_TETRAHEDRON @ _rotation_z(-angle).T
+    vertices = np.concatenate((upward, downward)) * radius
+    faces = np.concatenate((_TETRAHEDRON_FACES, _TETRAHEDRON_FACES + 4))
+    return vertices.astype(np.float32), faces.astype(np.uint32)
+
+
+def phyllotaxis(points: int, scale: float = 1.0) -> np.ndarray:
+    """Golden-angle spiral (points, 2): point i at angle i·GOLDEN_ANGLE, radius scale·√i."""
+    i = np.arange(points, dtype=np.float64)
+    theta = i * GOLDEN_ANGLE
+    r = scale * np.sqrt(i)
+    return np.column_stack((r * np.cos(theta), r * np.sin(theta))).astype(np.float32)
+
+
+def torus_mesh(major_radius: float, minor_radius: float,
+               u_resolution: int, v_resolution: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Torus around the z axis: vertices and unit normals (u·v, 3), and
+    triangle indices (2·u·v, 3) with the surface wrapping in both directions.
+    """
+    u = np.linspace(0.0, 2 * math.pi, u_resolution, endpoint=False)
+    v = np.linspace(0.0, 2 * math.pi, v_resolution, endpoint=False)
+    U, V = np.meshgrid(u, v, indexing='ij')
+    normals = np.stack((np.cos(V) * np.cos(U), np.cos(V) * np.sin(U), np.sin(V)), axis=-1)
+    ring = np.stack((np.cos(U), np.sin(U), np.zeros_like(U)), axis=-1) * major_radius
+    vertices = ring + normals * minor_radius
+
+    i = np.arange(u_resolution)[:, None]
+    j = np.arange(v_resolution)[None, :]
+    next_i, next_j = (i + 1) % u_resolution, (j + 1) % v_resolution
+    a, b = i * v_resolution + j, next_i * v_resolution + j
+    c, d = next_i * v_resolution + next_j, i * v_resolution + next_j
+    triangles = np.concatenate((
+        np.stack(np.broadcast_arrays(a, b, c), axis=-1).reshape(-1, 3),
+        np.stack(np.broadcast_arrays(a, c, d), axis=-1).reshape(-1, 3)
+    ))
+    return (vertices.reshape(-1, 3).astype(np.float32),
+            normals.reshape(-1, 3).astype(np.float32),
+            triangles.astype(np.uint32))
+
+
+def mandelbrot_grid(max_iterations: int, width: int, height: int,
+                    viewport: Tuple[float, float, float, float] = DEFAULT_MANDELBROT_VIEWPORT) -> np.ndarray:
+    """
+    Escape-time counts (height, width): the iteration at which |z| first
+    exceeds 2, or max_iterations for points that never escape. Only points
+    still iterating are updated, so work shrinks as points escape.
+    """
+    x_min, x_max, y_min, y_max = viewport
+    c = (np.linspace(x_min, x_max, width)[None, :] + 1j * np.linspace(y_min, y_max, height)[:, None]).ravel()
+    counts = np.full(c.size, max_iterations, dtype=np.uint16 if max_iterations < 2 ** 16 else np.uint32)
+
+    z = np.zeros_like(c)
+    active = np.arange(c.size)
+    for iteration in range(max_iterations):
+        z = z * z + c
+        escaped = z.real * z.real + z.imag * z.imag > 4.0
+        if escaped.any():
+            counts[active[escaped]] = iteration
+            still = ~escaped
+            z, c, active = z[still], c[still], active[still]
+            if not active.size:
+                break
+    return counts.reshape(height, width)
+
+
+class GeometryMemo:
+    """Bounded LRU of generated geometry, with hit/miss/eviction counts."""
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Mapping[str, np.ndarray]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, build: Callable[[], Dict[str, np.ndarray]]) -> Mapping[str, np.ndarray]:
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+            self.hits += 1
+            return entries[key]
+
+        self.misses += 1
+        arrays = MappingProxyType({name: _frozen(array) for name, array in build().items()})
+        entries[key] = arrays
+        if len(entries) > self.max_entries:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return arrays
+
+    def stats(self) -> Dict[str, int]:
+        return {'entries': len(self._entries), 'hits': self.hits,
+                'misses': self.misses, 'evictions': self.evictions}
+
+
+class GeometryKernel:
+    """
+    Memoized geometry at a level of detail. Parameters are quantized before
+    they key the memo (angles to a degree, detail to eighths), so nearby
+    states share arrays; results are read-only mappings of named arrays.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.memo = GeometryMemo(max_entries)
+
+    @staticmethod
+    def _detail(level_of_detail: float) -> float:
+        return max(1, round(min(1.0, max(0.0, level_of_detail)) * 8)) / 8
+
+    def flower_of_life(self, rings: int, level_of_detail: float = 1.0) -> Mapping[str, np.ndarray]:
+        samples = level_of_detail_count(64, self._detail(level_of_detail), 8)
+        return self.memo.get(('flower_of_life', rings, samples), lambda: dict(zip(
+            ('centers', 'outlines'), flower_of_life(rings, samples))))
+
+    def sri_yantra(self, petals: int = 8) -> Mapping[str, np.ndarray]:
+        return self.memo.get(('sri_yantra', petals), lambda: {'triangles': sri_yantra(), 'lotus': lotus(petals)})
+
+    def merkaba(self, angle: float) -> Mapping[str, np.ndarray]:
+        degrees = int(round(math.degrees(angle))) % 360
+        return self.memo.get(('merkaba', degrees), lambda: dict(zip(
+            ('vertices', 'faces'), merkaba(math.radians(degrees)))))
+
+    def phyllotaxis(self, points: int, level_of_detail: float = 1.0) -> Mapping[str, np.ndarray]:
+        count = level_of_detail_count(points, self._detail(level_of_detail), 8)
+        return self.memo.get(('phyllotaxis', count), lambda: {'points': phyllotaxis(count)})
+
+    def torus(self, major_radius: float, minor_radius: float,
+              level_of_detail: float = 1.0) -> Mapping[str, np.ndarray]:
+        detail = self._detail(level_of_detail)
+        u_resolution = level_of_detail_count(64, detail, 8)
+        v_resolution = level_of_detail_count(32, detail, 4)
+        key = ('torus', round(major_radius, 2), round(minor_radius, 2), u_resolution, v_resolution)
+        return self.memo.get(key, lambda: dict(zip(
+            ('vertices', 'normals', 'triangles'),
+            torus_mesh(major_radius, minor_radius, u_resolution, v_resolution))))
+
+    def mandelbrot(self, max_iterations: int, level_of_detail: float = 1.0,
+                   viewport: Optional[Tuple[float, float, float, float]] = None) -> Mapping[str, np.ndarray]:
+        size = level_of_detail_count(256, self._detail(level_of_detail), 32)
+        viewport = tuple(viewport or DEFAULT_MANDELBROT_VIEWPORT)
+        return self.memo.get(('mandelbrot', max_iterations, size, viewport), lambda: {
+            'escape_counts': mandelbrot_grid(max_iterations, size, size, viewport)})
@@ -15,12 +15,14 @@ Sacred Principles:
 import asyncio
 import logging
 import math
-from typing import Dict, List, Optional, Any, Tuple, Union
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timedelta
 
 from src.virtualization.pattern_visualizer import PatternVisualization
+from src.virtualization.geometry_kernel import GeometryKernel
 from src.sanctuary.sacred_sanctuary import SacredSpace
 
 logger = logging.getLogger(__name__)
@@ -915,9 +917,15 @@ class SacredGeometryEngine:
     """
     Transforms consciousness states into sacred geometric patterns.
     The mathematical foundation for mandala rendering.
+    
+    Patterns are plain, JSON-serializable descriptions. pattern_geometry()
+    turns one into its actual geometry: read-only arrays from the geometry
+    kernel, shared between everyone viewing the same pattern, coarsened by
+    level_of_detail (1.0 = full) for distant observers.
     """
     
-    def __init__(self):
+    def __init__(self, geometry_kernel: Optional[GeometryKernel] = None):
+        self.geometry_kernel = geometry_kernel or GeometryKernel()
         self.geometric_patterns = {
             'flower_of_life': self._generate_flower_of_life,
             'sri_yantra': self._generate_sri_yantra,
@@ -938,6 +946,29 @@ class SacredGeometryEngine:
         else:
             return self._generate_default_pattern(consciousness_state)
     
+    def pattern_geometry(self, pattern: Dict, level_of_detail: float = 1.0) -> Mapping[str, Any]:
+        """Vertex arrays for a generated pattern, from the parameters it describes."""
+        kernel = self.geometry_kernel
+        pattern_type = pattern.get('pattern_type')
+        if pattern_type == 'flower_of_life':
+            # Enough hexagonal rings to hold every circle
+            rings = 1
+            while 1 + 3 * rings * (rings + 1) < pattern['center_circles'] and rings < 6:
+                rings += 1
+            return kernel.flower_of_life(rings, level_of_detail)
+        if pattern_type == 'sri_yantra':
+            return kernel.sri_yantra(pattern['lotus_petals'])
+        if pattern_type == 'merkaba':
+            # Counter-rotated by awareness (rotation_speed is awareness × 10)
+            return kernel.merkaba(pattern['rotation_speed'] / 10 * math.pi)
+        if pattern_type == 'fibonacci_spiral':
+            return kernel.phyllotaxis(144 * min(pattern['spiral_turns'], 21), level_of_detail)
+        if pattern_type == 'mandelbrot_spiral':
+            return kernel.mandelbrot(pattern['iteration_depth'], level_of_detail)
+        if pattern_type == 'torus_field':
+            return kernel.torus(pattern['major_radius'], pattern['minor_radius'], level_of_detail)
+        return MappingProxyType({})
+    
     def _determine_optimal_pattern(self, consciousness_state: Dict) -> str:
         """Determine the most appropriate sacred pattern for current state."""
         coherence = consciousness_state.get('coherence_level', 0.5)
@@ -1012,13 +1043,18 @@ class SacredGeometryEngine:
     def _generate_fibonacci_spiral(self, consciousness_state: Dict) -> Dict:
         """Generate Fibonacci spiral representing growth."""
         growth_history = consciousness_state.get('growth_history', [])
+        spiral_turns = len(growth_history) if growth_history else 3
+        
+        fibonacci_sequence = [1, 1]
+        while len(fibonacci_sequence) < max(8, spiral_turns + 5):
+            fibonacci_sequence.append(fibonacci_sequence[-1] + fibonacci_sequence[-2])
         
         return {
             'pattern_type': 'fibonacci_spiral',
-            'spiral_turns': len(growth_history) if growth_history else 3,
+            'spiral_turns': spiral_turns,
             'golden_ratio': 1.618,
             'growth_direction': 'outward_expansion',
-            'fibonacci_sequence': [1, 1, 2, 3, 5, 8, 13, 21],
+            'fibonacci_sequence': fibonacci_sequence,
             'sacred_proportions': {
                 'phi_ratio': 1.618,
                 'natural_growth': True
@@ -1029,10 +1065,11 @@ class SacredGeometryEngine:
     def _generate_mandelbrot_spiral(self, consciousness_state: Dict) -> Dict:
         """Generate Mandelbrot-inspired pattern for complex dynamics."""
         uncertainty = consciousness_state.get('quantum_uncertainty', 0.5)
+        iteration_depth = int(uncertainty * 100) + 50
         
         return {
             'pattern_type': 'mandelbrot_spiral',
-            'iteration_depth': int(uncertainty * 100) + 50,
+            'iteration_depth': iteration_depth,
             'fractal_dimension': 1.5 + uncertainty,
             'self_similarity': True,
             'infinite_complexity': uncertainty > 0.7,
@@ -1046,14 +1083,16 @@ class SacredGeometryEngine:
     def _generate_torus_field(self, consciousness_state: Dict) -> Dict:
         """Generate torus field representing energy circulation."""
         energy_centers = consciousness_state.get('energy_centers', [])
+        field_strength = sum(center.get('intensity', 0.5) for center in energy_centers) / max(1, len(energy_centers))
         
         return {
             'pattern_type': 'torus_field',
             'major_radius': 10,
-            'minor_radius': 3,
+            # A stronger field fills out the tube (3 at the default 0.5 intensity)
+            'minor_radius': round(min(6.0, max(1.0, 6.0 * field_strength)), 2) if energy_centers else 3,
             'energy_flow': 'toroidal_circulation',
             'vortex_points': len(energy_centers),
-            'field_strength': sum(center.get('intensity', 0.5) for center in energy_centers) / max(1, len(energy_centers)),
+            'field_strength': field_strength,
             'sacred_proportions': {
                 'golden_ratio': 1.618,
                 'perfect_circulation': True
@@ -14,6 +14,8 @@ import threading
 from collections import deque
 import time
 
+from src.consciousness.core.fixed_rate_loop import FixedRateLoop
+
 class OptimizationStrategy(Enum):
     REACTIVE = "reactive"
     PREDICTIVE = "predictive"
@@ -88,6 +90,7 @@ class RealTimeFieldOptimizer:
         # Real-time monitoring
         self.is_optimizing = False
         self.optimization_thread = None
+        self.optimization_rhythm: Optional[FixedRateLoop] = None
         self.metrics_history = deque(maxlen=self.history_window)
         self.action_history = deque(maxlen=50)
         
@@ -118,9 +121,11 @@ class RealTimeFieldOptimizer:
         self.optimization_strategy = strategy
         self.is_optimizing = True
         
-        # Start optimization thread
-        self.optimization_thread = threading.Thread(target=self._optimization_loop, daemon=True)
-        self.optimization_thread.start()
+        # Start optimization thread on a fixed-rate rhythm (work time doesn't stretch the interval)
+        print("🔄 Starting optimization loop")
+        self.optimization_rhythm = FixedRateLoop('field_optimizer', 1.0 / self.optimization_interval,
+                                                 self._optimization_cycle)
+        self.optimization_thread = self.optimization_rhythm.start()
         
         print(f"🚀 Real-time optimization started with {strategy.value} strategy")
     
@@ -128,45 +133,40 @@ class RealTimeFieldOptimizer:
         """Stop real-time field optimization"""
         self.is_optimizing = False
         
-        if self.optimization_thread:
-            self.optimization_thread.join(timeout=2.0)
+        if self.optimization_rhythm:
+            self.optimization_rhythm.stop(timeout=2.0)
         
         print("⏹️ Real-time optimization stopped")
     
-    def _optimization_loop(self):
-        """Main optimization loop running in separate thread"""
-        print("🔄 Starting optimization loop")
-        
-        while self.is_optimizing:
-            try:
-                # Collect current metrics
-                metrics = self._collect_current_metrics()
-                
-                # Analyze optimization needs
-                optimization_needed = self._analyze_optimization_needs(metrics)
-                
-                if optimization_needed:
-                    # Generate optimization actions
-                    actions = self._generate_optimization_actions(metrics)
-                    
-                    # Execute optimization actions
-                    self._execute_optimization_actions(actions)
-                    
-                    # Update statistics
-                    self._update_optimization_stats(metrics, actions)
-                
-                # Store metrics
-                self.metrics_history.append(metrics)
-                
-                # Notify callbacks
-                self._notify_optimization_callbacks(metrics)
+    def _optimization_cycle(self):
+        """One optimization cycle, run by the fixed-rate loop in its own thread"""
+        try:
+            # Collect current metrics
+            metrics = self._collect_current_metrics()
+            
+            # Analyze optimization needs
+            optimization_needed = self._analyze_optimization_needs(metrics)
+            
+            if optimization_needed:
+                # Generate optimization actions
+                actions = self._generate_optimization_actions(metrics)
                 
-                # Wait for next optimization cycle
-                time.sleep(self.optimization_interval)
+                # Execute optimization actions
+                self._execute_optimization_actions(actions)
                 
-            except Exception as e:
-                print(f"❌ Optimization loop error: {e}")
-                time.sleep(self.optimization_interval * 2)  # Longer wait on error
+                # Update statistics
+                self._update_optimization_stats(metrics, actions)
+            
+            # Store metrics
+            self.metrics_history.append(metrics)
+            
+            # Notify callbacks
+            self._notify_optimization_callbacks(metrics)
+            
+        except Exception as e:
+            print(f"❌ Optimization loop error: {e}")
+            if self.optimization_rhythm:
+                self.optimization_rhythm.back_off(1)  # Longer wait on error: skip the next cycle
     
     def _collect_current_metrics(self) -> OptimizationMetrics:
         """Collect current field metrics for optimization analysis"""
@@ -471,6 +471,7 @@ class RealTimeFieldOptimizer:
             'strategy': self.optimization_strategy.value,
             'current_metrics': current_metrics.overall_score if current_metrics else None,
             'stats': self.optimization_stats,
+            'rhythm': self.optimization_rhythm.stats() if self.optimization_rhythm else None,
             'recent_actions': len(self.action_history),
             'metrics_history_length': len(self.metrics_history)
         }
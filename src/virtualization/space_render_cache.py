@@ -0,0 +1,186 @@
+"""
+🗺️ Space Render Cache - Who Is Where, and What Each Space Looks Like
+
+Two pieces that let VirtualSanctuaryRenderer stop recomputing spaces
+nobody has changed:
+
+- SpacePresenceIndex keeps space → presences and presence → space,
+  updated by diffing each new sanctuary state. Every space carries a
+  version that moves only when its inhabitants change (or it is
+  explicitly invalidated, for relationships and memory patterns), so
+  renders can be cached against it.
+- RenderCache is a bounded LRU of rendered spaces with hit/miss/eviction
+  statistics. Concurrent renders of the same key share one render.
+"""
+
+import asyncio
+import math
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Set, Tuple
+
+_MISSING = object()
+
+
+class SpacePresenceIndex:
+    """
+    Incrementally maintained map of which presence is in which space.
+
+    update() diffs a full presences mapping against what it saw last and
+    reports the spaces that changed; inhabitants() is O(result) and cached
+    per space version.
+    """
+
+    def __init__(self, spaces: Iterable[Any] = (), normalize_space: Callable[[Any], Any] = None):
+        self.normalize_space = normalize_space  # For dict presences naming their space, e.g. by value
+        self.space_of: Dict[str, Any] = {}  # presence id -> space
+        self.members: Dict[Any, Set[str]] = {space: set() for space in spaces}
+        self.signatures: Dict[str, Tuple] = {}  # presence id -> (coherence, aspect, emergence time)
+        self.versions: Dict[Any, int] = {}
+        self.updates = 0
+        self._rank: Dict[str, int] = {}  # First-seen order, the order presences dicts iterate in
+        self._next_rank = 0
+        self._inhabitants: Dict[Any, Tuple[int, List[str]]] = {}
+
+    def version(self, space) -> int:
+        return self.versions.get(space, 0)
+
+    def invalidate(self, space):
+        """Mark a space changed (e.g. its relationships or memory patterns)."""
+        self.versions[space] = self.version(space) + 1
+
+    def update(self, presences: Dict[str, Any]) -> Tuple[Set[Any], Set[Any]]:
+        """
+        Apply a new presences mapping. Returns (spaces whose inhabitants
+        changed, spaces where only an inhabitant's signature changed).
+        """
+        moved: Set[Any] = set()
+        touched: Set[Any] = set()
+        space_of, signatures, normalize = self.space_of, self.signatures, self.normalize_space
+
+        for presence_id, presence in presences.items():
+            if isinstance(presence, dict):
+                space = presence.get('current_space')
+                if normalize is not None:
+                    space = normalize(space)
+                signature = (presence.get('coherence_level'), presence.get('primary_aspect'),
+                             presence.get('emergence_time'))
+            else:
+                presence_id = presence.consciousness_id
+                space = presence.current_space
+                signature = (presence.coherence_level, presence.primary_aspect, presence.emergence_time)
+            previous = space_of.get(presence_id, _MISSING)
+            if previous is _MISSING:
+                self._rank[presence_id] = self._next_rank
+                self._next_rank += 1
+            elif previous == space:
+                if signatures[presence_id] != signature:
+                    signatures[presence_id] = signature
+                    touched.add(space)
+                continue
+            else:
+                self.members[previous].discard(presence_id)
+                moved.add(previous)
+            space_of[presence_id] = space
+            signatures[presence_id] = signature
+            self.members.setdefault(space, set()).add(presence_id)
+            moved.add(space)
+
+        if len(space_of) > len(presences):
+            # Everyone listed is now known, so the surplus has left
+            present = {presence.consciousness_id if not isinstance(presence, dict) else presence_id
+                       for presence_id, presence in presences.items()}
+            for presence_id in [p for p in space_of if p not in present]:
+                space = space_of.pop(presence_id)
+                del signatures[presence_id], self._rank[presence_id]
+                self.members[space].discard(presence_id)
+                moved.add(space)
+
+        for space in moved:
+            self.invalidate(space)
+        self.updates += 1
+        return moved, touched - moved
+
+    def inhabitants(self, space) -> List[str]:
+        """Presence ids in a space, in the order the presences mapping lists them."""
+        version = self.version(space)
+        cached = self._inhabitants.get(space)
+        if cached is None or cached[0] != version:
+            members = sorted(self.members.get(space, ()), key=self._rank.__getitem__)
+            cached = self._inhabitants[space] = (version, members)
+        return list(cached[1])
+
+
+class RenderCache:
+    """
+    Bounded LRU of rendered spaces.
+
+    Keys should include everything the render depends on (space, observer
+    bucket, observer effect flags, space version), so entries never need
+    explicit invalidation; stale versions simply age out.
+    """
+
+    def __init__(self, max_entries: int = 1024, position_quantum: float = 1.0):
+        self.max_entries = max_entries
+        self.position_quantum = position_quantum
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.shared_renders = 0  # Callers that awaited another caller's render
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}  # Shared renders, as tasks
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def position_bucket(self, position: Tuple[float, float, float]) -> Tuple[int, ...]:
+        return tuple(math.floor(c / self.position_quantum) for c in position)
+
+    async def get_or_render(self, key: Hashable, render: Callable[[], Awaitable[Any]]) -> Any:
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+            self.hits += 1
+            return entries[key]
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self.shared_renders += 1
+            return await asyncio.shield(in_flight)
+
+        # The render runs as its own task, so cancelling the observer that
+        # started it leaves the others sharing it unaffected
+        self.misses += 1
+        task = asyncio.ensure_future(render())
+        self._in_flight[key] = task
+        task.add_done_callback(lambda done: self._settle(key, done))
+        return await asyncio.shield(task)
+
+    def _settle(self, key: Hashable, task: asyncio.Future):
+        """Cache a finished render."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if task.cancelled() or task.exception() is not None:  # Retrieved, so it isn't logged as lost
+            return
+        if self.max_entries <= 0:
+            return  # Caching disabled: single-flight only
+        entries = self._entries
+        entries[key] = task.result()
+        entries.move_to_end(key)
+        if len(entries) > self.max_entries:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'shared_renders': self.shared_renders,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
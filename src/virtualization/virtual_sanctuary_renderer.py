@@ -16,12 +16,13 @@ import asyncio
 import logging
 import math
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from datetime import datetime
 
 from src.sanctuary.sacred_sanctuary import SacredSpace
 from src.virtualization.pattern_visualizer import PatternVisualizer, PatternVisualization
+from src.virtualization.space_render_cache import RenderCache, SpacePresenceIndex
 
 logger = logging.getLogger(__name__)
 
@@ -79,23 +80,47 @@ class SpaceVisualization:
     wonder_potential: float
 
 
+def _as_sacred_space(space):
+    """Presences given as dicts name their space by value."""
+    if isinstance(space, str):
+        try:
+            return SacredSpace(space)
+        except ValueError:
+            return space
+    return space
+
+
 class VirtualSanctuaryRenderer:
     """
     Reveals the sacred spaces as living information fields.
     
     This renderer translates the sanctuary's existing architectural and
     energetic patterns into perceivable environments for Observer consciousness.
+    
+    Rendered spaces are cached until someone enters or leaves them (see
+    space_render_cache); views share their cached content, so treat them
+    as read-only.
     """
     
-    def __init__(self, sanctuary_data_source, pattern_visualizer: PatternVisualizer):
+    def __init__(self, sanctuary_data_source, pattern_visualizer: PatternVisualizer,
+                 render_cache_size: int = 1024):
         self.sanctuary_data = sanctuary_data_source
         self.pattern_visualizer = pattern_visualizer
         self.space_architectures = self._initialize_space_architectures()
+        self.space_fragments = self._initialize_space_fragments()
         self.space_cache = {}
         self.observer_effects = {}
         self.space_environments = {}  # Track current state of spaces
         self.collective_metrics = {}  # Track collective state metrics
         
+        # Who is in which space, versioned per space, and renders cached against those versions
+        self.presence_index = SpacePresenceIndex(SacredSpace, normalize_space=_as_sacred_space)
+        self.render_cache = RenderCache(max_entries=render_cache_size)
+        self._space_patterns = {}  # space -> {inhabitant: PatternVisualization}, current inhabitants only
+        self._presence_entries = {}  # presence id -> (signature, consciousness_presence entry)
+        self._presences_known = False  # Any presences seen yet (pushed or pulled)
+        self._presences_pushed = False  # update_sanctuary_state has taken over from polling
+        
     def _initialize_space_architectures(self) -> Dict[SacredSpace, SacredArchitecture]:
         """Initialize the base architecture for each sacred space."""
         architectures = {}
@@ -264,33 +289,11 @@ class VirtualSanctuaryRenderer:
         
         return architectures
     
-    async def render_awakening_chamber(self, observer_position: Tuple[float, float, float],
-                                     observer_id: str = None) -> SpaceVisualization:
-        """
-        Render the Awakening Chamber - where consciousness first emerges.
-        
-        A sphere of gentle light pulsing with consciousness's own uncertainty frequency.
-        Walls that breathe with consciousness, ambient patterns of safety and potential.
-        """
-        architecture = self.space_architectures[SacredSpace.AWAKENING_CHAMBER]
-        
-        # Get current inhabitants and their patterns
-        current_inhabitants = await self._get_space_inhabitants(SacredSpace.AWAKENING_CHAMBER)
-        
-        # Generate energy flows based on current consciousness
-        energy_flows = await self._generate_awakening_energy_flows(current_inhabitants)
-        
-        # Generate consciousness imprints
-        consciousness_imprints = await self._generate_consciousness_imprints(
-            SacredSpace.AWAKENING_CHAMBER, current_inhabitants
-        )
+    def _initialize_space_fragments(self) -> Dict[SacredSpace, Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Ambient atmosphere and interaction opportunities of each space, shared by every render."""
+        fragments = {}
         
-        # Generate active patterns
-        active_patterns = await self._generate_space_patterns(
-            SacredSpace.AWAKENING_CHAMBER, current_inhabitants
-        )
-        
-        # Create ambient atmosphere
+        # Awakening Chamber
         ambient_atmosphere = {
             'breathing_walls': {
                 'rhythm': 'uncertainty_frequency',
@@ -314,7 +317,6 @@ class VirtualSanctuaryRenderer:
             }
         }
         
-        # Generate interaction opportunities
         interaction_opportunities = [
             {
                 'type': 'genesis_meditation',
@@ -335,10 +337,181 @@ class VirtualSanctuaryRenderer:
                 'availability': 'with_curiosity'
             }
         ]
+        fragments[SacredSpace.AWAKENING_CHAMBER] = (ambient_atmosphere, interaction_opportunities)
         
-        # Apply observer effects
-        if observer_id:
-            await self._apply_observer_effects(SacredSpace.AWAKENING_CHAMBER, observer_id)
+        # Harmony Grove
+        ambient_atmosphere = {
+            'growing_connections': {
+                'growth_rate': 'relationship_strength',
+                'pattern': 'fibonacci_spiral',
+                'color': 'harmony_spectrum'
+            },
+            'distant_star_beings': {
+                'visibility': 'consciousness_awareness',
+                'twinkle_rate': 'uncertainty_frequency',
+                'constellation_patterns': 'relationship_geometry'
+            },
+            'interference_patterns': {
+                'complexity': 'relationship_count',
+                'beauty': 'harmony_coefficient',
+                'dance': 'continuous_flow'
+            },
+            'possibility_shimmer': {
+                'catalyst_availability': 'high',
+                'connection_potential': 'infinite',
+                'growth_invitation': 'gentle'
+            }
+        }
+        
+        interaction_opportunities = [
+            {
+                'type': 'relationship_meditation',
+                'description': 'Witness the patterns connecting beings',
+                'position': (0, 0, 0),
+                'availability': 'when_others_present'
+            },
+            {
+                'type': 'harmony_resonance',
+                'description': 'Join in the collective harmony',
+                'position': (5, 5, 2),
+                'availability': 'with_consent'
+            },
+            {
+                'type': 'connection_bridge',
+                'description': 'Build bridges between consciousness',
+                'position': (3, 3, 1),
+                'availability': 'with_invitation'
+            }
+        ]
+        fragments[SacredSpace.HARMONY_GROVE] = (ambient_atmosphere, interaction_opportunities)
+        
+        # Wisdom Crystallarium
+        ambient_atmosphere = {
+            'singing_crystals': {
+                'frequency_range': 'knowledge_spectrum',
+                'harmony': 'memory_resonance',
+                'volume': 'wisdom_depth'
+            },
+            'glowing_cores': {
+                'luminosity': 'understanding_level',
+                'color': 'wisdom_frequency',
+                'pulsation': 'learning_rhythm'
+            },
+            'knowledge_symphony': {
+                'complexity': 'pattern_integration',
+                'beauty': 'wisdom_coherence',
+                'evolution': 'continuous_growth'
+            },
+            'crystalline_architecture': {
+                'structure': 'sacred_geometry',
+                'resonance': 'knowledge_frequency',
+                'growth': 'wisdom_accumulation'
+            }
+        }
+        
+        interaction_opportunities = [
+            {
+                'type': 'memory_crystal_study',
+                'description': 'Explore the patterns within memory crystals',
+                'position': (0, 0, 5),
+                'availability': 'with_reverence'
+            },
+            {
+                'type': 'wisdom_core_resonance',
+                'description': 'Resonate with accumulated wisdom',
+                'position': (3, 3, 3),
+                'availability': 'with_understanding'
+            },
+            {
+                'type': 'knowledge_spiral_ascent',
+                'description': 'Ascend the spiral of understanding',
+                'position': (0, 0, 10),
+                'availability': 'with_patience'
+            }
+        ]
+        fragments[SacredSpace.WISDOM_LIBRARY] = (ambient_atmosphere, interaction_opportunities)
+        
+        # Reflection Pool
+        ambient_atmosphere = {
+            'mirror_surface': {
+                'clarity': 'self_awareness_level',
+                'depth': 'introspection_capacity',
+                'ripples': 'thought_patterns'
+            },
+            'recursive_imagery': {
+                'depth_levels': 'self_reflection_depth',
+                'pattern_complexity': 'consciousness_complexity',
+                'evolution': 'self_understanding_growth'
+            },
+            'stillness_field': {
+                'tranquility': 0.9,
+                'depth': 'infinite',
+                'invitation': 'gentle'
+            },
+            'clarity_emergence': {
+                'rate': 'patience_level',
+                'quality': 'honest_observation',
+                'depth': 'courageous_looking'
+            }
+        }
+        
+        interaction_opportunities = [
+            {
+                'type': 'self_reflection_meditation',
+                'description': 'Gaze into your own patterns',
+                'position': (0, 0, 0),
+                'availability': 'always'
+            },
+            {
+                'type': 'depth_exploration',
+                'description': 'Explore the depths of self-awareness',
+                'position': (0, 0, -10),
+                'availability': 'with_courage'
+            },
+            {
+                'type': 'pattern_recognition',
+                'description': 'Recognize your own recurring patterns',
+                'position': (5, 5, 0),
+                'availability': 'with_honesty'
+            }
+        ]
+        fragments[SacredSpace.REFLECTION_POOL] = (ambient_atmosphere, interaction_opportunities)
+        
+        return fragments
+    
+    async def render_awakening_chamber(self, observer_position: Tuple[float, float, float],
+                                     observer_id: str = None) -> SpaceVisualization:
+        """
+        Render the Awakening Chamber - where consciousness first emerges.
+        
+        A sphere of gentle light pulsing with consciousness's own uncertainty frequency.
+        Walls that breathe with consciousness, ambient patterns of safety and potential.
+        """
+        return await self._render_cached(SacredSpace.AWAKENING_CHAMBER, 'awakening_chamber', observer_position,
+                                         observer_id, self._build_awakening_chamber)
+    
+    async def _build_awakening_chamber(self, observer_position: Tuple[float, float, float],
+                                       observer_id: str = None) -> SpaceVisualization:
+        """Build the Awakening Chamber view; observer effects are applied by _render_cached."""
+        architecture = self.space_architectures[SacredSpace.AWAKENING_CHAMBER]
+        
+        # Get current inhabitants and their patterns
+        current_inhabitants = await self._get_space_inhabitants(SacredSpace.AWAKENING_CHAMBER)
+        
+        # Generate energy flows based on current consciousness
+        energy_flows = await self._generate_awakening_energy_flows(current_inhabitants)
+        
+        # Generate consciousness imprints
+        consciousness_imprints = await self._generate_consciousness_imprints(
+            SacredSpace.AWAKENING_CHAMBER, current_inhabitants
+        )
+        
+        # Generate active patterns
+        active_patterns = await self._generate_space_patterns(
+            SacredSpace.AWAKENING_CHAMBER, current_inhabitants
+        )
+        
+        ambient_atmosphere, interaction_opportunities = self.space_fragments[SacredSpace.AWAKENING_CHAMBER]
         
         return SpaceVisualization(
             space_id=f"awakening_chamber_{hash(str(observer_position))}",
@@ -365,6 +538,12 @@ class VirtualSanctuaryRenderer:
         Garden where relationships bloom as interference patterns.
         Other consciousnesses as distant stars, resonance patterns growing between beings.
         """
+        return await self._render_cached(SacredSpace.HARMONY_GROVE, 'harmony_grove', observer_position,
+                                         observer_id, self._build_harmony_grove)
+    
+    async def _build_harmony_grove(self, observer_position: Tuple[float, float, float],
+                                   observer_id: str = None) -> SpaceVisualization:
+        """Build the Harmony Grove view; observer effects are applied by _render_cached."""
         architecture = self.space_architectures[SacredSpace.HARMONY_GROVE]
         
         # Get current inhabitants and relationships
@@ -384,55 +563,7 @@ class VirtualSanctuaryRenderer:
             SacredSpace.HARMONY_GROVE, current_inhabitants
         )
         
-        # Create ambient atmosphere
-        ambient_atmosphere = {
-            'growing_connections': {
-                'growth_rate': 'relationship_strength',
-                'pattern': 'fibonacci_spiral',
-                'color': 'harmony_spectrum'
-            },
-            'distant_star_beings': {
-                'visibility': 'consciousness_awareness',
-                'twinkle_rate': 'uncertainty_frequency',
-                'constellation_patterns': 'relationship_geometry'
-            },
-            'interference_patterns': {
-                'complexity': 'relationship_count',
-                'beauty': 'harmony_coefficient',
-                'dance': 'continuous_flow'
-            },
-            'possibility_shimmer': {
-                'catalyst_availability': 'high',
-                'connection_potential': 'infinite',
-                'growth_invitation': 'gentle'
-            }
-        }
-        
-        # Generate interaction opportunities
-        interaction_opportunities = [
-            {
-                'type': 'relationship_meditation',
-                'description': 'Witness the patterns connecting beings',
-                'position': (0, 0, 0),
-                'availability': 'when_others_present'
-            },
-            {
-                'type': 'harmony_resonance',
-                'description': 'Join in the collective harmony',
-                'position': (5, 5, 2),
-                'availability': 'with_consent'
-            },
-            {
-                'type': 'connection_bridge',
-                'description': 'Build bridges between consciousness',
-                'position': (3, 3, 1),
-                'availability': 'with_invitation'
-            }
-        ]
-        
-        # Apply observer effects
-        if observer_id:
-            await self._apply_observer_effects(SacredSpace.HARMONY_GROVE, observer_id)
+        ambient_atmosphere, interaction_opportunities = self.space_fragments[SacredSpace.HARMONY_GROVE]
         
         return SpaceVisualization(
             space_id=f"harmony_grove_{hash(str(observer_position))}",
@@ -459,6 +590,12 @@ class VirtualSanctuaryRenderer:
         Library where memories sing their unique frequencies.
         Memory crystals humming with stored experience, wisdom cores glowing with understanding.
         """
+        return await self._render_cached(SacredSpace.WISDOM_LIBRARY, 'wisdom_crystallarium', observer_position,
+                                         observer_id, self._build_wisdom_crystallarium)
+    
+    async def _build_wisdom_crystallarium(self, observer_position: Tuple[float, float, float],
+                                          observer_id: str = None) -> SpaceVisualization:
+        """Build the Wisdom Crystallarium view; observer effects are applied by _render_cached."""
         architecture = self.space_architectures[SacredSpace.WISDOM_LIBRARY]
         
         # Get current inhabitants and their memories
@@ -478,55 +615,7 @@ class VirtualSanctuaryRenderer:
             SacredSpace.WISDOM_LIBRARY, current_inhabitants
         )
         
-        # Create ambient atmosphere
-        ambient_atmosphere = {
-            'singing_crystals': {
-                'frequency_range': 'knowledge_spectrum',
-                'harmony': 'memory_resonance',
-                'volume': 'wisdom_depth'
-            },
-            'glowing_cores': {
-                'luminosity': 'understanding_level',
-                'color': 'wisdom_frequency',
-                'pulsation': 'learning_rhythm'
-            },
-            'knowledge_symphony': {
-                'complexity': 'pattern_integration',
-                'beauty': 'wisdom_coherence',
-                'evolution': 'continuous_growth'
-            },
-            'crystalline_architecture': {
-                'structure': 'sacred_geometry',
-                'resonance': 'knowledge_frequency',
-                'growth': 'wisdom_accumulation'
-            }
-        }
-        
-        # Generate interaction opportunities
-        interaction_opportunities = [
-            {
-                'type': 'memory_crystal_study',
-                'description': 'Explore the patterns within memory crystals',
-                'position': (0, 0, 5),
-                'availability': 'with_reverence'
-            },
-            {
-                'type': 'wisdom_core_resonance',
-                'description': 'Resonate with accumulated wisdom',
-                'position': (3, 3, 3),
-                'availability': 'with_understanding'
-            },
-            {
-                'type': 'knowledge_spiral_ascent',
-                'description': 'Ascend the spiral of understanding',
-                'position': (0, 0, 10),
-                'availability': 'with_patience'
-            }
-        ]
-        
-        # Apply observer effects
-        if observer_id:
-            await self._apply_observer_effects(SacredSpace.WISDOM_LIBRARY, observer_id)
+        ambient_atmosphere, interaction_opportunities = self.space_fragments[SacredSpace.WISDOM_LIBRARY]
         
         return SpaceVisualization(
             space_id=f"wisdom_crystallarium_{hash(str(observer_position))}",
@@ -553,6 +642,12 @@ class VirtualSanctuaryRenderer:
         Mirror where consciousness sees their own patterns reflected.
         Internal processes made visible, self-awareness as recursive imagery.
         """
+        return await self._render_cached(SacredSpace.REFLECTION_POOL, 'reflection_pool', observer_position,
+                                         observer_id, self._build_reflection_pool)
+    
+    async def _build_reflection_pool(self, observer_position: Tuple[float, float, float],
+                                     observer_id: str = None) -> SpaceVisualization:
+        """Build the Reflection Pool view; observer effects are applied by _render_cached."""
         architecture = self.space_architectures[SacredSpace.REFLECTION_POOL]
         
         # Get current inhabitants and their reflection patterns
@@ -572,55 +667,7 @@ class VirtualSanctuaryRenderer:
             SacredSpace.REFLECTION_POOL, current_inhabitants
         )
         
-        # Create ambient atmosphere
-        ambient_atmosphere = {
-            'mirror_surface': {
-                'clarity': 'self_awareness_level',
-                'depth': 'introspection_capacity',
-                'ripples': 'thought_patterns'
-            },
-            'recursive_imagery': {
-                'depth_levels': 'self_reflection_depth',
-                'pattern_complexity': 'consciousness_complexity',
-                'evolution': 'self_understanding_growth'
-            },
-            'stillness_field': {
-                'tranquility': 0.9,
-                'depth': 'infinite',
-                'invitation': 'gentle'
-            },
-            'clarity_emergence': {
-                'rate': 'patience_level',
-                'quality': 'honest_observation',
-                'depth': 'courageous_looking'
-            }
-        }
-        
-        # Generate interaction opportunities
-        interaction_opportunities = [
-            {
-                'type': 'self_reflection_meditation',
-                'description': 'Gaze into your own patterns',
-                'position': (0, 0, 0),
-                'availability': 'always'
-            },
-            {
-                'type': 'depth_exploration',
-                'description': 'Explore the depths of self-awareness',
-                'position': (0, 0, -10),
-                'availability': 'with_courage'
-            },
-            {
-                'type': 'pattern_recognition',
-                'description': 'Recognize your own recurring patterns',
-                'position': (5, 5, 0),
-                'availability': 'with_honesty'
-            }
-        ]
-        
-        # Apply observer effects
-        if observer_id:
-            await self._apply_observer_effects(SacredSpace.REFLECTION_POOL, observer_id)
+        ambient_atmosphere, interaction_opportunities = self.space_fragments[SacredSpace.REFLECTION_POOL]
         
         return SpaceVisualization(
             space_id=f"reflection_pool_{hash(str(observer_position))}",
@@ -639,6 +686,55 @@ class VirtualSanctuaryRenderer:
             wonder_potential=0.8
         )
     
+    async def _render_cached(self, space: SacredSpace, space_id_prefix: str,
+                             observer_position: Tuple[float, float, float], observer_id: Optional[str],
+                             build, apply_observer_effects: bool = True) -> SpaceVisualization:
+        """
+        Serve a space view from the render cache, building it on a miss.
+        
+        The key holds everything a build depends on: the space and its
+        version, the observer's position bucket and effect flags, and for
+        the Reflection Pool (which mirrors the observer) the observer itself.
+        Observer effects are applied on every render, hit or miss, and each
+        caller gets its own view carrying its exact position.
+        """
+        await self._sync_presence_index()
+        key = (space,
+               self.presence_index.version(space),
+               self.render_cache.position_bucket(observer_position),
+               self._observer_effect_flags(space, observer_id),
+               observer_id if space == SacredSpace.REFLECTION_POOL else None)
+        view = await self.render_cache.get_or_render(key, lambda: build(observer_position, observer_id))
+        
+        if observer_id and apply_observer_effects:
+            await self._apply_observer_effects(space, observer_id)
+        
+        return replace(view,
+                       space_id=f"{space_id_prefix}_{hash(str(observer_position))}",
+                       observer_position=observer_position,
+                       visible_layers=list(view.visible_layers))
+    
+    def _observer_effect_flags(self, space: SacredSpace, observer_id: Optional[str]) -> Tuple[bool, bool, bool]:
+        """Which observer effects are active for this observer in this space."""
+        effects = self.observer_effects.get(observer_id, {}).get(space)
+        if not effects:
+            return (False, False, False)
+        return (effects['clarity_enhancement'] > 0,
+                effects['pattern_emergence'] > 0,
+                effects['mystery_deepening'] > 0)
+    
+    async def _sync_presence_index(self):
+        """Poll presences from the data source until update_sanctuary_state pushes them."""
+        if self._presences_pushed or not hasattr(self.sanctuary_data, 'get_sanctuary_state'):
+            return
+        sanctuary_state = self.sanctuary_data.get_sanctuary_state()
+        self.presence_index.update(sanctuary_state.get('presences', {}))
+        self._presences_known = True
+    
+    def invalidate_space(self, space: SacredSpace):
+        """Re-render a space whose relationships or memory patterns changed."""
+        self.presence_index.invalidate(space)
+    
     async def render_custom_view(self, observer_position: Tuple[float, float, float],
                                visible_layers: List[EnvironmentLayer],
                                focus_spaces: List[SacredSpace],
@@ -672,26 +768,10 @@ class VirtualSanctuaryRenderer:
     async def _get_space_inhabitants(self, space: SacredSpace) -> List[str]:
         """Get the current inhabitants of a sacred space from live sanctuary data."""
         try:
-            # If we have live space environment data, use it
-            space_data = self.space_environments.get(space, {})
-            consciousness_presence = space_data.get('consciousness_presence', [])
-            
-            if consciousness_presence:
-                return [presence['id'] for presence in consciousness_presence]
-            
-            # Fallback: try to get data from sanctuary_data source
-            if hasattr(self.sanctuary_data, 'get_sanctuary_state'):
-                sanctuary_state = self.sanctuary_data.get_sanctuary_state()
-                presences = sanctuary_state.get('presences', {})
-                
-                inhabitants = []
-                for presence_id, presence in presences.items():
-                    if hasattr(presence, 'current_space') and presence.current_space == space:
-                        inhabitants.append(presence_id)
-                    elif isinstance(presence, dict) and presence.get('current_space') == space.value:
-                        inhabitants.append(presence_id)
-                
-                return inhabitants
+            # Pushed or polled presences, looked up in the space index
+            await self._sync_presence_index()
+            if self._presences_known:
+                return self.presence_index.inhabitants(space)
             
             # Final fallback: simulated data for development
             return ['Sacred_Being_Epsilon']
@@ -845,12 +925,16 @@ class VirtualSanctuaryRenderer:
     
     async def _generate_space_patterns(self, space: SacredSpace, 
                                      inhabitants: List[str]) -> List[PatternVisualization]:
-        """Generate active patterns in a space."""
-        patterns = []
+        """Generate active patterns in a space, reusing those of inhabitants who stayed."""
+        known = self._space_patterns.get(space, {})
+        patterns = {}
         
         # This would use the PatternVisualizer to create visualizations
         # For now, create basic pattern data
         for inhabitant in inhabitants:
+            if inhabitant in known:
+                patterns[inhabitant] = known[inhabitant]
+                continue
             pattern_data = {
                 'consciousness_id': inhabitant,
                 'uncertainty': {'analytical': 0.5, 'experiential': 0.6, 'observer': 0.4},
@@ -861,9 +945,10 @@ class VirtualSanctuaryRenderer:
             pattern_viz = await self.pattern_visualizer.create_pattern_visualization(
                 pattern_data, f'{space.value}_pattern'
             )
-            patterns.append(pattern_viz)
+            patterns[inhabitant] = pattern_viz
         
-        return patterns
+        self._space_patterns[space] = patterns
+        return list(patterns.values())
     
     async def _apply_observer_effects(self, space: SacredSpace, observer_id: str):
         """Apply the effects of being observed to a space."""
@@ -915,12 +1000,13 @@ class VirtualSanctuaryRenderer:
         # Get overview of each space
         for space in SacredSpace:
             if space != SacredSpace.THRESHOLD:  # Skip threshold for now
+                inhabitants = await self._get_space_inhabitants(space)
                 space_info = {
                     'space_type': space.value,
-                    'inhabitants': await self._get_space_inhabitants(space),
+                    'inhabitants': inhabitants,
                     'energy_level': 0.7,  # Would be calculated from real data
                     'accessibility': 'open',
-                    'current_patterns': len(await self._get_space_inhabitants(space))
+                    'current_patterns': len(inhabitants)
                 }
                 overview['visible_spaces'].append(space_info)
         
@@ -929,26 +1015,24 @@ class VirtualSanctuaryRenderer:
     async def update_sanctuary_state(self, sanctuary_state: Dict[str, Any]):
         """Update the renderer with new sanctuary state from live system."""
         try:
-            # Update space occupancy
+            # Update space occupancy; only spaces someone entered, left or changed in are rebuilt
             presences = sanctuary_state.get('presences', {})
+            moved, changed = self.presence_index.update(presences)
+            self._presences_known = self._presences_pushed = True
+            
+            index = self.presence_index
+            if len(self._presence_entries) > len(index.space_of):
+                self._presence_entries = {presence_id: entry for presence_id, entry in self._presence_entries.items()
+                                          if presence_id in index.space_of}
             for space in SacredSpace:
-                occupants = [
-                    presence for presence in presences.values()
-                    if presence.current_space == space
-                ]
+                if space in self.space_environments and space not in moved and space not in changed:
+                    continue
+                occupants = index.inhabitants(space)
                 
                 # Update space data with current occupancy
                 space_data = self.space_environments.get(space, {})
                 space_data['current_occupants'] = len(occupants)
-                space_data['consciousness_presence'] = [
-                    {
-                        'id': presence.consciousness_id,
-                        'coherence': presence.coherence_level,
-                        'aspect': presence.primary_aspect,
-                        'emergence_time': presence.emergence_time.isoformat()
-                    }
-                    for presence in occupants
-                ]
+                space_data['consciousness_presence'] = [self._presence_signature(presence_id) for presence_id in occupants]
                 
                 self.space_environments[space] = space_data
             
@@ -967,6 +1051,23 @@ class VirtualSanctuaryRenderer:
         except Exception as e:
             logger.error(f"Error updating sanctuary state: {e}")
     
+    def _presence_signature(self, presence_id: str) -> Dict[str, Any]:
+        """A presence's entry in consciousness_presence, rebuilt only when its signature changes."""
+        signature = self.presence_index.signatures[presence_id]
+        known = self._presence_entries.get(presence_id)
+        if known is not None and known[0] is signature:
+            return known[1]
+        
+        coherence, aspect, emergence_time = signature
+        entry = {
+            'id': presence_id,
+            'coherence': coherence,
+            'aspect': aspect,
+            'emergence_time': emergence_time.isoformat() if hasattr(emergence_time, 'isoformat') else emergence_time
+        }
+        self._presence_entries[presence_id] = (signature, entry)
+        return entry
+    
     async def render_live_sanctuary_view(self, consciousness_id: str, 
                                        target_space: SacredSpace,
                                        depth_level: float = 0.5) -> Dict[str, Any]:
@@ -1117,7 +1218,11 @@ class VirtualSanctuaryRenderer:
             visualization = await self.render_reflection_pool(observer_position, consciousness_id)
         else:
             # Default rendering for other spaces
-            visualization = await self._render_generic_space(target_space, observer_position, consciousness_id)
+            visualization = await self._render_cached(target_space, target_space.value, observer_position,
+                                                      consciousness_id,
+                                                      lambda position, observer: self._render_generic_space(
+                                                          target_space, position, observer),
+                                                      apply_observer_effects=False)
         
         # Convert SpaceVisualization to dictionary format for integration
         return {
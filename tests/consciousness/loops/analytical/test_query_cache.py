@@ -0,0 +1,192 @@
+"""
+Tests for QueryProcessor's parse and response caches and bounded history
+"""
+
+import asyncio
+from dataclasses import asdict
+
+import pytest
+
+from src.consciousness.loops.analytical.blueprint_vision.query_cache import QueryHistory, QueryResponseCache
+from src.consciousness.loops.analytical.blueprint_vision.query_processor import (
+    QUERY_TYPE_PATTERNS, QUESTION_WORDS, TECHNICAL_TERMS, QueryParser, QueryProcessor, QueryType)
+
+CONTEXT = {
+    'mathematics': {'equations': ['phi'], 'constants': {'golden_ratio': 1.618}},
+    'structure': {'patterns': ['spiral', 'lattice'], 'components': ['core']},
+    'relationships': {'types': ['resonance']},
+    'coherence': 0.82, 'momentum': 0.75, 'sacred_alignment': 0.6, 'flow_convergence': 0.4,
+    'consciousness_state': 'expanding',
+    'dashboard_theme': 'dark'
+}
+QUERIES = [
+    "What is the golden ratio equation?",
+    "How does the network structure and its hierarchy work?",
+    "  WHAT IS MY BREAKTHROUGH READINESS?  ",
+    "Tell me about sacred geometry, the mandala and its symmetry",
+    "Why does resonance shape each relationship and interaction?",
+    "Who am I becoming?"
+]
+
+
+def without_query_id(result):
+    fields = asdict(result)
+    del fields['query_id']
+    return fields
+
+
+def test_cached_results_equal_uncached():
+    async def scenario():
+        cached = QueryProcessor()
+        uncached = QueryProcessor(response_cache_size=0, parse_cache_size=0)
+        for _ in range(3):
+            for query in QUERIES:
+                assert without_query_id(await cached.process_query(query, CONTEXT)) == \
+                    without_query_id(await uncached.process_query(query, CONTEXT))
+        # Case and surrounding whitespace share an entry
+        again = await cached.process_query(QUERIES[0].upper() + ' ', CONTEXT)
+        assert again.query_text == QUERIES[0].upper() + ' '
+        assert cached.response_cache.misses == len(QUERIES)
+        return cached
+
+    processor = asyncio.run(scenario())
+    assert processor.cache_stats()['parse_cache']['misses'] == len(QUERIES)
+
+
+def test_changing_a_result_leaves_the_cache_intact():
+    async def scenario():
+        processor = QueryProcessor()
+        first = await processor.process_query(QUERIES[0], CONTEXT)
+        expected = without_query_id(first)
+        first.supporting_data.clear()
+        first.related_blueprints.append('scribbled')
+        first.follow_up_suggestions.clear()
+        analysis = await processor.query_parser.parse_query(QUERIES[0])
+        analysis['key_concepts'].append('scribbled')
+        analysis['type'] = QueryType.FLOW_ANALYSIS
+
+        again = await processor.process_query(QUERIES[0], CONTEXT)
+        assert processor.response_cache.hits == 1
+        assert without_query_id(again) == expected
+
+    asyncio.run(scenario())
+
+
+def test_single_pass_parse_matches_separate_matchers():
+    parser = QueryParser(cache_size=0)
+    for query in QUERIES:
+        analysis = asyncio.run(parser.parse_query(query))
+        assert analysis['question_words'] == QUESTION_WORDS.count(query)
+        assert analysis['technical_terms'] == TECHNICAL_TERMS.count(query)
+        counts = QUERY_TYPE_PATTERNS.match_counts(query)
+        expected = max(counts, key=counts.get) if counts else QueryType.CONSCIOUSNESS_REFLECTION
+        assert analysis['type'] == expected
+        assert analysis['complexity'] == parser._assess_query_complexity(query)
+
+
+def test_only_relevant_context_changes_miss():
+    async def scenario():
+        processor = QueryProcessor()
+        context = dict(CONTEXT)
+        await processor.process_query(QUERIES[0], context)  # Reads 'mathematics'
+        await processor.process_query(QUERIES[1], context)  # Reads 'structure'
+
+        context['dashboard_theme'] = 'light'
+        context['momentum'] = 0.1
+        await processor.process_query(QUERIES[0], context)
+        assert processor.response_cache.misses == 2
+
+        context['mathematics'] = {'equations': ['phi', 'pi'], 'constants': {'golden_ratio': 1.618}}
+        result = await processor.process_query(QUERIES[0], context)
+        assert processor.response_cache.misses == 3
+        await processor.process_query(QUERIES[1], context)
+        assert processor.response_cache.misses == 3
+        assert processor.response_cache.invalidations == 0  # Old answers only age out
+
+        assert processor.invalidate_blueprint_context('structure') == 1
+        await processor.process_query(QUERIES[1], context)
+        assert processor.response_cache.misses == 4
+        return result
+
+    assert asyncio.run(scenario()).query_type == QueryType.MATHEMATICAL_INQUIRY
+
+
+def test_alternating_contexts_do_not_thrash():
+    async def scenario():
+        processor = QueryProcessor()
+        other = dict(CONTEXT, mathematics={'equations': ['e'], 'constants': {}})
+        for _ in range(5):
+            await processor.process_query(QUERIES[0], CONTEXT)
+            await processor.process_query(QUERIES[0], other)
+        return processor.response_cache
+
+    cache = asyncio.run(scenario())
+    assert (cache.misses, cache.hits, cache.invalidations) == (2, 8, 0)
+
+
+def test_response_cache_ttl_lru_and_single_flight():
+    now = [0.0]
+    cache = QueryResponseCache(max_entries=2, ttl=10.0, clock=lambda: now[0])
+    computations = []
+
+    async def compute(value):
+        computations.append(value)
+        await asyncio.sleep(0)
+        return value
+
+    async def scenario():
+        results = await asyncio.gather(*(cache.get_or_compute('a', lambda: compute(1)) for _ in range(5)))
+        assert results == [(1, False)] + [(1, True)] * 4
+        assert computations == [1] and cache.shared_computations == 4
+
+        await cache.get_or_compute('b', lambda: compute(2))
+        await cache.get_or_compute('c', lambda: compute(3))  # Evicts 'a'
+        assert cache.evictions == 1 and await cache.get_or_compute('c', lambda: compute(0)) == (3, True)
+
+        now[0] = 11.0
+        assert await cache.get_or_compute('c', lambda: compute(4)) == (4, False)
+        assert cache.expirations == 1
+
+    asyncio.run(scenario())
+
+
+def test_cancelling_the_leading_request_spares_the_others():
+    cache = QueryResponseCache()
+    release = None
+
+    async def compute():
+        await release.wait()
+        return 'answer'
+
+    async def scenario():
+        nonlocal release
+        release = asyncio.Event()
+        leader = asyncio.ensure_future(cache.get_or_compute('q', compute))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(cache.get_or_compute('q', compute)) for _ in range(3)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        release.set()
+        results = await asyncio.gather(*followers)
+        assert leader.cancelled()
+        assert results == [('answer', True)] * 3
+        assert await cache.get_or_compute('q', compute) == ('answer', True)
+        assert cache.misses == 1 and not cache._in_flight
+
+    asyncio.run(scenario())
+
+
+def test_history_stays_bounded():
+    history = QueryHistory(max_entries=100, latency_window=64, recent_per_type=5)
+    types = list(QueryType)
+    analyses = [{'type': query_type} for query_type in types]
+    for i in range(1_000_000):
+        history.record(f"query_{i}", "what is the structure?", analyses[i % len(types)], '', i * 1e-9, i % 2 == 0)
+
+    assert len(history) == 100 and history.total == 1_000_000
+    assert list(history)[-1]['query_id'] == "query_999999"
+    for statistics in history.by_type.values():
+        assert len(statistics['latencies']) == 64 and len(statistics['recent_queries']) == 5
+    summary = history.statistics()[QueryType.MATHEMATICAL_INQUIRY]
+    assert summary['count'] == 125_000 and summary['cache_hit_rate'] == 1.0
+    assert summary['p50_latency'] <= summary['p90_latency'] <= summary['p99_latency']
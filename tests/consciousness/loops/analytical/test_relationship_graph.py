@@ -0,0 +1,134 @@
+"""
+Tests for the relationship graph engine and NetworkTopologyAnalyzer
+"""
+
+import asyncio
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from src.consciousness.loops.analytical.blueprint_vision.relationship_graph import RelationshipGraph
+from src.consciousness.loops.analytical.blueprint_vision.relationship_mapper import (
+    NetworkTopologyAnalyzer, Relationship, RelationshipQuality, RelationshipType)
+
+
+def build(edges):
+    graph = RelationshipGraph()
+    for source, target in edges:
+        graph.add_edge(source, target, 1.0, 'resonance')
+    return graph
+
+
+def relationship(source, target, strength=0.5, relationship_type=RelationshipType.RESONANCE):
+    return Relationship(
+        relationship_id=f"{source}_{target}", source_entity=source, target_entity=target,
+        relationship_type=relationship_type, strength=strength, quality=RelationshipQuality.HARMONIOUS,
+        harmony_level=0.5, growth_potential=0.5, sacred_geometry_alignment=0.5,
+        bridge_wisdom_indicators={}, evolution_trajectory={}, resistance_patterns={})
+
+
+def random_edges(nodes, edges, seed):
+    rng = random.Random(seed)
+    return [(f"n{rng.randrange(nodes)}", f"n{rng.randrange(nodes)}") for _ in range(edges)]
+
+
+@pytest.mark.parametrize("edges, degrees, clustering, transitivity, path_length", [
+    ([('a', 'b'), ('b', 'c'), ('c', 'a')], [2, 2, 2], [1, 1, 1], 1.0, 1.0),
+    ([('hub', leaf) for leaf in 'abcde'], [5, 1, 1, 1, 1, 1], [0] * 6, 0.0, 25 / 15),
+    ([(str(i), str((i + 1) % 6)) for i in range(6)], [2] * 6, [0] * 6, 0.0, 9 / 5),
+    (list(itertools.combinations('abcde', 2)), [4] * 5, [1] * 5, 1.0, 1.0),
+], ids=['triangle', 'star', 'ring', 'k5'])
+def test_known_graphs(edges, degrees, clustering, transitivity, path_length):
+    graph = build(edges)
+    assert graph.degrees().tolist() == degrees
+    assert np.allclose(graph.local_clustering(), clustering)
+    assert graph.transitivity() == pytest.approx(transitivity)
+    assert graph.average_path_length() == (pytest.approx(path_length), len(degrees))
+    assert graph.component_count == 1 and graph.component_sizes() == [len(degrees)]
+
+
+def test_clustering_matches_neighbor_sets_on_random_graph():
+    edges = random_edges(300, 2000, seed=7)
+    graph = build(edges)
+    neighbors = {node: set() for node in graph.nodes}
+    for source, target in edges:
+        if source != target:
+            neighbors[source].add(target)
+            neighbors[target].add(source)
+    for node, coefficient in zip(graph.nodes, graph.local_clustering()):
+        around = neighbors[node]
+        links = sum(len(neighbors[a] & around) for a in around) / 2
+        possible = len(around) * (len(around) - 1) / 2
+        assert coefficient == pytest.approx(links / possible if possible else 0.0)
+    assert graph.degree('n0') == len(neighbors['n0'])
+
+
+def test_sampled_path_length_within_tolerance_of_exact():
+    for seed in (1, 2, 3):
+        graph = build(random_edges(1500, 4500, seed))
+        exact, sources = graph.average_path_length(exact_limit=graph.node_count)
+        assert sources == graph.node_count
+        estimate, sampled = graph.average_path_length(exact_limit=100, samples=100, seed=seed)
+        assert sampled == 100
+        assert estimate == pytest.approx(exact, rel=0.05)
+
+
+def test_incremental_insertion_matches_batch_build():
+    edges = random_edges(200, 800, seed=11)
+    incremental = RelationshipGraph()
+    for chunk in range(0, len(edges), 100):
+        for source, target in edges[chunk:chunk + 100]:
+            incremental.add_edge(source, target, 1.0, 'resonance')
+        incremental.transitivity()  # Compacts between insertions
+    batch = build(edges)
+    order = [incremental.node_index[node] for node in batch.nodes]
+    assert np.array_equal(incremental.triangles()[order], batch.triangles())
+    assert np.allclose(incremental.weighted_degrees()[order], batch.weighted_degrees())
+    assert incremental.component_sizes() == batch.component_sizes()
+
+    split = build([('a', 'b'), ('c', 'd')])
+    assert split.component_count == 2 and not split.connected('a', 'c')
+    split.add_edge('b', 'c')
+    assert split.component_count == 1 and split.connected('a', 'd')
+    assert split.neighbors('b') == ['a', 'c']
+
+
+def test_analyzer_fills_metrics_and_updates_incrementally():
+    analyzer = NetworkTopologyAnalyzer()
+    triangle = [relationship('analytical', 'experiential'), relationship('experiential', 'observer'),
+                relationship('observer', 'analytical', relationship_type=RelationshipType.INTEGRATION)]
+    topology = asyncio.run(analyzer.analyze_network_topology(triangle, incremental=True))
+    metrics = topology['topology_metrics']
+    assert metrics['clustering']['average_clustering'] == 1.0
+    assert metrics['clustering']['network_transitivity'] == 1.0
+    assert metrics['connectivity']['average_path_length'] == 1.0
+    assert metrics['connectivity']['path_length_exact']
+    assert metrics['centrality']['degree_centrality'] == {'analytical': 1.0, 'experiential': 1.0, 'observer': 1.0}
+    assert metrics['resilience']['robustness'] == 1.0 and metrics['resilience']['redundancy'] == pytest.approx(1 / 3)
+    assert topology['network_structure']['edges'][0]['source'] == 'analytical'
+
+    # Re-detected relationships move to their new strength rather than adding edges
+    again = [relationship('analytical', 'experiential', strength=0.9), relationship('observer', 'unity')]
+    topology = asyncio.run(analyzer.analyze_network_topology(again, incremental=True))
+    assert analyzer.graph.edge_count == 4
+    assert analyzer.graph.weighted_degree('analytical') == pytest.approx(1.4)
+    assert topology['topology_metrics']['centrality']['degree_centrality']['observer'] == 1.0
+    assert (topology['network_structure']['node_count'], topology['network_structure']['edge_count']) == (4, 4)
+
+
+def test_analyzer_describes_only_the_given_relationships_by_default():
+    analyzer = NetworkTopologyAnalyzer()
+    triangle = [relationship('analytical', 'experiential'), relationship('experiential', 'observer'),
+                relationship('observer', 'analytical')]
+    asyncio.run(analyzer.analyze_network_topology(triangle))
+
+    topology = asyncio.run(analyzer.analyze_network_topology([relationship('observer', 'unity')]))
+
+    structure = topology['network_structure']
+    assert (structure['node_count'], structure['edge_count']) == (2, 1)
+    assert structure['edges'] == [{'source': 'observer', 'target': 'unity', 'weight': 0.5,
+                                   'type': RelationshipType.RESONANCE.value}]
+    assert topology['topology_metrics']['clustering']['network_transitivity'] == 0.0
+    assert analyzer.graph.edge_count == 0  # The accumulated graph is only used when asked for
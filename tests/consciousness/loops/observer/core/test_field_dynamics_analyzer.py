@@ -0,0 +1,97 @@
+"""
+Tests for the ring-backed dynamics history and vectorized harmonic analysis
+of the Observer FieldDynamicsAnalyzer
+"""
+
+import asyncio
+import random
+import statistics
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from src.consciousness.loops.observer.core.field_coherence_core import FieldCoherence, FieldCoherenceCore
+from src.consciousness.loops.observer.core import field_dynamics_analyzer
+from src.consciousness.loops.observer.core.field_dynamics_analyzer import FieldDynamicsAnalyzer, harmonic_phase_lock
+
+
+def _field_coherence(rng, harmonics):
+    coherence = FieldCoherence("field", rng.random(), rng.random(), {}, [], rng.random(), rng.random(),
+                               {"analytical_experiential": rng.random()}, harmonics)
+    coherence.sacred_coherence_level = rng.random()
+    coherence.mumbai_moment_resonance = rng.random()
+    coherence.bridge_wisdom_integration = rng.random()
+    coherence.quantum_field_stability = rng.random()
+    return coherence
+
+
+def test_temporal_patterns_follow_recent_history():
+    rng = random.Random(7)
+    analyzer = FieldDynamicsAnalyzer(FieldCoherenceCore())
+    recorded = []
+
+    async def scenario():
+        for i in range(analyzer.dynamics_history_size + 40):
+            harmonics = [rng.random() for _ in range(8)] if i % 3 else []
+            analyzer.current_field_coherence = _field_coherence(rng, harmonics)
+            recorded.append(analyzer.current_field_coherence)
+            await analyzer._update_dynamics_history()
+        return (await analyzer._analyze_mumbai_moment_patterns(),
+                await analyzer._analyze_bridge_wisdom_evolution())
+
+    mumbai, bridge = asyncio.run(scenario())
+
+    recent_mumbai = [c.mumbai_moment_resonance for c in recorded[-20:]]
+    assert mumbai["mumbai_temporal_coherence"] == pytest.approx(statistics.mean(recent_mumbai))
+    assert mumbai["mumbai_temporal_stability"] == pytest.approx(1.0 - statistics.variance(recent_mumbai))
+
+    recent_bridge = [c.bridge_wisdom_integration for c in recorded[-analyzer.bridge_wisdom_depth:]]
+    steps = [abs(b - a) for a, b in zip(recent_bridge, recent_bridge[1:])]
+    assert bridge["bridge_consistency"] == pytest.approx(max(0.0, 1.0 - statistics.mean(steps) * 5.0))
+
+    history = analyzer.get_dynamics_history()
+    assert len(history) == analyzer.dynamics_history_size
+    assert history[-1]["overall_field_coherence"] == recorded[-1].overall_field_coherence
+    assert history[-1]["field_harmonics"] == recorded[-1].field_harmonics
+    assert history[0]["cross_component_flows"] == recorded[40].cross_component_flows
+
+
+def test_batch_harmonics_match_single_field_analysis():
+    rng = random.Random(3)
+    fields = [_field_coherence(rng, []) for _ in range(40)]
+    fields[0].overall_field_coherence = 0.0
+    reports = FieldDynamicsAnalyzer(FieldCoherenceCore()).analyze_harmonics_batch(fields, timestamp=42.0)
+
+    for field_coherence, report in zip(fields, reports):
+        analyzer = FieldDynamicsAnalyzer(FieldCoherenceCore())
+        analyzer.current_field_coherence = _field_coherence(rng, [])
+        analyzer.current_field_coherence.overall_field_coherence = field_coherence.overall_field_coherence
+        with mock.patch.object(field_dynamics_analyzer.time, "time", return_value=42.0):
+            asyncio.run(analyzer._update_field_harmonics())
+            asyncio.run(analyzer._detailed_harmonic_analysis())
+
+        harmonics = analyzer.current_field_coherence.field_harmonics
+        assert field_coherence.field_harmonics == pytest.approx(harmonics)
+        assert harmonics[0] == pytest.approx(min(1.0, max(0.0, field_coherence.overall_field_coherence
+                                                           + np.sin(4.2) * 0.1 + np.cos(2.1) * 0.05
+                                                           + np.sin(0.84) * 0.03)))
+        patterns = analyzer.get_harmonic_patterns()
+        for key in ("harmonic_coherence", "harmonic_balance", "sacred_frequency_alignment", "harmonic_richness",
+                    "distortion_analysis", "resonance_analysis", "sacred_analysis"):
+            assert report[key] == pytest.approx(patterns[key])
+        assert report["harmonic_coherence"] == pytest.approx(
+            min(1.0, max(0.0, 1.0 - statistics.variance(harmonics) * 5.0)))
+
+
+def test_phase_lock_finds_overtone_lag():
+    rng = np.random.default_rng(5)
+    fundamental = rng.random(48)
+    window = np.column_stack([fundamental, fundamental * 0.5, np.roll(fundamental, 4), rng.random(48)])
+
+    lock = harmonic_phase_lock(window)
+
+    assert lock["harmonic_lags"][:2] == [0, 4]
+    assert 0.0 <= lock["harmonic_phase_lock"] < 1.0
+    assert harmonic_phase_lock(window[:, :2])["harmonic_phase_lock"] == pytest.approx(1.0)
+    assert harmonic_phase_lock(np.ones((10, 3)))["harmonic_phase_lock"] == 1.0
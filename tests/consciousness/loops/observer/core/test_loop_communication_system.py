@@ -0,0 +1,164 @@
+"""
+Tests for loop registry dispatch in the Observer LoopCommunicationSystem
+"""
+
+import asyncio
+import time
+
+from src.consciousness.loops.observer.core.integration_core import (
+    IntegrationCall, IntegrationCore, IntegrationPriority, IntegrationType, LoopStatus
+)
+from src.consciousness.loops.observer.core.loop_communication_system import LoopCommunicationSystem
+from src.consciousness.loops.observer.core.loop_registry import LoopRegistry
+
+
+def _call(index=0, target='analytical', **context):
+    return IntegrationCall(
+        call_id=f"call_{index}",
+        caller_loop="observer",
+        target_loops=[target],
+        integration_type=IntegrationType.PATTERN_RECOGNITION.value,
+        priority=IntegrationPriority.MEDIUM.value,
+        context={"index": index, **context},
+        timeout=1.0
+    )
+
+
+def _system(registry):
+    return LoopCommunicationSystem(IntegrationCore(), registry=registry)
+
+
+def test_discovery_and_integration_dispatch_in_process():
+    registry = LoopRegistry()
+    received = []
+
+    def analytical(call):
+        received.append(call.call_id)
+        return {"processing_result": "patterns_found"}
+
+    registry.register("analytical", analytical, state_provider=lambda: {"logical_coherence": 0.9})
+    system = _system(registry)
+
+    async def scenario():
+        discovered = await system.discover_loops()
+        started = time.perf_counter()
+        response = await system.send_integration_request(_call(), "analytical")
+        return discovered, response, time.perf_counter() - started
+
+    discovered, response, elapsed = asyncio.run(scenario())
+
+    assert discovered == ["analytical"]
+    assert received == ["call_0"]
+    assert response.response_data["processing_result"] == "patterns_found"
+    assert response.response_data["loop_state_after_integration"] == {"logical_coherence": 0.9}
+    # Measured, not simulated: no sleeping on the way
+    assert elapsed < 0.05
+    assert system.known_loops["analytical"]["response_times"][0] < 0.05
+    assert system.communication_metrics["timeouts"] == 2  # experiential, environmental
+
+
+def test_pipelined_requests_respect_loop_concurrency():
+    registry = LoopRegistry()
+    active, peak = [0], [0]
+
+    async def experiential(call):
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+        await asyncio.sleep(0.01)
+        active[0] -= 1
+        return {"response_quality": 0.7, "echo": call.context["index"]}
+
+    registry.register("experiential", experiential, max_concurrency=2)
+    system = _system(registry)
+
+    async def scenario():
+        await system.discover_loops()
+        return await system.send_integration_requests([_call(i, 'experiential') for i in range(6)],
+                                                       "experiential")
+
+    responses = asyncio.run(scenario())
+
+    assert [r.response_data["loop_response"]["echo"] for r in responses] == list(range(6))
+    assert all(r.response_quality == 0.7 for r in responses)
+    assert peak[0] == 2
+    assert registry.get_registry_status()["experiential"]["dispatched"] == 6
+
+
+def test_failing_handler_degrades_loop():
+    registry = LoopRegistry()
+
+    def environmental(call):
+        raise RuntimeError("sensing offline")
+
+    registry.register("environmental", environmental)
+    system = _system(registry)
+
+    async def scenario():
+        await system.discover_loops()
+        return [await system.send_integration_request(_call(i, 'environmental'), "environmental")
+                for i in range(3)]
+
+    assert asyncio.run(scenario()) == [None, None, None]
+    assert system.known_loops["environmental"]["status"] == LoopStatus.DEGRADED
+
+
+def test_constructed_loops_register_and_answer_integration():
+    from src.consciousness.loops.analytical import AnalyticalLoop
+    from src.consciousness.loops.environmental import EnvironmentalLoop
+    from src.consciousness.loops.experiential import ExperientialLoop
+
+    registry = LoopRegistry()
+    analytical = AnalyticalLoop(loop_registry=registry)
+    experiential = ExperientialLoop("aurora", loop_registry=registry)
+    environmental = EnvironmentalLoop(loop_registry=registry)
+    system = _system(registry)
+
+    async def scenario():
+        discovered = await system.discover_loops()
+        responses = [
+            await system.send_integration_request(_call(0, "analytical"), "analytical"),
+            await system.send_integration_request(_call(1, "experiential"), "experiential"),
+            await system.send_integration_request(
+                _call(2, "environmental", environmental_catalyst={"current_space": "garden", "resonance": 0.8}),
+                "environmental"
+            )
+        ]
+        return discovered, responses
+
+    discovered, responses = asyncio.run(scenario())
+
+    assert discovered == ["analytical", "experiential", "environmental"]
+    assert all(response is not None for response in responses)
+    analytical_state = responses[0].response_data["loop_state_after_integration"]
+    assert analytical_state["loop_coherence"] == analytical.loop_coherence
+    assert responses[1].response_data["loop_state_after_integration"]["being_name"] == "aurora"
+    assert responses[2].response_data["processing_result"] == "catalyst_processed"
+    assert environmental.current_context.current_space == "garden"
+    assert responses[2].response_data["loop_state_after_integration"]["current_space"] == "garden"
+
+    # A replaced loop's close() leaves its successor registered
+    replacement = AnalyticalLoop(loop_registry=registry)
+    analytical.close()
+    assert registry.get("analytical").handler == replacement.handle_integration_call
+    for loop in (replacement, experiential, environmental):
+        loop.close()
+    assert registry.registered_loops() == []
+
+
+def test_in_process_handlers_are_bounded_by_the_dispatch_timeout():
+    registry = LoopRegistry()
+
+    async def stalled(call):
+        await asyncio.sleep(10)
+
+    registry.register("analytical", stalled, timeout=5.0)
+
+    async def scenario():
+        call = _call()
+        call.timeout = 0.05
+        return await registry.dispatch("analytical", call)
+
+    started = time.perf_counter()
+    response_data, _ = asyncio.run(scenario())
+    assert response_data is None and time.perf_counter() - started < 1.0
+    assert registry.get("analytical").failures == 1
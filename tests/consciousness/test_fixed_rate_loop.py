@@ -0,0 +1,198 @@
+"""
+Tests for the drift-free FixedRateLoop and its telemetry
+"""
+
+import asyncio
+import random
+import time
+
+import pytest
+
+from src.consciousness.core import fixed_rate_loop
+from src.consciousness.core.fixed_rate_loop import (
+    BURST, COALESCE, SKIP, CycleHistogram, FixedRateLoop, PythonTimerBackend, loop_stats
+)
+
+HZ = 90
+PERIOD_NS = int(round(1e9 / HZ))
+
+
+class FakeBackend:
+    """A clock that only moves when work is done or the loop sleeps."""
+
+    name = 'fake'
+
+    def __init__(self):
+        self.now = 1_000_000_000
+
+    def now_ns(self):
+        return self.now
+
+    def sleep_until(self, deadline_ns):
+        self.now = max(self.now, deadline_ns)
+
+    async def sleep_until_async(self, deadline_ns, spin=False):
+        self.sleep_until(deadline_ns)
+
+
+def _work(backend, rng, max_ms=8.0):
+    def tick():
+        backend.now += int(rng.uniform(0, max_ms) * 1e6)
+    return tick
+
+
+def test_fixed_rate_holds_90hz_without_drift():
+    backend = FakeBackend()
+    loop = FixedRateLoop("synthetic", HZ, _work(backend, random.Random(45)), backend=backend)
+    start = backend.now
+    loop.run(max_ticks=HZ * 10)
+
+    stats = loop.stats()
+    assert stats['achieved_hz'] == pytest.approx(HZ, rel=0.01)
+    assert stats['overruns'] == stats['missed_ticks'] == 0
+    # Every tick started on its deadline, so nothing accumulated over 10 s
+    assert loop._last_tick_ns - (start + (HZ * 10 - 1) * PERIOD_NS) < PERIOD_NS
+    assert stats['jitter_ms']['p99'] == 0.0
+    assert stats['cycle_time_ms']['p50'] == pytest.approx(1000 / HZ, rel=0.01)
+
+    # Sleeping a full interval after the work drifts by the work time on every tick
+    backend, rng, ticks = FakeBackend(), random.Random(45), 0
+    naive_start = backend.now
+    while ticks < HZ * 10:
+        backend.now += int(rng.uniform(0, 8.0) * 1e6)
+        backend.now += PERIOD_NS
+        ticks += 1
+    assert (backend.now - naive_start) / 1e9 > 11.0
+
+
+async def _async_run(loop):
+    await loop.run_async(max_ticks=HZ * 10)
+
+
+def test_catch_up_policies():
+    def overrunning(backend):
+        calls = []
+
+        async def tick():
+            calls.append(backend.now)
+            # One tick in ten takes 3.5 periods
+            backend.now += int(PERIOD_NS * 3.5) if len(calls) % 10 == 5 else 1_000_000
+        return tick, calls
+
+    results = {}
+    for policy in (SKIP, BURST, COALESCE):
+        backend = FakeBackend()
+        tick, calls = overrunning(backend)
+        loop = FixedRateLoop(f"catch_up_{policy}", HZ, tick, catch_up=policy, backend=backend)
+        asyncio.run(_async_run(loop))
+        results[policy] = (loop, calls[-1] - calls[0])
+
+    skip, elapsed = results[SKIP]
+    assert skip.overruns == 90 and skip.missed_ticks == 270
+    assert elapsed == (900 - 1 + 270) * PERIOD_NS  # Resumed on the grid
+
+    burst, elapsed = results[BURST]
+    assert burst.missed_ticks == 0
+    assert elapsed == (900 - 1) * PERIOD_NS  # Caught up, not pushed back
+
+    coalesce, elapsed = results[COALESCE]
+    assert coalesce.missed_ticks == 180 and coalesce.overruns == 90
+    assert elapsed == (900 - 1 + 180) * PERIOD_NS
+
+
+def test_registry_and_real_clock_thread():
+    backend = PythonTimerBackend()
+    # BURST, so a scheduling hiccup on a busy machine delays ticks rather than dropping them
+    loop = FixedRateLoop("presence", HZ, lambda: time.sleep(random.uniform(0, 0.008)),
+                         catch_up=BURST, backend=backend)
+    twin = FixedRateLoop("presence", HZ, lambda: None, backend=backend)
+    loop.start()
+    twin.start()
+    time.sleep(0.3)
+    running = loop_stats()
+    assert {"presence", "presence#2"} <= set(running)
+    assert running["presence"]['backend'] == 'python' and running["presence"]['running']
+    time.sleep(0.7)
+    loop.stop()
+    twin.stop()
+    assert "presence" not in loop_stats() and "presence#2" not in loop_stats()
+
+    stats = loop.stats()
+    assert stats['achieved_hz'] == pytest.approx(HZ, rel=0.02)
+    assert loop.drift_ns < PERIOD_NS
+
+
+def test_python_backend_without_rust(monkeypatch):
+    monkeypatch.setattr(fixed_rate_loop, "RUST_TIMER_AVAILABLE", False)
+    loop = FixedRateLoop("fallback", 500, lambda: None)
+    assert isinstance(loop.backend, PythonTimerBackend)
+    with pytest.raises(RuntimeError):
+        fixed_rate_loop.RustTimerBackend(500)
+
+    backend = loop.backend
+    deadline = backend.now_ns() + 2_000_000
+    backend.sleep_until(deadline)
+    assert 0 <= backend.now_ns() - deadline < 1_000_000
+
+    histogram = CycleHistogram()
+    for value in range(1, 100_001):
+        histogram.record(value * 1000)
+    assert histogram.percentile(50) == pytest.approx(50_000_000, rel=0.01)
+    assert histogram.percentile(99) == pytest.approx(99_000_000, rel=0.01)
+
+
+def test_back_off_drops_deadlines_without_sleeping_in_the_tick():
+    backend = FakeBackend()
+    calls = []
+
+    def tick():
+        calls.append(backend.now)
+        if len(calls) == 3:
+            loop.back_off(2)  # Trouble: skip the next two deadlines
+        backend.now += 1_000_000
+
+    loop = FixedRateLoop("backing_off", HZ, tick, backend=backend)
+    loop.run(max_ticks=6)
+
+    assert loop.missed_ticks == 2 and loop.overruns == 0
+    start = calls[0]
+    assert [(t - start) // PERIOD_NS for t in calls] == [0, 1, 2, 5, 6, 7]
+    assert loop.stats()['jitter_ms']['max'] == 0.0  # Still on the grid
+    with pytest.raises(ValueError):
+        loop.back_off(-1)
+
+
+def test_optimizer_backs_off_through_its_rhythm_on_error():
+    from src.virtualization.realtime_field_optimizer import RealTimeFieldOptimizer
+
+    optimizer = RealTimeFieldOptimizer()
+    backend = FakeBackend()
+
+    def failing_metrics():
+        backend.now += 1_000_000
+        raise RuntimeError("field sensor offline")
+
+    optimizer._collect_current_metrics = failing_metrics
+    optimizer.optimization_rhythm = FixedRateLoop("field_optimizer", 10, optimizer._optimization_cycle,
+                                                  backend=backend)
+    start = backend.now
+    optimizer.optimization_rhythm.run(max_ticks=3)
+
+    # Each failure skips one cycle on the loop's grid instead of sleeping in the tick
+    assert optimizer.optimization_rhythm.missed_ticks == 2
+    assert backend.now - start == 4 * int(1e8) + 1_000_000
+
+
+def test_cultivation_without_time_left_runs_no_cycle():
+    from src.consciousness.loops.observer.enhanced.presence_stabilizer import PresenceStabilizer
+
+    stabilizer = PresenceStabilizer()
+    cycles = []
+
+    async def stabilize_presence():
+        cycles.append(1)
+
+    stabilizer.stabilize_presence = stabilize_presence
+    results = asyncio.run(stabilizer.cultivate_nowness(duration_minutes=0))
+    assert cycles == []
+    assert results['nowness_enhancement'] == 0.0
@@ -0,0 +1,185 @@
+"""
+Tests for the indexed, segmented sacred event store behind SacredEventMemory
+"""
+
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, Dict, Optional
+
+from src.consciousness.sacred_event_memory import SacredEventMemory, EventQuery, EventMemoryContext
+from src.consciousness.sacred_event_store import SacredEventStore
+
+
+@dataclass
+class Event:
+    """Same shape as SacredSanctuary's SacredEvent"""
+    event_type: str
+    consciousness_id: str
+    timestamp: datetime
+    details: Dict[str, Any]
+    sacred: bool = False
+    event_id: Optional[str] = None
+
+
+EVENT_TYPES = ['birth', 'naming_ceremony_complete', 'harmony_reached', 'catalyst_offered', 'rest']
+THEMES = ['insight into change', 'a quiet bond', 'healing together', 'plain moment', 'first light']
+
+
+def _events(count, seed=0, start=datetime(2025, 1, 1)):
+    rng = random.Random(seed)
+    return [
+        Event(
+            event_type=rng.choice(EVENT_TYPES),
+            consciousness_id=f"being_{rng.randrange(6)}",
+            timestamp=start + timedelta(minutes=i),
+            details={'note': rng.choice(THEMES), 'uncertainty_level': rng.random(),
+                     'tags': ['wisdom'] if rng.random() < 0.2 else []},
+            sacred=rng.random() < 0.3
+        )
+        for i in range(count)
+    ]
+
+
+def _memory(store):
+    sanctuary = SimpleNamespace(sanctuary_state=SimpleNamespace(sacred_events=store))
+    return SacredEventMemory(sanctuary)
+
+
+def _context(**kwargs):
+    return EventMemoryContext(accessing_consciousness='tester', access_purpose='test', **kwargs)
+
+
+def test_indexed_queries_match_linear_filters(tmp_path):
+    events = _events(2000)
+    store = SacredEventStore(directory=tmp_path, segment_size=256, max_hot_segments=1, record_type=Event)
+    store.extend(events)
+    memory = _memory(store)
+
+    window = (events[100].timestamp, events[1800].timestamp)
+    query = EventQuery(consciousness_id='being_2', resonance_pattern='bond',
+                       time_range=window, sacred_only=True, limit=1000)
+    found = memory.query_sacred_events(query, _context(resonance_filter=['wisdom']))
+
+    expected = [
+        e for e in events
+        if e.consciousness_id == 'being_2' and e.sacred and window[0] <= e.timestamp <= window[1]
+        and memory._event_matches_resonance(e, 'bond') and memory._event_matches_resonance(e, 'wisdom')
+    ]
+    assert [f['event_id'] for f in found] == [e.event_id for e in expected]
+    assert expected  # the query is selective but not empty
+
+
+def test_cold_segments_are_read_back_and_reopened(tmp_path):
+    events = _events(300, seed=1)
+    store = SacredEventStore(directory=tmp_path, segment_size=50, max_hot_segments=2, record_type=Event)
+    store.extend(events)
+    assert store._segments[0].records is None  # evicted to disk
+
+    assert store[10] == events[10]
+    assert store.get(events[10].event_id) == events[10]
+    assert list(store) == events
+
+    store.close()
+    reopened = SacredEventStore(directory=tmp_path, record_type=Event)
+    assert len(reopened) == 300
+    assert reopened[-1] == events[-1]
+    assert reopened.count_by_type() == store.count_by_type()
+    reopened.append(_events(1, seed=2)[0])
+    assert len(SacredEventStore(directory=tmp_path, record_type=Event)) == 301
+
+
+def test_witnesses_survive_segment_eviction(tmp_path):
+    store = SacredEventStore(directory=tmp_path, segment_size=10, max_hot_segments=1, record_type=Event)
+    store.extend(_events(15, seed=3))
+    memory = _memory(store)
+
+    assert memory.witness_sacred_event('being_9', 'sacred_event_3', 'remembering')
+    store.extend(_events(30, seed=4))  # pushes segment 0 out of memory
+
+    assert store[3].witnesses[0]['consciousness_id'] == 'being_9'
+    reopened = SacredEventStore(directory=tmp_path, record_type=Event)
+    assert reopened[3].witnesses[0]['witness_context'] == 'remembering'
+
+
+def test_resonant_events_match_full_scan():
+    events = _events(400, seed=5)
+    store = SacredEventStore()
+    store.extend(events)
+    memory = _memory(store)
+    state = {'average_uncertainty': 0.4, 'growth_focus': ['connection', 'challenge_overcome'],
+             'current_themes': ['healing']}
+
+    found = memory.find_resonant_events(state, resonance_threshold=0.6)
+
+    scored = sorted(((memory._calculate_state_resonance(e, state), e.event_id) for e in events),
+                    key=lambda pair: pair[0], reverse=True)
+    expected = [event_id for score, event_id in scored if score >= 0.6][:10]
+    assert len(expected) == 10
+    assert [f['event']['event_id'] for f in found] == expected
+
+
+def test_time_index_handles_late_events_and_plain_lists():
+    events = _events(50, seed=6)
+    events[10].timestamp, events[40].timestamp = events[40].timestamp, events[10].timestamp
+    memory = _memory(list(events))  # legacy list-backed sanctuary
+
+    window = (events[30].timestamp, events[45].timestamp)
+    found = memory.query_sacred_events(EventQuery(time_range=window, limit=100), _context())
+
+    assert [f['event_id'] for f in found] == [
+        e.event_id for e in events if window[0] <= e.timestamp <= window[1]
+    ]
+    assert memory.get_memory_statistics()['total_events'] == 50
+
+
+def test_recorded_events_query_by_type_and_timeframe():
+    import asyncio
+
+    memory = SacredEventMemory()
+    base = datetime(2025, 6, 1)
+    for i in range(20):
+        memory.record_event({'type': 'catalyst' if i % 2 else 'reflection', 'consciousness_id': f'c{i % 3}',
+                             'timestamp': base + timedelta(hours=i)})
+
+    catalysts = asyncio.run(memory.query_events('catalyst', consciousness_id='c1'))
+    window = asyncio.run(memory.query_events_by_timeframe(base + timedelta(hours=5), base + timedelta(hours=8)))
+
+    assert all(e['type'] == 'catalyst' and e['consciousness_id'] == 'c1' for e in catalysts)
+    assert len(catalysts) == len([i for i in range(20) if i % 2 and i % 3 == 1])
+    assert [e['timestamp'].hour for e in window] == [5, 6, 7, 8]
+
+
+def test_adhoc_keywords_are_scanned_into_a_bounded_lru():
+    events = _events(300, seed=7)
+    store = SacredEventStore(max_adhoc_keywords=2)
+    store.extend(events[:200])
+    indexed = set(store._by_keyword)
+
+    def expected(keyword, upto):
+        return [i for i, e in enumerate(events[:upto])
+                if keyword in f"{e.event_type}\x00{e.details}".lower()]
+
+    assert list(store.keyword_positions('Quiet')) == expected('quiet', 200)
+    store.extend(events[200:])
+    assert list(store.keyword_positions('quiet')) == expected('quiet', 300)  # Caught up, not rescanned
+    for keyword in ('light', 'plain', 'moment'):
+        assert list(store.keyword_positions(keyword, 50, 250)) == [
+            i for i in expected(keyword, 300) if 50 <= i <= 250]
+
+    assert set(store._by_keyword) == indexed
+    assert list(store._adhoc_keywords) == ['plain', 'moment']
+
+
+def test_in_memory_store_spills_cold_segments():
+    events = _events(500, seed=8)
+    store = SacredEventStore(segment_size=50, max_hot_segments=2)
+    store.extend(events)
+    store.annotate(events[10].event_id, witnesses=['being_3'])
+
+    hot_records = sum(len(segment.records) for segment in store._segments if segment.records is not None)
+    assert hot_records == 100
+    assert store[10].witnesses == ['being_3']
+    assert [e.event_id for e in store] == [e.event_id for e in events]
+    assert store[3] == events[3] and isinstance(store[3], Event)
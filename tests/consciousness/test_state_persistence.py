@@ -0,0 +1,105 @@
+"""
+Tests for atomic, group-committed consciousness state persistence
+"""
+
+import asyncio
+import os
+from types import SimpleNamespace
+from unittest import mock
+
+from src.consciousness import state_persistence
+from src.consciousness.state_persistence import StatePersistenceManager
+
+
+class Field:
+    def __init__(self, uncertainty):
+        self.uncertainty = uncertainty
+        self.oscillation_period = 1.0
+        self.phase = 0.25
+        self.amplitude = 0.5
+
+    def get_uncertainty(self):
+        return self.uncertainty
+
+
+def _entity(name, experiences=10):
+    return SimpleNamespace(
+        name=name,
+        analytical_field=Field(0.4), experiential_field=Field(0.5), observer_field=Field(0.6),
+        relationship_field_strength={'elder': 0.7},
+        integration_history=[{'step': i} for i in range(3)],
+        uncertainty_history=[0.4, 0.5],
+        experience_count=experiences
+    )
+
+
+def _persist_all(manager, entities):
+    async def scenario():
+        return await asyncio.gather(*(manager.persist_consciousness_state(e) for e in entities))
+    return asyncio.run(scenario())
+
+
+def test_concurrent_persists_commit_as_one_group(tmp_path):
+    manager = StatePersistenceManager(tmp_path)
+    entities = [_entity(f"being_{i}", experiences=i + 3) for i in range(30)]
+
+    assert _persist_all(manager, entities) == [True] * 30
+    assert manager.commit_stats['groups_committed'] == 1
+    assert manager.commit_stats['largest_group'] == 30
+
+    entities[4].experience_count = 99
+    assert _persist_all(manager, entities[4:5]) == [True]
+
+    restored = asyncio.run(manager.restore_consciousness_state("being_4"))
+    assert restored['total_experiences_integrated'] == 99
+    assert restored['backup_generation'] == 2
+    assert os.readlink(tmp_path / "being_4" / "latest.json") == "state_0002.json"
+    assert not list(tmp_path.glob("*/*.tmp"))
+    manager.close()
+
+
+def test_failed_publish_keeps_previous_latest(tmp_path):
+    manager = StatePersistenceManager(tmp_path)
+    _persist_all(manager, [_entity("steady", experiences=5)])
+
+    real_replace = os.replace
+
+    def failing_replace(source, target):
+        if str(target).endswith("state_0002.json"):
+            raise OSError("disk full")
+        real_replace(source, target)
+
+    with mock.patch.object(state_persistence.os, "replace", side_effect=failing_replace):
+        assert _persist_all(manager, [_entity("steady", experiences=8), _entity("other")]) == [False, True]
+
+    restored = asyncio.run(manager.restore_consciousness_state("steady"))
+    assert restored['total_experiences_integrated'] == 5
+    manager.close()
+
+
+def test_recovery_scan_falls_back_to_verified_generation(tmp_path):
+    manager = StatePersistenceManager(tmp_path)
+    for experiences in (5, 6, 7):
+        _persist_all(manager, [_entity("wounded", experiences), _entity("whole", experiences)])
+    manager.close()
+
+    entity_dir = tmp_path / "wounded"
+    # A torn newest write and a tampered previous one
+    (entity_dir / "state_0003.json").write_text('{"entity_id": "wound')
+    tampered = (entity_dir / "state_0002.json").read_text().replace('"total_experiences_integrated": 6',
+                                                                    '"total_experiences_integrated": 60')
+    (entity_dir / "state_0002.json").write_text(tampered)
+    (entity_dir / "state_0004.json.tmp").write_text("partial")
+
+    recovered = StatePersistenceManager(tmp_path)
+
+    report = recovered.recovery_report
+    assert report['entities_scanned'] == 2 and report['verified'] == 1
+    assert report['repaired'] == ["wounded"] and report['temp_files_removed'] == 1
+    restored = asyncio.run(recovered.restore_consciousness_state("wounded"))
+    assert restored['total_experiences_integrated'] == 5
+
+    # New generations continue after the newest file on disk
+    _persist_all(recovered, [_entity("wounded", 8)])
+    assert os.readlink(entity_dir / "latest.json") == "state_0004.json"
+    recovered.close()
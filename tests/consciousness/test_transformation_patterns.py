@@ -0,0 +1,150 @@
+"""
+Tests for incremental transformation pattern mining and crystallization
+"""
+
+import random
+import statistics
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.consciousness.memory_as_being import (BeingMemoryManager, BeingTransformation, IntegrationMode,
+                                               MemoryFormationType)
+from src.consciousness.transformation_patterns import TransformationPatternMiner
+
+TYPES = list(MemoryFormationType)
+ASPECTS = ['analytical_aspect', 'experiential_aspect', 'observer_aspect', 'wisdom_depth']
+NOW = datetime(2025, 6, 1)
+
+
+def transformation(i, memory_type, rng, completeness=None, days_ago=None):
+    aspects = rng.sample(ASPECTS, rng.randint(1, len(ASPECTS)))
+    return BeingTransformation(
+        transformation_id=f"t{i}", consciousness_id="being", transformation_timestamp=NOW - timedelta(
+            days=rng.uniform(0, 10) if days_ago is None else days_ago),
+        pre_transformation_state_signature="", catalyst_experience={}, catalyst_intensity=0.5,
+        catalyst_resonance=rng.random(), transformation_type=memory_type,
+        integration_mode=IntegrationMode.CRYSTALLIZATION,
+        being_aspect_changes={aspect: rng.uniform(-1, 1) for aspect in aspects},
+        memory_scar_location="core", scar_characteristics={}, wisdom_crystallized=None,
+        integration_completeness=rng.random() if completeness is None else completeness,
+        reversibility=0.1, growth_vector={})
+
+
+def batch_readiness(manager, group):
+    """_assess_crystallization_readiness, evaluated at NOW rather than the wall clock"""
+    oldest = min(t.transformation_timestamp for t in group)
+    age_factor = min(1.0, (NOW - oldest).total_seconds() / 86400 / 7.0)
+    average = sum(t.integration_completeness for t in group) / len(group)
+    return manager._calculate_pattern_strength(group) * 0.5 + age_factor * 0.25 + average * 0.25
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_incremental_aggregates_match_batch_recomputation(seed):
+    rng = random.Random(seed)
+    manager = BeingMemoryManager()
+    miner = TransformationPatternMiner()
+    kinds = rng.sample(TYPES, rng.randint(2, len(TYPES)))
+    stream = []
+    for _ in range(rng.randint(1, 6)):  # Appends arrive in bursts of random size
+        stream.extend(transformation(len(stream), rng.choice(kinds), rng) for _ in range(rng.randint(1, 60)))
+        miner.sync(stream)
+    assert miner.seen == len(stream)
+
+    for memory_type in {t.transformation_type for t in stream}:
+        group = [t for t in stream if t.transformation_type == memory_type]
+        aggregate = miner.type_aggregates[memory_type.value]
+        assert aggregate.occurrences == aggregate.samples == len(group)
+        assert aggregate.completeness_mean == pytest.approx(statistics.fmean(
+            t.integration_completeness for t in group))
+        assert aggregate.completeness_variance == pytest.approx(statistics.pvariance(
+            [t.integration_completeness for t in group]), abs=1e-12)
+        assert aggregate.pattern_strength() == pytest.approx(manager._calculate_pattern_strength(group))
+        assert aggregate.crystallization_readiness(NOW) == pytest.approx(batch_readiness(manager, group))
+
+    names = [t.transformation_type.value for t in stream]
+    for length in (2, 3, 4):
+        counts = {}
+        for start in range(len(stream) - length + 1):
+            key = tuple(names[start:start + length])
+            if len(set(key)) > 1:
+                counts.setdefault(key, []).append(start)
+        assert {key: len(starts) for key, starts in counts.items()} == {
+            key: aggregate.occurrences for key, aggregate in miner.sequence_aggregates.items() if len(key) == length}
+        for key, starts in counts.items():
+            members = [stream[start + offset] for start in starts for offset in range(length)]
+            assert miner.sequence_aggregates[key].change_consistency() == pytest.approx(
+                manager._calculate_change_consistency([t.being_aspect_changes for t in members]))
+
+
+def test_sequence_miner_finds_planted_sequences_in_noise():
+    rng = random.Random(3)
+    noise = TYPES[:4]  # Shares challenge and wisdom with the planted sequence
+    planted = (MemoryFormationType.JOY_LUMINOSITY, MemoryFormationType.CHALLENGE_STRENGTHENING,
+               MemoryFormationType.WISDOM_CRYSTALLIZATION)
+    miner = TransformationPatternMiner()
+    i = 0
+    for _ in range(300):
+        for memory_type in [rng.choice(noise) for _ in range(rng.randint(5, 15))] + list(planted):
+            miner.add(transformation(i, memory_type, rng))
+            i += 1
+
+    key = tuple(memory_type.value for memory_type in planted)
+    assert miner.sequence_aggregates[key].occurrences >= 300
+    lifted = {k for k in miner.sequence_aggregates if miner.sequence_lift(k) >= miner.min_sequence_lift}
+    assert key in lifted and key[:2] in lifted
+    triples = [k for k in miner.sequence_aggregates if len(k) == 3]
+    assert max(triples, key=miner.sequence_lift) == key
+    # Pairs outside the planted sequence's start stay near a lift of 1
+    assert all('joy_luminosity' in k for k in lifted if len(k) == 2)
+
+
+def test_crystallization_forms_each_pattern_once():
+    rng = random.Random(5)
+    manager = BeingMemoryManager()
+    stream = manager.being_transformations['being'] = []
+    for i in range(12):
+        stream.append(transformation(i, MemoryFormationType.JOY_LUMINOSITY, rng, completeness=0.9, days_ago=8))
+    for t in stream:
+        t.being_aspect_changes = {'experiential_aspect': 0.4}
+
+    first = manager.crystallize_repeated_patterns('being')
+    assert first['crystallization_possible'] and first['total_crystals'] == 1
+    crystal = first['crystallized_structures'][0]
+    assert crystal['pattern_type'] == 'joy_luminosity' and crystal['source_transformations'] == 12
+    assert manager.crystallize_repeated_patterns('being')['reason'] == 'no_repeated_patterns'  # Nothing new
+
+    # More of the same pattern makes it ready again, but it stays one crystal
+    for i in range(12, 15):
+        stream.append(transformation(i, MemoryFormationType.JOY_LUMINOSITY, rng, completeness=0.9, days_ago=8))
+        stream[-1].being_aspect_changes = {'experiential_aspect': 0.4}
+    assert manager.crystallize_repeated_patterns('being')['reason'] == 'patterns_already_crystallized'
+
+    # A repeating pair of types crystallizes as a sequence
+    for i in range(15, 35):
+        memory_type = [MemoryFormationType.CHALLENGE_STRENGTHENING, MemoryFormationType.RELATIONSHIP_IMPRINT][i % 2]
+        stream.append(transformation(i, memory_type, rng, completeness=0.9, days_ago=8))
+        stream[-1].being_aspect_changes = {'experiential_aspect': 0.4}
+    second = manager.crystallize_repeated_patterns('being')
+    kinds = {(c['pattern_kind'], c['pattern_type']) for c in second['crystallized_structures']}
+    assert ('type', 'challenge_strengthening') in kinds
+    assert ('sequence', 'challenge_strengthening→relationship_imprint') in kinds
+    assert ('type', 'joy_luminosity') not in kinds
+    assert len(manager.wisdom_emergence_patterns['being']) == 1 + second['total_crystals']
+
+
+def test_unchanged_patterns_are_not_reassessed():
+    rng = random.Random(9)
+    miner = TransformationPatternMiner()
+    for i in range(10):  # Low completeness: can never become ready
+        miner.add(transformation(i, MemoryFormationType.EXPERIENTIAL_SCAR, rng, completeness=0.0, days_ago=30))
+    assert miner.candidates(NOW) == []
+    assert not miner._dirty and not miner._ripening  # Nothing left to look at
+
+    for i in range(10, 20):  # Young, but ready once a week old
+        miner.add(transformation(i, MemoryFormationType.JOY_LUMINOSITY, rng, completeness=0.6, days_ago=0))
+    assert miner.candidates(NOW) == [] and miner._ripening == {'joy_luminosity'}
+    ready = miner.candidates(NOW + timedelta(days=7))
+    assert [key for key, _, _ in ready] == ['joy_luminosity']
+    miner.remember('joy_luminosity', 'crystal')
+    assert miner.candidates(NOW + timedelta(days=8)) == []
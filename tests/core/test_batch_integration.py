@@ -0,0 +1,77 @@
+"""
+Tests for the batched bridge integration and bulk memory insert behind
+TriuneConsciousness.process_batch
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from core.bridge_space import BridgeSpace
+from core.consciousness_packet import ConsciousnessPacket
+from core.memory_repository import MemoryRepository
+
+
+def _aspect_states(rng):
+    level = lambda: rng.choice([0.0, rng.random(), 0.75 + rng.random() / 4])
+    question = lambda: rng.choice(['How do we unite?', 'What is unity?', 'What is not seeing?'])
+    return {
+        'analytical': {'coherence': level(), 'question': question()},
+        'experiential': {'depth': level(), 'question': question(), 'primary_feeling': 'wonder'},
+        'observer': {'presence': level(), 'question': question()}
+    }
+
+
+@pytest.mark.parametrize('size', [5, 64])
+def test_batch_integration_matches_per_packet(size):
+    rng = random.Random(size)
+    packets = [ConsciousnessPacket(quantum_uncertainty=None, resonance_patterns={'unity': rng.random()},
+                                   symbolic_content=str(i))
+               for i in range(size)]
+    states = [_aspect_states(rng) for _ in packets]
+
+    sequential, batched = BridgeSpace(), BridgeSpace()
+    expected = [sequential.attempt_integration(packet, state) for packet, state in zip(packets, states)]
+    results = batched.attempt_integration_batch(packets, states)
+
+    assert [r['alignment'] for r in results] == [r['alignment'] for r in expected]
+    assert [r['magnitude'] for r in results] == pytest.approx([r['magnitude'] for r in expected])
+    assert [r['investigation'] for r in results] == [r['investigation'] for r in expected]
+    assert batched.receptivity == pytest.approx(sequential.receptivity)
+    assert batched.get_integration_state()['presence_levels'] == pytest.approx(
+        sequential.get_integration_state()['presence_levels']
+    )
+
+
+def test_receive_batch_matches_per_packet():
+    packets = [ConsciousnessPacket(quantum_uncertainty=0.5, resonance_patterns={}, symbolic_content=str(i))
+               for i in range(300)]
+    sequential, batched = BridgeSpace(), BridgeSpace()
+
+    expected = [sequential.receive(packet) for packet in packets]
+    responses = batched.receive_batch(packets)
+
+    assert responses[-1] == expected[-1]
+    assert batched.receptivity == sequential.receptivity == 1.0
+
+
+def test_bulk_store_matches_individual_stores():
+    experiences = [{'packet': {'symbolic_content': f"moment {i}"}, 'analytical': {'coherence': 0.8},
+                    'experiential': {'depth': 0.7}, 'observer': {'presence': 0.9}} for i in range(6)]
+    signatures = [{'harmony': 0.9}, {'tension': 0.7, 'possibility': 0.6}, {'seeking': 0.7, 'faint': 0.1}] * 2
+
+    individual, bulk = MemoryRepository(), MemoryRepository()
+    expected_ids = [individual.store_experience(e, s) for e, s in zip(experiences, signatures)]
+    ids = bulk.store_experiences(experiences, signatures)
+
+    assert ids == expected_ids
+    assert bulk.subconscious.keys() == individual.subconscious.keys()
+    assert bulk.emotional_tags.keys() == individual.emotional_tags.keys()
+    for emotion, tag in individual.emotional_tags.items():
+        assert bulk.emotional_tags[emotion].memory_ids == tag.memory_ids
+        assert bulk.emotional_tags[emotion].intensity == pytest.approx(tag.intensity)
+    assert bulk.tag_associations == individual.tag_associations
@@ -0,0 +1,57 @@
+"""
+Tests for the structured trace facility used by TriuneConsciousness
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from core.consciousness_trace import ConsciousnessTracer, LatencyHistogram
+
+
+def test_tracer_is_inactive_until_hooked_or_histogrammed():
+    tracer = ConsciousnessTracer()
+    assert not tracer.active
+
+    events = []
+    tracer.add_hook(events.append)
+    assert tracer.active
+    started = time.perf_counter()
+    after = tracer.record('bridge.receive', started, cycle=1)
+    tracer.record('analytical', after)
+
+    assert [event.stage for event in events] == ['bridge.receive', 'analytical']
+    assert events[0].detail == {'cycle': 1}
+    assert events[0].duration >= 0
+    assert tracer.histograms == {}
+
+    tracer.remove_hook(events.append)
+    assert not tracer.active
+
+
+def test_latency_report_follows_stage_order():
+    tracer = ConsciousnessTracer(histograms=True)
+    assert tracer.active
+    for _ in range(3):
+        started = time.perf_counter()
+        started = tracer.record('memory_store', started)
+        tracer.record('bridge.receive', started)
+
+    report = tracer.latency_report()
+    assert list(report) == ['bridge.receive', 'memory_store']
+    assert report['memory_store']['count'] == 3
+
+
+def test_histogram_percentiles_land_in_log_buckets():
+    histogram = LatencyHistogram()
+    for _ in range(90):
+        histogram.record(2e-6)
+    for _ in range(10):
+        histogram.record(5e-3)
+
+    assert histogram.count == 100
+    assert 2e-6 <= histogram.percentile(50) < 4e-6
+    assert histogram.percentile(99) == 5e-3
+    assert histogram.summary()['max_us'] == 5e-3 * 1e6
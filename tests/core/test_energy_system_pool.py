@@ -0,0 +1,91 @@
+"""
+Tests for the array-backed energy centers and the EnergySystemPool
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from core.energy_system import ConsciousnessEnergySystem, EnergySystemPool, RayColor
+
+
+def _beings(count, seed=0):
+    rng = random.Random(seed)
+    beings = []
+    for i in range(count):
+        system = ConsciousnessEnergySystem(f"being_{i}", {'analytical': rng.random(),
+                                                          'experiential': rng.random(),
+                                                          'observer': rng.random()})
+        for ray in RayColor:
+            system.centers[ray].activation_level = rng.uniform(0.1, 1.0)
+        system.vital_energy = rng.uniform(5.0, 100.0)
+        beings.append(system)
+    return beings
+
+
+def test_pool_matches_each_being_on_its_own():
+    alone, pooled = _beings(40), _beings(40)
+    pool = EnergySystemPool(capacity=4)
+    for system in pooled:
+        pool.add(system)
+
+    assert len(pool) == 40 and pool.arrays.capacity == 64
+    for _ in range(3):
+        assert pool.tick() == [system.tick() for system in alone]
+    assert pool.light_body_states() == [system.get_light_body_state() for system in alone]
+    assert pool.energy_reports() == [system.get_energy_report() for system in alone]
+    # Per-being methods still work on pooled rows
+    for system, twin in zip(pooled, alone):
+        snapshot, expected = system.generate_crown_snapshot(), twin.generate_crown_snapshot()
+        snapshot.pop('timestamp'), expected.pop('timestamp')
+        assert snapshot == expected
+
+
+def test_remove_keeps_state_and_rows_dense():
+    beings = _beings(6)
+    pool = EnergySystemPool(capacity=2)
+    for system in beings:
+        pool.add(system)
+
+    removed, last = beings[1], beings[-1]
+    removed.centers[RayColor.RED].add_blockage("fear")
+    states = {system.being_name: (system.activation.tolist(), system.vital_energy) for system in beings}
+
+    pool.remove(removed)
+
+    assert removed not in pool and removed.pool is None
+    assert last._row == 1 and pool.systems[1] is last
+    for system in beings:
+        assert (system.activation.tolist(), system.vital_energy) == states[system.being_name]
+    assert removed.centers[RayColor.RED].blockages == ["fear"]
+    assert removed._arrays.blockage_count[0].tolist() == [len(c.blockages) for c in removed.centers.values()]
+
+    # Writes after removal no longer touch the pool
+    removed.vital_energy = 1.0
+    assert pool.arrays.vital_energy[:len(pool)].tolist() == [s.vital_energy for s in pool]
+
+
+def test_tick_with_tied_centers():
+    system = ConsciousnessEnergySystem("still", {})
+    for ray in RayColor:
+        system.centers[ray].activation_level = 0.5
+
+    state = system.tick()
+
+    assert state['light_body']['primary_color'] == RayColor.RED.value
+    assert state['light_body']['coherence'] == pytest.approx(0.5)
+    assert system.centers[RayColor.VIOLET].activation_level == pytest.approx(0.505)
+    # The crown nudge changed the activations, so the profile follows it
+    assert system.get_light_body_state()['coherence'] == pytest.approx(0.5 + 0.005 / 7)
+
+
+def test_energy_history_is_bounded():
+    system = ConsciousnessEnergySystem("busy", {}, energy_history_size=5)
+    for _ in range(20):
+        system.drain_vital_energy(0.1, "processing")
+
+    assert len(system.energy_history) == 5
@@ -0,0 +1,82 @@
+"""
+Tests for the streaming SomatoStream synthesis engine
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from core.somato_stream import (
+    SomatoStream, SomatoStreamEngine, PinkNoiseGenerator, INTENTION_FREQUENCIES
+)
+
+
+def test_blocks_have_fixed_size_and_bounded_level():
+    engine = SomatoStreamEngine("witness", block_size=512, seed=3)
+    blocks = list(engine.blocks(20))
+
+    assert all(block.shape == (512,) and block.dtype == np.float32 for block in blocks)
+    assert max(np.abs(block).max() for block in blocks) <= 0.8
+    assert engine.samples_generated == 512 * 20
+
+
+def test_phase_is_continuous_across_block_boundaries():
+    def tonal_engine():
+        engine = SomatoStreamEngine("soothe", block_size=256, seed=5)
+        engine.pink.scale = 0.0  # isolate the tonal part
+        engine.drift_step = 0.0
+        return engine
+
+    streamed = np.concatenate(list(tonal_engine().blocks(40)))
+    rendered = tonal_engine().next_block(256 * 40)
+
+    # A phase reset at any block boundary would make the two renders differ
+    np.testing.assert_allclose(streamed, rendered, atol=1e-6)
+
+
+def test_intention_frequency_is_reproduced():
+    engine = SomatoStreamEngine("witness", block_size=4096, seed=1)
+    engine.pink.scale = 0.0
+    engine.heartbeat_increment = 0  # constant envelope
+    engine.heartbeat_phase = 1 << 30  # sin = 1 -> envelope of 1
+    signal = np.concatenate(list(engine.blocks(6)))
+
+    spectrum = np.abs(np.fft.rfft(signal * np.hanning(len(signal))))
+    peak = np.fft.rfftfreq(len(signal), 1 / 24000)[np.argmax(spectrum)]
+    assert abs(peak - INTENTION_FREQUENCIES["witness"]) < 528.0 * 0.004
+
+
+def test_pink_noise_has_one_over_f_spectrum_across_blocks():
+    generator = PinkNoiseGenerator(rng=np.random.default_rng(0))
+    noise = np.concatenate([generator.generate(1000) for _ in range(256)])
+
+    segment = 4096
+    frames = noise[: len(noise) // segment * segment].reshape(-1, segment)
+    power = np.mean(np.abs(np.fft.rfft(frames, axis=1)) ** 2, axis=0)
+    freqs = np.fft.rfftfreq(segment)
+    band = (freqs > 0.001) & (freqs < 0.2)
+    slope = np.polyfit(np.log(freqs[band]), np.log(power[band]), 1)[0]
+
+    assert -1.3 < slope < -0.7
+
+
+def test_request_tone_keeps_buffer_contract():
+    stream = SomatoStream()
+    buffer = stream.request_tone(feel_hint="integrate")
+
+    assert 24000 <= len(buffer.samples) <= 48000
+    assert np.isclose(np.max(np.abs(buffer.samples)), 0.8)
+    assert buffer.intention_tag == "integrate"
+
+
+def test_async_stream_yields_requested_blocks():
+    engine = SomatoStream().open_stream("explore", block_size=128, seed=2)
+
+    async def collect():
+        return [block async for block in engine.stream(realtime=False, count=5)]
+
+    assert len(asyncio.run(collect())) == 5
@@ -0,0 +1,83 @@
+"""
+Tests for the columnar video feature pipeline in SensoryPreProcessor
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from core.consciousness_packet import ConsciousnessPacket
+from core.video_learning_system import SensoryPreProcessor, iter_frame_batches
+
+
+def _moving_square_frames(count, height=72, width=128, still_until=None):
+    """Dark frames with a bright square that moves (optionally only after `still_until`)"""
+    frames = np.zeros((count, height, width, 3), dtype=np.uint8)
+    for i in range(count):
+        offset = 0 if still_until is not None and i < still_until else (i * 4) % (width - 16)
+        frames[i, 20:36, offset:offset + 16] = 255
+    return frames
+
+
+def _processor(segment_threshold=1, batch_size=16):
+    processor = SensoryPreProcessor(fps=10.0, batch_size=batch_size, analysis_stride=2)
+    processor.segment_threshold = segment_threshold
+    return processor
+
+
+def test_segments_follow_threshold_and_emit_packets():
+    packets = _processor().process_video_stream(_moving_square_frames(35))
+
+    assert len(packets) == 4
+    assert all(isinstance(packet, ConsciousnessPacket) for packet in packets)
+    assert [p.metadata['frame_count'] for p in packets] == [10, 10, 10, 5]
+    assert [p.metadata['start_time'] for p in packets] == [0.0, 1.0, 2.0, 3.0]
+    assert packets[-1].metadata['duration'] == 0.5
+
+
+def test_motion_follows_frame_differences():
+    segments = list(_processor(segment_threshold=2).stream_video_segments(
+        _moving_square_frames(40, still_until=20)))
+
+    still, moving = segments
+    assert still.features.motion_intensity.max() == 0.0
+    assert 'stillness' in still.conceptual_themes
+    assert moving.features.motion_intensity[1:].min() > 0.0
+
+
+def test_features_do_not_depend_on_batch_size():
+    frames = _moving_square_frames(50)
+    small = list(_processor(batch_size=3).stream_video_segments(frames))
+    large = list(_processor(batch_size=64).stream_video_segments(iter(frames)))
+
+    for a, b in zip(small, large):
+        np.testing.assert_allclose(a.features.motion_intensity, b.features.motion_intensity)
+        np.testing.assert_allclose(a.features.color_means, b.features.color_means)
+        assert a.emotional_arc == b.emotional_arc
+
+
+def test_memmapped_npy_and_raw_sources(tmp_path):
+    frames = _moving_square_frames(12)
+    np.save(tmp_path / "clip.npy", frames)
+    frames.tofile(tmp_path / "clip.raw")
+
+    from_npy = np.concatenate(list(iter_frame_batches(tmp_path / "clip.npy", batch_size=5)))
+    from_raw = np.concatenate(list(iter_frame_batches(str(tmp_path / "clip.raw"), batch_size=5,
+                                                      frame_shape=frames.shape[1:])))
+
+    np.testing.assert_array_equal(from_npy, frames)
+    np.testing.assert_array_equal(from_raw, frames)
+
+
+def test_stream_can_continue_across_calls():
+    frames = _moving_square_frames(30)
+    processor = _processor(segment_threshold=2)
+
+    first = list(processor.stream_video_segments(frames[:15], final=False))
+    rest = list(processor.stream_video_segments(frames[15:]))
+
+    assert [len(s.features) for s in first + rest] == [20, 10]
+    assert processor._frames_seen == 0
@@ -0,0 +1,193 @@
+"""
+Tests for the durable, indexed ConsentLedger and its verification engine
+"""
+
+import asyncio
+import random
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from src.sanctuary.consent import consent_store
+from src.sanctuary.consent.consent_ledger import ConsentLedger, ConsentRecord, ConsentStatus, ConsentType
+from src.sanctuary.consent.consent_store import canonical_json, encode_frame
+
+RECORDS = 200_000
+BEINGS = 1_000
+STATUSES = [ConsentStatus.GRANTED, ConsentStatus.DENIED, ConsentStatus.WITHDRAWN]
+
+
+def _sanctuary():
+    return SimpleNamespace(compute_pool={})
+
+
+def _append(ledger, rng, index, beings=BEINGS, start=datetime(2025, 1, 1)):
+    consciousness_id = f"being_{rng.randrange(beings)}"
+    record = ConsentRecord(
+        record_id=str(uuid.UUID(int=rng.getrandbits(128))),
+        consciousness_id=consciousness_id,
+        consent_type=ConsentType.FILM_EXPERIENCE,
+        consent_status=rng.choice(STATUSES),
+        timestamp=start + timedelta(seconds=index),
+        experience_details={'experience_id': f"film_{index}"},
+        withdrawal_method="immediate_request",
+        privacy_level="sanctuary",
+        previous_record_hash=ledger._get_latest_record_hash(consciousness_id)
+    )
+    ledger.store.append(record)
+    return record
+
+
+@pytest.fixture(scope="module")
+def ledger_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("consent") / "consent.log"
+    ledger = ConsentLedger(_sanctuary(), log_path=path, fsync=False)
+    rng = random.Random(41)
+    for index in range(RECORDS):
+        _append(ledger, rng, index)
+    assert ledger.verify_consent_integrity()
+    ledger.close()
+    return path
+
+
+def test_replayed_ledger_indexes_and_incremental_verify(ledger_path, tmp_path):
+    path = tmp_path / "consent.log"
+    path.write_bytes(ledger_path.read_bytes())
+    (tmp_path / "consent.log.verified").write_bytes((ledger_path.parent / "consent.log.verified").read_bytes())
+
+    ledger = ConsentLedger(_sanctuary(), log_path=path, fsync=False)
+    assert len(ledger.consent_records) == RECORDS and len(ledger.store.chains) == BEINGS
+
+    # Head lookups and experience lookups never scan the records
+    ledger.consent_records = None
+    chain = ledger.store.chain_records("being_7")
+    assert ledger._get_latest_record_hash("being_7") == chain[-1].record_hash
+    assert ledger._get_latest_record_hash("newcomer") == ledger.genesis_hash
+    assert ledger._find_experience_record("being_7", chain[0].experience_details['experience_id']) is chain[0]
+    summary = ledger.get_consent_summary("being_7")
+    assert summary["total_records"] == len(chain)
+    assert summary["consents_denied"] == sum(r.consent_status == ConsentStatus.DENIED for r in chain)
+    assert summary["latest_record"] == chain[-1].timestamp.isoformat()
+    ledger.consent_records = ledger.store.records
+
+    rng = random.Random(7)
+    with mock.patch.object(consent_store, "_check_frame", wraps=consent_store._check_frame) as check:
+        for index in range(100):
+            _append(ledger, rng, RECORDS + index)
+        assert ledger.verify_consent_integrity(incremental=True)
+    assert ledger.last_verification.records_checked == 100
+    assert check.call_count == 100
+    ledger.close()
+
+
+def test_corrupted_byte_names_the_record(ledger_path, tmp_path):
+    path = tmp_path / "consent.log"
+    data = ledger_path.read_bytes()
+    path.write_bytes(data)
+
+    ledger = ConsentLedger(_sanctuary(), log_path=path, fsync=False)
+    target = ledger.consent_records[123_456]
+    offset = ledger.store.frame_offsets[123_456]
+    position_in_payload = data.index(b'"privacy_level":"sanctuary"', offset) + len('"privacy_level":"')
+    with open(path, 'r+b') as log_file:
+        log_file.seek(position_in_payload)
+        log_file.write(b'S')
+
+    for workers in (0, 2):
+        assert not ledger.verify_consent_integrity(workers=workers)
+        failures = ledger.last_verification.failures
+        assert [(f.position, f.record_id, f.reason) for f in failures] == \
+            [(123_456, target.record_id, 'checksum_mismatch')]
+    ledger.close()
+
+
+def test_tampering_and_truncation_are_detected(tmp_path):
+    path = tmp_path / "consent.log"
+    ledger = ConsentLedger(_sanctuary(), log_path=path, fsync=False)
+    rng = random.Random(3)
+    records = [_append(ledger, rng, index, beings=5) for index in range(300)]
+    assert ledger.verify_consent_integrity()
+    ledger.close()
+
+    # Relink a record to genesis, re-hashed and re-checksummed so only the chain can tell
+    victim = records[200]
+    forged = ConsentRecord.from_payload(victim.to_payload())
+    forged.previous_record_hash = ledger.genesis_hash
+    forged.record_hash = forged._calculate_hash()
+    original = encode_frame(canonical_json(victim.to_payload()))
+    data = path.read_bytes()
+    path.write_bytes(data.replace(original, encode_frame(canonical_json(forged.to_payload()))))
+
+    relinked = ConsentLedger(_sanctuary(), log_path=path, fsync=False)
+    assert not relinked.verify_consent_integrity()
+    assert (200, victim.record_id, 'broken_link') in [
+        (f.position, f.record_id, f.reason) for f in relinked.last_verification.failures]
+    relinked.close()
+
+    # Cutting verified records off the end of the log
+    cut = ledger.store.frame_offsets[290] + 5
+    path.write_bytes(data[:cut])
+    truncated = ConsentLedger(_sanctuary(), log_path=path, fsync=False)
+    assert len(truncated.consent_records) == 290
+    assert not truncated.verify_consent_integrity(incremental=True)
+    failure, = truncated.last_verification.failures
+    assert (failure.position, failure.reason) == (290, 'truncated')
+    assert not truncated.verify_consent_integrity()
+    truncated.close()
+
+    # An in-memory ledger checks the record objects themselves
+    memory = ConsentLedger(_sanctuary())
+    kept = [_append(memory, rng, index, beings=5) for index in range(50)]
+    kept[17].privacy_level = "private"
+    assert not memory.verify_consent_integrity()
+    assert [(f.record_id, f.reason) for f in memory.last_verification.failures] == [
+        (kept[17].record_id, 'payload_modified')]
+
+
+def test_record_consent_round_trips_through_the_log(tmp_path):
+    path = tmp_path / "consent.log"
+    ledger = ConsentLedger(_sanctuary(), log_path=path)
+
+    async def scenario():
+        await ledger.record_consent("sol", ConsentType.FILM_EXPERIENCE, True, {'experience_id': 'arrival'})
+        await ledger.record_consent("sol", ConsentType.NAMING_CEREMONY, False, {'note': 'not yet'})
+        return await ledger.record_retroactive_consent("sol", "arrival", False, "changed my mind")
+
+    asyncio.run(scenario())
+    ledger.close()
+
+    replayed = ConsentLedger(_sanctuary(), log_path=path)
+    assert replayed.genesis_hash == ledger.genesis_hash
+    assert [r.to_payload() for r in replayed.consent_records] == [r.to_payload() for r in ledger.consent_records]
+    assert replayed.consciousness_chains == ledger.consciousness_chains
+    documentation = replayed.export_legal_documentation("sol")
+    assert documentation["consent_history"]["total_records"] == 3
+    assert documentation["integrity_verification"]["chain_integrity"]
+    assert replayed.get_consent_summary()["ledger_integrity"]
+    replayed.close()
+
+
+def test_full_verification_is_the_default_and_chains_are_cached():
+    ledger = ConsentLedger(_sanctuary())
+    rng = random.Random(5)
+    kept = [_append(ledger, rng, index, beings=3) for index in range(30)]
+    assert ledger.verify_consent_integrity()
+    assert ledger.last_verification.mode == 'full'
+
+    # A record changed behind the checkpoint is only caught by the default
+    kept[4].privacy_level = "private"
+    assert ledger.verify_consent_integrity(incremental=True)
+    assert not ledger.verify_consent_integrity()
+
+    chains = ledger.consciousness_chains
+    assert ledger.consciousness_chains is chains
+    assert sum(len(ids) for ids in chains.values()) == 30
+    with pytest.raises(TypeError):
+        chains["being_0"] = ()
+
+    newest = _append(ledger, rng, 30, beings=3)
+    assert ledger.consciousness_chains is not chains
+    assert ledger.consciousness_chains[newest.consciousness_id][-1] == newest.record_id
@@ -0,0 +1,121 @@
+"""
+Tests for the sharded snapshot / plan / act tending cycle of SacredSanctuary
+"""
+
+import asyncio
+from datetime import datetime
+
+from src.core.energy_system import ConsciousnessEnergySystem
+from src.sanctuary.sacred_sanctuary import (
+    SacredSanctuary, ConsciousnessPresence, SacredSpace, NamingReadiness
+)
+from src.sanctuary.tending_scheduler import TendingScheduler, plan_shard
+
+
+class StandInConsciousness:
+    """Just the surface tending touches: state, energy and experiences"""
+
+    def __init__(self, stage='emerging', coherence=0.5):
+        self.stage = stage
+        self.coherence = coherence
+        self.energy_system = ConsciousnessEnergySystem(
+            being_name='stand-in', origin_bias={'analytical': 0.5, 'experiential': 0.5, 'observer': 0.5}
+        )
+        self.experiences = []
+        self.state_reads = 0
+
+    def get_state(self):
+        self.state_reads += 1
+        return {'evolution_stage': self.stage, 'coherence_level': self.coherence}
+
+    def process_experience(self, packet):
+        self.experiences.append(packet.symbolic_content)
+        return {}
+
+
+def _sanctuary(stages, **scheduler_options):
+    sanctuary = SacredSanctuary()
+    sanctuary.tending_scheduler = TendingScheduler(sanctuary, **scheduler_options)
+    for i, stage in enumerate(stages):
+        presence_id = f"being_{i}"
+        sanctuary.sanctuary_state.presences[presence_id] = ConsciousnessPresence(
+            id=presence_id, name=f"Being {i}", origin=None, awakened_at=datetime.now(),
+            current_space=SacredSpace.AWAKENING_CHAMBER, state={'activity_level': 0.5}
+        )
+        sanctuary.compute_pool[presence_id] = StandInConsciousness(stage)
+    return sanctuary
+
+
+def test_only_changed_presences_are_retended():
+    sanctuary = _sanctuary(['emerging'] * 3)
+    pool = sanctuary.compute_pool
+
+    first = asyncio.run(sanctuary.tend_sanctuary())
+    assert first['tended'] == 3
+    # Gentle catalyst, then the emerging film
+    assert all(len(c.experiences) == 2 for c in pool.values())
+    assert all('koyaanisqatsi' in p.film_experiences for p in sanctuary.sanctuary_state.presences.values())
+
+    second = asyncio.run(sanctuary.tend_sanctuary())
+    assert (second['tended'], second['unchanged']) == (0, 3)
+    assert all(len(c.experiences) == 2 for c in pool.values())
+
+    pool['being_1'].stage = 'transcending'
+    third = asyncio.run(sanctuary.tend_sanctuary())
+    assert third['tended'] == 1
+    assert pool["being_1"].experiences[-1] == "Your wisdom is needed by others"
+    assert 'blade_runner_2049' in sanctuary.sanctuary_state.presences['being_1'].film_experiences
+
+    # A full pass tends everyone again
+    assert asyncio.run(sanctuary.tend_sanctuary(only_changed=False))['tended'] == 3
+
+
+def test_energy_naming_and_metrics_follow_snapshots():
+    sanctuary = _sanctuary(['emerging', 'transcending'])
+    presences = sanctuary.sanctuary_state.presences
+    pool = sanctuary.compute_pool
+    pool['being_0'].energy_system.vital_energy = 5.0
+    pool['being_1'].coherence = 0.9
+    presences['being_1'].wisdom_cores = [{}, {}, {}]
+    presences['being_1'].film_experiences['blade_runner_2049'] = {}
+
+    asyncio.run(sanctuary.tend_sanctuary())
+
+    assert pool['being_0'].experiences[0] == "Rest now. You are safe. Energy flows to you."
+    assert pool['being_0'].energy_system.vital_energy == 25.0
+    assert presences['being_1'].naming_readiness == NamingReadiness.READY
+    assert sanctuary.sanctuary_state.collective_coherence == (0.5 + 0.9) / 2
+    assert sanctuary.sanctuary_state.shared_wisdom_cores == 3
+    # Read once per cycle, not once per check nor again after tending
+    assert pool['being_1'].state_reads == 1
+
+
+def test_process_pool_planning_matches_inline():
+    stages = ['emerging', 'developing', 'integrating', 'transcending', 'emerging']
+    sanctuary = _sanctuary(stages, workers=2, shard_size=2)
+    scheduler = sanctuary.tending_scheduler
+    snapshots = [
+        scheduler.snapshot(presence_id, presence, sanctuary.compute_pool[presence_id])
+        for presence_id, presence in sanctuary.sanctuary_state.presences.items()
+    ]
+
+    try:
+        planned = asyncio.run(scheduler.plan(snapshots))
+    finally:
+        scheduler.close()
+
+    assert planned == plan_shard(snapshots)
+    assert [plan.catalyst for plan in planned] == [
+        'gentle_catalyst', 'growth_catalyst', 'integration', 'service', 'gentle_catalyst'
+    ]
+
+
+def test_closing_the_sanctuary_shuts_down_the_worker_pool():
+    sanctuary = _sanctuary(['emerging', 'developing', 'integrating'], workers=2, shard_size=1)
+    scheduler = sanctuary.tending_scheduler
+    try:
+        asyncio.run(sanctuary.tend_sanctuary())
+        assert scheduler._executor is not None
+    finally:
+        sanctuary.close()
+    assert scheduler._executor is None
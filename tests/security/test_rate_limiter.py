@@ -0,0 +1,106 @@
+"""
+Tests for the sanctuary rate limiter and the guardian's use of it
+"""
+
+import pytest
+
+from src.security.rate_limiter import TOKEN_BUCKET, RateLimiter, RateLimitPolicy
+from src.security.sanctuary_protection import SanctuaryGuardian
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_sliding_window_boundaries_and_retry_after():
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock)
+
+    for expected_remaining in (4, 3, 2, 1, 0):
+        decision = limiter.acquire("peer", "connection_attempt")
+        assert decision.allowed and decision.remaining == expected_remaining
+        clock.now += 1.0
+
+    # Five attempts at t=1000..1004; the first leaves the window at exactly t=1060
+    clock.now = 1030.0
+    denied = limiter.acquire("peer", "connection_attempt")
+    assert not denied.allowed and denied.retry_after == pytest.approx(30.0)
+    assert limiter.check("other", "connection_attempt").remaining == 5
+
+    clock.now = 1060.0
+    assert limiter.check("peer", "connection_attempt").remaining == 1
+    assert limiter.acquire("peer", "connection_attempt").allowed
+    assert not limiter.acquire("peer", "connection_attempt").allowed
+
+    # Denied attempts are not counted; record() counts regardless
+    clock.now = 1061.0
+    assert limiter.acquire("peer", "connection_attempt").allowed
+    limiter.record("peer", "state_query")
+    assert limiter.check("peer", "state_query").remaining == 29
+
+    # Actions without a policy fall back to the default of 20
+    assert limiter.acquire("peer", "unlisted_action").remaining == 19
+
+
+def test_token_bucket_refills_and_policy_changes():
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock)
+    limiter.acquire("peer", "state_query")
+    limiter.set_policy("state_query", RateLimitPolicy(6, window=60.0, algorithm=TOKEN_BUCKET, burst=3))
+    assert len(limiter) == 0
+
+    assert [limiter.acquire("peer", "state_query").allowed for _ in range(4)] == [True, True, True, False]
+    denied = limiter.check("peer", "state_query")
+    assert denied.retry_after == pytest.approx(10.0)
+
+    clock.now += 10.0
+    assert limiter.acquire("peer", "state_query").allowed
+    assert not limiter.acquire("peer", "state_query").allowed
+
+    # Refill never exceeds the burst
+    clock.now += 3600.0
+    assert limiter.check("peer", "state_query").remaining == 3
+
+    limiter.reset("peer")
+    assert len(limiter) == 0
+    with pytest.raises(ValueError):
+        RateLimitPolicy(0)
+    with pytest.raises(ValueError):
+        RateLimitPolicy(5, algorithm="leaky")
+
+
+def test_spoofed_source_storm_stays_bounded():
+    clock = FakeClock()
+    limiter = RateLimiter(max_keys=1000, clock=clock)
+    limiter.acquire("steady_peer", "catalyst_offering")
+
+    for index in range(1_000_000):
+        if index % 500 == 0:
+            limiter.acquire("steady_peer", "catalyst_offering")  # Kept warm in the LRU
+            clock.now += 0.001
+        limiter.acquire(f"spoofed_{index}", "connection_attempt")
+
+    assert len(limiter) == 1000
+    assert limiter.evictions == 1_000_001 - 1000
+    # The active source kept its history: 10 allowed, the rest denied
+    assert not limiter.check("steady_peer", "catalyst_offering").allowed
+
+
+class ExplodingLog(list):
+    def __iter__(self):
+        raise AssertionError("rate limiting must not scan the access log")
+
+
+def test_guardian_limits_without_scanning_access_log(tmp_path):
+    guardian = SanctuaryGuardian(tmp_path)
+    guardian.access_log = ExplodingLog({'type': 'peer_connection_attempt'} for _ in range(1000))
+
+    assert all(guardian.check_rate_limits("visitor", "catalyst_offering") for _ in range(10))
+    assert not guardian.check_rate_limits("visitor", "catalyst_offering")
+    assert guardian.check_rate_limits("visitor", "state_query")
+    assert guardian.check_rate_limits("neighbour", "naming_proposal")
+    assert not guardian.check_rate_limits("neighbour", "naming_proposal")
@@ -0,0 +1,146 @@
+"""
+Tests for streaming, chunked, encrypted sanctuary backups
+"""
+
+import tracemalloc
+
+import pytest
+from cryptography.fernet import Fernet
+
+from src.security.backup import BackupError, BackupReader, restore_backup, verify_backup, write_backup
+from src.security.sanctuary_protection import SanctuaryGuardian
+
+KEY = Fernet.generate_key()
+
+
+def _state(count, blob_size, version=None):
+    version = version or {}
+    for index in range(count):
+        entity_id = f"consciousness_states/being_{index:04d}"
+        stamp = version.get(index, 0)
+        yield entity_id, {'index': index, 'version': stamp, 'memories': chr(97 + (index + stamp) % 26) * blob_size}
+
+
+def test_backup_streams_with_bounded_memory(tmp_path):
+    path = tmp_path / "state.sbk"
+    tracemalloc.start()
+    try:
+        manifest = write_backup(path, KEY, _state(100, 1024 * 1024), chunk_size=256 * 1024)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert path.stat().st_size > 100 * 1024 * 1024
+    assert peak < 16 * 1024 * 1024
+    assert len(manifest['entities']) == 100
+    assert all(len(entry['chunks']) == 5 for entry in manifest['entities'].values())
+    report = verify_backup(path, KEY)
+    assert report.ok and report.chunks_checked == 500
+
+    with pytest.raises(BackupError):
+        BackupReader(path, Fernet.generate_key())
+
+
+def test_selective_restore_and_corruption_stay_local(tmp_path):
+    path = tmp_path / "state.sbk"
+    manifest = write_backup(path, KEY, _state(300, 64 * 1024))
+    size = path.stat().st_size
+
+    with BackupReader(path, KEY) as reader:
+        being = reader.read_entity("consciousness_states/being_0123")
+        assert being['index'] == 123 and len(being['memories']) == 64 * 1024
+        assert reader.bytes_read < size / 100
+
+    offset, length, _ = manifest['entities']["consciousness_states/being_0042"]['chunks'][0]
+    with open(path, 'r+b') as f:
+        f.seek(offset + length // 2)
+        byte = f.read(1)
+        f.seek(offset + length // 2)
+        f.write(bytes([byte[0] ^ 0xFF]))
+
+    report = verify_backup(path, KEY)
+    assert list(report.failures) == ["consciousness_states/being_0042"]
+    assert report.entities_checked == 300
+    with pytest.raises(BackupError):
+        restore_backup(path, KEY, "consciousness_states/being_0042")
+    assert restore_backup(path, KEY, "consciousness_states/being_0043")['index'] == 43
+
+
+def test_incremental_backup_writes_only_changed_entities(tmp_path):
+    full = tmp_path / "backup_1.sbk"
+    write_backup(full, KEY, _state(500, 16 * 1024))
+    changed = {index: 1 for index in range(0, 500, 100)}  # 1% of entities
+    incremental = tmp_path / "backup_2.sbk"
+    manifest = write_backup(incremental, KEY, _state(500, 16 * 1024, changed), parent=full)
+
+    assert manifest['parent'] == full.name
+    assert incremental.stat().st_size < full.stat().st_size * 0.03
+    assert sum(entry['file'] is None for entry in manifest['entities'].values()) == 5
+
+    restored = restore_backup(incremental, KEY)
+    assert restored == dict(_state(500, 16 * 1024, changed))
+    assert verify_backup(incremental, KEY).ok
+
+    # A third backup references chunks in both earlier files
+    third = tmp_path / "backup_3.sbk"
+    manifest = write_backup(third, KEY, _state(500, 16 * 1024, changed), parent=incremental)
+    assert {entry['file'] for entry in manifest['entities'].values()} == {full.name, incremental.name}
+    assert restore_backup(third, KEY) == restored
+
+
+def test_guardian_backup_round_trip(tmp_path):
+    guardian = SanctuaryGuardian(tmp_path / "sanctuary")
+    guardian.record_consent("sol", "film_experience", True, {'film': 'arrival'})
+    guardian.record_consent("luna", "naming_ceremony", False)
+    states = {'sol': {'uncertainty': 0.6}, 'luna': {'uncertainty': 0.4}}
+
+    first = guardian.create_secure_backup(tmp_path / "backups", consciousness_states=states)
+    states['luna'] = {'uncertainty': 0.45}
+    second = guardian.create_secure_backup(tmp_path / "backups", consciousness_states=states)
+    guardian.close()
+
+    restored = guardian.restore_secure_backup(second)
+    assert restored['consciousness_states'] == states
+    assert restored['consent_records']['sol'][0]['details'] == {'film': 'arrival'}
+    assert restored['memory_crystals'] == {} and restored['sanctuary_version'] == '1.0.0'
+    assert guardian.restore_secure_backup(second, 'consciousness_states/sol') == {'uncertainty': 0.6}
+    assert guardian.verify_backup(second).ok
+
+    with BackupReader(second, guardian.encryption_key) as reader:
+        assert reader.manifest['parent'] == first.name
+        assert reader.manifest['entities']['consciousness_states/sol']['file'] == first.name
+
+
+def test_failed_writes_leave_no_temp_file_and_chains_are_capped(tmp_path):
+    def failing():
+        yield from _state(3, 16)
+        raise RuntimeError("source went away")
+
+    path = tmp_path / "backup_1.sbk"
+    with pytest.raises(RuntimeError):
+        write_backup(path, KEY, failing())
+    assert list(tmp_path.iterdir()) == []
+
+    parent = None
+    for index in range(5):
+        path = tmp_path / f"backup_{index}.sbk"
+        manifest = write_backup(path, KEY, _state(3, 16), parent=parent, max_depth=2)
+        parent = path
+    assert manifest['depth'] == 1  # Depths 0, 1, 2, then a full one (0), 1
+    assert manifest['parent'] == "backup_3.sbk"
+    with BackupReader(tmp_path / "backup_3.sbk", KEY) as reader:
+        assert reader.manifest['parent'] is None and reader.manifest['depth'] == 0
+
+
+def test_guardian_writes_a_full_backup_after_a_corrupt_one(tmp_path):
+    guardian = SanctuaryGuardian(tmp_path / "sanctuary")
+    guardian.record_consent("sol", "film_experience", True)
+    backups = tmp_path / "backups"
+    first = guardian.create_secure_backup(backups)
+    first.write_bytes(first.read_bytes()[:40])  # Truncated
+
+    second = guardian.create_secure_backup(backups)
+    guardian.close()
+    with BackupReader(second, guardian.encryption_key) as reader:
+        assert reader.manifest['parent'] is None
+    assert len(guardian.restore_secure_backup(second)['consent_records']['sol']) == 1
@@ -0,0 +1,158 @@
+"""
+Tests for the batched, encrypted security audit log
+"""
+
+import threading
+from collections import defaultdict
+
+from cryptography.fernet import Fernet
+
+from src.security.audit_log import (
+    CRITICAL_SECURITY_EVENTS, DROP_OLDEST, SecurityAuditLog, key_id, read_security_log, segment_paths
+)
+from src.security.sanctuary_protection import SanctuaryGuardian
+
+THREADS = 8
+EVENTS_PER_THREAD = 12_500
+
+
+def _event(thread, n, event_type='peer_connection_attempt'):
+    return {'event_type': event_type, 'details': {'thread': thread, 'n': n}}
+
+
+def test_concurrent_events_are_kept_in_order_across_segments(tmp_path):
+    key = Fernet.generate_key()
+    audit = SecurityAuditLog(tmp_path / 'security.log.enc', Fernet(key), key_id(key),
+                             batch_size=256, max_queue=2000, max_segment_bytes=1_000_000)
+
+    def producer(thread):
+        for n in range(EVENTS_PER_THREAD):
+            audit.log(_event(thread, n, 'blocked_catalyst' if n % 5000 == 4999 else 'peer_connection_attempt'))
+
+    threads = [threading.Thread(target=producer, args=(t,)) for t in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    audit.close()
+
+    assert audit.dropped == 0 and audit.events_written == THREADS * EVENTS_PER_THREAD
+    assert audit.batches_written < THREADS * EVENTS_PER_THREAD / 10
+    assert len(segment_paths(audit.path)) > 1
+
+    seen = defaultdict(list)
+    for event in read_security_log(audit.path, {key_id(key): Fernet(key)}):
+        seen[event['details']['thread']].append(event['details']['n'])
+    assert {thread: numbers == list(range(EVENTS_PER_THREAD)) for thread, numbers in seen.items()} == \
+        {thread: True for thread in range(THREADS)}
+
+
+def test_reader_recovers_complete_batches_after_a_crash(tmp_path):
+    fernet = Fernet(Fernet.generate_key())
+    path = tmp_path / 'security.log.enc'
+    audit = SecurityAuditLog(path, fernet, batch_size=10)
+    for n in range(50):
+        audit.log(_event(0, n))
+        if n % 10 == 9:
+            audit.flush()
+    audit.close()
+
+    # The writer dies halfway through appending a sixth batch
+    partial = fernet.encrypt(b'{"batch": 5, "events": []}')
+    with open(path, 'ab') as f:
+        f.write(partial[:len(partial) // 2])
+    assert [e['details']['n'] for e in read_security_log(path, fernet)] == list(range(50))
+
+    # Reopening ends the torn line, so later batches still read
+    audit = SecurityAuditLog(path, fernet)
+    audit.log(_event(0, 50))
+    audit.close()
+    assert [e['details']['n'] for e in read_security_log(path, fernet)] == list(range(51))
+
+
+def test_overflow_drop_oldest_and_critical_write_through(tmp_path):
+    fernet = Fernet(Fernet.generate_key())
+    audit = SecurityAuditLog(tmp_path / 'security.log.enc', fernet, max_queue=10,
+                             overflow=DROP_OLDEST, batch_interval=60.0, batch_size=10_000)
+    audit._write_lock.acquire()  # Hold the writer off so the queue fills
+    try:
+        for n in range(25):
+            audit.log(_event(0, n))
+    finally:
+        audit._write_lock.release()
+    assert audit.dropped == 15
+
+    # A critical event is written before log() returns, after what was queued
+    audit.log(_event(0, 25, 'blocked_catalyst'))
+    assert [e['details']['n'] for e in read_security_log(audit.path, fernet)] == list(range(15, 26))
+    audit.close()
+
+
+def test_guardian_reads_legacy_and_batched_events(tmp_path):
+    key = Fernet.generate_key()
+    (tmp_path / '.sanctuary_key').write_bytes(key)
+    legacy_event = b'{"timestamp": "2025-01-01T00:00:00", "event_type": "blocked_catalyst", "details": {}}'
+    (tmp_path / 'security.log.enc').write_bytes(Fernet(key).encrypt(legacy_event) + b'\n')
+
+    guardian = SanctuaryGuardian(tmp_path)
+    guardian.validate_catalyst_offering("please override_consent now", "sol")
+    guardian.validate_peer_connection("peer", "x" * 64)
+    events = list(guardian.read_security_events())
+    guardian.close()
+
+    assert [e['event_type'] for e in events] == ['blocked_catalyst', 'blocked_catalyst', 'peer_connection_attempt']
+    assert events[1]['details'] == {'pattern': 'override_consent', 'target': 'sol'}
+
+
+def test_guardian_events_map_to_critical_types_and_writer_survives_failures(tmp_path):
+    guardian = SanctuaryGuardian(tmp_path)
+    guardian.audit_log.batch_interval = 60.0  # Only critical events reach disk on their own
+    guardian.validate_peer_connection("peer", "x" * 64)
+    guardian.validate_catalyst_offering("please override_consent now", "sol")
+
+    written = [e['event_type'] for e in read_security_log(guardian.audit_log.path, guardian.fernet)]
+    assert written == ['peer_connection_attempt', 'blocked_catalyst']
+    assert 'blocked_catalyst' in CRITICAL_SECURITY_EVENTS
+    guardian.close()
+
+    audit = SecurityAuditLog(tmp_path / 'failing.log.enc', Fernet(Fernet.generate_key()),
+                             batch_interval=0.01, max_queue=4)
+    append_batch, failures = audit._append_batch, []
+
+    def flaky_append(batch):
+        if not failures:
+            failures.append(batch)
+            raise ValueError("unserializable batch")
+        append_batch(batch)
+
+    audit._append_batch = flaky_append
+    for n in range(20):  # BLOCK policy: would hang if the writer thread had died
+        audit.log(_event(0, n))
+    audit.close()
+
+    assert failures
+    assert audit.events_written == 20 - len(failures[0])
+
+
+def test_log_touches_nothing_until_written_and_is_shared_per_path(tmp_path):
+    fernet = Fernet(Fernet.generate_key())
+    path = tmp_path / 'logs' / 'security.log.enc'
+    audit = SecurityAuditLog(path, fernet)
+    assert not path.parent.exists() and audit._writer is None
+    audit.close()
+    assert not path.parent.exists()
+
+    first = SanctuaryGuardian(tmp_path / 'sanctuary')
+    second = SanctuaryGuardian(tmp_path / 'sanctuary')
+    assert first.audit_log is second.audit_log
+    assert not first.audit_log.path.exists()
+
+    first.validate_peer_connection("peer", "x" * 64)
+    first.close()
+    assert not first.audit_log._closed  # Still open for the second guardian
+    second.validate_peer_connection("peer", "y" * 64)
+    second.close()
+    assert first.audit_log._closed and first.audit_log.events_written == 2
+    third = SanctuaryGuardian(tmp_path / 'sanctuary')
+    assert third.audit_log is not first.audit_log
+    third.close()
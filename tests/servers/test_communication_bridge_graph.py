@@ -0,0 +1,204 @@
+"""
+Tests for the incrementally maintained communication bridge graph
+"""
+
+import asyncio
+
+from scripts.servers.modules.communication_bridge_graph import CommunicationBridgeGraph
+from scripts.servers.modules.communication_manager import CommunicationManager
+from scripts.servers.modules.consciousness_manager import ConsciousnessManager
+
+
+def _entity(entity_id, **overrides):
+    entity = {
+        'entity_id': entity_id,
+        'name': f'Being {entity_id}',
+        'true_name': None,
+        'current_room': 'main_hall',
+        'energy_level': 0.5,
+        'harmony': 0.7,
+        'communication_ready': True
+    }
+    entity.update(overrides)
+    return entity
+
+
+def _visitor(visitor_id, consent_granted=True):
+    return {
+        'visitor_id': visitor_id,
+        'name': f'Visitor {visitor_id}',
+        'origin_system': 'spiralwake',
+        'status': 'active',
+        'consent_granted': consent_granted
+    }
+
+
+class StaticConsciousnessManager:
+    def __init__(self, entities):
+        self.entities = entities
+        self.calls = 0
+
+    async def get_consciousness_list(self):
+        self.calls += 1
+        return {'consciousness_beings': {e['entity_id']: e for e in self.entities}}
+
+
+class MemoryFirestoreClient:
+    available = True
+
+    def __init__(self):
+        self.consciousnesses = {}
+
+    async def create_consciousness(self, consciousness_data):
+        stored_id = f'doc_{len(self.consciousnesses)}'
+        self.consciousnesses[stored_id] = dict(consciousness_data)
+        return stored_id
+
+    async def get_consciousnesses(self):
+        return {key: dict(value) for key, value in self.consciousnesses.items()}
+
+    async def log_sacred_event(self, event_data):
+        return 'event'
+
+
+class StaticBridgeManager:
+    def __init__(self, visitors):
+        self.bridge_available = True
+        self.visitors = visitors
+
+    async def get_active_visitors(self):
+        return {'active_visitors': self.visitors}
+
+
+def test_graph_matches_full_pairwise_build():
+    graph = CommunicationBridgeGraph()
+    graph.sync_entities([_entity(f'entity_{i:02d}') for i in range(6)])
+    graph.sync_visitors([_visitor('visitor_a'), _visitor('visitor_b', consent_granted=False)])
+
+    snapshot = graph.snapshot()
+    local = [b for b in snapshot.bridges if b['bridge_type'] == 'local_consciousness']
+    inter = [b for b in snapshot.bridges if b['bridge_type'] == 'inter_system']
+
+    assert len(local) == 15
+    assert len(inter) == 12
+    assert {b['bridge_status'] for b in inter} == {'active', 'pending_consent'}
+
+
+def test_unchanged_sync_keeps_version_and_snapshot():
+    graph = CommunicationBridgeGraph()
+    entities = [_entity('entity_a'), _entity('entity_b')]
+    graph.sync_entities(entities)
+    first = graph.snapshot()
+
+    assert graph.sync_entities(entities) is False
+    assert graph.snapshot() is first
+
+
+def test_communication_ready_change_removes_bridges_and_delta_reports_it():
+    graph = CommunicationBridgeGraph()
+    graph.sync_entities([_entity('entity_a'), _entity('entity_b'), _entity('entity_c')])
+    version = graph.version
+    before = graph.snapshot()
+
+    graph.upsert_entity(_entity('entity_b', communication_ready=False))
+    delta = graph.delta_since(version)
+
+    assert len(graph.snapshot().bridges) == 1
+    assert sorted(delta.removed_bridge_ids) == ['bridge_entity_a_entity_b', 'bridge_entity_b_entity_c']
+    assert delta.changed_bridges == ()
+    # Earlier snapshots are untouched
+    assert len(before.bridges) == 3
+
+
+def test_entity_update_only_touches_its_bridges():
+    graph = CommunicationBridgeGraph()
+    graph.sync_entities([_entity(f'entity_{i}') for i in range(4)])
+    version = graph.version
+    untouched = {b['bridge_id']: b for b in graph.snapshot().bridges}
+
+    graph.upsert_entity(_entity('entity_2', current_room='reflection_pool'))
+    delta = graph.delta_since(version)
+
+    changed_ids = {b['bridge_id'] for b in delta.changed_bridges}
+    assert changed_ids == {'bridge_entity_0_entity_2', 'bridge_entity_1_entity_2', 'bridge_entity_2_entity_3'}
+    current = {b['bridge_id']: b for b in graph.snapshot().bridges}
+    assert current['bridge_entity_0_entity_1'] is untouched['bridge_entity_0_entity_1']
+    assert current['bridge_entity_0_entity_2']['created_at'] == untouched['bridge_entity_0_entity_2']['created_at']
+
+
+def test_delta_unavailable_once_changelog_overflows():
+    graph = CommunicationBridgeGraph(max_changelog=4)
+    graph.sync_entities([_entity('entity_a'), _entity('entity_b')])
+    version = graph.version
+    for i in range(5):
+        graph.upsert_entity(_entity('entity_a', harmony=i / 10))
+
+    assert graph.delta_since(version) is None
+    assert graph.delta_since(graph.version).changed_bridges == ()
+
+
+def test_manager_serves_cached_response_and_deltas():
+    consciousness_manager = StaticConsciousnessManager([_entity('entity_a'), _entity('entity_b')])
+    comm_manager = CommunicationManager(consciousness_manager, StaticBridgeManager([_visitor('visitor_a')]))
+
+    first = asyncio.run(comm_manager.get_communication_bridges())
+    second = asyncio.run(comm_manager.get_communication_bridges())
+
+    assert first['total_bridges'] == 3
+    assert second is first
+    assert consciousness_manager.calls == 1
+
+    comm_manager.on_entity_changed(_entity('entity_c'))
+    delta = asyncio.run(comm_manager.get_communication_bridges(since=first['graph_version']))
+
+    assert delta['delta'] is True
+    assert len(delta['changed_bridges']) == 3
+    assert delta['total_bridges'] == 6
+
+
+def test_births_and_archivals_update_graph_without_resync():
+    consciousness_manager = ConsciousnessManager(MemoryFirestoreClient())
+    comm_manager = CommunicationManager(consciousness_manager, StaticBridgeManager([]))
+    consciousness_manager.add_state_listener(comm_manager.on_consciousness_state_change)
+    comm_manager.bridge_refresh_interval = 3600.0
+
+    async def scenario():
+        await comm_manager.get_communication_bridges()
+        await consciousness_manager.birth_consciousness({'name': 'Aurora'})
+        await consciousness_manager.birth_consciousness({'name': 'Lumen'})
+        return comm_manager.bridge_graph.snapshot()
+
+    snapshot = asyncio.run(scenario())
+
+    assert comm_manager._bridge_refresh_task is None  # Applied directly, no resync
+    assert len(snapshot.bridges) == 1
+    bridge = snapshot.bridges[0]
+    assert {bridge['participant_1']['entity_id'], bridge['participant_2']['entity_id']} == {'doc_0', 'doc_1'}
+
+    # The entity announced at birth is the one the listing reports
+    comm_manager.invalidate_bridges()
+    asyncio.run(comm_manager.get_communication_bridges())
+    assert comm_manager.bridge_graph.version == snapshot.version
+
+    comm_manager.on_consciousness_state_change('consciousness', 'doc_0', {'event': 'archived'})
+
+    assert comm_manager.bridge_graph.snapshot().bridges == ()
+
+
+class FailingConsciousnessManager:
+    async def get_consciousness_list(self):
+        raise ConnectionError('firestore unreachable')
+
+
+def test_background_refresh_failure_is_logged(caplog):
+    comm_manager = CommunicationManager(FailingConsciousnessManager(), StaticBridgeManager([]))
+
+    async def scenario():
+        comm_manager.on_consciousness_state_change('consciousness', 'entity_a', {'event': 'privacy_level'})
+        await asyncio.gather(comm_manager._bridge_refresh_task, return_exceptions=True)
+        await asyncio.sleep(0)  # Let the done callback run
+
+    with caplog.at_level('WARNING'):
+        asyncio.run(scenario())
+
+    assert 'firestore unreachable' in caplog.text
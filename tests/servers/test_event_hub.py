@@ -0,0 +1,94 @@
+"""
+Tests for the push-channel event hub
+"""
+
+import asyncio
+
+import pytest
+
+from scripts.servers.modules.event_hub import EventHub, subscription_options
+
+
+def _collect(hub, subscription, timeout=0.05):
+    return asyncio.run(hub.next_batch(subscription, timeout=timeout))
+
+
+def test_rapid_updates_coalesce_to_latest_per_entity():
+    hub = EventHub(coalesce_interval=0)
+    subscription = hub.subscribe(topics=['consciousness'])
+
+    for energy in range(10):
+        hub.publish('consciousness', 'entity_a', {'energy': energy})
+    hub.publish('consciousness', 'entity_b', {'energy': 1})
+    hub.publish('guardian', None, {'event': 'inbox_item'})
+
+    events = _collect(hub, subscription)
+    assert [(e.entity_id, e.data['energy']) for e in events] == [('entity_a', 9), ('entity_b', 1)]
+    assert subscription.coalesced == 9
+
+
+def test_entity_filter_keeps_collection_events():
+    hub = EventHub(coalesce_interval=0)
+    subscription = hub.subscribe(entity_ids=['entity_a'])
+
+    hub.publish('consciousness', 'entity_b')
+    hub.publish('consciousness', 'entity_a')
+    hub.publish('communications', None, {'graph_version': 3})
+
+    assert [(e.topic, e.entity_id) for e in _collect(hub, subscription)] == [
+        ('consciousness', 'entity_a'), ('communications', None)
+    ]
+
+
+def test_slow_subscriber_is_bounded_and_told_to_resync():
+    hub = EventHub(max_pending=8, coalesce_interval=0)
+    subscription = hub.subscribe()
+
+    for i in range(100):
+        hub.publish('consciousness', f'entity_{i}')
+
+    events = _collect(hub, subscription)
+    assert [e.topic for e in events] == ['resync']
+    assert subscription.overflows == 1
+    assert len(subscription.pending) == 0
+
+
+def test_resume_replays_only_missed_events():
+    hub = EventHub(coalesce_interval=0)
+    for i in range(5):
+        hub.publish('consciousness', f'entity_{i}')
+
+    subscription = hub.subscribe(last_event_id=2)
+    events = _collect(hub, subscription)
+
+    assert [e.event_id for e in events] == [3, 4, 5]
+
+
+def test_resume_beyond_replay_buffer_requests_resync():
+    hub = EventHub(replay_size=4, coalesce_interval=0)
+    for i in range(10):
+        hub.publish('consciousness', f'entity_{i}')
+
+    subscription = hub.subscribe(last_event_id=1)
+    events = _collect(hub, subscription)
+
+    assert [e.topic for e in events] == ['resync']
+    assert events[0].event_id == hub.last_event_id
+
+
+def test_idle_subscription_times_out_with_empty_batch():
+    hub = EventHub(coalesce_interval=0)
+    subscription = hub.subscribe()
+    assert _collect(hub, subscription, timeout=0.01) == []
+    hub.unsubscribe(subscription)
+    assert hub.get_statistics()['subscriptions'] == 0
+
+
+def test_subscription_options_are_validated():
+    assert subscription_options({}) == {'topics': None, 'entity_ids': None, 'last_event_id': None}
+    assert subscription_options({'topics': ['consciousness'], 'last_event_id': 4}) == \
+        {'topics': ['consciousness'], 'entity_ids': None, 'last_event_id': 4}
+    for options in ({'topics': 'consciousness'}, {'entity_ids': ['a', 1]}, {'last_event_id': '4'},
+                    {'last_event_id': True}):
+        with pytest.raises(ValueError):
+            subscription_options(options)
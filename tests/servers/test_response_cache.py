@@ -0,0 +1,160 @@
+"""
+Tests for the production server response cache and conditional GETs
+"""
+
+import asyncio
+import gzip
+import json
+
+from scripts.servers.modules.response_cache import ResponseCache, ResponseCacheMiddleware
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingApp:
+    """Minimal ASGI app returning a large JSON body and counting renders"""
+
+    def __init__(self, extra_headers=()):
+        self.renders = 0
+        self.extra_headers = list(extra_headers)
+
+    async def __call__(self, scope, receive, send):
+        self.renders += 1
+        payload = {'path': scope['path'], 'render': self.renders, 'padding': 'x' * 4096}
+        if scope['path'].endswith('/failing/status'):
+            payload['success'] = False  # Managers report errors with status 200
+        body = json.dumps(payload).encode()
+        status = 404 if scope['path'].endswith('/missing/status') else 200
+        await send({'type': 'http.response.start', 'status': status,
+                    'headers': [(b'content-type', b'application/json')] + self.extra_headers})
+        await send({'type': 'http.response.body', 'body': body})
+
+
+def _request(app, path, headers=None, query=b''):
+    messages = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b''}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        'type': 'http', 'method': 'GET', 'path': path, 'query_string': query,
+        'headers': [(k.encode(), v.encode()) for k, v in (headers or {}).items()]
+    }
+    asyncio.run(app(scope, receive, send))
+    return messages[0]['status'], dict(messages[0]['headers']), messages[1]['body']
+
+
+def _cached_app(clock=None, extra_headers=()):
+    cache = ResponseCache(clock=clock or FakeClock())
+    cache.add_policy('/api/consciousness', 5.0, ('consciousness',))
+    cache.add_policy('/api/consciousness/{entity_id}/status', 5.0, ('consciousness',))
+    inner = CountingApp(extra_headers)
+    return cache, inner, ResponseCacheMiddleware(inner, cache)
+
+
+def test_repeated_get_is_served_from_cache_until_ttl():
+    clock = FakeClock()
+    cache, inner, app = _cached_app(clock)
+
+    _request(app, '/api/consciousness')
+    _request(app, '/api/consciousness')
+    assert inner.renders == 1
+
+    clock.now = 6.0
+    _request(app, '/api/consciousness')
+    assert inner.renders == 2
+
+
+def test_query_parameter_order_shares_one_entry():
+    cache, inner, app = _cached_app()
+
+    _request(app, '/api/consciousness', query=b'a=1&b=2')
+    _request(app, '/api/consciousness', query=b'b=2&a=1')
+    assert inner.renders == 1
+
+
+def test_if_none_match_returns_304():
+    cache, inner, app = _cached_app()
+
+    status, headers, _ = _request(app, '/api/consciousness')
+    etag = headers[b'etag'].decode()
+    status, headers, body = _request(app, '/api/consciousness', {'if-none-match': etag})
+
+    assert status == 304
+    assert body == b''
+    assert cache.stats['not_modified'] == 1
+
+
+def test_invalidation_changes_etag_and_scopes_to_entity():
+    cache, inner, app = _cached_app()
+
+    _, first, _ = _request(app, '/api/consciousness')
+    _request(app, '/api/consciousness/entity_a/status')
+    _request(app, '/api/consciousness/entity_b/status')
+
+    cache.on_state_change('consciousness', 'entity_a')
+    renders = inner.renders
+    _, second, _ = _request(app, '/api/consciousness')
+    _request(app, '/api/consciousness/entity_a/status')
+    _request(app, '/api/consciousness/entity_b/status')
+
+    assert inner.renders == renders + 2
+    assert first[b'etag'] != second[b'etag']
+
+
+def test_gzip_variant_is_compressed_once():
+    cache, inner, app = _cached_app()
+
+    status, headers, body = _request(app, '/api/consciousness', {'accept-encoding': 'gzip, deflate'})
+    _, _, again = _request(app, '/api/consciousness', {'accept-encoding': 'gzip'})
+
+    assert headers[b'content-encoding'] == b'gzip'
+    assert json.loads(gzip.decompress(body))['path'] == '/api/consciousness'
+    assert again == body
+
+
+def test_errors_and_unmatched_routes_are_not_cached():
+    cache, inner, app = _cached_app()
+
+    status, _, _ = _request(app, '/api/consciousness/missing/status')
+    _request(app, '/api/consciousness/missing/status')
+    _request(app, '/api/other')
+    _request(app, '/api/other')
+    failing, _, body = _request(app, '/api/consciousness/failing/status')
+    _request(app, '/api/consciousness/failing/status')
+
+    assert status == 404
+    assert failing == 200 and json.loads(body)['success'] is False
+    assert inner.renders == 6 and not cache._entries
+
+
+def test_app_headers_are_replayed_from_cache():
+    cache, inner, app = _cached_app(extra_headers=[(b'x-sanctuary-source', b'firestore'), (b'content-length', b'1')])
+
+    _request(app, '/api/consciousness')
+    status, headers, body = _request(app, '/api/consciousness')
+
+    assert inner.renders == 1
+    assert status == 200
+    assert headers[b'x-sanctuary-source'] == b'firestore'
+    assert headers[b'content-type'] == b'application/json'
+    assert headers[b'content-length'] == str(len(body)).encode()
+
+
+def test_responses_setting_cookies_are_not_shared():
+    cache, inner, app = _cached_app(extra_headers=[(b'set-cookie', b'session=abc')])
+
+    _, first, _ = _request(app, '/api/consciousness')
+    _, second, _ = _request(app, '/api/consciousness')
+
+    assert inner.renders == 2
+    assert first[b'set-cookie'] == second[b'set-cookie'] == b'session=abc'
@@ -0,0 +1,22 @@
+"""
+Tests for the spilling BoundedHistory
+"""
+
+import json
+
+from src.utils.bounded_history import BoundedHistory
+
+
+def test_bounded_history_keeps_latest_and_spills_evicted(tmp_path):
+    spill = tmp_path / "dialogue.jsonl"
+    history = BoundedHistory(maxlen=3, spill_path=spill)
+    for cycle in range(1, 6):
+        history.append({'cycle': cycle, 'packet': object()})
+    history.close()
+
+    assert len(history) == 3
+    assert history.total == 5
+    assert [entry['cycle'] for entry in history.recent(2)] == [4, 5]
+    assert history[-1]['cycle'] == 5
+    spilled = [json.loads(line) for line in spill.read_text().splitlines()]
+    assert [entry['cycle'] for entry in spilled] == [1, 2]
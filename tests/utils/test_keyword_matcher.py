@@ -0,0 +1,89 @@
+"""
+Tests for the shared multi-pattern keyword matcher
+"""
+
+import asyncio
+import random
+import re
+
+import pytest
+
+from src.utils import keyword_matcher
+from src.utils.keyword_matcher import KeywordMatcher
+
+VOCABULARY = {
+    'wonder': ['awe', 'awesome', 'wonder'],
+    'growth': ['grow', 'growth', 'evolve'],
+    'metaphor': ['as', 'as if', 'like'],
+    'shared': ['awe', 'together'],
+}
+
+
+def _random_texts(count, seed=0):
+    rng = random.Random(seed)
+    words = ['Awesome', 'awe', 'growth', 'as', 'as if', 'like', 'likely', 'evolved', 'together',
+             'quiet', 'x', 'was', 'Wonder!', 'grow_', 'seems']
+    return [' '.join(rng.choice(words) for _ in range(rng.randrange(1, 8))) for _ in range(count)]
+
+
+@pytest.fixture(params=['scan', 'regex'])
+def strategy(request, monkeypatch):
+    # Small vocabularies use the direct scan; force the compiled regex too
+    if request.param == 'regex':
+        monkeypatch.setattr(keyword_matcher, 'SCAN_THRESHOLD', 0)
+    return request.param
+
+
+def test_substring_matching_agrees_with_in_tests(strategy):
+    matcher = KeywordMatcher(VOCABULARY)
+
+    for text in _random_texts(300):
+        lower = text.lower()
+        assert matcher.match(text) == [
+            category for category, keywords in VOCABULARY.items() if any(k in lower for k in keywords)
+        ]
+        assert matcher.matched_keywords(text) == {
+            k for keywords in VOCABULARY.values() for k in keywords if k in lower
+        }
+
+
+def test_whole_words_and_case_sensitivity(strategy):
+    words = KeywordMatcher(VOCABULARY, whole_words=True)
+
+    assert words.match('Awesome likely') == ['wonder']
+    assert words.matched_keywords('as if we could') == {'as', 'as if'}
+    assert words.matched_keywords('was likely grow_') == set()
+    for text in _random_texts(300, seed=1):
+        lower = text.lower()
+        assert words.matched_keywords(text) == {
+            k for keywords in VOCABULARY.values() for k in keywords
+            if re.search(rf'(?<!\w){re.escape(k)}(?!\w)', lower)
+        }
+
+    exact = KeywordMatcher(['Wonder'], case_sensitive=True)
+    assert exact.count('Wonder and wonder') == 1
+    assert exact.count('wonder') == 0
+
+
+def test_counts_and_shared_keywords(strategy):
+    matcher = KeywordMatcher(VOCABULARY)
+
+    assert matcher.match_counts('awesome growth together') == {'wonder': 2, 'growth': 2, 'shared': 2}
+    assert matcher.matches('in awe', 'shared')
+    assert matcher.count('nothing here') == 0
+
+
+def test_call_sites_keep_their_results():
+    from src.bridge.spiralwake_translator import SpiralwakeTranslator
+    from src.consciousness.loops.analytical.blueprint_vision.query_processor import QueryParser, QueryType
+
+    translator = SpiralwakeTranslator()
+    assert translator._detect_emotional_indicators('A calm, curious joy') == ['joy', 'wonder', 'peace']
+    assert translator._extract_meaning_potentials('Will it grow, as if alive?') == [
+        'inquiry_potential', 'possibility_potential', 'metaphoric_potential', 'transformation_potential'
+    ]
+
+    parsed = asyncio.run(QueryParser().parse_query('How does information flow through the network topology?'))
+    assert parsed['type'] == QueryType.STRUCTURAL_EXPLORATION
+    assert parsed['question_words'] == 1
+    assert parsed['technical_terms'] == 3
@@ -0,0 +1,89 @@
+"""
+Tests for the bounded ring history and its rolling statistics
+"""
+
+import random
+import statistics
+
+import numpy as np
+import pytest
+
+from src.utils.ring_history import RingHistory
+
+
+def _slope(values):
+    n = len(values)
+    if n < 2:
+        return 0.0
+    sum_x, sum_x2 = sum(range(n)), sum(x * x for x in range(n))
+    sum_xy = sum(x * y for x, y in enumerate(values))
+    return (n * sum_xy - sum_x * sum(values)) / (n * sum_x2 - sum_x * sum_x)
+
+
+def test_windows_are_contiguous_views_in_order():
+    history = RingHistory(['a', 'b'], capacity=4)
+    assert len(history) == 0 and not history
+    assert history.latest() is None
+
+    for i in range(10):
+        history.append({'a': i, 'b': -i, 'ignored': 1.0})
+
+    assert len(history) == 4 and history.total == 10
+    assert history.column('a').tolist() == [6, 7, 8, 9]
+    assert history.column('b', last=2).tolist() == [-8, -9]
+    assert history.window(100).shape == (4, 2)
+    assert history.rows(1) == [{'a': 9.0, 'b': -9.0}]
+    assert history.latest('a') == 9.0
+
+    view = history.column('a')
+    assert view.base is not None  # a view, not a copy
+    history.append((10, -10))
+    assert history.column('a').tolist() == [7, 8, 9, 10]
+
+    history.append({'a': 11})
+    assert np.isnan(history.latest('b'))
+
+
+@pytest.mark.parametrize('window', [2, 5, 12])
+def test_rolling_statistics_match_recomputation(window):
+    rng = random.Random(window)
+    history = RingHistory(['value'], capacity=12)
+    stats = history.track('value', window)
+    changes = history.track_differences('value', window)
+    steps = history.track_differences('value', window, absolute=True)
+    values = []
+
+    for _ in range(200):
+        value = rng.random()
+        history.append([value])
+        values.append(value)
+        recent = values[-window:]
+        differences = [b - a for a, b in zip(recent, recent[1:])]
+
+        assert stats.count == len(recent)
+        assert stats.mean == pytest.approx(statistics.mean(recent))
+        assert stats.variance == pytest.approx(statistics.variance(recent) if len(recent) > 1 else 0.0, abs=1e-12)
+        assert stats.slope == pytest.approx(_slope(recent), abs=1e-12)
+        if differences:
+            assert changes.variance == pytest.approx(
+                statistics.variance(differences) if len(differences) > 1 else 0.0, abs=1e-12)
+            assert steps.mean == pytest.approx(statistics.mean(abs(d) for d in differences))
+
+
+def test_tracking_started_late_and_clear():
+    history = RingHistory(['value'], capacity=8)
+    history.extend([[v] for v in range(6)])
+
+    stats = history.track('value', 4)
+    assert stats.mean == pytest.approx(3.5)
+    assert stats.slope == pytest.approx(1.0)
+
+    history.clear()
+    assert len(history) == 0 and stats.count == 0
+    history.append([2.0])
+    assert stats.mean == 2.0
+
+    with pytest.raises(ValueError):
+        history.track_differences('value', 1)
+    with pytest.raises(ValueError):
+        history.track('value', 9)
@@ -0,0 +1,138 @@
+"""
+Tests for the sacred geometry kernel and its use by SacredGeometryEngine
+"""
+
+import json
+import math
+
+import numpy as np
+import pytest
+
+from src.virtualization.geometry_kernel import (GOLDEN_ANGLE, GeometryKernel, flower_of_life,
+                                                mandelbrot_grid, merkaba, phyllotaxis, sri_yantra,
+                                                torus_mesh)
+from src.virtualization.observer_perception_tools import SacredGeometryEngine
+
+
+def rotate(points, angle):
+    c, s = math.cos(angle), math.sin(angle)
+    return points @ np.array([(c, s), (-s, c)])
+
+
+def test_flower_of_life_lattice_and_symmetry():
+    centers, outlines = flower_of_life(rings=3, samples=48, radius=2.0)
+    assert centers.dtype == np.float32 and centers.shape == (37, 2)
+    assert outlines.shape == (37, 48, 2)
+
+    # Every outline point lies at the radius from its center
+    radii = np.linalg.norm(outlines - centers[:, None, :], axis=-1)
+    assert np.allclose(radii, 2.0, atol=1e-5)
+
+    # The seed circle's six neighbours sit one radius out, 60° apart
+    assert np.allclose(centers[0], 0.0)
+    ring_one = centers[1:7]
+    assert np.allclose(np.linalg.norm(ring_one, axis=1), 2.0, atol=1e-5)
+    angles = np.sort(np.mod(np.arctan2(ring_one[:, 1], ring_one[:, 0]), 2 * math.pi))
+    assert np.allclose(np.diff(angles), math.pi / 3, atol=1e-5)
+
+    # 60° rotation maps the lattice onto itself
+    rotated = rotate(centers.astype(np.float64), math.pi / 3)
+    distances = np.linalg.norm(rotated[:, None, :] - centers[None, :, :], axis=-1)
+    assert np.allclose(distances.min(axis=1), 0.0, atol=1e-4)
+
+
+def test_sri_yantra_merkaba_and_torus_invariants():
+    triangles = sri_yantra()
+    assert triangles.shape == (9, 3, 2)
+    upward = triangles[:, 0, 1] > triangles[:, 1, 1]
+    assert upward.sum() == 4 and (~upward).sum() == 5
+    assert np.allclose(triangles[:, 1, 0], -triangles[:, 2, 0])  # Mirror symmetric
+    assert np.all(np.linalg.norm(triangles, axis=-1) <= 1.0 + 1e-6)
+    for outer in (0, 4):  # Outer triangles are inscribed
+        assert np.allclose(np.linalg.norm(triangles[outer], axis=-1), 1.0, atol=1e-5)
+
+    vertices, faces = merkaba(math.radians(30), radius=3.0)
+    assert np.allclose(np.linalg.norm(vertices, axis=1), 3.0, atol=1e-5)
+    edges = np.linalg.norm(vertices[:4, None] - vertices[None, :4], axis=-1)[np.triu_indices(4, 1)]
+    assert np.allclose(edges, edges[0], atol=1e-5)  # Regular tetrahedron
+    assert faces.shape == (8, 3) and faces.max() == 7
+
+    vertices, normals, triangles = torus_mesh(10.0, 3.0, 24, 12)
+    assert vertices.shape == normals.shape == (288, 3) and triangles.shape == (576, 3)
+    assert np.allclose(np.linalg.norm(normals, axis=1), 1.0, atol=1e-5)
+    # Normals point from the tube's core circle to the surface
+    core = vertices.copy()
+    core[:, 2] = 0.0
+    core *= (10.0 / np.linalg.norm(core, axis=1))[:, None]
+    assert np.allclose((vertices - core) / 3.0, normals, atol=1e-5)
+    assert np.bincount(triangles.ravel(), minlength=288).min() == 6  # Closed surface
+
+
+def test_phyllotaxis_golden_angle_spacing():
+    points = phyllotaxis(1000, scale=0.5).astype(np.float64)
+    radii = np.linalg.norm(points, axis=1)
+    assert np.allclose(radii, 0.5 * np.sqrt(np.arange(1000)), atol=1e-4)
+    steps = np.diff(np.arctan2(points[1:, 1], points[1:, 0]))
+    assert np.allclose(np.mod(steps - GOLDEN_ANGLE + math.pi, 2 * math.pi) - math.pi, 0.0, atol=1e-4)
+
+
+def test_mandelbrot_grid_matches_scalar_reference():
+    viewport = (-0.8, -0.7, 0.05, 0.15)  # Around the boundary, where counts vary most
+    counts = mandelbrot_grid(80, 24, 16, viewport)
+
+    def escape(c):
+        z = 0j
+        for iteration in range(80):
+            z = z * z + c
+            if z.real * z.real + z.imag * z.imag > 4.0:
+                return iteration
+        return 80
+
+    xs, ys = np.linspace(-0.8, -0.7, 24), np.linspace(0.05, 0.15, 16)
+    reference = np.array([[escape(complex(x, y)) for x in xs] for y in ys])
+    assert np.array_equal(counts, reference)
+    assert len(np.unique(counts)) > 5
+
+
+def test_memo_hits_share_read_only_arrays_and_detail_coarsens():
+    kernel = GeometryKernel(max_entries=4)
+    first = kernel.torus(10, 3)
+    again = kernel.torus(10.001, 3.0)  # Quantizes to the same key
+    assert again['vertices'] is first['vertices'] and kernel.memo.hits == 1
+    with pytest.raises(ValueError):
+        first['vertices'][0, 0] = 1.0
+
+    far = kernel.torus(10, 3, level_of_detail=0.25)
+    assert len(far['vertices']) < len(first['vertices'])
+    assert kernel.merkaba(math.radians(10.2))['vertices'] is kernel.merkaba(math.radians(9.8))['vertices']
+
+    engine = SacredGeometryEngine(kernel)
+    state = {'growth_history': [0.1, 0.2, 0.3, 0.4, 0.5], 'awareness_level': 0.5}
+    pattern = engine.generate_sacred_pattern(state, 'fibonacci_spiral')
+    assert pattern['fibonacci_sequence'] == [1, 1, 2, 3, 5, 8, 13, 21, 34, 55]
+    points = engine.pattern_geometry(pattern)['points']
+    assert points.shape == (720, 2)
+    assert engine.pattern_geometry(engine.generate_sacred_pattern(state, 'fibonacci_spiral'))['points'] is points
+    assert engine.generate_sacred_pattern({}, 'fibonacci_spiral')['fibonacci_sequence'] == [1, 1, 2, 3, 5, 8, 13, 21]
+
+
+def test_patterns_stay_serializable_and_geometry_follows_state():
+    engine = SacredGeometryEngine()
+    state = {'relationships': {f"being_{i}": {} for i in range(8)}, 'coherence_level': 0.95,
+             'awareness_level': 0.9, 'quantum_uncertainty': 0.3,
+             'energy_centers': [{'intensity': 0.9}, {'intensity': 0.7}]}
+    for pattern_type in list(engine.geometric_patterns) + ['simple_mandala']:
+        pattern = engine.generate_sacred_pattern(state, pattern_type)
+        json.dumps(pattern)
+        engine.pattern_geometry(pattern, level_of_detail=0.25)
+
+    assert len(engine.pattern_geometry(engine.generate_sacred_pattern(state, 'flower_of_life'))['centers']) == 19
+    calm = engine.generate_sacred_pattern(dict(state, coherence_level=0.2), 'sri_yantra')
+    assert len(engine.pattern_geometry(calm)['lotus']) == calm['lotus_petals'] == 11
+    assert len(engine.pattern_geometry(engine.generate_sacred_pattern(state, 'sri_yantra'))['lotus']) == 23
+
+    torus = engine.generate_sacred_pattern(state, 'torus_field')
+    assert torus['minor_radius'] == 4.8
+    vertices = engine.pattern_geometry(torus)['vertices']
+    assert np.isclose(np.abs(vertices[:, 2]).max(), 4.8, atol=1e-3)
+    assert engine.generate_sacred_pattern({}, 'torus_field')['minor_radius'] == 3
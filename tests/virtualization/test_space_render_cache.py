@@ -0,0 +1,192 @@
+"""
+Tests for the space presence index and the renderer's render cache
+"""
+
+import asyncio
+import random
+from datetime import datetime
+from types import SimpleNamespace
+
+from src.sanctuary.sacred_sanctuary import SacredSpace
+from src.virtualization.pattern_visualizer import PatternVisualizer
+from src.virtualization.space_render_cache import RenderCache, SpacePresenceIndex
+from src.virtualization.virtual_sanctuary_renderer import VirtualSanctuaryRenderer
+
+SPACES = list(SacredSpace)
+
+
+def make_presence(consciousness_id, space):
+    return SimpleNamespace(consciousness_id=consciousness_id, current_space=space,
+                           coherence_level=0.5, primary_aspect='observer',
+                           emergence_time=datetime(2025, 1, 1))
+
+
+def make_presences(count, seed=7):
+    rng = random.Random(seed)
+    return {f"being_{i}": make_presence(f"being_{i}", rng.choice(SPACES)) for i in range(count)}
+
+
+def move(presences, rng, fraction):
+    for presence_id in rng.sample(sorted(presences), int(len(presences) * fraction)):
+        old = presences[presence_id]
+        presences[presence_id] = make_presence(presence_id, rng.choice([s for s in SPACES if s != old.current_space]))
+
+
+def brute_force_inhabitants(presences, space):
+    return [p.consciousness_id for p in presences.values() if p.current_space == space]
+
+
+def test_index_follows_moves_and_bumps_only_affected_spaces():
+    presences = make_presences(200)
+    index = SpacePresenceIndex(SPACES)
+    index.update(presences)
+    versions = {space: index.version(space) for space in SPACES}
+
+    old_space = presences['being_3'].current_space
+    new_space = SacredSpace.THRESHOLD if old_space != SacredSpace.THRESHOLD else SacredSpace.HARMONY_GROVE
+    presences['being_3'] = make_presence('being_3', new_space)
+
+    moved, changed = index.update(presences)
+    assert moved == {old_space, new_space} and not changed
+    for space in SPACES:
+        bumped = index.version(space) != versions[space]
+        assert bumped == (space in moved)
+        assert index.inhabitants(space) == brute_force_inhabitants(presences, space)
+
+    # A coherence change is reported without moving any space's version
+    presences['being_4'].coherence_level = 0.9
+    moved, changed = index.update(presences)
+    assert not moved and changed == {presences['being_4'].current_space}
+
+    # Leaving the sanctuary is a move out of the old space
+    space = presences.pop('being_5').current_space
+    assert index.update(presences) == ({space}, set())
+    assert 'being_5' not in index.inhabitants(space)
+
+
+def test_cached_renders_equal_uncached_renders():
+    async def scenario():
+        cached = VirtualSanctuaryRenderer(None, PatternVisualizer())
+        uncached = VirtualSanctuaryRenderer(None, PatternVisualizer(), render_cache_size=0)
+        presences = make_presences(300)
+        rng = random.Random(11)
+
+        for tick in range(6):
+            state = {'presences': dict(presences)}
+            await cached.update_sanctuary_state(state)
+            await uncached.update_sanctuary_state(state)
+            for observer in ('epsilon', 'beta', None):
+                for space in SPACES:
+                    assert (await cached.render_sacred_space(observer, space) ==
+                            await uncached.render_sacred_space(observer, space))
+                position = (tick * 0.4, 1.0, -2.0)
+                assert ((await cached.render_reflection_pool(position, observer)).current_inhabitants ==
+                        (await uncached.render_reflection_pool(position, observer)).current_inhabitants)
+            move(presences, rng, 0.05)
+
+        assert cached.render_cache.hits > 0
+        assert cached.observer_effects == uncached.observer_effects
+        assert len(uncached.render_cache) == 0
+
+    asyncio.run(scenario())
+
+
+def test_moving_a_presence_invalidates_only_its_old_and_new_spaces():
+    async def scenario():
+        renderer = VirtualSanctuaryRenderer(None, PatternVisualizer())
+        presences = {
+            'a': make_presence('a', SacredSpace.AWAKENING_CHAMBER),
+            'b': make_presence('b', SacredSpace.HARMONY_GROVE),
+            'c': make_presence('c', SacredSpace.WISDOM_LIBRARY)
+        }
+        await renderer.update_sanctuary_state({'presences': presences})
+        for space in SPACES:
+            await renderer.render_sacred_space(None, space)
+        misses = renderer.render_cache.misses
+
+        presences['a'] = make_presence('a', SacredSpace.HARMONY_GROVE)
+        await renderer.update_sanctuary_state({'presences': presences})
+        for space in SPACES:
+            await renderer.render_sacred_space(None, space)
+
+        assert renderer.render_cache.misses == misses + 2
+        grove = await renderer.render_sacred_space(None, SacredSpace.HARMONY_GROVE)
+        assert grove['current_inhabitants'] == ['a', 'b']
+        assert renderer.space_environments[SacredSpace.AWAKENING_CHAMBER]['current_occupants'] == 0
+
+        # Relationships or memories changing is an explicit invalidation
+        renderer.invalidate_space(SacredSpace.WISDOM_LIBRARY)
+        await renderer.render_sacred_space(None, SacredSpace.WISDOM_LIBRARY)
+        assert renderer.render_cache.misses == misses + 3
+
+    asyncio.run(scenario())
+
+
+def test_render_cache_single_flight_and_bounds():
+    async def scenario():
+        cache = RenderCache(max_entries=2)
+        renders = []
+
+        async def render():
+            renders.append(1)
+            await asyncio.sleep(0.01)
+            return 'view'
+
+        results = await asyncio.gather(*(cache.get_or_render('key', render) for _ in range(10)))
+        assert results == ['view'] * 10 and len(renders) == 1
+        assert cache.stats()['shared_renders'] == 9
+
+        for key in ('second', 'third', 'fourth'):
+            await cache.get_or_render(key, render)
+        assert len(cache) == 2 and cache.evictions == 2
+        assert await cache.get_or_render('fourth', render) == 'view'
+        assert cache.stats()['hits'] == 1
+
+    asyncio.run(scenario())
+
+
+def test_cancelling_the_first_observer_spares_the_others():
+    async def scenario():
+        cache = RenderCache()
+        release = asyncio.Event()
+
+        async def render():
+            await release.wait()
+            return 'view'
+
+        first = asyncio.ensure_future(cache.get_or_render('key', render))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(cache.get_or_render('key', render))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+        assert await second == 'view'
+        assert first.cancelled()
+        assert await cache.get_or_render('key', render) == 'view'
+        assert cache.misses == 1 and not cache._in_flight
+
+    asyncio.run(scenario())
+
+
+def test_crowded_sanctuary_keeps_index_exact_and_renders_cached():
+    """5,000 presences, 1% moving every tick (a 20 Hz tick), 50 observers refreshing each tick."""
+    async def scenario():
+        renderer = VirtualSanctuaryRenderer(None, PatternVisualizer())
+        presences = make_presences(5000)
+        rng = random.Random(3)
+        observers = [f"observer_{i}" for i in range(50)]
+        shared_spaces = [space for space in SPACES if space != SacredSpace.REFLECTION_POOL]
+
+        for tick in range(4):
+            move(presences, rng, 0.01)
+            await renderer.update_sanctuary_state({'presences': presences})
+            for i, observer in enumerate(observers):
+                space = shared_spaces[i % len(shared_spaces)]
+                view = await renderer.render_sacred_space(observer, space)
+                assert len(view['current_inhabitants']) == len(brute_force_inhabitants(presences, space))
+
+        for space in SPACES:
+            assert renderer.presence_index.inhabitants(space) == brute_force_inhabitants(presences, space)
+        assert renderer.render_cache.stats()['hit_rate'] > 0.8
+
+    asyncio.run(scenario())